@@ -2,12 +2,30 @@
 
 from agents.lead_agent.context_manager import InvestigationContext
 from agents.lead_agent.entity_resolution import resolve, resolve_one
+from agents.lead_agent.events import (
+    EntityResolved,
+    FindingsBatch,
+    InvestigationCompleted,
+    LeadAgentEvent,
+    TaskCompleted,
+    TaskFailed,
+    TasksPlanned,
+    TaskStarted,
+)
 from agents.lead_agent.orchestrator import LeadAgent
 from agents.lead_agent.task_planner import SubTask, decompose
 
 __all__ = [
     "LeadAgent",
     "InvestigationContext",
+    "LeadAgentEvent",
+    "EntityResolved",
+    "TasksPlanned",
+    "TaskStarted",
+    "FindingsBatch",
+    "TaskFailed",
+    "TaskCompleted",
+    "InvestigationCompleted",
     "SubTask",
     "decompose",
     "resolve",
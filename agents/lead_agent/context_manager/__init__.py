@@ -1,5 +1,13 @@
 """Context manager: investigation state for Lead Agent and specialists."""
 
-from agents.lead_agent.context_manager.context import InvestigationContext
+from agents.lead_agent.context_manager.checkpoint import InvestigationCheckpoint, checkpoint_id_for, raw_file_fingerprinter
+from agents.lead_agent.context_manager.context import InvestigationContext, ReadOnlyView, TaskFailure
 
-__all__ = ["InvestigationContext"]
+__all__ = [
+    "InvestigationCheckpoint",
+    "InvestigationContext",
+    "ReadOnlyView",
+    "TaskFailure",
+    "checkpoint_id_for",
+    "raw_file_fingerprinter",
+]
@@ -0,0 +1,247 @@
+"""
+Investigation checkpoints: persist completed sub-tasks so a rerun resumes where it stopped.
+
+A checkpoint is a JSONL file, one record per line:
+
+- a header: version, query, the resolved entity and the planned tasks;
+- one line per completed task: the task, the agent, its findings (evidence rows)
+  and the task's input fingerprint.
+
+A line is appended (and fsynced) as each task finishes, so a crash loses at most
+the task in flight; a torn last line is ignored on load.
+
+A task's fingerprint hashes the task, the entity and what it consumed: for MCP
+sources ("source:sec_edgar") the size and mtime of the raw file the processor
+reads, for reference data ("source:ofac_sanctions", "source:courtlistener") the
+staged list files or the dumps the court index was built from, for keys
+produced by other tasks those tasks' fingerprints. On resume a completed task
+is restored only if its fingerprint still matches and every task it depends on
+was restored too; everything else runs again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from osint_swarm.entities import Entity, Evidence
+from osint_swarm.utils.io import ensure_parent, write_bytes
+
+from mcp_layer.evidence_loader import evidence_from_row, evidence_to_row
+
+from agents.lead_agent.task_planner.types import COURTLISTENER_SOURCE, OFAC_SOURCE, SOURCE_PREFIX, SubTask
+
+
+CHECKPOINT_VERSION = 1
+MISSING = "missing"
+
+# (entity, source_id) -> fingerprint of the data that source would serve now.
+SourceFingerprinter = Callable[[Entity, str], str]
+
+
+def checkpoint_id_for(query: str) -> str:
+    """Stable checkpoint name for a query (case and whitespace do not matter)."""
+    return hashlib.sha1(" ".join(query.lower().split()).encode("utf-8")).hexdigest()[:16]
+
+
+def reference_fingerprint(data_root: Path, source_id: str) -> Optional[str]:
+    """Fingerprint of locally staged reference data (OFAC lists, CourtListener index); None for MCP sources."""
+    if source_id == OFAC_SOURCE:
+        from agents.specialist_agents.legal_agent.sanctions_screener.lists import lists_signature, sanctions_dir
+
+        return lists_signature(sanctions_dir(data_root)) or MISSING
+    if source_id == COURTLISTENER_SOURCE:
+        from agents.specialist_agents.legal_agent.pacer_analyzer.index import court_db_path, index_signature
+
+        return index_signature(court_db_path(data_root)) or MISSING
+    return None
+
+
+def raw_file_fingerprinter(data_root: Path) -> SourceFingerprinter:
+    """Fingerprint a source by the size and mtime of the raw file its processor reads (or of its reference data)."""
+    from mcp_layer import get_processor
+
+    def fingerprint(entity: Entity, source_id: str) -> str:
+        reference = reference_fingerprint(data_root, source_id)
+        if reference is not None:
+            return reference
+        proc = get_processor(source_id, data_root)
+        raw_path = getattr(proc, "raw_path_for_entity", None)
+        path = raw_path(entity) if raw_path is not None else None
+        if path is None or not Path(path).exists():
+            return MISSING
+        st = Path(path).stat()
+        return f"{st.st_size}:{st.st_mtime_ns}"
+
+    return fingerprint
+
+
+def _task_to_dict(task: SubTask) -> Dict[str, Any]:
+    return {
+        "task_type": task.task_type,
+        "target_agent": task.target_agent,
+        "description": task.description,
+        "consumes": list(task.consumes),
+        "produces": list(task.produces),
+    }
+
+
+def _task_from_dict(d: Dict[str, Any]) -> SubTask:
+    return SubTask(d["task_type"], d["target_agent"], d.get("description", ""), tuple(d.get("consumes", ())), tuple(d.get("produces", ())))
+
+
+class InvestigationCheckpoint:
+    """
+    Append-only checkpoint for one investigation.
+
+    Call restore() before dispatch to get the still-valid completed tasks, start()
+    to (re)write the header, then record() as each task finishes. record() may be
+    called from dispatcher threads.
+    """
+
+    def __init__(self, path: Path, fingerprint_source: SourceFingerprinter):
+        self.path = Path(path)
+        self._fingerprint_source = fingerprint_source
+        self._fingerprints: Dict[SubTask, str] = {}
+        self._tasks: List[SubTask] = []
+        self._lock = threading.Lock()
+
+    def read(self) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """(header, task records) as stored; (None, []) if there is no usable checkpoint."""
+        if not self.path.exists():
+            return None, []
+        header: Optional[Dict[str, Any]] = None
+        records: List[Dict[str, Any]] = []
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    break  # torn write at the end
+                if header is None:
+                    if rec.get("type") != "investigation" or rec.get("version") != CHECKPOINT_VERSION:
+                        return None, []
+                    header = rec
+                elif rec.get("type") == "task":
+                    records.append(rec)
+        return header, records
+
+    def stored_entity(self) -> Optional[Entity]:
+        header, _ = self.read()
+        if header is None or not header.get("entity"):
+            return None
+        return Entity(**header["entity"])
+
+    def _producers(self, tasks: Sequence[SubTask]) -> Dict[SubTask, Set[SubTask]]:
+        by_key: Dict[str, List[SubTask]] = {}
+        for task in tasks:
+            for key in task.produces:
+                by_key.setdefault(key, []).append(task)
+        return {t: {p for key in t.consumes for p in by_key.get(key, ()) if p != t} for t in tasks}
+
+    def _fingerprint(self, entity: Entity, task: SubTask, producer_fps: Dict[str, List[str]]) -> str:
+        inputs: Dict[str, Any] = {}
+        for key in task.consumes:
+            if key.startswith(SOURCE_PREFIX):
+                inputs[key] = self._fingerprint_source(entity, key[len(SOURCE_PREFIX) :])
+            else:
+                inputs[key] = sorted(producer_fps.get(key, [])) or MISSING
+        payload = {
+            "task": _task_to_dict(task),
+            "entity_id": entity.entity_id,
+            "identifiers": dict(sorted(entity.identifiers.items())),
+            "inputs": inputs,
+        }
+        return hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _producer_fps(self, task: SubTask, producers: Set[SubTask]) -> Dict[str, List[str]]:
+        out: Dict[str, List[str]] = {}
+        for p in producers:
+            fp = self._fingerprints.get(p)
+            for key in p.produces:
+                if key in task.consumes and fp is not None:
+                    out.setdefault(key, []).append(fp)
+        return out
+
+    def restore(self, entity: Entity, tasks: Sequence[SubTask]) -> Dict[SubTask, Tuple[str, List[Evidence]]]:
+        """Completed tasks that are still valid: task -> (agent_id, findings)."""
+        header, records = self.read()
+        if header is None or (header.get("entity") or {}).get("entity_id") != entity.entity_id:
+            return {}
+        stored: Dict[SubTask, Dict[str, Any]] = {}
+        for rec in records:
+            stored[_task_from_dict(rec["task"])] = rec
+        unique = list(dict.fromkeys(tasks))
+        producers = self._producers(unique)
+        valid: Dict[SubTask, bool] = {}
+
+        def check(task: SubTask, visiting: Set[SubTask]) -> bool:
+            if task in valid:
+                return valid[task]
+            if task in visiting:  # cycle: the dispatcher rejects it anyway
+                return False
+            visiting.add(task)
+            ok = task in stored and all(check(p, visiting) for p in producers[task])
+            if ok:
+                fp = self._fingerprint(entity, task, self._producer_fps(task, producers[task]))
+                ok = fp == stored[task].get("fingerprint")
+                if ok:
+                    self._fingerprints[task] = fp
+            valid[task] = ok
+            return ok
+
+        restored: Dict[SubTask, Tuple[str, List[Evidence]]] = {}
+        for task in unique:
+            if check(task, set()):
+                rec = stored[task]
+                restored[task] = (rec.get("agent_id") or task.target_agent, [evidence_from_row(r) for r in rec.get("findings", [])])
+        return restored
+
+    def start(
+        self,
+        query: str,
+        entity: Entity,
+        tasks: Sequence[SubTask],
+        restored: Optional[Dict[SubTask, Tuple[str, List[Evidence]]]] = None,
+    ) -> None:
+        """Rewrite the checkpoint with a fresh header plus the restored tasks (atomically)."""
+        self._tasks = list(dict.fromkeys(tasks))
+        lines = [{"type": "investigation", "version": CHECKPOINT_VERSION, "query": query, "entity": entity.to_dict(), "tasks": [_task_to_dict(t) for t in tasks]}]
+        for task, (agent_id, findings) in (restored or {}).items():
+            lines.append(self._task_record(task, agent_id, findings, self._fingerprints[task]))
+        data = "".join(json.dumps(rec, ensure_ascii=False) + "\n" for rec in lines).encode("utf-8")
+        with self._lock:
+            self._fingerprints = {t: fp for t, fp in self._fingerprints.items() if t in (restored or {})}
+            write_bytes(self.path, data)
+
+    @staticmethod
+    def _task_record(task: SubTask, agent_id: str, findings: Sequence[Evidence], fingerprint: str) -> Dict[str, Any]:
+        return {
+            "type": "task",
+            "task": _task_to_dict(task),
+            "agent_id": agent_id,
+            "fingerprint": fingerprint,
+            "findings": [evidence_to_row(e) for e in findings],
+        }
+
+    def record(self, entity: Entity, task: SubTask, agent_id: str, findings: Sequence[Evidence]) -> None:
+        """Append one completed task; its producers must already be recorded to count as inputs."""
+        with self._lock:
+            producers = self._producers(self._tasks or [task]).get(task, set())
+            fp = self._fingerprint(entity, task, self._producer_fps(task, producers))
+            self._fingerprints[task] = fp
+            line = json.dumps(self._task_record(task, agent_id, findings, fp), ensure_ascii=False) + "\n"
+            ensure_parent(self.path)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fingerprints = {}
+            self.path.unlink(missing_ok=True)
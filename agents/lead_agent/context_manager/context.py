@@ -2,14 +2,78 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TypeVar, overload
 
 from osint_swarm.entities import Entity, Evidence
 
+from mcp_layer.evidence_cache import EvidenceCache
+
 from agents.lead_agent.task_planner.types import SubTask
 
 
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class TaskFailure:
+    """A sub-task that produced no findings: reason is 'timeout' or 'error'."""
+
+    task: SubTask
+    reason: str
+    message: str = ""
+
+
+class ReadOnlyView(Sequence[T]):
+    """
+    Read-only view of the first n items of an append-only list, optionally through
+    a list of positions (a secondary index). Later appends do not change the view,
+    so it is a consistent snapshot without copying.
+    """
+
+    __slots__ = ("_items", "_positions", "_n")
+
+    def __init__(self, items: List[T], positions: Optional[List[int]] = None, n: Optional[int] = None):
+        self._items = items
+        self._positions = positions
+        self._n = len(positions if positions is not None else items) if n is None else n
+
+    def __len__(self) -> int:
+        return self._n
+
+    @overload
+    def __getitem__(self, i: int) -> T: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> List[T]: ...
+
+    def __getitem__(self, i: Any) -> Any:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._n))]
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("view index out of range")
+        return self._items[self._positions[i] if self._positions is not None else i]
+
+    def __iter__(self) -> Iterator[T]:
+        if self._positions is None:
+            return islice(self._items, self._n)
+        return map(self._items.__getitem__, islice(self._positions, self._n))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (list, tuple, ReadOnlyView)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ReadOnlyView({list(self)!r})"
+
+
 @dataclass
 class InvestigationContext:
     """
@@ -18,13 +82,29 @@ class InvestigationContext:
     - entity: resolved investigation target (or None if unresolved)
     - query: original natural-language query
     - tasks: list of sub-tasks from the task planner
-    - results: findings per agent (agent_id -> list of Evidence)
+    - results: findings per agent (agent_id -> read-only view of Evidence)
+    - failures: sub-tasks that timed out or raised (the rest of the investigation continues)
+    - evidence_cache: investigation-scoped MCP cache shared by all agents in this run
+
+    Findings live in one append-only list with secondary indexes by agent, risk
+    category, source type and evidence_id; getters return read-only views, not copies.
+    A finding whose evidence_id is already stored is dropped (the first agent to
+    report it keeps it). Results and failures may be added from several dispatcher
+    threads at once.
     """
 
     entity: Optional[Entity] = None
     query: str = ""
     tasks: List[SubTask] = field(default_factory=list)
-    results: Dict[str, List[Evidence]] = field(default_factory=dict)
+    failures: List[TaskFailure] = field(default_factory=list)
+    evidence_cache: EvidenceCache = field(default_factory=EvidenceCache, repr=False, compare=False)
+    duplicates_dropped: int = field(default=0, init=False, compare=False)
+    _findings: List[Evidence] = field(default_factory=list, init=False, repr=False)
+    _by_agent: Dict[str, List[int]] = field(default_factory=dict, init=False, repr=False)
+    _by_risk: Dict[str, List[int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_source: Dict[str, List[int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_id: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False, compare=False)
 
     def set_entity(self, entity: Optional[Entity]) -> None:
         self.entity = entity
@@ -38,22 +118,67 @@ class InvestigationContext:
     def get_query(self) -> str:
         return self.query
 
-    def set_tasks(self, tasks: List[SubTask]) -> None:
-        self.tasks = tasks
-
-    def get_tasks(self) -> List[SubTask]:
-        return self.tasks.copy()
-
-    def add_agent_results(self, agent_id: str, findings: List[Evidence]) -> None:
-        if agent_id not in self.results:
-            self.results[agent_id] = []
-        self.results[agent_id].extend(findings)
-
-    def get_agent_results(self, agent_id: str) -> List[Evidence]:
-        return self.results.get(agent_id, []).copy()
-
-    def get_all_findings(self) -> List[Evidence]:
-        out: List[Evidence] = []
-        for findings in self.results.values():
-            out.extend(findings)
-        return out
+    def set_tasks(self, tasks: Sequence[SubTask]) -> None:
+        self.tasks = list(tasks)
+
+    def get_tasks(self) -> Sequence[SubTask]:
+        return ReadOnlyView(self.tasks)
+
+    def add_agent_results(self, agent_id: str, findings: Sequence[Evidence]) -> int:
+        """Append findings not already stored (by evidence_id); returns how many were added."""
+        with self._lock:
+            store, by_id = self._findings, self._by_id
+            agent_positions = self._by_agent.setdefault(agent_id, [])
+            added = 0
+            for e in findings:
+                if e.evidence_id in by_id:
+                    self.duplicates_dropped += 1
+                    continue
+                pos = by_id[e.evidence_id] = len(store)
+                store.append(e)
+                agent_positions.append(pos)
+                self._by_risk.setdefault(e.risk_category, []).append(pos)
+                self._by_source.setdefault(e.source_type, []).append(pos)
+                added += 1
+            return added
+
+    def _view(self, positions: Optional[List[int]]) -> Sequence[Evidence]:
+        with self._lock:
+            if positions is None:
+                return ReadOnlyView([])
+            return ReadOnlyView(self._findings, positions, len(positions))
+
+    @property
+    def results(self) -> Dict[str, Sequence[Evidence]]:
+        """agent_id -> read-only view of that agent's findings."""
+        with self._lock:
+            return {agent_id: self._view(positions) for agent_id, positions in self._by_agent.items()}
+
+    def get_agent_results(self, agent_id: str) -> Sequence[Evidence]:
+        return self._view(self._by_agent.get(agent_id))
+
+    def get_findings_by_risk(self, risk_category: str) -> Sequence[Evidence]:
+        return self._view(self._by_risk.get(risk_category))
+
+    def get_findings_by_source(self, source_type: str) -> Sequence[Evidence]:
+        return self._view(self._by_source.get(source_type))
+
+    def get_finding(self, evidence_id: str) -> Optional[Evidence]:
+        pos = self._by_id.get(evidence_id)
+        return self._findings[pos] if pos is not None else None
+
+    def add_task_failure(self, failure: TaskFailure) -> None:
+        with self._lock:
+            self.failures.append(failure)
+
+    def get_task_failures(self) -> Sequence[TaskFailure]:
+        with self._lock:
+            return ReadOnlyView(self.failures)
+
+    def iter_findings(self) -> Iterator[Evidence]:
+        """Stream all findings in the order they were added (as of the call)."""
+        return iter(self.get_all_findings())
+
+    def get_all_findings(self) -> Sequence[Evidence]:
+        with self._lock:
+            return ReadOnlyView(self._findings, None, len(self._findings))
@@ -0,0 +1,248 @@
+"""Task dispatcher: schedule sub-tasks as a dependency DAG on specialist agents.
+
+Each SubTask declares the data it consumes and produces. The dispatcher turns a
+task list into a DAG:
+
+- a task depends on every task that produces one of its consumed keys;
+- a consumed key nobody produces but a data fetcher can supply (e.g.
+  "source:sec_edgar") becomes one shared fetch node, so tasks needing the same
+  source wait on a single pull instead of each pulling it;
+- identical tasks are run once.
+
+Nodes run on a thread pool as soon as their dependencies have finished, so
+independent branches overlap and downstream work starts without idle time.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Union
+
+from osint_swarm.entities import Entity, Evidence
+
+from agents.lead_agent.context_manager import InvestigationContext, TaskFailure
+from agents.lead_agent.task_planner import SubTask
+
+
+AgentStub = Callable[[Entity, SubTask, InvestigationContext], List[Evidence]]
+# Supplies one data key (e.g. warms the evidence cache for a source); return value is ignored.
+DataFetcher = Callable[[Entity, InvestigationContext], Any]
+# Seconds per task: one value for all, or a task_type -> seconds map.
+TaskTimeout = Union[float, Mapping[str, float], None]
+# Receives LeadAgent events (agents.lead_agent.events); called from dispatcher threads.
+EventSink = Callable[[Any], None]
+
+_POLL_S = 0.05
+
+
+@dataclass
+class _Node:
+    node_id: int
+    label: str
+    run: Callable[[], Any]
+    task_index: Optional[int] = None  # index into tasks for task nodes; None for fetch nodes
+    timeout_s: Optional[float] = None
+    deps: Set[int] = field(default_factory=set)
+    dependents: Set[int] = field(default_factory=set)
+
+
+def _timeout_for(task: SubTask, task_timeout_s: TaskTimeout) -> Optional[float]:
+    if task_timeout_s is None:
+        return None
+    if isinstance(task_timeout_s, Mapping):
+        value = task_timeout_s.get(task.task_type, task_timeout_s.get(task.target_agent))
+        return float(value) if value is not None else None
+    return float(task_timeout_s)
+
+
+def _build_graph(
+    entity: Entity,
+    tasks: Sequence[SubTask],
+    stubs: Mapping[str, AgentStub],
+    context: InvestigationContext,
+    data_fetchers: Mapping[str, DataFetcher],
+    task_timeout_s: TaskTimeout,
+) -> Dict[int, _Node]:
+    nodes: Dict[int, _Node] = {}
+    first_seen: Dict[SubTask, int] = {}
+    producers: Dict[str, List[int]] = {}
+    for i, task in enumerate(tasks):
+        stub = stubs.get(task.target_agent)
+        if stub is None or task in first_seen:
+            continue  # no agent, or an identical task already scheduled
+        first_seen[task] = i
+        nodes[i] = _Node(
+            node_id=i,
+            label=task.task_type,
+            run=lambda stub=stub, task=task: stub(entity, task, context),
+            task_index=i,
+            timeout_s=_timeout_for(task, task_timeout_s),
+        )
+        for key in task.produces:
+            producers.setdefault(key, []).append(i)
+
+    fetch_nodes: Dict[str, int] = {}
+    for node in list(nodes.values()):
+        task = tasks[node.task_index]  # type: ignore[index]
+        for key in task.consumes:
+            deps = [p for p in producers.get(key, []) if p != node.node_id]
+            if not deps and key in data_fetchers:
+                if key not in fetch_nodes:
+                    fid = len(tasks) + len(fetch_nodes)
+                    fetcher = data_fetchers[key]
+                    nodes[fid] = _Node(fid, key, lambda fetcher=fetcher: fetcher(entity, context))
+                    fetch_nodes[key] = fid
+                deps = [fetch_nodes[key]]
+            node.deps.update(deps)
+    for node in nodes.values():
+        for dep in node.deps:
+            nodes[dep].dependents.add(node.node_id)
+    _check_acyclic(nodes)
+    return nodes
+
+
+def _check_acyclic(nodes: Mapping[int, _Node]) -> None:
+    indegree = {nid: len(n.deps) for nid, n in nodes.items()}
+    ready = [nid for nid, d in indegree.items() if d == 0]
+    visited = 0
+    while ready:
+        nid = ready.pop()
+        visited += 1
+        for dep in nodes[nid].dependents:
+            indegree[dep] -= 1
+            if indegree[dep] == 0:
+                ready.append(dep)
+    if visited != len(nodes):
+        stuck = sorted(nodes[nid].label for nid, d in indegree.items() if d > 0)
+        raise ValueError(f"Task dependency cycle among: {', '.join(stuck)}")
+
+
+def dispatch_tasks(
+    entity: Entity,
+    tasks: Sequence[SubTask],
+    stubs: Mapping[str, AgentStub],
+    context: InvestigationContext,
+    *,
+    max_parallel: Optional[int] = None,
+    task_timeout_s: TaskTimeout = None,
+    data_fetchers: Optional[Mapping[str, DataFetcher]] = None,
+    on_event: Optional[EventSink] = None,
+) -> List[TaskFailure]:
+    """
+    Run every task whose target_agent has a stub, in dependency order, at most
+    max_parallel nodes at a time.
+
+    Each task's timeout counts from when it starts running, not from when it was queued.
+    A task that raises or times out is recorded on the context as a TaskFailure; the
+    others are unaffected, and its dependents still run (they see whatever data exists).
+    Findings are added to the context as tasks finish, in task order (a finished task
+    waits for earlier ones), so results are deterministic. Timed-out tasks are abandoned,
+    not interrupted; their late findings are dropped. Fetch-node errors are ignored:
+    consumers fall back to fetching (or not finding) the data themselves.
+    on_event receives TaskStarted, FindingsBatch, TaskFailed and TaskCompleted as they
+    happen (completion order, not task order).
+    Raises ValueError if consumes/produces form a cycle.
+    """
+    from agents.lead_agent.events import FindingsBatch, TaskCompleted, TaskFailed, TaskStarted
+
+    emit: EventSink = on_event or (lambda event: None)
+    failures: List[TaskFailure] = []
+    nodes = _build_graph(entity, tasks, stubs, context, data_fetchers or {}, task_timeout_s)
+    if not nodes:
+        return failures
+
+    started: Dict[int, float] = {}
+    started_lock = threading.Lock()
+
+    def _run(node: _Node) -> Any:
+        with started_lock:
+            started[node.node_id] = time.monotonic()
+        if node.task_index is not None:
+            emit(TaskStarted(tasks[node.task_index]))
+        return node.run()
+
+    outcomes: Dict[int, Optional[List[Evidence]]] = {}  # None = failed
+    order = sorted(nid for nid, n in nodes.items() if n.task_index is not None)
+    next_to_commit = 0
+
+    def _commit_ready() -> None:
+        nonlocal next_to_commit
+        while next_to_commit < len(order) and order[next_to_commit] in outcomes:
+            i = order[next_to_commit]
+            findings = outcomes[i]
+            if findings is not None:
+                context.add_agent_results(tasks[i].target_agent, findings)
+            next_to_commit += 1
+
+    def _fail(i: int, reason: str, message: str) -> None:
+        failure = TaskFailure(tasks[i], reason, message)
+        failures.append(failure)
+        context.add_task_failure(failure)
+        outcomes[i] = None
+        emit(TaskFailed(failure))
+
+    remaining = {nid: len(n.deps) for nid, n in nodes.items()}
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, max_parallel or len(nodes)),
+        thread_name_prefix="lead-dispatch",
+    )
+    futures: Dict["Future[Any]", int] = {}
+    pending: Set["Future[Any]"] = set()
+
+    def _submit(nid: int) -> None:
+        fut = executor.submit(_run, nodes[nid])
+        futures[fut] = nid
+        pending.add(fut)
+
+    def _finished(nid: int) -> None:
+        for dep in sorted(nodes[nid].dependents):
+            remaining[dep] -= 1
+            if remaining[dep] == 0:
+                _submit(dep)
+
+    try:
+        for nid in sorted(nodes):
+            if remaining[nid] == 0:
+                _submit(nid)
+        while pending:
+            now = time.monotonic()
+            with started_lock:
+                deadlines = {
+                    fut: started[futures[fut]] + nodes[futures[fut]].timeout_s  # type: ignore[operator]
+                    for fut in pending
+                    if futures[fut] in started and nodes[futures[fut]].timeout_s is not None
+                }
+            for fut in [f for f, d in deadlines.items() if d <= now and not f.done()]:
+                pending.discard(fut)
+                nid = futures[fut]
+                _fail(nid, "timeout", f"no result after {nodes[nid].timeout_s:.2f}s")
+                _finished(nid)
+            _commit_ready()
+            if not pending:
+                break
+            upcoming = [d for f, d in deadlines.items() if f in pending]
+            wait_s: Optional[float] = max(0.0, min(upcoming) - now) if upcoming else None
+            # Queued tasks have no deadline until they start; poll so their clock is picked up.
+            if any(f not in deadlines and nodes[futures[f]].timeout_s is not None for f in pending):
+                wait_s = min(wait_s, _POLL_S) if wait_s is not None else _POLL_S
+            done, _ = wait(set(pending), timeout=wait_s, return_when=FIRST_COMPLETED)
+            for fut in sorted(done, key=lambda f: futures[f]):
+                pending.discard(fut)
+                nid = futures[fut]
+                exc = fut.exception()
+                if nodes[nid].task_index is not None:
+                    if exc is not None:
+                        _fail(nid, "error", str(exc) or type(exc).__name__)
+                    else:
+                        findings = outcomes[nid] = list(fut.result() or [])
+                        task = tasks[nid]
+                        emit(FindingsBatch(task, task.target_agent, findings))
+                        emit(TaskCompleted(task, len(findings), round(time.monotonic() - started[nid], 4)))
+                _finished(nid)
+            _commit_ready()
+    finally:
+        executor.shutdown(wait=False)
+    return failures
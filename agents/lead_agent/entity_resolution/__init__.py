@@ -1,9 +1,37 @@
 """Entity resolution: query string -> Entity candidates."""
 
-from agents.lead_agent.entity_resolution.resolver import (
+from agents.lead_agent.entity_resolution.fuzzy import FuzzyHit, FuzzyNameIndex, jaro_winkler
+from agents.lead_agent.entity_resolution.index import EntityIndex, NameMatch, Resolution
+from agents.lead_agent.entity_resolution.normalize import normalize_name
+from agents.lead_agent.entity_resolution.registry import (
     ENTITY_REGISTRY,
+    EntityRegistry,
+    get_default_registry,
+    load_entities_csv,
+    set_default_registry,
+)
+from agents.lead_agent.entity_resolution.resolver import (
+    get_index,
     resolve,
+    resolve_detailed,
     resolve_one,
 )
 
-__all__ = ["ENTITY_REGISTRY", "resolve", "resolve_one"]
+__all__ = [
+    "ENTITY_REGISTRY",
+    "EntityIndex",
+    "EntityRegistry",
+    "FuzzyHit",
+    "FuzzyNameIndex",
+    "NameMatch",
+    "Resolution",
+    "get_default_registry",
+    "get_index",
+    "jaro_winkler",
+    "load_entities_csv",
+    "normalize_name",
+    "resolve",
+    "resolve_detailed",
+    "resolve_one",
+    "set_default_registry",
+]
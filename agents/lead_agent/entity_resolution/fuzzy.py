@@ -0,0 +1,253 @@
+"""Fuzzy entity resolution: typo-tolerant candidate generation and ranking.
+
+Registry names and aliases are reduced to a fuzzy key (normalized, legal suffixes
+like "Inc" dropped) and split into padded character trigrams. Candidate names for
+a query window come from a trigram inverted index (or, optionally, MinHash LSH
+buckets), so only names sharing enough trigrams with the query are ever scored.
+Candidates scoring at least the Jaro-Winkler threshold are kept and ranked by
+the number of query tokens they explain, then by similarity.
+
+Queries are matched window by window (1..MAX_WINDOW_TOKENS consecutive tokens), so
+"Investigate Tesler for fraud" finds "tesla" through the window "tesler". Windows
+never include query words ("investigate", "company", "money laundering"), which
+would otherwise fuzzy-match real issuers (Investview, MoneyLion). A single-token
+window must also be about as long as the name it matches and clear
+SINGLE_TOKEN_THRESHOLD. Hits rank by similarity, discounted for windows that
+cover only part of the surrounding words, then by window length.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from agents.lead_agent.entity_resolution.normalize import normalize_name
+
+
+LEGAL_SUFFIXES = frozenset(
+    {"inc", "incorporated", "corp", "corporation", "co", "company", "ltd", "limited", "llc", "plc", "lp", "sa", "ag", "nv"}
+)
+DEFAULT_THRESHOLD = 0.85
+MAX_WINDOW_TOKENS = 4
+MIN_WINDOW_CHARS = 4  # "for" must not fuzzy-match "Ford"
+MIN_DICE = 0.3  # trigram overlap a candidate needs before it is scored
+MAX_CANDIDATES = 25  # per window, by trigram overlap
+MAX_DF = 0.05  # trigrams in more than this share of names do not generate candidates
+SINGLE_TOKEN_THRESHOLD = 0.88
+COVERAGE_WEIGHT = 0.25  # rank discount for a window covering none of its run (see _rank)
+MIN_SINGLE_TOKEN_LENGTH_RATIO = 0.8  # shorter/longer of a one-token window and the name it matches
+# Command, filler and planner words: never part of a fuzzy window.
+QUERY_STOPWORDS = frozenset(
+    {
+        "a", "about", "adverse", "aml", "an", "analyse", "analyze", "and", "anti", "any", "at", "audit", "background",
+        "beneficial", "bribery", "by", "check", "company", "companies", "compliance", "controls", "corporation",
+        "corruption", "crime", "diligence", "due", "entity", "exposed", "exposure", "filings", "find", "firm",
+        "for", "fraud", "from", "in", "into", "investigate", "investigation", "is", "laundering", "lawsuits",
+        "litigation", "look", "media", "money", "network", "news", "now", "of", "ofac", "on", "or", "owner",
+        "ownership", "pattern", "patterns", "pep", "politically", "probe", "proceeds", "research", "review",
+        "risk", "risks", "sanctions", "screen", "search", "shell", "show", "target", "that", "the", "to",
+        "transaction", "transactions", "what", "who", "with",
+    }
+)
+_MERSENNE = (1 << 61) - 1
+
+
+def fuzzy_key(text: str) -> str:
+    """normalize_name without a leading "the" or trailing legal suffixes ("Tesla, Inc." -> "tesla")."""
+    tokens = normalize_name(text).split(" ")
+    if tokens and tokens[0] == "the":
+        tokens = tokens[1:]
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        tokens.pop()
+    return " ".join(t for t in tokens if t)
+
+
+def trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def jaro_winkler(a: str, b: str, prefix_scale: float = 0.1) -> float:
+    """Jaro-Winkler similarity in [0, 1] (1 = identical)."""
+    if a == b:
+        return 1.0
+    la, lb = len(a), len(b)
+    if not la or not lb:
+        return 0.0
+    window = max(la, lb) // 2 - 1
+    b_used = [False] * lb
+    a_matched: List[str] = []
+    for i, ch in enumerate(a):
+        for j in range(max(0, i - window), min(lb, i + window + 1)):
+            if not b_used[j] and b[j] == ch:
+                b_used[j] = True
+                a_matched.append(ch)
+                break
+    m = len(a_matched)
+    if not m:
+        return 0.0
+    b_matched = [b[j] for j in range(lb) if b_used[j]]
+    transpositions = sum(x != y for x, y in zip(a_matched, b_matched)) / 2
+    jaro = (m / la + m / lb + (m - transpositions) / m) / 3
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * prefix_scale * (1 - jaro)
+
+
+class _MinHashLSH:
+    """Banded MinHash over trigram sets: names sharing any band bucket are candidates."""
+
+    def __init__(self, num_perm: int, bands: int):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.rows = num_perm // bands
+        self.bands = bands
+        # Deterministic (a, b) pairs for the universal hashes (a*x + b) mod p.
+        self._perms = [(2 * i + 1 + (i << 33), (i * 0x9E3779B97F4A7C15) & 0xFFFFFFFF) for i in range(num_perm)]
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+
+    def signature(self, grams: Iterable[str]) -> List[int]:
+        hashes = [zlib.crc32(g.encode("utf-8")) for g in grams]
+        return [min((a * h + b) % _MERSENNE for h in hashes) for a, b in self._perms]
+
+    def _bands(self, grams: Iterable[str]) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        sig = self.signature(grams)
+        for band in range(self.bands):
+            yield band, tuple(sig[band * self.rows : (band + 1) * self.rows])
+
+    def add(self, name_id: int, grams: Set[str]) -> None:
+        for key in self._bands(grams):
+            self._buckets.setdefault(key, []).append(name_id)
+
+    def query(self, grams: Set[str]) -> Set[int]:
+        out: Set[int] = set()
+        for key in self._bands(grams):
+            out.update(self._buckets.get(key, ()))
+        return out
+
+
+@dataclass(frozen=True)
+class FuzzyHit:
+    """Best fuzzy match for one entity: the registry name key, the query window and the score."""
+
+    entity_idx: int
+    name: str
+    window: str
+    score: float
+
+
+class FuzzyNameIndex:
+    """
+    Trigram (optionally MinHash LSH) candidate index over registry names.
+
+    names: (text, entity indexes) pairs, typically every name and alias.
+    """
+
+    def __init__(
+        self,
+        names: Iterable[Tuple[str, Sequence[int]]],
+        *,
+        use_minhash: bool = False,
+        num_perm: int = 32,
+        bands: int = 16,
+    ):
+        self._keys: List[str] = []
+        self._grams: List[int] = []  # trigram count per name
+        self._entities: List[Tuple[int, ...]] = []
+        key_ids: Dict[str, int] = {}
+        for text, entity_idxs in names:
+            key = fuzzy_key(text)
+            if not key:
+                continue
+            nid = key_ids.get(key)
+            if nid is None:
+                nid = key_ids[key] = len(self._keys)
+                self._keys.append(key)
+                self._grams.append(len(trigrams(key)))
+                self._entities.append(())
+            self._entities[nid] = tuple(dict.fromkeys(self._entities[nid] + tuple(entity_idxs)))
+
+        self._postings: Dict[str, List[int]] = {}
+        for nid, key in enumerate(self._keys):
+            for g in trigrams(key):
+                self._postings.setdefault(g, []).append(nid)
+        self._max_df = max(50, int(MAX_DF * len(self._keys)))
+        self._lsh: Optional[_MinHashLSH] = None
+        if use_minhash:
+            self._lsh = _MinHashLSH(num_perm, bands)
+            for nid, key in enumerate(self._keys):
+                self._lsh.add(nid, trigrams(key))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _candidates(self, grams: Set[str]) -> List[int]:
+        """Name ids with trigram Dice >= MIN_DICE, best overlap first."""
+        if self._lsh is not None:
+            pool = self._lsh.query(grams)
+            shared = Counter({nid: len(grams & trigrams(self._keys[nid])) for nid in pool})
+        else:
+            shared = Counter()
+            for g in grams:
+                posting = self._postings.get(g)
+                if posting and len(posting) <= self._max_df:
+                    shared.update(posting)
+        n = len(grams)
+        scored = [(2 * c / (n + self._grams[nid]), nid) for nid, c in shared.items()]
+        scored = [s for s in scored if s[0] >= MIN_DICE]
+        scored.sort(reverse=True)
+        return [nid for _, nid in scored[:MAX_CANDIDATES]]
+
+    def search(self, query: str, *, threshold: float = DEFAULT_THRESHOLD, limit: int = 10) -> List[FuzzyHit]:
+        """Entities whose name is similar to some window of the query, best first."""
+        windows: Dict[str, float] = {}  # window -> share of its run's characters it covers
+        for run in _content_runs(normalize_name(query).split(" ")):
+            run_chars = len(" ".join(run))
+            for size in range(1, MAX_WINDOW_TOKENS + 1):
+                for start in range(len(run) - size + 1):
+                    window = fuzzy_key(" ".join(run[start : start + size]))
+                    if len(window) >= MIN_WINDOW_CHARS:
+                        windows[window] = max(windows.get(window, 0.0), min(1.0, len(window) / run_chars))
+
+        best: Dict[int, FuzzyHit] = {}
+        ranks: Dict[int, Tuple[float, int]] = {}
+        for window, coverage in windows.items():
+            single = " " not in window
+            for nid in self._candidates(trigrams(window)):
+                key = self._keys[nid]
+                if single and min(len(window), len(key)) < MIN_SINGLE_TOKEN_LENGTH_RATIO * max(len(window), len(key)):
+                    continue
+                score = round(jaro_winkler(window, key), 4)
+                if score < (max(threshold, SINGLE_TOKEN_THRESHOLD) if single else threshold):
+                    continue
+                hit_rank = _rank(window, score, coverage)
+                for e in self._entities[nid]:
+                    if e not in best or hit_rank < ranks[e]:
+                        best[e] = FuzzyHit(e, key, window, score)
+                        ranks[e] = hit_rank
+        return sorted(best.values(), key=lambda h: (ranks[h.entity_idx], h.entity_idx))[:limit]
+
+
+def _content_runs(tokens: Sequence[str]) -> List[List[str]]:
+    """Maximal runs of tokens between QUERY_STOPWORDS."""
+    runs: List[List[str]] = [[]]
+    for tok in tokens:
+        if tok in QUERY_STOPWORDS:
+            if runs[-1]:
+                runs.append([])
+        elif tok:
+            runs[-1].append(tok)
+    return [r for r in runs if r]
+
+
+def _rank(window: str, score: float, coverage: float) -> Tuple[float, int]:
+    """
+    Similarity, discounted when the window covers only part of its run of query words
+    ("aple" in "aple hospitality"), then the longer window.
+    """
+    return -round(score * (1 - COVERAGE_WEIGHT * (1 - coverage)), 4), -(window.count(" ") + 1)
@@ -0,0 +1,267 @@
+"""Entity resolution index: exact-match maps plus an Aho-Corasick automaton over name tokens.
+
+Names, aliases, tickers and CIKs are normalized into token sequences
+("Tesla, Inc." -> ("tesla", "inc"); CIK "0001318605" -> ("1318605",)).
+
+- A query that *is* a name/alias/ticker/CIK is answered from a hash map. Names
+  also match without their legal suffix ("Apple" for "Apple Inc.").
+- Names mentioned inside a longer query ("Investigate Tesla Motors for fraud") are
+  found in one left-to-right pass over the query tokens with a word-level
+  Aho-Corasick automaton, so the cost depends on the query length, not the
+  registry size. Overlapping hits are reduced to the longest, leftmost spans.
+- A query that is the start of a longer name ("tesla mot") is found by binary
+  search over the sorted names.
+
+Tickers only match inside a longer query when written in upper case, so short
+tickers ("ON", "ALL") do not fire on ordinary words. Likewise a short name
+("NOW INC." -> "now", "TARGET CORP" -> "target") only matches inside a longer
+query when it is capitalized or spans several tokens, and mentions of real
+names and aliases rank before short-name mentions. When nothing matches, the
+typo-tolerant FuzzyNameIndex (entity_resolution.fuzzy) is the last resort.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from osint_swarm.entities import Entity
+
+from agents.lead_agent.entity_resolution.fuzzy import DEFAULT_THRESHOLD, FuzzyNameIndex, fuzzy_key
+from agents.lead_agent.entity_resolution.normalize import name_tokens, normalize_name
+
+
+MIN_PREFIX_LEN = 3  # shorter partial queries would match too many names
+MAX_PREFIX_MATCHES = 20
+
+
+@dataclass(frozen=True)
+class NameMatch:
+    """One name/alias/ticker/CIK found in a query (token span [start, end))."""
+
+    term: str
+    start: int
+    end: int
+    entities: Tuple[Entity, ...]
+    short_name: bool = False  # matched only through a name without its legal suffix
+
+    @property
+    def ambiguous(self) -> bool:
+        return len(self.entities) > 1
+
+
+@dataclass(frozen=True)
+class Resolution:
+    """
+    Resolution of one query: candidates best-first, plus how they were found.
+
+    match_type: "exact" (the whole query is a name/alias/ticker/CIK), "mention"
+    (names found inside the query), "prefix" (the query starts a name), "fuzzy"
+    (similar names; scores holds each candidate's similarity) or "none".
+    ambiguous is True when the best match points at more than one entity.
+    """
+
+    query: str
+    candidates: List[Entity]
+    match_type: str
+    matches: Tuple[NameMatch, ...] = ()
+    scores: Tuple[float, ...] = ()
+
+    @property
+    def ambiguous(self) -> bool:
+        if self.match_type == "mention":
+            return self.matches[0].ambiguous
+        if self.match_type == "fuzzy":
+            return len(self.scores) > 1 and self.scores[0] == self.scores[1]
+        return len(self.candidates) > 1
+
+
+class EntityIndex:
+    """
+    Immutable resolution index over a list of entities; build once, query from any thread.
+
+    All state is plain lists, dicts and tuples, so a pickled index loads quickly.
+    fuzzy_threshold: minimum Jaro-Winkler similarity for the fuzzy fallback (None disables it);
+    use_minhash: generate fuzzy candidates with MinHash LSH instead of the trigram postings.
+    """
+
+    def __init__(
+        self,
+        entities: Sequence[Entity],
+        *,
+        fuzzy_threshold: Optional[float] = DEFAULT_THRESHOLD,
+        use_minhash: bool = False,
+    ):
+        self.entities: Sequence[Entity] = entities if isinstance(entities, Sequence) else list(entities)
+        self.fuzzy_threshold = fuzzy_threshold
+        # Parallel per-term arrays, indexed by term id.
+        self._term_texts: List[str] = []
+        self._text_entities: List[Any] = []  # names, aliases, CIKs: match in any case
+        self._ticker_entities: List[Any] = []  # tickers: match in a longer query only when upper case
+        self._short_entities: List[Any] = []  # names without legal suffix: in a longer query only when capitalized or multi-token
+        self._term_ids: Dict[str, int] = {}
+        for i, entity in enumerate(self.entities):
+            for text in [entity.name, *entity.aliases]:
+                self._add(text, i)
+            cik = entity.identifiers.get("cik")
+            if cik:
+                self._add(cik, i)
+            tickers = [entity.identifiers.get("ticker", ""), *entity.identifiers.get("tickers", "").split(",")]
+            for ticker in filter(None, tickers):
+                self._add(ticker, i, ticker=True)
+        # Short names ("Apple Inc." -> "apple") rank after every real name and alias.
+        for i, entity in enumerate(self.entities):
+            self._add(fuzzy_key(entity.name), i, short=True)
+        # Freeze buckets; empty ones share the () singleton.
+        self._text_entities = [tuple(b) for b in self._text_entities]
+        self._ticker_entities = [tuple(b) for b in self._ticker_entities]
+        self._short_entities = [tuple(b) for b in self._short_entities]
+        named = [tid for tid in range(len(self._term_texts)) if self._text_entities[tid] or self._short_entities[tid]]
+        self._sorted_names = sorted(self._term_texts[tid] for tid in named)
+        self._build_automaton()
+        self.fuzzy: Optional[FuzzyNameIndex] = None
+        if fuzzy_threshold is not None:
+            self.fuzzy = FuzzyNameIndex(
+                ((self._term_texts[tid], self._text_entities[tid]) for tid in named if not self._term_texts[tid].isdigit()),
+                use_minhash=use_minhash,
+            )
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def _add(self, text: str, entity_idx: int, *, ticker: bool = False, short: bool = False) -> None:
+        key = normalize_name(text)
+        if not key:
+            return
+        tid = self._term_ids.get(key)
+        if tid is None:
+            tid = self._term_ids[key] = len(self._term_texts)
+            self._term_texts.append(key)
+            self._text_entities.append([])
+            self._ticker_entities.append([])
+            self._short_entities.append([])
+        bucket = self._ticker_entities[tid] if ticker else self._short_entities[tid] if short else self._text_entities[tid]
+        if short and entity_idx in self._text_entities[tid]:
+            return
+        if entity_idx not in bucket:
+            bucket.append(entity_idx)
+
+    def _build_automaton(self) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        out: List[Tuple[int, ...]] = [()]
+        for tid, text in enumerate(self._term_texts):
+            state = 0
+            for tok in text.split(" "):
+                nxt = goto[state].get(tok)
+                if nxt is None:
+                    nxt = goto[state][tok] = len(goto)
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] += (tid,)
+
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:  # breadth-first; queue grows while iterating
+            for tok, nxt in goto[state].items():
+                queue.append(nxt)
+                if state:
+                    f = fail[state]
+                    while f and tok not in goto[f]:
+                        f = fail[f]
+                    fail[nxt] = goto[f].get(tok, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+        self._goto, self._fail, self._out = goto, fail, out
+
+    def _entities(self, idxs: Iterable[int]) -> Tuple[Entity, ...]:
+        return tuple(self.entities[i] for i in idxs)
+
+    def lookup(self, text: str) -> List[Entity]:
+        """Entities whose name, alias, ticker or CIK equals text (after normalization)."""
+        tid = self._term_ids.get(normalize_name(text))
+        if tid is None:
+            return []
+        return list(self._entities(dict.fromkeys(self._text_entities[tid] + self._short_entities[tid] + self._ticker_entities[tid])))
+
+    def find_mentions(self, query: str) -> List[NameMatch]:
+        """
+        Every indexed name in the query, reduced to non-overlapping longest (then leftmost)
+        spans; name and alias mentions come before short-name-only mentions.
+        """
+        raw = name_tokens(query)
+        tokens = [t.lower() for t in raw]
+        goto, fail, out = self._goto, self._fail, self._out
+        hits: List[Tuple[int, int, int]] = []  # (start, end, term id)
+        state = 0
+        for i, tok in enumerate(tokens):
+            while state and tok not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(tok, 0)
+            for tid in out[state]:
+                n = self._term_texts[tid].count(" ") + 1
+                hits.append((i + 1 - n, i + 1, tid))
+
+        matches: List[NameMatch] = []
+        taken: Set[int] = set()
+        for start, end, tid in sorted(hits, key=lambda h: (h[0] - h[1], h[0])):
+            span = range(start, end)
+            if any(p in taken for p in span):
+                continue
+            idxs = list(self._text_entities[tid])
+            tickers = self._ticker_entities[tid]
+            if tickers and all(raw[p].isupper() for p in span):
+                idxs.extend(i for i in tickers if i not in idxs)
+            short_only = not idxs
+            shorts = self._short_entities[tid]
+            if shorts and (end - start > 1 or all(raw[p][:1].isupper() for p in span)):
+                idxs.extend(i for i in shorts if i not in idxs)
+            if not idxs:
+                continue
+            taken.update(span)
+            matches.append(NameMatch(self._term_texts[tid], start, end, self._entities(idxs), short_name=short_only))
+        matches.sort(key=lambda m: m.short_name)  # stable: keeps longest-then-leftmost within each group
+        return matches
+
+    def prefix_matches(self, query: str, limit: int = MAX_PREFIX_MATCHES) -> List[Entity]:
+        """Entities with a name/alias that starts with the (normalized) query."""
+        key = normalize_name(query)
+        if len(key) < MIN_PREFIX_LEN:
+            return []
+        names = self._sorted_names
+        found: Dict[int, None] = {}
+        pos = bisect_left(names, key)
+        while pos < len(names) and names[pos].startswith(key) and len(found) < limit:
+            tid = self._term_ids[names[pos]]
+            for i in self._text_entities[tid] + self._short_entities[tid]:
+                found[i] = None
+            pos += 1
+        return list(self._entities(list(found)[:limit]))
+
+    def resolve(self, query: str) -> Resolution:
+        """Exact match, else longest mentions, else name prefix, else fuzzy (typo-tolerant) match."""
+        if not normalize_name(query):
+            return Resolution(query, [], "none")
+        exact = self.lookup(query)
+        if exact:
+            return Resolution(query, exact, "exact")
+        matches = self.find_mentions(query)
+        if matches:
+            seen: Dict[str, Entity] = {}
+            for m in matches:
+                for e in m.entities:
+                    seen.setdefault(e.entity_id, e)
+            return Resolution(query, list(seen.values()), "mention", tuple(matches))
+        prefix = self.prefix_matches(query)
+        if prefix:
+            return Resolution(query, prefix, "prefix")
+        if self.fuzzy is not None and self.fuzzy_threshold is not None:
+            hits = self.fuzzy.search(query, threshold=self.fuzzy_threshold)
+            if hits:
+                return Resolution(
+                    query,
+                    [self.entities[h.entity_idx] for h in hits],
+                    "fuzzy",
+                    scores=tuple(h.score for h in hits),
+                )
+        return Resolution(query, [], "none")
@@ -0,0 +1,19 @@
+"""Name normalization shared by the exact and fuzzy resolution indexes."""
+
+from __future__ import annotations
+
+import re
+from typing import List
+
+
+_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+
+
+def name_tokens(text: str) -> List[str]:
+    """Original-case alphanumeric tokens; leading zeros dropped from numbers (CIKs)."""
+    return [(t.lstrip("0") or "0") if t.isdigit() else t for t in _TOKEN_RE.findall(text or "")]
+
+
+def normalize_name(text: str) -> str:
+    """Lower-case, punctuation-free, single-spaced form used for all index keys."""
+    return " ".join(t.lower() for t in name_tokens(text))
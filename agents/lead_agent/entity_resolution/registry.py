@@ -0,0 +1,348 @@
+"""Entity registry: curated entries plus issuers from local reference files, with a prebuilt snapshot.
+
+Sources (all optional) in data/reference/:
+
+- company_tickers_exchange.json / company_tickers.json: SEC's issuer lists
+  (scripts/build_entity_registry.py --fetch downloads them);
+- entities.csv: extra entities (entity_id,name,entity_type,cik,ticker,make,aliases).
+
+Entities are merged by entity_id and CIK (curated > CSV > SEC) and compiled, with
+their EntityIndex, into data/processed/entity_registry.pickle. Startup unpickles
+the snapshot instead of parsing and indexing tens of thousands of names. The
+snapshot records the size/mtime of every source file and the curated entries;
+when any of them changes the registry rebuilds on next use (checked at most every
+check_interval_s seconds).
+"""
+
+from __future__ import annotations
+
+import csv
+import pickle
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+from osint_swarm.data_sources.sec_edgar import iter_company_tickers, normalize_cik
+from osint_swarm.entities import Entity
+from osint_swarm.utils.io import read_json, write_bytes
+
+from agents.lead_agent.entity_resolution.index import EntityIndex
+from agents.lead_agent.entity_resolution.normalize import normalize_name
+
+
+DEFAULT_DATA_ROOT = Path(__file__).resolve().parents[3] / "data"
+REFERENCE_DIR_NAME = "reference"
+SEC_TICKER_FILES = ("company_tickers_exchange.json", "company_tickers.json")
+ENTITIES_CSV_NAME = "entities.csv"
+SNAPSHOT_NAME = "entity_registry.pickle"
+SNAPSHOT_VERSION = 2  # bump when EntityIndex state changes
+RELOAD_CHECK_S = 2.0
+IDENTIFIER_COLUMNS = ("cik", "ticker", "make")
+
+
+# Curated entries: always present, and they win over loaded data for the same entity/CIK.
+ENTITY_REGISTRY: List[Entity] = [
+    Entity(
+        entity_id="tesla_inc_cik_0001318605",
+        name="Tesla, Inc.",
+        entity_type="public_company",
+        identifiers={"cik": "0001318605", "ticker": "TSLA", "make": "TESLA"},
+        aliases=["Tesla", "Tesla Inc", "Tesla Motors", "TSLA"],
+    ),
+]
+
+
+def sec_entity_id(name: str, cik: str) -> str:
+    """Registry id for an SEC issuer, e.g. ("Tesla, Inc.", "1318605") -> "tesla_inc_cik_0001318605"."""
+    slug = normalize_name(name).replace(" ", "_") or "issuer"
+    return f"{slug}_cik_{normalize_cik(cik)}"
+
+
+def entities_from_sec_tickers(payload: Any) -> List[Entity]:
+    """One public_company Entity per CIK; extra share-class tickers go to identifiers["tickers"]."""
+    rows: Dict[str, Tuple[str, List[str], Optional[str]]] = {}
+    for cik10, name, ticker, exchange in iter_company_tickers(payload):
+        entry = rows.get(cik10)
+        if entry is None:
+            entry = rows[cik10] = (name, [], exchange)
+        if ticker and ticker not in entry[1]:
+            entry[1].append(ticker)
+    out: List[Entity] = []
+    for cik10, (name, tickers, exchange) in rows.items():
+        identifiers = {"cik": cik10}
+        if tickers:
+            identifiers["ticker"] = tickers[0]
+        if len(tickers) > 1:
+            identifiers["tickers"] = ",".join(tickers)
+        if exchange:
+            identifiers["exchange"] = sys.intern(str(exchange))
+        out.append(Entity(sec_entity_id(name, cik10), name or cik10, "public_company", identifiers=identifiers))
+    return out
+
+
+def load_entities_csv(path: Path) -> List[Entity]:
+    """Entities from a CSV with columns entity_id,name[,entity_type,cik,ticker,make,aliases]; aliases are |-separated."""
+    out: List[Entity] = []
+    with Path(path).open(newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            name = (row.get("name") or "").strip()
+            cik = (row.get("cik") or "").strip()
+            entity_id = (row.get("entity_id") or "").strip() or (f"cik_{cik.zfill(10)}" if cik else name.lower().replace(" ", "_"))
+            if not entity_id:
+                continue
+            out.append(
+                Entity(
+                    entity_id=entity_id,
+                    name=name or entity_id,
+                    entity_type=(row.get("entity_type") or "unknown").strip() or "unknown",  # type: ignore[arg-type]
+                    identifiers={k: row[k].strip() for k in IDENTIFIER_COLUMNS if (row.get(k) or "").strip()},
+                    aliases=[a.strip() for a in (row.get("aliases") or "").split("|") if a.strip()],
+                )
+            )
+    return out
+
+
+def _merge(preferred: Entity, other: Entity) -> Entity:
+    aliases = list(dict.fromkeys([*preferred.aliases, *other.aliases, *([other.name] if other.name != preferred.name else [])]))
+    return Entity(
+        entity_id=preferred.entity_id,
+        name=preferred.name,
+        entity_type=preferred.entity_type if preferred.entity_type != "unknown" else other.entity_type,
+        country=preferred.country or other.country,
+        jurisdiction=preferred.jurisdiction or other.jurisdiction,
+        identifiers={**other.identifiers, **preferred.identifiers},
+        aliases=aliases,
+    )
+
+
+def merge_entities(groups: Sequence[Iterable[Entity]]) -> List[Entity]:
+    """Merge entity groups, highest precedence first; the same entity_id or CIK collapses to one entry."""
+    merged: List[Entity] = []
+    by_key: Dict[str, int] = {}
+    for group in groups:
+        for e in group:
+            cik = e.identifiers.get("cik", "")
+            keys = [f"id:{e.entity_id}"] + ([f"cik:{normalize_cik(cik)}"] if cik.isdigit() else [])
+            pos = next((by_key[k] for k in keys if k in by_key), None)
+            if pos is None:
+                pos = len(merged)
+                merged.append(e)
+            else:
+                merged[pos] = _merge(merged[pos], e)
+            for k in keys:
+                by_key.setdefault(k, pos)
+    return merged
+
+
+_EntityRow = Tuple[str, str, str, Optional[str], Optional[str], Tuple[Tuple[str, str], ...], Tuple[str, ...]]
+
+
+class EntityTable(Sequence[Entity]):
+    """
+    Entities stored as plain tuples and turned into Entity objects on access.
+
+    Tuples of strings pickle and unpickle in C, so a snapshot of tens of thousands
+    of issuers loads quickly, and only the entities a caller touches become objects.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, entities: Iterable[Entity] = ()):
+        self._rows: List[_EntityRow] = [
+            (
+                e.entity_id,
+                e.name,
+                sys.intern(e.entity_type),
+                e.country,
+                e.jurisdiction,
+                tuple(e.identifiers.items()),
+                tuple(e.aliases),
+            )
+            for e in entities
+        ]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @overload
+    def __getitem__(self, i: int) -> Entity: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> List[Entity]: ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[Entity, List[Entity]]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        entity_id, name, entity_type, country, jurisdiction, identifiers, aliases = self._rows[i]
+        return Entity(entity_id, name, entity_type, country, jurisdiction, dict(identifiers), list(aliases))  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[Entity]:
+        for i in range(len(self._rows)):
+            yield self[i]
+
+    def __getstate__(self) -> List[_EntityRow]:
+        return self._rows
+
+    def __setstate__(self, rows: List[_EntityRow]) -> None:
+        self._rows = rows
+
+
+@dataclass
+class RegistrySnapshot:
+    """What the snapshot file holds: the merged entities, their index, and the inputs they came from."""
+
+    version: int
+    signature: Tuple[Any, ...]
+    entities: EntityTable
+    index: EntityIndex
+    by_id: Dict[str, int]
+    by_cik: Dict[str, int]
+
+
+class EntityRegistry:
+    """
+    Lazily loaded registry; thread-safe. Use .entities, .index, .get() and .find_by_cik().
+
+    data_root: data directory holding reference/ (sources) and processed/ (snapshot).
+    curated: highest-precedence entries (default: ENTITY_REGISTRY, re-read on each check).
+    """
+
+    def __init__(
+        self,
+        data_root: Optional[Path] = None,
+        *,
+        curated: Optional[List[Entity]] = None,
+        snapshot_path: Optional[Path] = None,
+        check_interval_s: float = RELOAD_CHECK_S,
+    ):
+        self.data_root = Path(data_root) if data_root else DEFAULT_DATA_ROOT
+        self.reference_dir = self.data_root / REFERENCE_DIR_NAME
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else self.data_root / "processed" / SNAPSHOT_NAME
+        self.check_interval_s = check_interval_s
+        self._curated = curated
+        self._lock = threading.Lock()
+        self._snapshot: Optional[RegistrySnapshot] = None
+        self._checked_at = 0.0
+
+    @property
+    def curated(self) -> List[Entity]:
+        return self._curated if self._curated is not None else ENTITY_REGISTRY
+
+    def source_paths(self) -> List[Path]:
+        names = [*SEC_TICKER_FILES, ENTITIES_CSV_NAME]
+        return [p for p in (self.reference_dir / n for n in names) if p.exists()]
+
+    def signature(self) -> Tuple[Any, ...]:
+        """Identity of the current inputs: (name, size, mtime_ns) per source file plus the curated entries."""
+        files = []
+        for p in self.source_paths():
+            st = p.stat()
+            files.append((p.name, st.st_size, st.st_mtime_ns))
+        curated = tuple((e.entity_id, e.name, tuple(e.aliases), tuple(sorted(e.identifiers.items()))) for e in self.curated)
+        return (tuple(files), curated)
+
+    def _snapshot_now(self) -> RegistrySnapshot:
+        snap = self._snapshot
+        now = time.monotonic()
+        if snap is not None and now - self._checked_at < self.check_interval_s:
+            return snap
+        with self._lock:
+            if self._snapshot is not None and now - self._checked_at < self.check_interval_s:
+                return self._snapshot
+            sig = self.signature()
+            if self._snapshot is None or self._snapshot.signature != sig:
+                self._snapshot = self._load(sig)
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def _load(self, sig: Tuple[Any, ...]) -> RegistrySnapshot:
+        if self.snapshot_path.exists():
+            try:
+                with self.snapshot_path.open("rb") as f:
+                    snap = pickle.load(f)
+                if isinstance(snap, RegistrySnapshot) and snap.version == SNAPSHOT_VERSION and snap.signature == sig:
+                    return snap
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+                pass  # stale or unreadable snapshot: rebuild
+        snap = self.build(sig)
+        if sig[0]:  # only worth persisting when reference files exist
+            write_bytes(self.snapshot_path, pickle.dumps(snap, protocol=pickle.HIGHEST_PROTOCOL))
+        return snap
+
+    def build(self, sig: Optional[Tuple[Any, ...]] = None) -> RegistrySnapshot:
+        """Parse the sources and index them (no snapshot I/O)."""
+        sig = sig if sig is not None else self.signature()
+        csv_path = self.reference_dir / ENTITIES_CSV_NAME
+        sec: List[Entity] = []
+        for name in SEC_TICKER_FILES:
+            path = self.reference_dir / name
+            if path.exists():
+                sec = entities_from_sec_tickers(read_json(path))
+                break  # the exchange file is a superset of company_tickers.json
+        groups = [list(self.curated), load_entities_csv(csv_path) if csv_path.exists() else [], sec]
+        entities = EntityTable(merge_entities(groups))
+        by_cik: Dict[str, int] = {}
+        by_id: Dict[str, int] = {}
+        for i, e in enumerate(entities):
+            by_id[e.entity_id] = i
+            cik = e.identifiers.get("cik", "")
+            if cik.isdigit():
+                by_cik.setdefault(normalize_cik(cik), i)
+        return RegistrySnapshot(
+            version=SNAPSHOT_VERSION,
+            signature=sig,
+            entities=entities,
+            index=EntityIndex(entities),
+            by_id=by_id,
+            by_cik=by_cik,
+        )
+
+    def reload(self) -> None:
+        """Re-check the sources now (instead of at the next interval)."""
+        with self._lock:
+            self._checked_at = 0.0
+        self._snapshot_now()
+
+    @property
+    def entities(self) -> Sequence[Entity]:
+        return self._snapshot_now().entities
+
+    @property
+    def index(self) -> EntityIndex:
+        return self._snapshot_now().index
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def get(self, entity_id: str) -> Optional[Entity]:
+        snap = self._snapshot_now()
+        i = snap.by_id.get(entity_id)
+        return snap.entities[i] if i is not None else None
+
+    def find_by_cik(self, cik: str) -> Optional[Entity]:
+        snap = self._snapshot_now()
+        i = snap.by_cik.get(normalize_cik(cik)) if str(cik).strip().isdigit() else None
+        return snap.entities[i] if i is not None else None
+
+
+_default_registry: Optional[EntityRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_default_registry() -> EntityRegistry:
+    """Process-wide registry over the project's data/ directory (created on first use)."""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = EntityRegistry()
+        return _default_registry
+
+
+def set_default_registry(registry: Optional[EntityRegistry]) -> None:
+    """Replace the shared registry (e.g. another data root); None resets to a fresh default."""
+    global _default_registry
+    with _default_registry_lock:
+        _default_registry = registry
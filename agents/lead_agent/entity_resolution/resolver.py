@@ -6,48 +6,29 @@ from typing import List, Optional
 
 from osint_swarm.entities import Entity
 
+from agents.lead_agent.entity_resolution.index import EntityIndex, Resolution
+from agents.lead_agent.entity_resolution.registry import get_default_registry
 
-# Lookup table: normalized name/alias -> Entity.
-# Expand with more entities as needed.
-ENTITY_REGISTRY: List[Entity] = [
-    Entity(
-        entity_id="tesla_inc_cik_0001318605",
-        name="Tesla, Inc.",
-        entity_type="public_company",
-        identifiers={"cik": "0001318605", "ticker": "TSLA", "make": "TESLA"},
-        aliases=["Tesla", "Tesla Inc", "Tesla Motors", "TSLA"],
-    ),
-]
 
+def get_index() -> EntityIndex:
+    """Resolution index of the default registry (prebuilt snapshot; reloads when its sources change)."""
+    return get_default_registry().index
 
-def _normalize(s: str) -> str:
-    return s.strip().lower() if s else ""
+
+def resolve_detailed(query: str) -> Resolution:
+    """Resolve with match details: match type, matched spans, and whether the result is ambiguous."""
+    return get_index().resolve(query or "")
 
 
 def resolve(query: str) -> List[Entity]:
     """
     Resolve a query string (e.g. 'Tesla', 'Investigate Tesla for money laundering') to candidates.
 
-    Uses a registry and alias match. Returns all entities whose name or any alias
-    appears in the query (case-insensitive), or when the query equals the name/alias.
+    Best first: an exact name/alias/ticker/CIK match; else every registry name
+    mentioned in the query (case-insensitive, whole words, longest span first);
+    else names that start with the query; else similar (misspelled) names.
     """
-    if not query or not query.strip():
-        return []
-    norm = _normalize(query)
-    if not norm:
-        return []
-    candidates: List[Entity] = []
-    for entity in ENTITY_REGISTRY:
-        name_norm = _normalize(entity.name)
-        if norm == name_norm or name_norm in norm or norm in name_norm:
-            candidates.append(entity)
-            continue
-        for alias in entity.aliases:
-            alias_norm = _normalize(alias)
-            if norm == alias_norm or alias_norm in norm or norm in alias_norm:
-                candidates.append(entity)
-                break
-    return candidates
+    return resolve_detailed(query).candidates
 
 
 def resolve_one(query: str) -> Optional[Entity]:
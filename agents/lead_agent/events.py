@@ -0,0 +1,82 @@
+"""Lead Agent events: emitted by LeadAgent.iter_run as the investigation progresses."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Union
+
+from osint_swarm.entities import Entity, Evidence
+
+from agents.lead_agent.context_manager import TaskFailure
+from agents.lead_agent.task_planner import SubTask
+
+if TYPE_CHECKING:
+    from agents.lead_agent.context_manager import InvestigationContext
+
+
+@dataclass(frozen=True)
+class EntityResolved:
+    """The query resolved to an entity (not emitted when resolution fails)."""
+
+    entity: Entity
+    kind: str = "entity_resolved"
+
+
+@dataclass(frozen=True)
+class TasksPlanned:
+    """Sub-tasks produced by the planner, before any of them run."""
+
+    tasks: List[SubTask]
+    kind: str = "tasks_planned"
+
+
+@dataclass(frozen=True)
+class TaskStarted:
+    task: SubTask
+    kind: str = "task_started"
+
+
+@dataclass(frozen=True)
+class FindingsBatch:
+    """Findings from one finished task, emitted as soon as the task returns."""
+
+    task: SubTask
+    agent_id: str
+    findings: List[Evidence]
+    kind: str = "findings_batch"
+
+
+@dataclass(frozen=True)
+class TaskFailed:
+    failure: TaskFailure
+    kind: str = "task_failed"
+
+
+@dataclass(frozen=True)
+class TaskCompleted:
+    """A task finished; restored=True means its findings came from a checkpoint instead of a run."""
+
+    task: SubTask
+    finding_count: int
+    elapsed_s: float
+    restored: bool = False
+    kind: str = "task_completed"
+
+
+@dataclass(frozen=True)
+class InvestigationCompleted:
+    """Last event: the populated context (same object LeadAgent.run returns)."""
+
+    context: "InvestigationContext"
+    kind: str = "investigation_completed"
+
+
+LeadAgentEvent = Union[
+    EntityResolved,
+    TasksPlanned,
+    TaskStarted,
+    FindingsBatch,
+    TaskFailed,
+    TaskCompleted,
+    InvestigationCompleted,
+]
@@ -2,17 +2,35 @@
 
 from __future__ import annotations
 
+import queue
+import threading
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Any, Dict, Iterator, Optional
 
-from osint_swarm.entities import Entity, Evidence
+from osint_swarm.entities import Entity
 
-from agents.lead_agent.context_manager import InvestigationContext
-from agents.lead_agent.entity_resolution import resolve_one
-from agents.lead_agent.task_planner import SubTask, decompose
+from mcp_layer.evidence_cache import EvidenceCache
 
+from agents.lead_agent.context_manager import (
+    InvestigationCheckpoint,
+    InvestigationContext,
+    checkpoint_id_for,
+    raw_file_fingerprinter,
+)
+from agents.lead_agent.dispatcher import AgentStub, DataFetcher, TaskTimeout, dispatch_tasks
+from agents.lead_agent.entity_resolution import resolve_one
+from agents.lead_agent.events import (
+    EntityResolved,
+    FindingsBatch,
+    InvestigationCompleted,
+    LeadAgentEvent,
+    TaskCompleted,
+    TasksPlanned,
+)
+from agents.lead_agent.task_planner import decompose, source_key
 
-AgentStub = Callable[[Entity, SubTask, InvestigationContext], List[Evidence]]
+# MCP sources the scheduler pulls once per investigation for the tasks that consume them.
+PREFETCH_SOURCES = ("sec_edgar", "nhtsa")
 
 
 def _default_agent_stubs(data_root: Optional[Path] = None) -> Dict[str, AgentStub]:
@@ -20,7 +38,7 @@ def _default_agent_stubs(data_root: Optional[Path] = None) -> Dict[str, AgentStu
     data_root = data_root or Path("data")
     from agents.specialist_agents import CorporateAgent, LegalAgent, SocialGraphAgent
     corporate = CorporateAgent(data_root=data_root)
-    legal = LegalAgent()
+    legal = LegalAgent(data_root=data_root)
     social = SocialGraphAgent()
     return {
         "corporate_agent": lambda e, t, c: corporate.run(e, t, c),
@@ -29,42 +47,174 @@ def _default_agent_stubs(data_root: Optional[Path] = None) -> Dict[str, AgentStu
     }
 
 
+def _default_data_fetchers(data_root: Optional[Path] = None) -> Dict[str, DataFetcher]:
+    """One fetcher per MCP source: warms the investigation's evidence cache for that source."""
+    data_root = data_root or Path("data")
+
+    def _fetcher(source_id: str) -> DataFetcher:
+        def fetch(entity, context):
+            from mcp_layer import fetch_evidence_for_entity
+            return fetch_evidence_for_entity(entity, sources=[source_id], data_root=data_root, cache=context.evidence_cache)
+        return fetch
+
+    return {source_key(sid): _fetcher(sid) for sid in PREFETCH_SOURCES}
+
+
 class LeadAgent:
     """
     Lead Agent: accepts a natural-language investigation query, resolves the entity,
     decomposes into sub-tasks, dispatches to specialist agents (stubs), and
     collects results into an InvestigationContext.
+
+    Sub-tasks run as a dependency DAG (see agents.lead_agent.dispatcher): each MCP
+    source is pulled once for all tasks consuming it, independent tasks run concurrently
+    (max_parallel at a time, default all), and downstream tasks start when their inputs
+    are ready. task_timeout_s bounds each task (seconds, or a task_type/agent -> seconds
+    map). A failing or slow task is recorded in context.failures instead of aborting.
+    data_fetchers defaults to MCP prefetching only when the default agents are used.
+
+    iter_run() yields events (agents.lead_agent.events) while the investigation runs,
+    so callers can show findings as each task finishes; run() just drains it.
+
+    checkpoint_dir: when set, every completed task is checkpointed to
+    <checkpoint_dir>/<checkpoint id>.jsonl (see context_manager.checkpoint), and
+    run(..., resume=True) restores the tasks whose inputs are unchanged instead of
+    running them again.
     """
 
     def __init__(
         self,
         data_root: Optional[Path] = None,
         agent_stubs: Optional[Dict[str, AgentStub]] = None,
+        *,
+        max_parallel: Optional[int] = None,
+        task_timeout_s: TaskTimeout = None,
+        data_fetchers: Optional[Dict[str, DataFetcher]] = None,
+        checkpoint_dir: Optional[Path] = None,
     ):
         self.data_root = Path(data_root) if data_root else Path("data")
         self._stubs = agent_stubs if agent_stubs is not None else _default_agent_stubs(self.data_root)
-
-    def run(self, query: str) -> InvestigationContext:
+        if data_fetchers is None:
+            data_fetchers = _default_data_fetchers(self.data_root) if agent_stubs is None else {}
+        self._data_fetchers = data_fetchers
+        self.max_parallel = max_parallel
+        self.task_timeout_s = task_timeout_s
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
+
+    def checkpoint_for(self, query: str, checkpoint_id: Optional[str] = None) -> Optional[InvestigationCheckpoint]:
+        """The checkpoint a run of query would use (None without checkpoint_dir)."""
+        if self.checkpoint_dir is None:
+            return None
+        path = self.checkpoint_dir / f"{checkpoint_id or checkpoint_id_for(query)}.jsonl"
+        return InvestigationCheckpoint(path, raw_file_fingerprinter(self.data_root))
+
+    def run(
+        self,
+        query: str,
+        *,
+        entity: Optional[Entity] = None,
+        evidence_cache: Optional[EvidenceCache] = None,
+        resume: bool = False,
+        checkpoint_id: Optional[str] = None,
+    ) -> InvestigationContext:
         """
         Execute the investigation pipeline: resolve entity -> decompose -> dispatch -> collect.
 
         Returns the InvestigationContext with entity, tasks, and results per agent.
         """
-        context = InvestigationContext()
+        for event in self.iter_run(query, entity=entity, evidence_cache=evidence_cache, resume=resume, checkpoint_id=checkpoint_id):
+            if isinstance(event, InvestigationCompleted):
+                return event.context
+        raise RuntimeError("iter_run ended without InvestigationCompleted")  # pragma: no cover
+
+    def iter_run(
+        self,
+        query: str,
+        *,
+        entity: Optional[Entity] = None,
+        evidence_cache: Optional[EvidenceCache] = None,
+        resume: bool = False,
+        checkpoint_id: Optional[str] = None,
+    ) -> Iterator[LeadAgentEvent]:
+        """
+        Run the investigation, yielding events as they happen:
+        EntityResolved, TasksPlanned, then TaskStarted / FindingsBatch / TaskFailed /
+        TaskCompleted in completion order, and finally InvestigationCompleted.
+
+        Dispatch runs on a background thread; events are handed over through a queue,
+        so a slow consumer never blocks the agents. The context is only final once
+        InvestigationCompleted arrives. Unresolved queries yield InvestigationCompleted only.
+
+        entity skips resolution (already resolved by the caller); evidence_cache lets
+        several investigations of the same entity share MCP fetches.
+        resume=True (needs checkpoint_dir) reuses the checkpointed entity and emits
+        FindingsBatch + TaskCompleted(restored=True) for each still-valid task before
+        dispatching the rest; otherwise the checkpoint is started afresh.
+        checkpoint_id overrides the default id derived from the query.
+        """
+        checkpoint = self.checkpoint_for(query, checkpoint_id)
+        if resume and checkpoint is None:
+            raise ValueError("resume=True needs a LeadAgent with checkpoint_dir")
+        context = InvestigationContext(evidence_cache=evidence_cache) if evidence_cache is not None else InvestigationContext()
         context.set_query(query)
 
-        entity = resolve_one(query)
+        if resume and entity is None:
+            entity = checkpoint.stored_entity()  # type: ignore[union-attr]
+        entity = entity or resolve_one(query)
         if not entity:
-            return context
+            yield InvestigationCompleted(context)
+            return
         context.set_entity(entity)
+        yield EntityResolved(entity)
 
         tasks = decompose(query, entity=entity)
         context.set_tasks(tasks)
-
-        for task in tasks:
-            stub = self._stubs.get(task.target_agent)
-            if stub:
-                findings = stub(entity, task, context)
-                context.add_agent_results(task.target_agent, findings)
-
-        return context
+        yield TasksPlanned(list(tasks))
+
+        if checkpoint is not None:
+            restored = checkpoint.restore(entity, tasks) if resume else {}
+            checkpoint.start(query, entity, tasks, restored)
+            for task, (agent_id, findings) in restored.items():
+                context.add_agent_results(agent_id, findings)
+                yield FindingsBatch(task, agent_id, findings)
+                yield TaskCompleted(task, len(findings), 0.0, restored=True)
+            tasks = [t for t in tasks if t not in restored]
+
+        events: "queue.Queue[Any]" = queue.Queue()
+
+        def _emit(event: Any) -> None:
+            if checkpoint is not None and isinstance(event, FindingsBatch):
+                checkpoint.record(entity, event.task, event.agent_id, event.findings)
+            events.put(event)
+
+        done = object()
+        errors: list = []
+
+        def _dispatch() -> None:
+            try:
+                dispatch_tasks(
+                    entity,
+                    tasks,
+                    self._stubs,
+                    context,
+                    max_parallel=self.max_parallel,
+                    task_timeout_s=self.task_timeout_s,
+                    data_fetchers=self._data_fetchers,
+                    on_event=_emit,
+                )
+            except BaseException as e:  # re-raised in the consumer
+                errors.append(e)
+            finally:
+                events.put(done)
+
+        worker = threading.Thread(target=_dispatch, name="lead-agent-run", daemon=True)
+        worker.start()
+        while True:
+            event = events.get()
+            if event is done:
+                break
+            yield event
+        worker.join()
+        if errors:
+            raise errors[0]
+        yield InvestigationCompleted(context)
@@ -1,6 +1,6 @@
 """Task planner: decompose query into sub-tasks for specialist agents."""
 
-from agents.lead_agent.task_planner.planner import decompose
-from agents.lead_agent.task_planner.types import SubTask
+from agents.lead_agent.task_planner.planner import TASK_DATA_FLOW, decompose
+from agents.lead_agent.task_planner.types import SOURCE_PREFIX, SubTask, source_key
 
-__all__ = ["SubTask", "decompose"]
+__all__ = ["SubTask", "decompose", "TASK_DATA_FLOW", "SOURCE_PREFIX", "source_key"]
@@ -6,7 +6,7 @@ from typing import List, Optional
 
 from osint_swarm.entities import Entity
 
-from agents.lead_agent.task_planner.types import SubTask
+from agents.lead_agent.task_planner.types import COURTLISTENER_SOURCE, OFAC_SOURCE, SubTask, source_key
 
 
 # Keywords that trigger task types (for rule-based decomposition).
@@ -47,6 +47,31 @@ SOCIAL_TASK_TYPES = [
 ]
 
 
+_SEC = source_key("sec_edgar")
+_NHTSA = source_key("nhtsa")
+_OFAC = source_key(OFAC_SOURCE)
+_COURTS = source_key(COURTLISTENER_SOURCE)
+
+# task_type -> (consumes, produces). Tasks over the same sources share one pull;
+# network analysis waits for the ownership structure mapped by beneficial_ownership.
+TASK_DATA_FLOW = {
+    "corporate_structure": ((_SEC, _NHTSA), ("corporate_profile",)),
+    "sec_filings": ((_SEC, _NHTSA), ("corporate_profile",)),
+    "transaction_patterns": ((_SEC, _NHTSA), ()),
+    "beneficial_ownership": ((), ("ownership_structure",)),
+    "sanctions_screening": ((_OFAC,), ("sanctions_hits",)),
+    "regulatory_actions": ((_COURTS,), ("enforcement_history",)),
+    "litigation": ((_COURTS,), ("court_records",)),
+    "adverse_media": ((), ("adverse_media",)),
+    "network_analysis": (("ownership_structure",), ("entity_network",)),
+}
+
+
+def _task(task_type: str, target_agent: str, description: str) -> SubTask:
+    consumes, produces = TASK_DATA_FLOW.get(task_type, ((), ()))
+    return SubTask(task_type, target_agent, description, consumes=consumes, produces=produces)
+
+
 def _query_lower(query: str) -> str:
     return (query or "").strip().lower()
 
@@ -71,15 +96,15 @@ def decompose(
     q = _query_lower(query)
 
     if _suggests_money_laundering(query):
-        tasks.append(SubTask("corporate_structure", "corporate_agent", "Analyze corporate structure and subsidiaries for red flags"))
-        tasks.append(SubTask("beneficial_ownership", "corporate_agent", "Map beneficial ownership and undisclosed interests"))
-        tasks.append(SubTask("sanctions_screening", "legal_agent", "Screen against OFAC and sanctions lists"))
-        tasks.append(SubTask("transaction_patterns", "corporate_agent", "Identify unusual transaction or revenue patterns"))
-        tasks.append(SubTask("adverse_media", "social_graph_agent", "Review adverse media and public records"))
+        tasks.append(_task("corporate_structure", "corporate_agent", "Analyze corporate structure and subsidiaries for red flags"))
+        tasks.append(_task("beneficial_ownership", "corporate_agent", "Map beneficial ownership and undisclosed interests"))
+        tasks.append(_task("sanctions_screening", "legal_agent", "Screen against OFAC and sanctions lists"))
+        tasks.append(_task("transaction_patterns", "corporate_agent", "Identify unusual transaction or revenue patterns"))
+        tasks.append(_task("adverse_media", "social_graph_agent", "Review adverse media and public records"))
         return tasks
 
     # Default: generic investigation
-    tasks.append(SubTask("sec_filings", "corporate_agent", "Review SEC filings and governance"))
-    tasks.append(SubTask("sanctions_screening", "legal_agent", "Screen against sanctions lists"))
-    tasks.append(SubTask("adverse_media", "social_graph_agent", "Check adverse media"))
+    tasks.append(_task("sec_filings", "corporate_agent", "Review SEC filings and governance"))
+    tasks.append(_task("sanctions_screening", "legal_agent", "Screen against sanctions lists"))
+    tasks.append(_task("adverse_media", "social_graph_agent", "Check adverse media"))
     return tasks
@@ -3,12 +3,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Tuple
+
+
+# Data keys for raw MCP sources; the scheduler pulls each at most once per investigation.
+SOURCE_PREFIX = "source:"
+# Locally staged reference data (not fetched per entity; checkpoints fingerprint it as a whole).
+OFAC_SOURCE = "ofac_sanctions"
+COURTLISTENER_SOURCE = "courtlistener"
+
+
+def source_key(source_id: str) -> str:
+    return f"{SOURCE_PREFIX}{source_id}"
 
 
 @dataclass(frozen=True)
 class SubTask:
-    """A single sub-task allocated to a specialist agent."""
+    """A single sub-task allocated to a specialist agent.
+
+    consumes/produces name the data the task reads and makes available (e.g.
+    "source:sec_edgar", "ownership_structure"); the scheduler orders tasks by them.
+    """
 
     task_type: str
     target_agent: str
     description: str
+    consumes: Tuple[str, ...] = ()
+    produces: Tuple[str, ...] = ()
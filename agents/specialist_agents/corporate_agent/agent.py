@@ -18,8 +18,9 @@ class CorporateAgent:
 
     AGENT_ID = "corporate_agent"
 
-    def __init__(self, data_root: Optional[Path] = None):
+    def __init__(self, data_root: Optional[Path] = None, source_timeout_s: Optional[float] = None):
         self.data_root = Path(data_root) if data_root else Path("data")
+        self.source_timeout_s = source_timeout_s
 
     @property
     def agent_id(self) -> str:
@@ -38,14 +39,16 @@ class CorporateAgent:
         if task.task_type == "beneficial_ownership":
             return structure_mapper_run(entity, task, context)
 
-        # Fetch evidence from MCP (SEC + NHTSA)
+        # Fetch evidence from MCP (SEC + NHTSA concurrently; a failed source yields partial results)
         try:
-            from mcp_layer import get_evidence_for_entity
-            evidence = get_evidence_for_entity(
+            from mcp_layer import fetch_evidence_for_entity
+            evidence = fetch_evidence_for_entity(
                 entity,
                 sources=("sec_edgar", "nhtsa"),
                 data_root=self.data_root,
-            )
+                cache=context.evidence_cache,
+                source_timeout_s=self.source_timeout_s,
+            ).evidence
         except Exception:
             evidence = []
 
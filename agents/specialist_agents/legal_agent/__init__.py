@@ -1,4 +1,4 @@
-"""Legal Agent: sanctions screening and PACER (stubs)."""
+"""Legal Agent: OFAC sanctions screening and court dockets from the local CourtListener index (PACER stub only when no index is built)."""
 
 from agents.specialist_agents.legal_agent.agent import LegalAgent
 
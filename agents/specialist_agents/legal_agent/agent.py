@@ -1,22 +1,26 @@
-"""Legal Agent: sanctions screening + PACER; implements SpecialistAgent contract."""
+"""Legal Agent: sanctions screening + court records; implements SpecialistAgent contract."""
 
 from __future__ import annotations
 
-from typing import List
+from pathlib import Path
+from typing import List, Optional
 
 from osint_swarm.entities import Entity, Evidence
 
 from agents.lead_agent.context_manager import InvestigationContext
 from agents.lead_agent.task_planner.types import SubTask
-from agents.specialist_agents.legal_agent.sanctions_screener.screener import run_stub as sanctions_run
-from agents.specialist_agents.legal_agent.pacer_analyzer.analyzer import run_stub as pacer_run
+from agents.specialist_agents.legal_agent.sanctions_screener.screener import run as sanctions_run
+from agents.specialist_agents.legal_agent.pacer_analyzer.analyzer import run as pacer_run
 
 
 class LegalAgent:
-    """Legal and compliance agent: sanctions (stub), PACER (stub)."""
+    """Legal and compliance agent: OFAC sanctions screening (local lists), court dockets (local CourtListener index)."""
 
     AGENT_ID = "legal_agent"
 
+    def __init__(self, data_root: Optional[Path] = None):
+        self.data_root = Path(data_root) if data_root else Path("data")
+
     @property
     def agent_id(self) -> str:
         return self.AGENT_ID
@@ -29,8 +33,8 @@ class LegalAgent:
     ) -> List[Evidence]:
         """Dispatch to sanctions_screener or pacer_analyzer by task_type."""
         if task.task_type == "sanctions_screening":
-            return sanctions_run(entity, task, context)
+            return sanctions_run(entity, task, context, data_root=self.data_root)
         if task.task_type in ("litigation", "regulatory_actions"):
-            return pacer_run(entity, task, context)
-        # Default: sanctions stub
-        return sanctions_run(entity, task, context)
+            return pacer_run(entity, task, context, data_root=self.data_root)
+        # Default: sanctions screening
+        return sanctions_run(entity, task, context, data_root=self.data_root)
@@ -1,5 +1,27 @@
-"""PACER Analyzer (stub)."""
+"""PACER Analyzer: court dockets from CourtListener bulk data (streamed into a local party-name index)."""
 
-from agents.specialist_agents.legal_agent.pacer_analyzer.analyzer import run_stub
+from agents.specialist_agents.legal_agent.pacer_analyzer.analyzer import analyze_entity, get_court_index, run, run_stub
+from agents.specialist_agents.legal_agent.pacer_analyzer.bulk import (
+    CourtIngestSummary,
+    bulk_dir,
+    ingest_courtlistener,
+    registry_party_keys,
+    split_caption,
+)
+from agents.specialist_agents.legal_agent.pacer_analyzer.index import CourtIndex, DocketMatch, court_db_path, party_key
 
-__all__ = ["run_stub"]
+__all__ = [
+    "CourtIndex",
+    "CourtIngestSummary",
+    "DocketMatch",
+    "analyze_entity",
+    "bulk_dir",
+    "court_db_path",
+    "get_court_index",
+    "ingest_courtlistener",
+    "party_key",
+    "registry_party_keys",
+    "run",
+    "run_stub",
+    "split_caption",
+]
@@ -1,13 +1,113 @@
-"""PACER Analyzer: court records (stub for Phase 4; PACER paywalled)."""
+"""PACER Analyzer: court dockets from the local CourtListener index (PACER itself is paywalled)."""
 
 from __future__ import annotations
 
-from typing import List
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 
 from osint_swarm.entities import Entity, Evidence
 
 from agents.lead_agent.context_manager import InvestigationContext
 from agents.lead_agent.task_planner.types import SubTask
+from agents.specialist_agents.legal_agent.pacer_analyzer.index import CAPTION_PARTY, CourtIndex, DocketMatch, court_db_path
+
+
+MAX_DOCKETS = 50
+
+_INDEXES: Dict[Path, CourtIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_court_index(data_root: Optional[Path] = None) -> Optional[CourtIndex]:
+    """Shared CourtIndex over <data_root>/processed/courtlistener.sqlite (None until it has been built)."""
+    db_path = court_db_path(Path(data_root) if data_root else Path("data"))
+    if not db_path.exists():
+        return None
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(db_path)
+        if index is None:
+            index = _INDEXES[db_path] = CourtIndex(db_path)
+        return index
+
+
+def _docket_evidence(entity: Entity, match: DocketMatch, raw_location: Optional[str]) -> Evidence:
+    court = match.court_name or match.court_id or "unknown court"
+    role = "named in the caption" if match.party_type == CAPTION_PARTY else f"party ({match.party_type})" if match.party_type else "party"
+    status = f"terminated {match.date_terminated}" if match.date_terminated else "open or status unknown"
+    return Evidence(
+        evidence_id=f"{entity.entity_id}_court_{match.docket_id}",
+        entity_id=entity.entity_id,
+        date=match.date_filed,
+        source_type="court_record",
+        risk_category="legal",
+        summary=(
+            f"{match.case_name or 'Untitled case'} ({court}, No. {match.docket_number or 'n/a'}), filed "
+            f"{match.date_filed or 'on an unknown date'}; {status}. '{match.party_name}' {role}."
+        ),
+        source_uri=match.url,
+        raw_location=raw_location,
+        confidence=0.7 if match.party_type == CAPTION_PARTY else 0.8,
+        attributes={
+            "docket_id": match.docket_id,
+            "court_id": match.court_id,
+            "docket_number": match.docket_number,
+            "case_name": match.case_name,
+            "date_terminated": match.date_terminated,
+            "nature_of_suit": match.nature_of_suit,
+            "cause": match.cause,
+            "party_name": match.party_name,
+            "party_type": match.party_type,
+        },
+    )
+
+
+def analyze_entity(
+    entity: Entity,
+    index: CourtIndex,
+    *,
+    related_parties: Iterable[str] = (),
+    limit: int = MAX_DOCKETS,
+    raw_location: Optional[str] = None,
+) -> List[Evidence]:
+    """
+    Dockets naming the entity (name, aliases, related_parties) as a party, most recent first.
+
+    Returns one Evidence per docket, or a single "no dockets" Evidence recording what was looked up.
+    """
+    names = list(dict.fromkeys(n for n in (entity.name, *entity.aliases, *related_parties) if n and n.strip()))
+    matches = index.find_dockets(names, limit=limit)
+    if matches:
+        return [_docket_evidence(entity, m, raw_location) for m in matches]
+    return [
+        Evidence(
+            evidence_id=f"{entity.entity_id}_court_none",
+            entity_id=entity.entity_id,
+            date="",
+            source_type="court_record",
+            risk_category="legal",
+            summary=f"No CourtListener dockets found for {len(names)} party name(s) ({index.docket_count()} indexed dockets).",
+            source_uri="https://www.courtlistener.com",
+            raw_location=raw_location,
+            confidence=0.6,
+            attributes={"party_names": names, "indexed_dockets": index.docket_count()},
+        )
+    ]
+
+
+def run(
+    entity: Entity,
+    task: SubTask,
+    context: InvestigationContext,
+    *,
+    data_root: Optional[Path] = None,
+    related_parties: Iterable[str] = (),
+) -> List[Evidence]:
+    """Look the entity up in the local CourtListener index; falls back to run_stub when none is built."""
+    index = get_court_index(data_root)
+    if index is None:
+        return run_stub(entity, task, context)
+    return analyze_entity(entity, index, related_parties=related_parties, raw_location=str(index.db_path))
 
 
 def run_stub(
@@ -0,0 +1,316 @@
+"""
+Streaming ingestion of CourtListener bulk CSV dumps into the docket index.
+
+Dumps are staged in data/raw/courtlistener/ as published (bz2, gzip, xz or
+plain CSV with a header row; CourtListener quotes fields with backticks, which is
+detected from the header):
+
+- courts*.csv*: id, short_name, full_name;
+- parties*.csv*: docket_id (or docket), name, party_type (or type), optional;
+- dockets*.csv*: id, court_id, docket_number, case_name, date_filed, ...
+
+Files are read row by row through the decompressor, so memory stays flat however
+large a dump is, and rows are written in batches. Each docket also yields the two
+sides of its case name ("Smith v. Tesla, Inc.") as caption parties, so dockets
+alone are enough to build a usable index.
+
+With keys (party keys of the registry, see registry_party_keys) only matching
+parties, and the dockets they appear on, are kept; without, every party is
+indexed. Ingested files are recorded by size and mtime and skipped on reruns.
+"""
+
+from __future__ import annotations
+
+import bz2
+import csv
+import gzip
+import hashlib
+import io
+import lzma
+import re
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+
+from osint_swarm.entities import Entity
+from osint_swarm.utils.io import GZIP_MAGIC, XZ_MAGIC
+
+from agents.specialist_agents.legal_agent.pacer_analyzer.index import CAPTION_PARTY, connect, party_key
+
+
+BULK_DIR_NAME = "courtlistener"
+BZ2_MAGIC = b"BZh"
+BATCH_SIZE = 5000
+# (table, file glob) in ingestion order: parties before dockets, so a filtered run knows which dockets to keep.
+BULK_FILES = (("courts", "courts*.csv*"), ("parties", "parties*.csv*"), ("dockets", "dockets*.csv*"))
+ALL_PARTIES = "all"
+
+_CAPTION_SPLIT = re.compile(r"\s+v(?:s)?\.?\s+", re.IGNORECASE)
+_CAPTION_NOISE = re.compile(r"^(?:in re|in the matter of)\s+|,?\s+et\.? al\.?$", re.IGNORECASE)
+
+csv.field_size_limit(min(sys.maxsize, 2**31 - 1))  # docket text fields can exceed the 128 KiB default
+
+
+def bulk_dir(data_root: Path) -> Path:
+    return Path(data_root) / "raw" / BULK_DIR_NAME
+
+
+def open_bulk_text(path: Path) -> TextIO:
+    """Text stream over a bulk file, decompressed by magic bytes (bz2, gzip, xz or plain)."""
+    with Path(path).open("rb") as f:
+        magic = f.read(6)
+    kwargs = {"encoding": "utf-8", "errors": "replace", "newline": ""}
+    if magic.startswith(BZ2_MAGIC):
+        return bz2.open(path, "rt", **kwargs)
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.open(path, "rt", **kwargs)
+    if magic.startswith(XZ_MAGIC):
+        return lzma.open(path, "rt", **kwargs)
+    return open(path, "r", **kwargs)
+
+
+def iter_bulk_rows(stream: TextIO) -> Iterator[Dict[str, str]]:
+    """Rows of a bulk CSV as {column: value}; the quote character (backtick or ") is taken from the header."""
+    header_line = stream.readline()
+    if not header_line:
+        return
+    quote = "`" if header_line.lstrip().startswith("`") else '"'
+    dialect = {"quotechar": quote, "escapechar": "\\" if quote == "`" else None}
+    header = [h.strip() for h in next(csv.reader(io.StringIO(header_line), **dialect))]
+    for row in csv.reader(stream, **dialect):
+        if row:
+            yield dict(zip(header, row))
+
+
+def split_caption(case_name: str) -> List[str]:
+    """Party names in a case caption: "Smith v. Tesla, Inc., et al." -> ["Smith", "Tesla, Inc."]."""
+    sides = _CAPTION_SPLIT.split(case_name or "", maxsplit=1)
+    return [s for s in (_CAPTION_NOISE.sub("", side.strip()).strip(" ,") for side in sides) if s]
+
+
+def registry_party_keys(entities: Iterable[Entity]) -> Set[str]:
+    """Party keys of the entities' names and aliases (the keys a filtered ingest keeps)."""
+    return {k for e in entities for k in (party_key(n) for n in (e.name, *e.aliases)) if k}
+
+
+def _keys_signature(keys: Optional[Set[str]]) -> str:
+    if keys is None:
+        return ALL_PARTIES
+    return hashlib.sha1("\n".join(sorted(keys)).encode("utf-8")).hexdigest()
+
+
+def _first(row: Dict[str, str], *names: str) -> str:
+    for name in names:
+        value = row.get(name)
+        if value:
+            return value.strip()
+    return ""
+
+
+def _docket_id(value: str) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class CourtIngestSummary:
+    """Outcome and throughput of one ingestion run."""
+
+    files: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    rows_read: int = 0
+    dockets: int = 0
+    parties: int = 0
+    rebuilt: bool = False
+    elapsed_s: float = 0.0
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows_read / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def format(self) -> str:
+        lines = [
+            "CourtListener ingestion",
+            "-----------------------",
+            f"Files:    {len(self.files)} ingested, {len(self.skipped)} unchanged{' (index rebuilt)' if self.rebuilt else ''}",
+            f"Rows:     {self.rows_read} read in {self.elapsed_s:.1f}s ({self.rows_per_s:.0f}/s)",
+            f"Kept:     {self.dockets} dockets, {self.parties} parties",
+        ]
+        return "\n".join(lines)
+
+
+class _Writer:
+    """Batched inserts into one table."""
+
+    def __init__(self, conn: sqlite3.Connection, sql: str):
+        self._conn = conn
+        self._sql = sql
+        self._batch: List[Tuple] = []
+        self.written = 0
+
+    def add(self, row: Tuple) -> None:
+        self._batch.append(row)
+        if len(self._batch) >= BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._batch:
+            self._conn.executemany(self._sql, self._batch)
+            self.written += len(self._batch)
+            self._batch.clear()
+
+
+class _Counted:
+    def __init__(self) -> None:
+        self.n = 0
+
+    def wrap(self, rows: Iterable[Dict[str, str]]) -> Iterator[Dict[str, str]]:
+        for row in rows:
+            self.n += 1
+            yield row
+
+
+def _ingest_courts(conn: sqlite3.Connection, rows: Iterable[Dict[str, str]]) -> int:
+    writer = _Writer(conn, "INSERT OR REPLACE INTO courts (id, short_name, full_name) VALUES (?, ?, ?)")
+    for row in rows:
+        court_id = _first(row, "id")
+        if court_id:
+            writer.add((court_id, _first(row, "short_name"), _first(row, "full_name")))
+    writer.flush()
+    return writer.written
+
+
+def _ingest_parties(conn: sqlite3.Connection, rows: Iterable[Dict[str, str]], keys: Optional[Set[str]]) -> int:
+    writer = _Writer(conn, "INSERT OR IGNORE INTO parties (key, docket_id, name, party_type) VALUES (?, ?, ?, ?)")
+    for row in rows:
+        name = _first(row, "name")
+        key = party_key(name) if name else ""
+        if not key or (keys is not None and key not in keys):
+            continue
+        docket_id = _docket_id(_first(row, "docket_id", "docket"))
+        if docket_id is not None:
+            writer.add((key, docket_id, name, _first(row, "party_type", "type")))
+    writer.flush()
+    return writer.written
+
+
+def _ingest_dockets(
+    conn: sqlite3.Connection, rows: Iterable[Dict[str, str]], keys: Optional[Set[str]], wanted: Set[int]
+) -> Tuple[int, int]:
+    dockets = _Writer(
+        conn,
+        "INSERT OR REPLACE INTO dockets (id, court_id, docket_number, case_name, date_filed, date_terminated, nature_of_suit, cause, slug) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    )
+    parties = _Writer(conn, "INSERT OR IGNORE INTO parties (key, docket_id, name, party_type) VALUES (?, ?, ?, ?)")
+    for row in rows:
+        docket_id = _docket_id(_first(row, "id"))
+        if docket_id is None:
+            continue
+        case_name = _first(row, "case_name", "case_name_full", "case_name_short")
+        caption = [(party_key(n), n) for n in split_caption(case_name)]
+        caption = [(k, n) for k, n in caption if k and (keys is None or k in keys)]
+        if keys is not None and not caption and docket_id not in wanted:
+            continue
+        dockets.add(
+            (
+                docket_id,
+                _first(row, "court_id", "court"),
+                _first(row, "docket_number"),
+                case_name,
+                _first(row, "date_filed"),
+                _first(row, "date_terminated"),
+                _first(row, "nature_of_suit"),
+                _first(row, "cause"),
+                _first(row, "slug"),
+            )
+        )
+        for key, name in caption:
+            parties.add((key, docket_id, name, CAPTION_PARTY))
+    dockets.flush()
+    parties.flush()
+    return dockets.written, parties.written
+
+
+def find_bulk_files(directory: Path) -> List[Tuple[str, Path]]:
+    """(table, path) of the staged dumps, in ingestion order."""
+    directory = Path(directory)
+    return [(table, path) for table, pattern in BULK_FILES for path in sorted(directory.glob(pattern)) if path.is_file()]
+
+
+def ingest_courtlistener(
+    directory: Path,
+    db_path: Path,
+    *,
+    keys: Optional[Set[str]] = None,
+    force: bool = False,
+) -> CourtIngestSummary:
+    """
+    Stream the dumps in directory into the index at db_path.
+
+    keys limits the index to those party keys (None indexes every party). A change
+    of keys, or force, rebuilds the index; otherwise files already ingested with
+    the same size and mtime are skipped.
+    """
+    start = time.monotonic()
+    summary = CourtIngestSummary()
+    conn = connect(db_path)
+    try:
+        conn.execute("PRAGMA synchronous=OFF")  # a crashed ingest is simply rerun with --force
+        signature = _keys_signature(keys)
+        stored = conn.execute("SELECT value FROM meta WHERE key = 'parties'").fetchone()
+        if force or (stored is not None and stored[0] != signature):
+            with conn:
+                for table in ("dockets", "parties", "courts", "files"):
+                    conn.execute(f"DELETE FROM {table}")
+            summary.rebuilt = True
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('parties', ?)", (signature,))
+        done = {r["name"]: (r["size"], r["mtime_ns"]) for r in conn.execute("SELECT name, size, mtime_ns FROM files")}
+
+        wanted: Optional[Set[int]] = None
+        new_parties = False
+        backfill = False
+        for table, path in find_bulk_files(directory):
+            st = path.stat()
+            if table == "dockets" and keys is not None and wanted is None:
+                # Every party-linked docket is kept, so a refreshed dockets dump updates them too.
+                wanted = {r[0] for r in conn.execute("SELECT DISTINCT docket_id FROM parties")}
+                # Unchanged dumps are rescanned only for dockets of newly ingested parties.
+                backfill = new_parties and conn.execute(
+                    "SELECT 1 FROM parties WHERE docket_id NOT IN (SELECT id FROM dockets) LIMIT 1"
+                ).fetchone() is not None
+            unchanged = done.get(path.name) == (st.st_size, st.st_mtime_ns)
+            if unchanged and not (table == "dockets" and backfill):
+                summary.skipped.append(path.name)
+                continue
+            new_parties = new_parties or table == "parties"
+            counted = _Counted()
+            with open_bulk_text(path) as stream, conn:
+                rows = counted.wrap(iter_bulk_rows(stream))
+                if table == "courts":
+                    _ingest_courts(conn, rows)
+                elif table == "parties":
+                    summary.parties += _ingest_parties(conn, rows, keys)
+                else:
+                    d, p = _ingest_dockets(conn, rows, keys, wanted or set())
+                    summary.dockets += d
+                    summary.parties += p
+                conn.execute(
+                    "INSERT OR REPLACE INTO files (name, size, mtime_ns, rows) VALUES (?, ?, ?, ?)",
+                    (path.name, st.st_size, st.st_mtime_ns, counted.n),
+                )
+            summary.rows_read += counted.n
+            summary.files.append(path.name)
+        with conn:
+            conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    summary.elapsed_s = round(time.monotonic() - start, 3)
+    return summary
+
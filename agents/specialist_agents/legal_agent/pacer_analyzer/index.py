@@ -0,0 +1,194 @@
+"""
+Court docket index: SQLite party-name index over CourtListener bulk data
+(data/processed/courtlistener.sqlite).
+
+Tables:
+
+- dockets: one row per kept docket (court, number, caption, dates, nature of suit);
+- parties: (party key, docket id, name as filed, party type), indexed on the key;
+  dockets also contribute the two sides of their case name ("caption" parties);
+- courts: court id -> names (from the courts dump, when staged);
+- files: bulk files already ingested (name, size, mtime), so reruns skip them.
+
+A party key is the entity-resolution fuzzy key of the name ("TESLA, INC." ->
+"tesla"), so a lookup by an entity's name and aliases is a handful of index
+probes however large the dumps were.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from functools import lru_cache
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, List, Optional
+
+from agents.lead_agent.entity_resolution.fuzzy import fuzzy_key
+
+
+COURT_DB_NAME = "courtlistener.sqlite"
+CAPTION_PARTY = "caption"  # party_type of names taken from a docket's case name
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dockets (
+    id              INTEGER PRIMARY KEY,
+    court_id        TEXT NOT NULL DEFAULT '',
+    docket_number   TEXT NOT NULL DEFAULT '',
+    case_name       TEXT NOT NULL DEFAULT '',
+    date_filed      TEXT NOT NULL DEFAULT '',
+    date_terminated TEXT NOT NULL DEFAULT '',
+    nature_of_suit  TEXT NOT NULL DEFAULT '',
+    cause           TEXT NOT NULL DEFAULT '',
+    slug            TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS parties (
+    key        TEXT NOT NULL,
+    docket_id  INTEGER NOT NULL,
+    name       TEXT NOT NULL,
+    party_type TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (key, docket_id, party_type)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS courts (
+    id         TEXT PRIMARY KEY,
+    short_name TEXT NOT NULL DEFAULT '',
+    full_name  TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS files (
+    name     TEXT PRIMARY KEY,
+    size     INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    rows     INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def court_db_path(data_root: Path) -> Path:
+    return Path(data_root) / "processed" / COURT_DB_NAME
+
+
+@lru_cache(maxsize=1 << 16)  # dumps repeat the same parties ("United States", large companies) millions of times
+def party_key(name: str) -> str:
+    """Index key of a party name: normalized, without a leading "the" or legal suffixes."""
+    return fuzzy_key(name)
+
+
+@dataclass(frozen=True)
+class DocketMatch:
+    """A docket on which a looked-up name appears as a party."""
+
+    docket_id: int
+    court_id: str
+    court_name: str
+    docket_number: str
+    case_name: str
+    date_filed: str
+    date_terminated: str
+    nature_of_suit: str
+    cause: str
+    slug: str
+    party_name: str
+    party_type: str
+
+    @property
+    def url(self) -> str:
+        return f"https://www.courtlistener.com/docket/{self.docket_id}/{self.slug or 'docket'}/"
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """Connection with the schema in place (used by both the ingester and CourtIndex)."""
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=30.0)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def index_signature(db_path: Path) -> str:
+    """The bulk files an index was built from, and its party filter ("" when there is no index)."""
+    db_path = Path(db_path)
+    if not db_path.exists():
+        return ""
+    try:
+        conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            files = conn.execute("SELECT name, size, mtime_ns FROM files ORDER BY name").fetchall()
+            meta = conn.execute("SELECT value FROM meta WHERE key = 'parties'").fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        st = db_path.stat()
+        return f"{st.st_size}:{st.st_mtime_ns}"
+    return ";".join([meta[0] if meta else "", *(f"{n}:{s}:{m}" for n, s, m in files)])
+
+
+class CourtIndex:
+    """Read side of the docket index; one connection shared across threads behind a lock."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn = connect(self.db_path)
+
+    def __enter__(self) -> "CourtIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def docket_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM dockets").fetchone()[0]
+
+    def party_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM parties").fetchone()[0]
+
+    def find_dockets(self, names: Iterable[str], *, limit: Optional[int] = None) -> List[DocketMatch]:
+        """Dockets with a party whose key equals the key of one of names, most recently filed first (one row per docket)."""
+        keys = sorted({k for k in (party_key(n) for n in names) if k})
+        if not keys:
+            return []
+        sql = (
+            "SELECT d.*, p.name AS party_name, p.party_type, COALESCE(c.short_name, '') AS court_name "
+            "FROM parties p JOIN dockets d ON d.id = p.docket_id LEFT JOIN courts c ON c.id = d.court_id "
+            f"WHERE p.key IN ({', '.join('?' for _ in keys)}) "
+            f"ORDER BY d.date_filed DESC, d.id DESC, p.party_type = '{CAPTION_PARTY}'"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, keys).fetchall()
+        out: List[DocketMatch] = []
+        seen = set()
+        for r in rows:
+            if r["id"] in seen:
+                continue
+            seen.add(r["id"])
+            out.append(
+                DocketMatch(
+                    docket_id=r["id"],
+                    court_id=r["court_id"],
+                    court_name=r["court_name"],
+                    docket_number=r["docket_number"],
+                    case_name=r["case_name"],
+                    date_filed=r["date_filed"],
+                    date_terminated=r["date_terminated"],
+                    nature_of_suit=r["nature_of_suit"],
+                    cause=r["cause"],
+                    slug=r["slug"],
+                    party_name=r["party_name"],
+                    party_type=r["party_type"],
+                )
+            )
+            if limit is not None and len(out) >= limit:
+                break
+        return out
@@ -1,5 +1,41 @@
-"""Sanctions Screener (stub)."""
+"""Sanctions Screener: OFAC SDN/consolidated list screening from local files, with delta rescreening."""
 
-from agents.specialist_agents.legal_agent.sanctions_screener.screener import run_stub
+from agents.specialist_agents.legal_agent.sanctions_screener.index import (
+    NameIndex,
+    SanctionsHit,
+    SanctionsIndex,
+    screening_key,
+    transliterate,
+)
+from agents.specialist_agents.legal_agent.sanctions_screener.lists import SanctionsEntry, load_ofac_csv, load_ofac_xml, load_sanctions_lists
+from agents.specialist_agents.legal_agent.sanctions_screener.monitor import (
+    ListDelta,
+    RescreenResult,
+    SanctionsAlert,
+    SanctionsMonitor,
+    default_state_path,
+    diff_lists,
+)
+from agents.specialist_agents.legal_agent.sanctions_screener.screener import get_sanctions_index, run, run_stub, screen_entity
 
-__all__ = ["run_stub"]
+__all__ = [
+    "ListDelta",
+    "NameIndex",
+    "RescreenResult",
+    "SanctionsAlert",
+    "SanctionsEntry",
+    "SanctionsHit",
+    "SanctionsIndex",
+    "SanctionsMonitor",
+    "default_state_path",
+    "diff_lists",
+    "get_sanctions_index",
+    "load_ofac_csv",
+    "load_ofac_xml",
+    "load_sanctions_lists",
+    "run",
+    "run_stub",
+    "screen_entity",
+    "screening_key",
+    "transliterate",
+]
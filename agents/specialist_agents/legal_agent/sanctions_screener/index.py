@@ -0,0 +1,242 @@
+"""
+Sanctions name index: transliterated keys, token postings and a character n-gram index.
+
+Every listed name and alias is transliterated (Cyrillic to Latin, accents and
+ligatures folded: "Łukasz Müller" -> "lukasz muller"), normalized and stripped of
+legal suffixes, then indexed by its tokens.
+
+Screening a name:
+
+1. an exact key hit comes straight from a hash map;
+2. each query token is looked up in the token vocabulary; a token that is not
+   listed (a misspelling) is matched against the vocabulary through a character
+   trigram inverted index, verified with Jaro-Winkler;
+3. names are counted over the postings of the matched tokens, rarest token
+   first; once POSTINGS_BUDGET names are counted, commoner tokens ("mohammad",
+   "trading") only add to names already found (a set intersection), so a query
+   never walks a huge posting list;
+4. the names sharing the most tokens (at least MIN_COVERAGE of the query's or of
+   their own) are scored with Jaro-Winkler on the key and on its token-sorted
+   form ("KIM, Jong Un" vs "Jong Un Kim"); the better of the two must reach the
+   threshold.
+"""
+
+from __future__ import annotations
+
+import heapq
+import unicodedata
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Iterable, List, Sequence, Set, Tuple, TypeVar
+
+from agents.lead_agent.entity_resolution.fuzzy import fuzzy_key, jaro_winkler
+from agents.specialist_agents.legal_agent.sanctions_screener.lists import SanctionsEntry
+
+
+DEFAULT_THRESHOLD = 0.88
+TOKEN_THRESHOLD = 0.85  # Jaro-Winkler for a misspelled query token to stand in for a listed token
+MIN_FUZZY_TOKEN = 4  # shorter tokens are only matched exactly
+MAX_TOKEN_VARIANTS = 5
+MIN_TOKEN_DICE = 0.3
+MIN_COVERAGE = 0.5  # share of the query's and of the listed name's tokens that must match
+MAX_CANDIDATES = 20
+POSTINGS_BUDGET = 1000  # names counted per query; commoner tokens only re-rank names already found
+
+T = TypeVar("T")
+
+_CYRILLIC = {
+    "а": "a", "б": "b", "в": "v", "г": "g", "ґ": "g", "д": "d", "е": "e", "ё": "e", "є": "ye",
+    "ж": "zh", "з": "z", "и": "i", "і": "i", "ї": "yi", "й": "y", "к": "k", "л": "l", "м": "m",
+    "н": "n", "о": "o", "п": "p", "р": "r", "с": "s", "т": "t", "у": "u", "ф": "f", "х": "kh",
+    "ц": "ts", "ч": "ch", "ш": "sh", "щ": "shch", "ъ": "", "ы": "y", "ь": "", "э": "e", "ю": "yu",
+    "я": "ya",
+}
+_LATIN = {"ß": "ss", "æ": "ae", "œ": "oe", "ø": "o", "ł": "l", "đ": "d", "ð": "d", "þ": "th", "ı": "i"}
+_TRANSLIT = str.maketrans(
+    {**_CYRILLIC, **_LATIN, **{k.upper(): v.capitalize() for k, v in {**_CYRILLIC, **_LATIN}.items() if len(k.upper()) == 1 and k != "ı"}}
+)
+
+
+def transliterate(text: str) -> str:
+    """Latin-script ASCII approximation of text (Cyrillic transliterated, diacritics dropped)."""
+    decomposed = unicodedata.normalize("NFKD", (text or "").translate(_TRANSLIT))
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def screening_key(name: str) -> str:
+    """Index key of a name: transliterated, normalized, without legal suffixes."""
+    return fuzzy_key(transliterate(name))
+
+
+def name_grams(key: str) -> Set[str]:
+    """Trigrams of each space-padded token (independent of token order)."""
+    grams: Set[str] = set()
+    for token in key.split(" "):
+        padded = f" {token} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _token_sorted(key: str) -> str:
+    return " ".join(sorted(key.split(" ")))
+
+
+def name_similarity(a: str, b: str) -> float:
+    """Similarity of two screening keys: best of Jaro-Winkler as written and token-sorted."""
+    if a == b:
+        return 1.0
+    return max(jaro_winkler(a, b), jaro_winkler(_token_sorted(a), _token_sorted(b)))
+
+
+@dataclass(frozen=True)
+class SanctionsHit:
+    """A screened name that matches a listed name or alias of entry."""
+
+    query: str
+    entry: SanctionsEntry
+    matched_name: str
+    score: float
+
+    @property
+    def exact(self) -> bool:
+        return self.score >= 1.0
+
+
+class NameIndex(Generic[T]):
+    """
+    Immutable screening index over items that each have several names; build once,
+    search from any thread. names(item) gives an item's names (only used while building,
+    so the index pickles without it).
+    """
+
+    def __init__(self, items: Sequence[T], names: Callable[[T], Iterable[str]]):
+        self.items: List[T] = list(items)
+        self._keys: List[str] = []
+        self._names: List[str] = []
+        self._entry_of = array("I")
+        self._token_counts = array("H")  # distinct tokens per name
+        self._exact: Dict[str, List[int]] = {}
+        self._vocab: Dict[str, int] = {}
+        self._tokens: List[str] = []
+        token_names: List[List[int]] = []
+        for ei, item in enumerate(self.items):
+            seen: Set[str] = set()
+            for text in names(item):
+                key = screening_key(text)
+                if not key or key in seen:
+                    continue
+                seen.add(key)
+                nid = len(self._keys)
+                self._keys.append(key)
+                self._names.append(text)
+                self._entry_of.append(ei)
+                self._exact.setdefault(key, []).append(nid)
+                tokens = set(key.split(" "))
+                self._token_counts.append(min(len(tokens), 0xFFFF))
+                for token in tokens:
+                    tid = self._vocab.get(token)
+                    if tid is None:
+                        tid = self._vocab[token] = len(self._tokens)
+                        self._tokens.append(token)
+                        token_names.append([])
+                    token_names[tid].append(nid)
+        self._token_names: List[array] = [array("I", ids) for ids in token_names]
+        gram_tokens: Dict[str, List[int]] = {}
+        for tid, token in enumerate(self._tokens):
+            if len(token) >= MIN_FUZZY_TOKEN:
+                for g in name_grams(token):
+                    gram_tokens.setdefault(g, []).append(tid)
+        self._gram_tokens: Dict[str, array] = {g: array("I", ids) for g, ids in gram_tokens.items()}
+        self._token_grams = array("H", (len(name_grams(t)) for t in self._tokens))
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def name_count(self) -> int:
+        return len(self._keys)
+
+    def _similar_tokens(self, token: str) -> List[int]:
+        """Listed tokens spelled like token (trigram candidates, Jaro-Winkler verified)."""
+        grams = name_grams(token)
+        counts: Counter = Counter()
+        for g in grams:
+            posting = self._gram_tokens.get(g)
+            if posting is not None:
+                counts.update(posting)
+        n, tg = len(grams), self._token_grams
+        scored = [(2 * c / (n + tg[tid]), tid) for tid, c in counts.items() if 2 * c >= MIN_TOKEN_DICE * (n + tg[tid])]
+        out = []
+        for _, tid in heapq.nlargest(2 * MAX_TOKEN_VARIANTS, scored):
+            if jaro_winkler(token, self._tokens[tid]) >= TOKEN_THRESHOLD:
+                out.append(tid)
+                if len(out) == MAX_TOKEN_VARIANTS:
+                    break
+        return out
+
+    def _candidates(self, tokens: Sequence[str]) -> List[int]:
+        """Name ids sharing (possibly misspelled) tokens with the query, most shared first."""
+        per_token: List[List[array]] = []
+        for token in tokens:
+            tid = self._vocab.get(token)
+            tids = [tid] if tid is not None else self._similar_tokens(token) if len(token) >= MIN_FUZZY_TOKEN else []
+            if tids:
+                per_token.append([self._token_names[t] for t in tids])
+        per_token.sort(key=lambda lists: sum(map(len, lists)))
+        counts: Counter = Counter()
+        read = 0
+        for i, lists in enumerate(per_token):
+            names = set().union(*lists) if len(lists) > 1 else lists[0]
+            size = len(names)
+            if i and read + size > POSTINGS_BUDGET:
+                # A common token ("mohammad", "trading") only adds to names the rarer tokens found.
+                counts.update(counts.keys() & (names if isinstance(names, set) else set(names)))
+                continue
+            read += size
+            counts.update(names)
+        n, tc = len(tokens), self._token_counts
+        need = MIN_COVERAGE * n
+        scored = [(c, -abs(tc[nid] - n), nid) for nid, c in counts.items() if c >= need or c >= MIN_COVERAGE * tc[nid]]
+        return [nid for _, _, nid in heapq.nlargest(MAX_CANDIDATES, scored)]
+
+    def search(self, name: str, *, threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[int, str, float]]:
+        """(item index, matched name, score) for items with a name similar to name, best first (one per item)."""
+        key = screening_key(name)
+        if not key:
+            return []
+        best: Dict[int, Tuple[int, str, float]] = {}
+        for nid in self._exact.get(key, ()):
+            best.setdefault(self._entry_of[nid], (self._entry_of[nid], self._names[nid], 1.0))
+        for nid in self._candidates(list(dict.fromkeys(key.split(" ")))):
+            ei = self._entry_of[nid]
+            if ei in best and best[ei][2] >= 1.0:
+                continue
+            score = round(name_similarity(key, self._keys[nid]), 4)
+            if score >= threshold and (ei not in best or score > best[ei][2]):
+                best[ei] = (ei, self._names[nid], score)
+        return sorted(best.values(), key=lambda h: (-h[2], h[0]))
+
+
+class SanctionsIndex(NameIndex[SanctionsEntry]):
+    """Screening index over sanctions list entries (names and aliases)."""
+
+    def __init__(self, entries: Sequence[SanctionsEntry]):
+        super().__init__(entries, _entry_names)
+
+    @property
+    def entries(self) -> List[SanctionsEntry]:
+        return self.items
+
+    def screen(self, name: str, *, threshold: float = DEFAULT_THRESHOLD, limit: int = 10) -> List[SanctionsHit]:
+        """Entries with a name or alias similar to name, best first (one hit per entry)."""
+        hits = [SanctionsHit(name, self.items[i], matched, score) for i, matched, score in self.search(name, threshold=threshold)]
+        return sorted(hits, key=lambda h: (-h.score, h.entry.key))[:limit]
+
+    def screen_many(self, names: Iterable[str], *, threshold: float = DEFAULT_THRESHOLD) -> Dict[str, List[SanctionsHit]]:
+        """Hits per distinct name (names with no hit map to [])."""
+        return {name: self.screen(name, threshold=threshold) for name in dict.fromkeys(names)}
+
+
+def _entry_names(entry: SanctionsEntry) -> Tuple[str, ...]:
+    return (entry.name, *entry.aliases)
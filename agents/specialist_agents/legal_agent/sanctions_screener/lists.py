@@ -0,0 +1,184 @@
+"""
+OFAC sanctions list loaders: SDN and consolidated (non-SDN) lists, CSV or XML.
+
+Files are staged offline in data/reference/sanctions/, as published at
+https://sanctionslist.ofac.treas.gov:
+
+- CSV: sdn.csv + alt.csv (SDN) and cons_prim.csv + cons_alt.csv (consolidated);
+  header-less, "-0-" for empty fields, aliases keyed by ent_num;
+- XML: sdn.xml and consolidated.xml (sdnEntry elements with an akaList).
+
+When both forms of a list are present the CSV files win.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+SANCTIONS_DIR_NAME = "sanctions"
+OFAC_NULL = "-0-"
+# (list name, primary file, alias file)
+CSV_LISTS = (("SDN", "sdn.csv", "alt.csv"), ("CONS", "cons_prim.csv", "cons_alt.csv"))
+XML_LISTS = (("SDN", "sdn.xml"), ("CONS", "consolidated.xml"))
+
+
+@dataclass(frozen=True)
+class SanctionsEntry:
+    """One listed party: uid is OFAC's ent_num, name is as published ("LAST, First" for individuals)."""
+
+    uid: str
+    list_name: str
+    name: str
+    entry_type: str = "entity"  # entity | individual | vessel | aircraft
+    programs: Tuple[str, ...] = ()
+    aliases: Tuple[str, ...] = ()
+    remarks: str = ""
+
+    @property
+    def key(self) -> str:
+        return f"{self.list_name}:{self.uid}"
+
+
+def sanctions_dir(data_root: Path) -> Path:
+    return Path(data_root) / "reference" / SANCTIONS_DIR_NAME
+
+
+def _clean(value: Optional[str]) -> str:
+    value = (value or "").strip()
+    return "" if value == OFAC_NULL else value
+
+
+def _read_text(path: Path) -> str:
+    data = path.read_bytes()
+    try:
+        return data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return data.decode("cp1252", errors="replace")
+
+
+def _csv_rows(path: Path) -> Iterator[List[str]]:
+    for row in csv.reader(io.StringIO(_read_text(path))):
+        if row and row[0].strip().isdigit():  # skips blank lines and the EOF marker
+            yield row
+
+
+def _programs(value: str) -> Tuple[str, ...]:
+    # "SDGT] [IFSR" -> ("SDGT", "IFSR")
+    return tuple(p.strip(" []") for p in _clean(value).split("] [") if p.strip(" []"))
+
+
+def load_ofac_csv(primary: Path, aliases: Optional[Path] = None, list_name: str = "SDN") -> List[SanctionsEntry]:
+    """Entries from an OFAC primary CSV (ent_num, name, type, programs, ..., remarks) plus its alt CSV."""
+    alt_names: Dict[str, List[str]] = {}
+    if aliases is not None and aliases.exists():
+        for row in _csv_rows(aliases):
+            if len(row) >= 4 and _clean(row[3]):
+                alt_names.setdefault(row[0].strip(), []).append(_clean(row[3]))
+    entries: List[SanctionsEntry] = []
+    for row in _csv_rows(primary):
+        row += [""] * (12 - len(row))
+        uid, name = row[0].strip(), _clean(row[1])
+        if not name:
+            continue
+        entries.append(
+            SanctionsEntry(
+                uid=uid,
+                list_name=list_name,
+                name=name,
+                entry_type=_clean(row[2]).lower() or "entity",
+                programs=_programs(row[3]),
+                aliases=tuple(dict.fromkeys(alt_names.get(uid, ()))),
+                remarks=_clean(row[11]),
+            )
+        )
+    return entries
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_text(elem: ET.Element, name: str) -> str:
+    for child in elem:
+        if _local(child.tag) == name:
+            return (child.text or "").strip()
+    return ""
+
+
+def _xml_name(elem: ET.Element) -> str:
+    last, first = _child_text(elem, "lastName"), _child_text(elem, "firstName")
+    return f"{last}, {first}" if last and first else last or first
+
+
+def load_ofac_xml(path: Path, list_name: str = "SDN") -> List[SanctionsEntry]:
+    """Entries from an OFAC XML file (streamed; any namespace)."""
+    entries: List[SanctionsEntry] = []
+    for _, elem in ET.iterparse(str(path), events=("end",)):
+        if _local(elem.tag) != "sdnEntry":
+            continue
+        name = _xml_name(elem)
+        if name:
+            programs: List[str] = []
+            aliases: List[str] = []
+            for child in elem:
+                tag = _local(child.tag)
+                if tag == "programList":
+                    programs.extend((p.text or "").strip() for p in child if (p.text or "").strip())
+                elif tag == "akaList":
+                    aliases.extend(n for n in (_xml_name(aka) for aka in child) if n)
+            entries.append(
+                SanctionsEntry(
+                    uid=_child_text(elem, "uid"),
+                    list_name=list_name,
+                    name=name,
+                    entry_type=(_child_text(elem, "sdnType") or "entity").lower(),
+                    programs=tuple(programs),
+                    aliases=tuple(dict.fromkeys(aliases)),
+                    remarks=_child_text(elem, "remarks"),
+                )
+            )
+        elem.clear()
+    return entries
+
+
+def list_files(directory: Path) -> List[Path]:
+    """The list files load_sanctions_lists would read from directory (primary and alias files)."""
+    directory = Path(directory)
+    files: List[Path] = []
+    for list_name, primary, alt in CSV_LISTS:
+        if (directory / primary).exists():
+            files.append(directory / primary)
+            if (directory / alt).exists():
+                files.append(directory / alt)
+        else:
+            xml_name = dict(XML_LISTS)[list_name]
+            if (directory / xml_name).exists():
+                files.append(directory / xml_name)
+    return files
+
+
+def lists_signature(directory: Path) -> str:
+    """Name, size and mtime of the staged list files ("" when none are staged)."""
+    parts = []
+    for path in list_files(directory):
+        st = path.stat()
+        parts.append(f"{path.name}:{st.st_size}:{st.st_mtime_ns}")
+    return ";".join(parts)
+
+
+def load_sanctions_lists(directory: Path) -> List[SanctionsEntry]:
+    """Every entry from the SDN and consolidated lists staged in directory (CSV preferred over XML)."""
+    directory = Path(directory)
+    entries: List[SanctionsEntry] = []
+    for list_name, primary, alt in CSV_LISTS:
+        if (directory / primary).exists():
+            entries.extend(load_ofac_csv(directory / primary, directory / alt, list_name))
+        elif (directory / dict(XML_LISTS)[list_name]).exists():
+            entries.extend(load_ofac_xml(directory / dict(XML_LISTS)[list_name], list_name))
+    return entries
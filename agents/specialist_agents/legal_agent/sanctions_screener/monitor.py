@@ -0,0 +1,261 @@
+"""
+Delta rescreening: when a sanctions list is updated, screen only what changed.
+
+The monitor keeps its state in one pickle (data/processed/sanctions_monitor.pickle,
+written atomically):
+
+- the list version: a fingerprint of every entry seen in the last update;
+- the monitored parties and a NameIndex over their names and aliases;
+- the current hits (party, list entry), so only hits not seen before alert.
+
+update(entries) diffs a newly loaded list against the stored fingerprints. Added
+and changed entries have their names searched in the monitored-name index, so the
+cost follows the size of the delta rather than of the portfolio or the list.
+Removed entries drop their hits, and a changed entry that no longer matches
+clears its hit. Parties added with watch() since the last update (and everyone,
+on the first update) are screened once against the whole list instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from osint_swarm.entities import Entity
+from osint_swarm.utils.io import write_bytes
+
+from agents.specialist_agents.legal_agent.sanctions_screener.index import DEFAULT_THRESHOLD, NameIndex, SanctionsIndex
+from agents.specialist_agents.legal_agent.sanctions_screener.lists import SanctionsEntry
+
+
+STATE_NAME = "sanctions_monitor.pickle"
+STATE_VERSION = 1
+
+# (entity_id, entry key) -> (score, monitored name, listed name)
+HitKey = Tuple[str, str]
+HitValue = Tuple[float, str, str]
+
+
+def default_state_path(data_root: Path) -> Path:
+    return Path(data_root) / "processed" / STATE_NAME
+
+
+def entry_fingerprint(entry: SanctionsEntry) -> str:
+    """Hash of everything screening depends on (names, type, programs, remarks)."""
+    data = [entry.name, entry.entry_type, sorted(entry.programs), sorted(entry.aliases), entry.remarks]
+    return hashlib.sha1(json.dumps(data, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ListDelta:
+    """Entries added, changed and removed (by key) since the previous list version."""
+
+    added: Tuple[SanctionsEntry, ...] = ()
+    changed: Tuple[SanctionsEntry, ...] = ()
+    removed: Tuple[str, ...] = ()
+    unchanged: int = 0
+    version: str = ""
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+
+def diff_lists(previous: Mapping[str, str], entries: Iterable[SanctionsEntry]) -> Tuple[ListDelta, Dict[str, str]]:
+    """(delta against previous fingerprints, new entry key -> fingerprint map)."""
+    current: Dict[str, str] = {}
+    added: List[SanctionsEntry] = []
+    changed: List[SanctionsEntry] = []
+    for entry in entries:
+        fp = current[entry.key] = entry_fingerprint(entry)
+        old = previous.get(entry.key)
+        if old is None:
+            added.append(entry)
+        elif old != fp:
+            changed.append(entry)
+    removed = tuple(sorted(k for k in previous if k not in current))
+    version = hashlib.sha1("".join(f"{k}={current[k]};" for k in sorted(current)).encode("utf-8")).hexdigest()
+    unchanged = len(current) - len(added) - len(changed)
+    return ListDelta(tuple(added), tuple(changed), removed, unchanged, version), current
+
+
+@dataclass(frozen=True)
+class MonitoredParty:
+    """A watched entity: its name, aliases and related parties are all screened."""
+
+    entity_id: str
+    names: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class SanctionsAlert:
+    """A new hit: reason is "added", "changed" (list side) or "watched" (newly monitored party)."""
+
+    entity_id: str
+    entry: SanctionsEntry
+    screened_name: str
+    matched_name: str
+    score: float
+    reason: str
+
+
+@dataclass
+class RescreenResult:
+    """Outcome of one SanctionsMonitor.update."""
+
+    delta: ListDelta
+    alerts: List[SanctionsAlert] = field(default_factory=list)
+    cleared: List[HitKey] = field(default_factory=list)
+    screened_entries: int = 0
+    screened_parties: int = 0
+    elapsed_s: float = 0.0
+
+
+def _party_names(party: MonitoredParty) -> Tuple[str, ...]:
+    return party.names
+
+
+class SanctionsMonitor:
+    """Monitored parties plus the list version and hits of the last update (see module docstring)."""
+
+    def __init__(self, state_path: Path, *, threshold: float = DEFAULT_THRESHOLD):
+        self.state_path = Path(state_path)
+        self.threshold = threshold
+        self.list_version = ""
+        self.updated_at: Optional[float] = None
+        self.parties: Dict[str, MonitoredParty] = {}
+        self.hits: Dict[HitKey, HitValue] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._pending: Set[str] = set()
+        self._index: Optional[NameIndex[MonitoredParty]] = None
+        self._load()
+
+    def _load(self) -> None:
+        if not self.state_path.exists():
+            return
+        try:
+            state = pickle.loads(self.state_path.read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return
+        if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+            return
+        self.list_version = state["list_version"]
+        self.updated_at = state["updated_at"]
+        self.parties = state["parties"]
+        self.hits = state["hits"]
+        self._fingerprints = state["fingerprints"]
+        self._pending = set(state["pending"])
+        self._index = state["index"]
+
+    def save(self) -> None:
+        state = {
+            "version": STATE_VERSION,
+            "list_version": self.list_version,
+            "updated_at": self.updated_at,
+            "parties": self.parties,
+            "hits": self.hits,
+            "fingerprints": self._fingerprints,
+            "pending": sorted(self._pending),
+            "index": self._monitored_index(),
+        }
+        write_bytes(self.state_path, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _monitored_index(self) -> NameIndex[MonitoredParty]:
+        if self._index is None:
+            self._index = NameIndex(sorted(self.parties.values(), key=lambda p: p.entity_id), _party_names)
+        return self._index
+
+    def watch(self, entities: Iterable[Entity], related_parties: Optional[Mapping[str, Iterable[str]]] = None) -> int:
+        """Monitor entities (name, aliases and related party names); returns how many are new or changed."""
+        related_parties = related_parties or {}
+        changed = 0
+        for entity in entities:
+            names = tuple(dict.fromkeys(n for n in (entity.name, *entity.aliases, *related_parties.get(entity.entity_id, ())) if n and n.strip()))
+            party = MonitoredParty(entity.entity_id, names)
+            if self.parties.get(entity.entity_id) != party:
+                self.parties[entity.entity_id] = party
+                self._pending.add(entity.entity_id)
+                changed += 1
+        if changed:
+            self._index = None
+        return changed
+
+    def unwatch(self, entity_ids: Iterable[str]) -> int:
+        removed = [eid for eid in entity_ids if self.parties.pop(eid, None) is not None]
+        if removed:
+            gone = set(removed)
+            self._pending -= gone
+            self.hits = {k: v for k, v in self.hits.items() if k[0] not in gone}
+            self._index = None
+        return len(removed)
+
+    def _screen_entry(self, entry: SanctionsEntry) -> Dict[HitKey, HitValue]:
+        """Hits of one list entry on the monitored parties (searched by each of the entry's names)."""
+        index = self._monitored_index()
+        out: Dict[HitKey, HitValue] = {}
+        for listed in (entry.name, *entry.aliases):
+            for i, monitored, score in index.search(listed, threshold=self.threshold):
+                key = (index.items[i].entity_id, entry.key)
+                if key not in out or score > out[key][0]:
+                    out[key] = (score, monitored, listed)
+        return out
+
+    def update(self, entries: Sequence[SanctionsEntry]) -> RescreenResult:
+        """Diff entries against the last version, screen the delta (and new parties), record and return new hits."""
+        start = time.monotonic()
+        delta, fingerprints = diff_lists(self._fingerprints, entries)
+        result = RescreenResult(delta)
+        previous = dict(self.hits)
+        by_key = {e.key: e for e in entries}
+        hits = dict(self.hits)
+        reasons: Dict[HitKey, str] = {}
+
+        # First update: nothing to diff against, so every party is screened against the whole list.
+        if not self._fingerprints:
+            self._pending.update(self.parties)
+        pending = sorted(eid for eid in self._pending if eid in self.parties)
+        pending_set = set(pending)
+
+        # Hits of changed/removed entries and of re-watched parties are recomputed below.
+        touched = set(delta.removed) | {e.key for e in delta.changed}
+        for key in [k for k in hits if k[1] in touched or k[0] in pending_set]:
+            del hits[key]
+
+        if self._fingerprints:
+            for reason, batch in (("added", delta.added), ("changed", delta.changed)):
+                for entry in batch:
+                    for key, value in self._screen_entry(entry).items():
+                        hits[key] = value
+                        reasons.setdefault(key, reason)
+            result.screened_entries = len(delta.added) + len(delta.changed)
+
+        if pending:
+            list_index = SanctionsIndex(entries)
+            for eid in pending:
+                for name in self.parties[eid].names:
+                    for hit in list_index.screen(name, threshold=self.threshold):
+                        key = (eid, hit.entry.key)
+                        if key not in hits or hit.score > hits[key][0]:
+                            hits[key] = (hit.score, name, hit.matched_name)
+                        reasons.setdefault(key, "watched")
+        result.screened_parties = len(pending)
+
+        for key in sorted(hits):
+            if key not in previous and key[1] in by_key:
+                score, monitored, listed = hits[key]
+                result.alerts.append(SanctionsAlert(key[0], by_key[key[1]], monitored, listed, score, reasons.get(key, "added")))
+        result.alerts.sort(key=lambda a: (-a.score, a.entity_id, a.entry.key))
+        result.cleared = sorted(k for k in previous if k not in hits)
+
+        self.hits = hits
+        self._fingerprints = fingerprints
+        self._pending.clear()
+        self.list_version = delta.version
+        self.updated_at = time.time()
+        result.elapsed_s = round(time.monotonic() - start, 4)
+        return result
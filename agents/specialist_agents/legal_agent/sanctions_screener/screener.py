@@ -1,13 +1,133 @@
-"""Sanctions Screener: OFAC/sanctions list checks (stub for Phase 4)."""
+"""Sanctions Screener: screen an entity and its related parties against local OFAC lists."""
 
 from __future__ import annotations
 
-from typing import List
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from osint_swarm.entities import Entity, Evidence
 
 from agents.lead_agent.context_manager import InvestigationContext
 from agents.lead_agent.task_planner.types import SubTask
+from agents.specialist_agents.legal_agent.sanctions_screener.index import DEFAULT_THRESHOLD, SanctionsHit, SanctionsIndex
+from agents.specialist_agents.legal_agent.sanctions_screener.lists import list_files, load_sanctions_lists, sanctions_dir
+
+
+OFAC_DETAILS_URL = "https://sanctionssearch.ofac.treas.gov/Details.aspx?id={uid}"
+
+_INDEXES: Dict[Path, Tuple[Tuple[Tuple[str, int, int], ...], SanctionsIndex]] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def _signature(files: Sequence[Path]) -> Tuple[Tuple[str, int, int], ...]:
+    out = []
+    for path in files:
+        st = path.stat()
+        out.append((path.name, st.st_size, st.st_mtime_ns))
+    return tuple(out)
+
+
+def get_sanctions_index(data_root: Optional[Path] = None) -> Optional[SanctionsIndex]:
+    """
+    Index over the lists staged in <data_root>/reference/sanctions/ (None if there are none).
+
+    Built once per process and rebuilt when a list file's size or mtime changes.
+    """
+    directory = sanctions_dir(Path(data_root) if data_root else Path("data"))
+    files = list_files(directory)
+    if not files:
+        return None
+    signature = _signature(files)
+    with _INDEXES_LOCK:
+        cached = _INDEXES.get(directory)
+        if cached is None or cached[0] != signature:
+            cached = _INDEXES[directory] = (signature, SanctionsIndex(load_sanctions_lists(directory)))
+        return cached[1]
+
+
+def _hit_evidence(entity: Entity, hit: SanctionsHit, raw_location: Optional[str]) -> Evidence:
+    entry = hit.entry
+    programs = ", ".join(entry.programs) or "unspecified program"
+    return Evidence(
+        evidence_id=f"{entity.entity_id}_sanctions_{entry.list_name.lower()}_{entry.uid}",
+        entity_id=entity.entity_id,
+        date="",
+        source_type="regulator_report",
+        risk_category="legal",
+        summary=(
+            f"{'Exact' if hit.exact else 'Possible'} OFAC {entry.list_name} match: '{hit.query}' ~ "
+            f"'{hit.matched_name}' ({entry.entry_type}; {programs}; score {hit.score:.2f})."
+        ),
+        source_uri=OFAC_DETAILS_URL.format(uid=entry.uid),
+        raw_location=raw_location,
+        confidence=round(hit.score, 4),
+        attributes={
+            "list": entry.list_name,
+            "uid": entry.uid,
+            "listed_name": entry.name,
+            "matched_name": hit.matched_name,
+            "screened_name": hit.query,
+            "score": hit.score,
+            "programs": list(entry.programs),
+            "entry_type": entry.entry_type,
+        },
+    )
+
+
+def screen_entity(
+    entity: Entity,
+    index: SanctionsIndex,
+    *,
+    related_parties: Iterable[str] = (),
+    threshold: float = DEFAULT_THRESHOLD,
+    raw_location: Optional[str] = None,
+) -> List[Evidence]:
+    """
+    Screen the entity's name, aliases and related_parties against index.
+
+    Returns one Evidence per matched list entry (best-scoring screened name), or a
+    single "no match" Evidence recording what was screened.
+    """
+    names = list(dict.fromkeys(n for n in (entity.name, *entity.aliases, *related_parties) if n and n.strip()))
+    best: Dict[str, SanctionsHit] = {}
+    for hits in index.screen_many(names, threshold=threshold).values():
+        for hit in hits:
+            if hit.entry.key not in best or hit.score > best[hit.entry.key].score:
+                best[hit.entry.key] = hit
+    if best:
+        ranked = sorted(best.values(), key=lambda h: (-h.score, h.entry.key))
+        return [_hit_evidence(entity, hit, raw_location) for hit in ranked]
+    return [
+        Evidence(
+            evidence_id=f"{entity.entity_id}_sanctions_clear",
+            entity_id=entity.entity_id,
+            date="",
+            source_type="regulator_report",
+            risk_category="legal",
+            summary=f"No OFAC sanctions list match for {len(names)} screened name(s) ({len(index)} listed entries).",
+            source_uri="https://sanctionslist.ofac.treas.gov",
+            raw_location=raw_location,
+            confidence=0.9,
+            attributes={"screened_names": names, "list_entries": len(index), "threshold": threshold},
+        )
+    ]
+
+
+def run(
+    entity: Entity,
+    task: SubTask,
+    context: InvestigationContext,
+    *,
+    data_root: Optional[Path] = None,
+    related_parties: Iterable[str] = (),
+) -> List[Evidence]:
+    """Screen against the locally staged OFAC lists; falls back to run_stub when none are staged."""
+    index = get_sanctions_index(data_root)
+    if index is None:
+        return run_stub(entity, task, context)
+    directory = sanctions_dir(Path(data_root) if data_root else Path("data"))
+    return screen_entity(entity, index, related_parties=related_parties, raw_location=str(directory))
 
 
 def run_stub(
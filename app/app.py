@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
 
@@ -11,9 +12,9 @@ for p in (ROOT, SRC):
     if str(p) not in sys.path:
         sys.path.insert(0, str(p))
 
-from flask import Flask, render_template, request
+from flask import Flask, Response, render_template, request, stream_with_context
 
-from app.pipeline import run_investigation
+from app.pipeline import run_investigation, stream_investigation
 
 app = Flask(__name__, template_folder=Path(__file__).resolve().parent / "templates")
 
@@ -41,6 +42,24 @@ def index():
     return render_template("results.html", result=result)
 
 
+@app.route("/stream")
+def stream():
+    """Server-sent events: one "progress" event per pipeline update, then "completed"."""
+    query = (request.args.get("query") or "").strip()
+    if not query:
+        return Response("Missing query parameter.", status=400, mimetype="text/plain")
+
+    def events():
+        for update in stream_investigation(query, data_root=ROOT / "data"):
+            if update["event"] == "completed":
+                result = {k: v for k, v in update["result"].items() if k not in ("report_html", "report_md")}
+                yield f"event: completed\ndata: {json.dumps(result, default=str)}\n\n"
+            else:
+                yield f"event: progress\ndata: {json.dumps(update, default=str)}\n\n"
+
+    return Response(stream_with_context(events()), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 def main():
     app.run(host="0.0.0.0", port=5000, debug=True)
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 # Path setup for running as app
 import sys
@@ -13,20 +16,75 @@ for p in (ROOT, SRC):
     if str(p) not in sys.path:
         sys.path.insert(0, str(p))
 
-from agents.lead_agent import LeadAgent
+from osint_swarm.entities import Entity
+
+from agents.lead_agent import (
+    EntityResolved,
+    FindingsBatch,
+    InvestigationCompleted,
+    LeadAgent,
+    TaskCompleted,
+    TaskFailed,
+    TasksPlanned,
+    TaskStarted,
+    resolve_one,
+)
 from knowledge_graph import build_graph_from_evidence
 from output_layer.audit_trail import AuditTrail
 from output_layer.evidence_report_generator import generate_markdown_report
-from output_layer.risk_dashboard import compute_risk_scores, format_dashboard_cli
-from reflexion_layer import aggregate_confidence, cross_check_findings, detect_gaps
+from output_layer.risk_dashboard import RiskScoreAccumulator, compute_risk_scores, format_dashboard_cli
+from mcp_layer.evidence_cache import EvidenceCache
+from reflexion_layer import ConfidenceAccumulator, CrossChecker, aggregate_confidence, cross_check_findings, detect_gaps
+
+DEFAULT_BATCH_WORKERS = 4
 
 
-def run_investigation(query: str, data_root: Optional[Path] = None) -> Dict[str, Any]:
+def run_investigation(
+    query: str,
+    data_root: Optional[Path] = None,
+    *,
+    agent: Optional[LeadAgent] = None,
+    entity: Optional[Entity] = None,
+    evidence_cache: Optional[EvidenceCache] = None,
+    resume: bool = False,
+) -> Dict[str, Any]:
     """
     Run the full pipeline for one investigation query.
     Returns a dict with keys: query, entity, tasks, findings_count, findings_by_agent,
     report_md, report_html, risk_scores, risk_dashboard_cli, gaps, conflicts,
-    confidence_scores, audit_events, error (if any).
+    confidence_scores, evidence_cache, task_failures, audit_events, error (if any).
+
+    agent, entity and evidence_cache let a caller reuse a LeadAgent, a resolved
+    entity and a warm MCP cache across queries (see run_investigations).
+    resume=True continues from the agent's checkpoint (LeadAgent(checkpoint_dir=...)).
+    """
+    for update in stream_investigation(query, data_root=data_root, agent=agent, entity=entity, evidence_cache=evidence_cache, resume=resume):
+        if update["event"] == "completed":
+            return update["result"]
+    raise RuntimeError("stream_investigation ended without a result")  # pragma: no cover
+
+
+def _task_dict(task: Any) -> Dict[str, Any]:
+    return {"task_type": task.task_type, "target_agent": task.target_agent, "description": task.description}
+
+
+def stream_investigation(
+    query: str,
+    data_root: Optional[Path] = None,
+    *,
+    agent: Optional[LeadAgent] = None,
+    entity: Optional[Entity] = None,
+    evidence_cache: Optional[EvidenceCache] = None,
+    resume: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run the pipeline, yielding JSON-serializable progress updates as agents finish.
+
+    Updates have an "event" key: entity_resolved, tasks_planned, task_started,
+    task_completed (with that task's findings count plus running findings_count,
+    confidence, risk and conflict counts; restored=True if it came from a checkpoint), task_failed, and finally "completed"
+    whose "result" is the dict run_investigation returns. Running scores are
+    provisional; the final result is computed from the committed context.
     """
     data_root = data_root or ROOT / "data"
     audit = AuditTrail()
@@ -45,15 +103,51 @@ def run_investigation(query: str, data_root: Optional[Path] = None) -> Dict[str,
         "gaps": [],
         "conflicts": [],
         "confidence_scores": None,
+        "evidence_cache": None,
+        "task_failures": [],
         "audit_events": [],
         "error": None,
     }
 
     try:
         audit.record("query_received", query=query)
-        agent = LeadAgent(data_root=data_root)
-        ctx = agent.run(query)
+        agent = agent or LeadAgent(data_root=data_root)
+        confidence = ConfidenceAccumulator()
+        risk = RiskScoreAccumulator()
+        checker = CrossChecker()
+        ctx = None
+        for event in agent.iter_run(query, entity=entity, evidence_cache=evidence_cache, resume=resume):
+            if isinstance(event, EntityResolved):
+                yield {"event": "entity_resolved", "entity_id": event.entity.entity_id, "entity_name": event.entity.name}
+            elif isinstance(event, TasksPlanned):
+                yield {"event": "tasks_planned", "tasks": [_task_dict(t) for t in event.tasks]}
+            elif isinstance(event, TaskStarted):
+                yield {"event": "task_started", "task": _task_dict(event.task)}
+            elif isinstance(event, FindingsBatch):
+                confidence.add(event.findings)
+                risk.add(event.findings)
+                checker.add(event.findings)
+            elif isinstance(event, TaskCompleted):
+                yield {
+                    "event": "task_completed",
+                    "task": _task_dict(event.task),
+                    "task_findings": event.finding_count,
+                    "elapsed_s": event.elapsed_s,
+                    "restored": event.restored,
+                    "findings_count": risk.count,
+                    "confidence_overall": confidence.scores().overall,
+                    "risk_overall": risk.scores().overall,
+                    "conflicts_count": len(checker.conflicts()),
+                }
+            elif isinstance(event, TaskFailed):
+                f = event.failure
+                yield {"event": "task_failed", "task": _task_dict(f.task), "reason": f.reason, "message": f.message}
+            elif isinstance(event, InvestigationCompleted):
+                ctx = event.context
+        assert ctx is not None
         audit.record("pipeline_completed", entity_resolved=ctx.get_entity() is not None, task_count=len(ctx.get_tasks()))
+        cache_stats = ctx.evidence_cache.stats()
+        result["evidence_cache"] = {"hits": cache_stats.hits, "misses": cache_stats.misses, "coalesced": cache_stats.coalesced, "entries": cache_stats.entries}
 
         entity = ctx.get_entity()
         if entity:
@@ -61,18 +155,19 @@ def run_investigation(query: str, data_root: Optional[Path] = None) -> Dict[str,
             result["entity_name"] = entity.name
             result["entity"] = {"entity_id": entity.entity_id, "name": entity.name, "identifiers": dict(entity.identifiers)}
 
-        result["tasks"] = [{"task_type": t.task_type, "target_agent": t.target_agent, "description": t.description} for t in ctx.get_tasks()]
-        findings = ctx.get_all_findings()
-        result["findings_count"] = len(findings)
+        result["tasks"] = [_task_dict(t) for t in ctx.get_tasks()]
+        result["task_failures"] = [{"task_type": f.task.task_type, "target_agent": f.task.target_agent, "reason": f.reason, "message": f.message} for f in ctx.get_task_failures()]
         result["findings_by_agent"] = {aid: len(evs) for aid, evs in ctx.results.items()}
+        result["findings_count"] = sum(result["findings_by_agent"].values())
 
-        # Reflexion
-        result["conflicts"] = [{"dimension": c.dimension, "description": c.description, "evidence_ids": list(c.evidence_ids)} for c in cross_check_findings(findings)]
+        # Reflexion (single-pass consumers: each reads a fresh stream of the findings)
+        result["conflicts"] = [{"dimension": c.dimension, "description": c.description, "evidence_ids": list(c.evidence_ids)} for c in cross_check_findings(ctx.iter_findings())]
         result["gaps"] = [{"area": g.area, "description": g.description, "suggested_follow_up": g.suggested_follow_up} for g in detect_gaps(ctx)]
-        conf_scores = aggregate_confidence(findings)
+        conf_scores = aggregate_confidence(ctx.iter_findings())
         result["confidence_scores"] = {"overall": conf_scores.overall, "by_risk_category": conf_scores.by_risk_category, "by_source_type": conf_scores.by_source_type}
 
-        # Knowledge graph
+        # Knowledge graph and report need the full set
+        findings = ctx.get_all_findings()
         nodes, edges = build_graph_from_evidence(findings)
         result["graph_summary"] = {"nodes": len(nodes), "edges": len(edges), "entity_nodes": sum(1 for n in nodes if n.node_type == "entity"), "evidence_nodes": sum(1 for n in nodes if n.node_type == "evidence")}
 
@@ -82,7 +177,7 @@ def run_investigation(query: str, data_root: Optional[Path] = None) -> Dict[str,
         result["report_html"] = generate_html_report(findings, entity_id=result["entity_id"], query=query, graph=(nodes, edges))
 
         # Risk dashboard
-        risk_scores = compute_risk_scores(findings)
+        risk_scores = compute_risk_scores(ctx.iter_findings())
         result["risk_scores"] = {"overall": risk_scores.overall, "by_risk_category": risk_scores.by_risk_category, "finding_count": risk_scores.finding_count}
         result["risk_dashboard_cli"] = format_dashboard_cli(risk_scores)
 
@@ -92,4 +187,85 @@ def run_investigation(query: str, data_root: Optional[Path] = None) -> Dict[str,
         audit.record("pipeline_error", error=str(e))
         result["audit_events"] = audit.get_events()
 
-    return result
+    yield {"event": "completed", "result": result}
+
+
+def run_investigations(
+    queries: Sequence[str],
+    data_root: Optional[Path] = None,
+    *,
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    agent: Optional[LeadAgent] = None,
+) -> Dict[str, Any]:
+    """
+    Run many queries with shared work: one LeadAgent (and specialist agents) for the
+    batch, every query resolved up front, and one evidence cache per entity so each
+    entity's MCP sources are fetched once however many queries target it.
+
+    Queries run on a thread pool of max_workers, grouped by entity so a cache can be
+    released once its last query finishes. Returns {"results": [...], "summary": {...}};
+    results are run_investigation dicts in input order (their evidence_cache stats are
+    the entity's shared cache), summary has counts and timing.
+    """
+    data_root = data_root or ROOT / "data"
+    start = time.monotonic()
+    agent = agent or LeadAgent(data_root=data_root)
+
+    resolved: Dict[str, Optional[Entity]] = {}
+    for q in queries:
+        if q not in resolved:
+            resolved[q] = resolve_one(q)
+    resolve_s = time.monotonic() - start
+
+    # entity_id -> query indexes; unresolved queries are keyed by None and run without a cache.
+    groups: Dict[Optional[str], List[int]] = {}
+    for i, q in enumerate(queries):
+        entity = resolved[q]
+        groups.setdefault(entity.entity_id if entity else None, []).append(i)
+
+    caches: Dict[str, EvidenceCache] = {eid: EvidenceCache() for eid in groups if eid is not None}
+    remaining = {eid: len(idx) for eid, idx in groups.items()}
+    cache_totals = {"hits": 0, "misses": 0, "coalesced": 0}
+    lock = threading.Lock()
+    results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+    durations = [0.0] * len(queries)
+
+    def _run(i: int, entity_id: Optional[str]) -> None:
+        t0 = time.monotonic()
+        cache = caches.get(entity_id) if entity_id is not None else None
+        results[i] = run_investigation(
+            queries[i], data_root=data_root, agent=agent, entity=resolved[queries[i]], evidence_cache=cache
+        )
+        durations[i] = time.monotonic() - t0
+        if entity_id is None:
+            return
+        with lock:
+            remaining[entity_id] -= 1
+            if remaining[entity_id] == 0:
+                stats = caches.pop(entity_id).stats()
+                cache_totals["hits"] += stats.hits
+                cache_totals["misses"] += stats.misses
+                cache_totals["coalesced"] += stats.coalesced
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="investigation") as pool:
+        futures = [pool.submit(_run, i, eid) for eid, idx in groups.items() for i in idx]
+        for fut in futures:
+            fut.result()
+
+    elapsed_s = time.monotonic() - start
+    done = [r for r in results if r is not None]
+    summary = {
+        "queries": len(queries),
+        "distinct_queries": len(resolved),
+        "entities": len([eid for eid in groups if eid is not None]),
+        "unresolved": len(groups.get(None, [])),
+        "errors": sum(1 for r in done if r.get("error")),
+        "findings_count": sum(r["findings_count"] for r in done),
+        "evidence_cache": cache_totals,
+        "resolve_s": round(resolve_s, 3),
+        "elapsed_s": round(elapsed_s, 3),
+        "mean_query_s": round(sum(durations) / len(durations), 3) if durations else 0.0,
+        "max_query_s": round(max(durations), 3) if durations else 0.0,
+        "queries_per_s": round(len(queries) / elapsed_s, 2) if elapsed_s > 0 else 0.0,
+    }
+    return {"results": results, "summary": summary}
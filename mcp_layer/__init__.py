@@ -10,6 +10,9 @@ Usage:
 
   entity = Entity(entity_id="tesla_inc_cik_0001318605", name="Tesla, Inc.", identifiers={"cik": "0001318605", "make": "TESLA"})
   evidence = get_evidence_for_entity(entity, sources=["sec_edgar", "nhtsa"])
+  # Or fan out to all sources at once, with deadlines and partial results:
+  result = fetch_evidence_for_entity(entity, sources=["sec_edgar", "nhtsa"], source_timeout_s=10, deadline_s=20)
+  result.evidence, result.failed
   # Or load from existing processed CSV:
   evidence = load_evidence_for_entity(Path("data/processed"), entity.entity_id)
 """
@@ -17,44 +20,118 @@ Usage:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Optional, Sequence
+from typing import Any, Dict, List, Mapping, Optional, Sequence
 
 from osint_swarm.entities import Entity, Evidence
 
 from mcp_layer.base import DataSourceProcessor
+from mcp_layer.evidence_cache import EvidenceCache, EvidenceCacheStats, evidence_cache_key
+from mcp_layer.evidence_loader import LazyAttributes, iter_evidence, load_evidence_batch
 from mcp_layer.evidence_loader import load_evidence_for_entity as load_evidence_for_entity_from_dir
+from mcp_layer.evidence_store import EvidenceStore, store_path
+from mcp_layer.evidence_builder import EvidenceBuilder, SourceBuildStats
+from mcp_layer.multi_source import MultiSourceResult, SourceFailure, SourceTimeout, fetch_from_processors
 from mcp_layer.sec_edgar_processor import SecEdgarProcessor
 from mcp_layer.nhtsa_processor import NhtsaProcessor
 
 
-def get_processor(source_id: str, data_root: Optional[Path] = None) -> Optional[DataSourceProcessor]:
-    """Return the processor for the given source_id, or None."""
+SourceOptions = Mapping[str, Mapping[str, Any]]
+
+
+def get_processor(
+    source_id: str,
+    data_root: Optional[Path] = None,
+    options: Optional[Mapping[str, Any]] = None,
+) -> Optional[DataSourceProcessor]:
+    """Return the processor for the given source_id, or None.
+
+    options: processor keyword arguments, e.g. {"full_history": True, "start_date": "2010-01-01"}
+    for sec_edgar.
+    """
     root = Path(data_root) if data_root else Path("data")
+    kwargs = dict(options or {})
     if source_id == "sec_edgar":
-        return SecEdgarProcessor(data_root=root)
+        return SecEdgarProcessor(data_root=root, **kwargs)
     if source_id == "nhtsa":
-        return NhtsaProcessor(data_root=root)
+        return NhtsaProcessor(data_root=root, **kwargs)
     return None
 
 
+def _cache_params(data_root: Optional[Path], options: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+    """Filter parameters that distinguish EvidenceCache entries for the same source/entity."""
+    return {"data_root": str(data_root or "data"), **dict(options or {})}
+
+
 def get_evidence_for_entity(
     entity: Entity,
     sources: Sequence[str] = ("sec_edgar", "nhtsa"),
     data_root: Optional[Path] = None,
+    cache: Optional[EvidenceCache] = None,
+    source_options: Optional[SourceOptions] = None,
 ) -> List[Evidence]:
     """
     Fetch evidence for an entity from the requested MCP sources.
 
     sources: e.g. ["sec_edgar", "nhtsa"]. Uses cache under data/raw/ when available.
+    cache: optional investigation-scoped EvidenceCache; repeated (and concurrent)
+    requests for the same source/entity are served from one fetch.
+    source_options: per-source processor options, e.g. {"sec_edgar": {"full_history": True}}.
     """
+    source_options = source_options or {}
     out: List[Evidence] = []
     for sid in sources:
-        proc = get_processor(sid, data_root=data_root)
-        if proc:
+        proc = get_processor(sid, data_root=data_root, options=source_options.get(sid))
+        if not proc:
+            continue
+        if cache is None:
             out.extend(proc.get_evidence_for_entity(entity))
+        else:
+            key = evidence_cache_key(sid, entity, _cache_params(data_root, source_options.get(sid)))
+            out.extend(cache.get_or_fetch(key, lambda p=proc: p.get_evidence_for_entity(entity)))
     return out
 
 
+def fetch_evidence_for_entity(
+    entity: Entity,
+    sources: Sequence[str] = ("sec_edgar", "nhtsa"),
+    data_root: Optional[Path] = None,
+    cache: Optional[EvidenceCache] = None,
+    source_options: Optional[SourceOptions] = None,
+    *,
+    source_timeout_s: SourceTimeout = None,
+    deadline_s: Optional[float] = None,
+    max_workers: Optional[int] = None,
+) -> MultiSourceResult:
+    """
+    Concurrent variant of get_evidence_for_entity: fetch all sources at once.
+
+    source_timeout_s: per-source timeout in seconds (float, or source_id -> seconds).
+    deadline_s: global deadline for the whole call.
+    Returns MultiSourceResult with the evidence of every source that finished in time
+    and `failed` listing sources that raised, timed out, or are unknown.
+    """
+    source_options = source_options or {}
+    processors: List[DataSourceProcessor] = []
+    unknown: List[SourceFailure] = []
+    for sid in dict.fromkeys(sources):
+        proc = get_processor(sid, data_root=data_root, options=source_options.get(sid))
+        if proc:
+            processors.append(proc)
+        else:
+            unknown.append(SourceFailure(sid, "unknown_source", "no processor registered"))
+    result = fetch_from_processors(
+        entity,
+        processors,
+        cache=cache,
+        cache_params={p.source_id: _cache_params(data_root, source_options.get(p.source_id)) for p in processors},
+        source_timeout_s=source_timeout_s,
+        deadline_s=deadline_s,
+        max_workers=max_workers,
+    )
+    result.failed.extend(unknown)
+    return result
+
+
 def load_evidence_for_entity(processed_dir: Path, entity_id: str) -> List[Evidence]:
     """Load all Evidence for entity_id from data/processed/ (canonical agent input)."""
     return load_evidence_for_entity_from_dir(Path(processed_dir), entity_id)
@@ -62,9 +139,23 @@ def load_evidence_for_entity(processed_dir: Path, entity_id: str) -> List[Eviden
 
 __all__ = [
     "DataSourceProcessor",
+    "EvidenceCache",
+    "EvidenceCacheStats",
+    "evidence_cache_key",
     "SecEdgarProcessor",
     "NhtsaProcessor",
     "get_processor",
     "get_evidence_for_entity",
+    "fetch_evidence_for_entity",
+    "fetch_from_processors",
+    "MultiSourceResult",
+    "SourceFailure",
     "load_evidence_for_entity",
+    "iter_evidence",
+    "load_evidence_batch",
+    "LazyAttributes",
+    "EvidenceStore",
+    "store_path",
+    "EvidenceBuilder",
+    "SourceBuildStats",
 ]
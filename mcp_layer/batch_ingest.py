@@ -0,0 +1,194 @@
+"""
+Batch ingestion: pull raw data and build processed evidence for many entities.
+
+Two pools run as a pipeline:
+
+- an I/O thread pool fetches/revalidates each entity's raw files through the
+  processors' RawCache; all threads share the default HttpClient, so the SEC
+  token bucket caps the whole batch (not each thread) at the fair-access rate;
+- a process pool runs the JSON -> Evidence normalization (EvidenceBuilder) for an
+  entity as soon as its fetches are done, so CPU work overlaps the network wait.
+
+Each evidence CSV and manifest is replaced atomically by the builder, but not
+as a group: an interrupted batch can leave an entity with some new CSVs next to
+its old manifest. The manifest is written last and records each CSV's size and
+mtime, so the next run detects those CSVs and rebuilds them from the raw files.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from osint_swarm.entities import Entity
+
+from mcp_layer import get_processor
+from mcp_layer.base import DataSourceProcessor
+from mcp_layer.evidence_builder import EvidenceBuilder, SourceBuildStats
+
+
+DEFAULT_IO_WORKERS = 8
+INGEST_SOURCES = ("sec_edgar", "nhtsa")
+
+
+@dataclass
+class IngestSummary:
+    """Outcome and throughput of one batch run."""
+
+    entities: int = 0
+    raw_files: int = 0  # raw files present after the fetch phase (downloaded, revalidated or fresh)
+    fetch_failures: List[Tuple[str, str, str]] = field(default_factory=list)  # (entity_id, source_id, message)
+    build_failures: List[Tuple[str, str]] = field(default_factory=list)  # (entity_id, message)
+    sources_built: int = 0
+    sources_unchanged: int = 0
+    records_normalized: int = 0
+    rows_reused: int = 0
+    rows_removed: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def entities_per_s(self) -> float:
+        return self.entities / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def records_per_s(self) -> float:
+        return self.records_normalized / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def add(self, stats: Sequence[SourceBuildStats]) -> None:
+        for s in stats:
+            if s.status == "built":
+                self.sources_built += 1
+            elif s.status == "unchanged":
+                self.sources_unchanged += 1
+            self.records_normalized += s.normalized
+            self.rows_reused += s.reused
+            self.rows_removed += s.removed
+
+    def format(self) -> str:
+        lines = [
+            "Ingestion summary",
+            "-----------------",
+            f"Entities:          {self.entities} in {self.elapsed_s:.1f}s ({self.entities_per_s:.2f}/s)",
+            f"Raw files ready:   {self.raw_files} ({len(self.fetch_failures)} fetches failed)",
+            f"Sources built:     {self.sources_built} ({self.sources_unchanged} unchanged)",
+            f"Records:           {self.records_normalized} normalized ({self.records_per_s:.0f}/s), "
+            f"{self.rows_reused} reused, {self.rows_removed} removed",
+        ]
+        for entity_id, source_id, msg in self.fetch_failures[:10]:
+            lines.append(f"  fetch failed: {entity_id} {source_id}: {msg}")
+        for entity_id, msg in self.build_failures[:10]:
+            lines.append(f"  build failed: {entity_id}: {msg}")
+        return "\n".join(lines)
+
+
+# One builder per worker process (created lazily in the child).
+_BUILDERS: Dict[Tuple[str, str], EvidenceBuilder] = {}
+
+
+def build_entity(
+    data_root: str,
+    processed_dir: str,
+    entity: Entity,
+    force: bool = False,
+) -> List[SourceBuildStats]:
+    """Process-pool task: normalize one entity's raw files into data/processed/<entity_id>/."""
+    key = (data_root, processed_dir)
+    builder = _BUILDERS.get(key)
+    if builder is None:
+        builder = _BUILDERS[key] = EvidenceBuilder(data_root=Path(data_root), processed_dir=Path(processed_dir))
+    return builder.build(entity, force=force)
+
+
+def _fetch_raw(proc: DataSourceProcessor, entity: Entity) -> Optional[Path]:
+    return proc.ensure_raw_for_entity(entity)  # type: ignore[attr-defined]
+
+
+def ingest_entities(
+    entities: Sequence[Entity],
+    *,
+    data_root: Optional[Path] = None,
+    processed_dir: Optional[Path] = None,
+    sources: Sequence[str] = INGEST_SOURCES,
+    io_workers: int = DEFAULT_IO_WORKERS,
+    cpu_workers: Optional[int] = None,
+    fetch: bool = True,
+    force: bool = False,
+) -> IngestSummary:
+    """
+    Fetch raw data for every entity (I/O pool) and build its evidence (process pool).
+
+    cpu_workers: process count (None = os.cpu_count(); 0 = normalize in this process).
+    fetch=False skips the network and builds from whatever is already in data/raw.
+    A failed fetch is recorded and the entity is still built from its cached raw files.
+    """
+    entities = list({e.entity_id: e for e in entities}.values())
+    data_root = Path(data_root) if data_root else Path("data")
+    processed_dir = Path(processed_dir) if processed_dir else data_root / "processed"
+    summary = IngestSummary(entities=len(entities))
+    start = time.monotonic()
+    processors = [p for p in (get_processor(sid, data_root) for sid in sources) if p is not None]
+
+    # spawn, not fork: the I/O threads (and their HTTP connections) must not be copied into workers.
+    cpu_pool: Optional[Executor] = (
+        ProcessPoolExecutor(max_workers=cpu_workers, mp_context=multiprocessing.get_context("spawn"))
+        if cpu_workers != 0
+        else None
+    )
+    io_pool = ThreadPoolExecutor(max_workers=max(1, io_workers), thread_name_prefix="ingest-io")
+    builds: Dict["Future[List[SourceBuildStats]]", str] = {}
+
+    def _submit_build(entity: Entity) -> None:
+        args = (str(data_root), str(processed_dir), entity, force)
+        if cpu_pool is None:
+            fut: "Future[List[SourceBuildStats]]" = Future()
+            try:
+                fut.set_result(build_entity(*args))
+            except Exception as e:
+                fut.set_exception(e)
+        else:
+            fut = cpu_pool.submit(build_entity, *args)
+        builds[fut] = entity.entity_id
+
+    try:
+        pending_fetches: Dict[Future, Tuple[Entity, str]] = {}
+        remaining: Dict[str, int] = {}
+        for entity in entities:
+            remaining[entity.entity_id] = 0
+            if fetch:
+                for proc in processors:
+                    pending_fetches[io_pool.submit(_fetch_raw, proc, entity)] = (entity, proc.source_id)
+                    remaining[entity.entity_id] += 1
+            if remaining[entity.entity_id] == 0:
+                _submit_build(entity)
+
+        waiting: Set[Future] = set(pending_fetches)
+        while waiting:
+            done, waiting = wait(waiting, return_when=FIRST_COMPLETED)
+            for fut in done:
+                entity, source_id = pending_fetches.pop(fut)
+                exc = fut.exception()
+                if exc is not None:
+                    summary.fetch_failures.append((entity.entity_id, source_id, str(exc) or type(exc).__name__))
+                elif fut.result() is not None:
+                    summary.raw_files += 1
+                remaining[entity.entity_id] -= 1
+                if remaining[entity.entity_id] == 0:
+                    _submit_build(entity)
+
+        for fut in list(builds):
+            entity_id = builds[fut]
+            try:
+                summary.add(fut.result())
+            except Exception as e:
+                summary.build_failures.append((entity_id, str(e) or type(e).__name__))
+    finally:
+        io_pool.shutdown(wait=True)
+        if cpu_pool is not None:
+            cpu_pool.shutdown(wait=True)
+
+    summary.elapsed_s = round(time.monotonic() - start, 3)
+    return summary
@@ -0,0 +1,310 @@
+"""
+Evidence builder: incremental raw -> processed normalization for any entity.
+
+For each source, the builder writes data/processed/<entity_id>/evidence_<source>.csv
+and records in data/processed/<entity_id>/manifest.json:
+
+- the raw input's size, mtime and SHA-256 (an unchanged file is skipped outright,
+  and the hash is only computed when size/mtime moved);
+- a fingerprint per raw record (key -> hash of its canonical JSON) and the
+  evidence_ids it produced;
+- the size and mtime of the CSV it wrote.
+
+The manifest is written after the CSVs, so after an interrupted build a CSV can
+be newer than the manifest; its recorded size/mtime then no longer match, and
+that source is normalized again in full instead of reusing rows from it.
+
+When an input did change, only records with a new or different fingerprint are
+normalized again; rows of unchanged records are copied from the previous CSV
+verbatim, and rows of records that disappeared are dropped. If an indexed
+evidence store exists, only the changed rows are upserted/deleted there.
+
+Usage:
+  builder = EvidenceBuilder(data_root=Path("data"))
+  stats = builder.build(entity)     # List[SourceBuildStats]
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from osint_swarm.data_sources import nhtsa, sec_edgar
+from osint_swarm.entities import Entity, Evidence
+from osint_swarm.utils.io import read_json, write_csv_dicts, write_json
+
+from mcp_layer.evidence_loader import EVIDENCE_CSV_FIELDS, evidence_to_row
+from mcp_layer.evidence_store import EvidenceStore, store_path
+from mcp_layer.nhtsa_processor import NhtsaProcessor
+from mcp_layer.nhtsa_processor.processor import _records_to_evidence
+from mcp_layer.sec_edgar_processor import SecEdgarProcessor
+from mcp_layer.sec_edgar_processor.processor import DEFAULT_MAX_FILINGS, _filings_to_evidence
+
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+_HASH_CHUNK = 1 << 20
+
+
+@dataclass
+class SourceBuildStats:
+    """What one build did for one (entity, source) pair."""
+
+    entity_id: str
+    source_id: str
+    status: str  # "built" | "unchanged" | "missing_input"
+    output: Optional[str] = None
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    reused: int = 0
+    manifest_updated: bool = False
+
+    @property
+    def normalized(self) -> int:
+        return self.added + self.updated
+
+
+# (record key, raw record) pairs for one raw input
+RecordIter = Callable[[Path], Iterator[Tuple[str, Dict[str, Any]]]]
+# normalize one raw record -> Evidence rows
+Normalizer = Callable[[Dict[str, Any], Entity, str], List[Evidence]]
+
+
+@dataclass(frozen=True)
+class SourceSpec:
+    """How the builder reads and normalizes one source's raw cache."""
+
+    source_id: str
+    raw_path: Callable[[Entity], Optional[Path]]
+    records: RecordIter
+    normalize: Normalizer
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def record_fingerprint(record: Any) -> str:
+    """Stable hash of a raw record (key order and whitespace do not matter)."""
+    data = json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def _keyed(pairs: Iterator[Tuple[str, Dict[str, Any]]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Disambiguate repeated keys with a #n suffix so every record keeps its own fingerprint."""
+    seen: Dict[str, int] = {}
+    for key, record in pairs:
+        n = seen.get(key, 0)
+        seen[key] = n + 1
+        yield (key if n == 0 else f"{key}#{n}"), record
+
+
+def _nhtsa_records(path: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    def pairs() -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for r in nhtsa.iter_recall_records(path):
+            if isinstance(r, dict):
+                key = r.get("nhtsa_id") or r.get("NHTSA_ID") or r.get("mfr_campaign_number") or r.get("report_received_date") or ""
+                yield str(key), r
+
+    return _keyed(pairs())
+
+
+def _nhtsa_normalize(record: Dict[str, Any], entity: Entity, raw_location: str) -> List[Evidence]:
+    return _records_to_evidence([record], entity.entity_id, raw_location=raw_location)
+
+
+def _sec_records(path: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    view = sec_edgar.recent_filings_view(read_json(path))
+
+    def pairs() -> Iterator[Tuple[str, Dict[str, Any]]]:
+        # Same window as SecEdgarProcessor.get_evidence_for_entity: the most recent DEFAULT_MAX_FILINGS rows.
+        for i in range(min(len(view), DEFAULT_MAX_FILINGS)):
+            row = view.row(i)
+            yield str(row.get("accessionNumber") or ""), row
+
+    return _keyed(pairs())
+
+
+def _sec_normalize(record: Dict[str, Any], entity: Entity, raw_location: str) -> List[Evidence]:
+    cik = sec_edgar.normalize_cik(entity.identifiers.get("cik", "0"))
+    view = sec_edgar.FilingsView({col: [record.get(col)] for col in sec_edgar.FILING_COLUMNS})
+    return _filings_to_evidence([(view, [0], raw_location)], entity.entity_id, cik, max_filings=None)
+
+
+def default_source_specs(data_root: Path) -> List[SourceSpec]:
+    """Sources the builder knows: NHTSA recalls and the SEC submissions recent window."""
+    nhtsa_proc = NhtsaProcessor(data_root=data_root)
+    sec_proc = SecEdgarProcessor(data_root=data_root)
+    return [
+        SourceSpec("sec_edgar", sec_proc.raw_path_for_entity, _sec_records, _sec_normalize),
+        SourceSpec("nhtsa", nhtsa_proc.raw_path_for_entity, _nhtsa_records, _nhtsa_normalize),
+    ]
+
+
+def _file_stat(path: Path) -> Optional[List[int]]:
+    """[size, mtime_ns] of path (a list, as it round-trips through the JSON manifest), or None."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _read_csv_rows(path: Path) -> Dict[str, List[str]]:
+    """evidence_id -> raw CSV row (kept as strings; nothing is parsed or decoded)."""
+    if not path.exists():
+        return {}
+    with path.open(newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header != EVIDENCE_CSV_FIELDS:
+            return {}
+        return {row[0]: row for row in reader if row}
+
+
+class EvidenceBuilder:
+    """Incremental evidence build driven by a per-entity manifest."""
+
+    def __init__(
+        self,
+        data_root: Optional[Path] = None,
+        processed_dir: Optional[Path] = None,
+        sources: Optional[Sequence[SourceSpec]] = None,
+    ):
+        self.data_root = Path(data_root) if data_root else Path("data")
+        self.processed_dir = Path(processed_dir) if processed_dir else self.data_root / "processed"
+        self.sources = list(sources) if sources is not None else default_source_specs(self.data_root)
+
+    def entity_dir(self, entity: Entity) -> Path:
+        return self.processed_dir / entity.entity_id
+
+    def manifest_path(self, entity: Entity) -> Path:
+        return self.entity_dir(entity) / MANIFEST_NAME
+
+    def read_manifest(self, entity: Entity) -> Dict[str, Any]:
+        path = self.manifest_path(entity)
+        if path.exists():
+            try:
+                manifest = read_json(path)
+                if manifest.get("version") == MANIFEST_VERSION:
+                    return manifest
+            except (ValueError, OSError):
+                pass
+        return {"version": MANIFEST_VERSION, "entity_id": entity.entity_id, "sources": {}}
+
+    def build(self, entity: Entity, *, force: bool = False) -> List[SourceBuildStats]:
+        """Bring data/processed/<entity_id>/ up to date with the raw cache; force=True ignores the manifest."""
+        manifest = self.read_manifest(entity)
+        if force:
+            manifest["sources"] = {}
+        db_path = store_path(self.processed_dir)
+        store = EvidenceStore(db_path) if db_path.exists() else None
+        try:
+            stats = [self._build_source(entity, spec, manifest, store) for spec in self.sources]
+        finally:
+            if store is not None:
+                store.close()
+        if any(s.manifest_updated for s in stats):
+            write_json(self.manifest_path(entity), manifest, compact=True)
+        return stats
+
+    def _build_source(
+        self,
+        entity: Entity,
+        spec: SourceSpec,
+        manifest: Dict[str, Any],
+        store: Optional[EvidenceStore],
+    ) -> SourceBuildStats:
+        entity_id = entity.entity_id
+        raw_path = spec.raw_path(entity)
+        if raw_path is None:
+            return SourceBuildStats(entity_id, spec.source_id, "missing_input")
+
+        out_path = self.entity_dir(entity) / f"evidence_{spec.source_id}.csv"
+        prev = manifest["sources"].get(spec.source_id) or {}
+        prev_input = prev.get("input") or {}
+        st = raw_path.stat()
+        input_meta = {"path": str(raw_path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+        out_stat = _file_stat(out_path)
+        # Manifests written before output stats were recorded are trusted as before.
+        out_in_sync = out_stat is not None and prev.get("output_stat", out_stat) == out_stat
+        if out_in_sync and prev_input.get("path") == str(raw_path):
+            same_stat = prev_input.get("size") == st.st_size and prev_input.get("mtime_ns") == st.st_mtime_ns
+            if same_stat:
+                if "output_stat" in prev:
+                    return SourceBuildStats(entity_id, spec.source_id, "unchanged", str(out_path))
+                prev["output_stat"] = out_stat
+                return SourceBuildStats(entity_id, spec.source_id, "unchanged", str(out_path), manifest_updated=True)
+            digest = file_sha256(raw_path)
+            if digest == prev_input.get("sha256"):
+                prev["input"] = {**input_meta, "sha256": digest}  # touched, not modified
+                prev["output_stat"] = out_stat
+                return SourceBuildStats(entity_id, spec.source_id, "unchanged", str(out_path), manifest_updated=True)
+        else:
+            digest = file_sha256(raw_path)
+
+        stats = SourceBuildStats(entity_id, spec.source_id, "built", str(out_path), manifest_updated=True)
+        prev_records: Dict[str, List[Any]] = prev.get("records") or {}
+        old_rows = _read_csv_rows(out_path) if prev_records else {}
+        # A CSV written after the manifest (interrupted build): none of its rows are reused,
+        # and any of its rows not rebuilt now are removed from the store as well.
+        stale_ids: List[str] = [] if out_in_sync else list(old_rows)
+        if not out_in_sync:
+            old_rows = {}
+        raw_location = str(raw_path)
+
+        records: Dict[str, List[Any]] = {}
+        rows: List[Any] = []
+        changed: List[Evidence] = []
+        for key, record in spec.records(raw_path):
+            fp = record_fingerprint(record)
+            old = prev_records.get(key)
+            if old is not None and old[0] == fp and all(ev_id in old_rows for ev_id in old[1]):
+                rows.extend(old_rows[ev_id] for ev_id in old[1])
+                records[key] = old
+                stats.reused += len(old[1])
+                continue
+            evidence = spec.normalize(record, entity, raw_location)
+            if old is None:
+                stats.added += len(evidence)
+            else:
+                stats.updated += len(evidence)
+            changed.extend(evidence)
+            rows.extend(evidence)
+            records[key] = [fp, [e.evidence_id for e in evidence]]
+
+        kept_ids = {ev_id for _, ids in records.values() for ev_id in ids}
+        removed_ids = list(dict.fromkeys(
+            ev_id for ev_id in [*(i for _, ids in prev_records.values() for i in ids), *stale_ids] if ev_id not in kept_ids
+        ))
+        stats.removed = len(removed_ids)
+
+        write_csv_dicts(
+            out_path,
+            (evidence_to_row(r) if isinstance(r, Evidence) else dict(zip(EVIDENCE_CSV_FIELDS, r)) for r in rows),
+            fieldnames=EVIDENCE_CSV_FIELDS,
+        )
+        if store is not None:
+            if removed_ids:
+                store.delete(entity_id, removed_ids)
+            if changed:
+                store.upsert(changed)
+            store.mark_imported(out_path)
+
+        manifest["sources"][spec.source_id] = {
+            "input": {**input_meta, "sha256": digest},
+            "output": str(out_path),
+            "output_stat": _file_stat(out_path),
+            "records": records,
+        }
+        return stats
@@ -0,0 +1,128 @@
+"""
+Evidence cache: investigation-scoped memoization of MCP source fetches.
+
+One investigation dispatches several tasks that ask the MCP layer for the same
+(source, entity) evidence. The cache keeps each result for the lifetime of the
+investigation and coalesces concurrent requests for the same key onto a single
+in-flight fetch (single-flight), so the raw JSON is read and normalized once.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional, Tuple
+
+from osint_swarm.entities import Entity, Evidence
+
+
+CacheKey = Tuple[Hashable, ...]
+
+
+@dataclass(frozen=True)
+class EvidenceCacheStats:
+    """Counters for an EvidenceCache (hits include callers that waited on an in-flight fetch)."""
+
+    hits: int
+    misses: int
+    coalesced: int
+    entries: int
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn filter parameters (dicts/lists/sets) into a hashable, order-independent value."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_freeze(v) for v in value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def evidence_cache_key(
+    source_id: str,
+    entity: Entity,
+    params: Optional[Mapping[str, Any]] = None,
+) -> CacheKey:
+    """Key for one source fetch: (source_id, entity identity, filter parameters)."""
+    return (
+        source_id,
+        entity.entity_id,
+        entity.name,
+        _freeze(entity.identifiers or {}),
+        _freeze(params or {}),
+    )
+
+
+class EvidenceCache:
+    """
+    Thread-safe, single-flight cache of List[Evidence] per source fetch.
+
+    Create one per investigation (InvestigationContext does this) and pass it to
+    mcp_layer.get_evidence_for_entity(..., cache=...). Failed fetches are not
+    cached; the exception is raised to the leader and to every waiting caller.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[CacheKey, List[Evidence]] = {}
+        self._in_flight: Dict[CacheKey, "Future[List[Evidence]]"] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    def get_or_fetch(self, key: CacheKey, fetch: Callable[[], List[Evidence]]) -> List[Evidence]:
+        """Return cached evidence for key, or run fetch() once and share its result."""
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                return list(self._entries[key])
+            pending = self._in_flight.get(key)
+            if pending is not None:
+                self._hits += 1
+                self._coalesced += 1
+                is_leader = False
+            else:
+                self._misses += 1
+                pending = Future()
+                self._in_flight[key] = pending
+                is_leader = True
+
+        if not is_leader:
+            return list(pending.result())
+
+        try:
+            result = list(fetch())
+        except BaseException as exc:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            pending.set_exception(exc)
+            raise
+        with self._lock:
+            self._entries[key] = result
+            self._in_flight.pop(key, None)
+        pending.set_result(result)
+        return list(result)
+
+    def stats(self) -> EvidenceCacheStats:
+        with self._lock:
+            return EvidenceCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                coalesced=self._coalesced,
+                entries=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset counters (in-flight fetches are left to finish)."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._coalesced = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -10,9 +10,10 @@ from __future__ import annotations
 import csv
 import json
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Union
 
 from osint_swarm.entities import Evidence
+from osint_swarm.evidence_batch import EvidenceBatch
 
 
 EVIDENCE_CSV_FIELDS = [
@@ -28,59 +29,403 @@ EVIDENCE_CSV_FIELDS = [
     "attributes",
 ]
 
+# A single value or a collection of accepted values (e.g. risk_category="legal" or {"legal", "regulatory"}).
+FieldFilter = Union[str, Collection[str], None]
+
+
+class LazyAttributes(dict):
+    """Evidence.attributes that keeps the raw JSON text and decodes it on first access.
+
+    Behaves as a plain dict once touched; filters and consumers that never look at
+    attributes never pay for json.loads. Every read and write decodes first, but
+    json.dumps (and orjson) read dict storage directly: serialize with
+    attributes_json() or json.dumps(dict(attrs)).
+    """
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._raw: Optional[str] = None
+
+    @classmethod
+    def from_json(cls, raw: str) -> "LazyAttributes":
+        attrs = cls()
+        attrs._raw = raw or None
+        return attrs
+
+    def _load(self) -> None:
+        raw, self._raw = self._raw, None
+        if raw is None:
+            return
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            return
+        if isinstance(value, dict):
+            dict.update(self, value)
+
+    @property
+    def decoded(self) -> bool:
+        return self._raw is None
+
+    def __getitem__(self, key: Any) -> Any:
+        self._load()
+        return super().__getitem__(key)
+
+    def __contains__(self, key: Any) -> bool:
+        self._load()
+        return super().__contains__(key)
+
+    def __iter__(self) -> Iterator[Any]:
+        self._load()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._load()
+        return super().__len__()
+
+    def __eq__(self, other: Any) -> bool:
+        self._load()
+        return super().__eq__(other)
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        self._load()
+        return super().__repr__()
+
+    def __reduce__(self) -> Any:
+        return (dict, (dict(self.items()),))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self._load()
+        return super().get(key, default)
+
+    def keys(self) -> Any:
+        self._load()
+        return super().keys()
+
+    def values(self) -> Any:
+        self._load()
+        return super().values()
+
+    def items(self) -> Any:
+        self._load()
+        return super().items()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._load()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self._load()
+        super().__delitem__(key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        self._load()
+        return super().pop(key, *default)
+
+    def popitem(self) -> Any:
+        self._load()
+        return super().popitem()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        self._load()
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._load()
+        super().update(*args, **kwargs)
+
+    def clear(self) -> None:
+        self._raw = None
+        super().clear()
+
+    def copy(self) -> Dict[Any, Any]:
+        self._load()
+        return dict(super().items())
+
+    def __or__(self, other: Any) -> Any:
+        self._load()
+        return {**dict(super().items()), **other} if isinstance(other, dict) else NotImplemented
+
+    def __ror__(self, other: Any) -> Any:
+        self._load()
+        return {**other, **dict(super().items())} if isinstance(other, dict) else NotImplemented
+
+    def __ior__(self, other: Any) -> "LazyAttributes":
+        self.update(other)
+        return self
+
+
+def attributes_json(attributes: Optional[Dict[str, Any]]) -> str:
+    """JSON text of Evidence.attributes; undecoded LazyAttributes are written back without a decode."""
+    if isinstance(attributes, LazyAttributes) and not attributes.decoded:
+        return attributes._raw  # type: ignore[return-value]
+    return json.dumps(dict(attributes or {}), ensure_ascii=False)
+
+
+def evidence_from_row(row: Mapping[str, Any]) -> Evidence:
+    """Build Evidence from a flat row (CSV DictReader row or store row); attributes is a JSON string."""
+    attrs = row.get("attributes", "{}")
+    if isinstance(attrs, str):
+        try:
+            attrs = json.loads(attrs) if attrs else {}
+        except json.JSONDecodeError:
+            attrs = {}
+    conf = row.get("confidence", "0.5")
+    try:
+        confidence = float(conf)
+    except (TypeError, ValueError):
+        confidence = 0.5
+    return Evidence(
+        evidence_id=row.get("evidence_id", "") or "",
+        entity_id=row.get("entity_id", "") or "",
+        date=row.get("date", "") or "",
+        source_type=row.get("source_type", "other") or "other",
+        risk_category=row.get("risk_category", "other") or "other",
+        summary=row.get("summary", "") or "",
+        source_uri=row.get("source_uri", "") or "",
+        raw_location=row.get("raw_location") or None,
+        confidence=confidence,
+        attributes=attrs if isinstance(attrs, dict) else {},
+    )
+
+
+def evidence_to_row(e: Evidence) -> Dict[str, Any]:
+    """Flatten Evidence to a CSV row (attributes as a JSON string); inverse of evidence_from_row."""
+    return {
+        "evidence_id": e.evidence_id,
+        "entity_id": e.entity_id,
+        "date": e.date,
+        "source_type": e.source_type,
+        "risk_category": e.risk_category,
+        "summary": e.summary,
+        "source_uri": e.source_uri,
+        "raw_location": e.raw_location,
+        "confidence": e.confidence,
+        "attributes": attributes_json(e.attributes),
+    }
+
 
 def load_evidence_from_csv(csv_path: Path) -> List[Evidence]:
-    """Load Evidence list from a single CSV (same schema as build_evidence_tesla output)."""
+    """Load Evidence list from a single CSV (same schema as the evidence builder output)."""
     if not csv_path.exists():
         return []
-    out: List[Evidence] = []
     with csv_path.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        return [evidence_from_row(row) for row in csv.DictReader(f)]
+
+
+def filter_values(value: FieldFilter) -> Optional[frozenset]:
+    """Normalize a FieldFilter to a set of accepted values (None = no filter)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return frozenset((value,))
+    return frozenset(value)
+
+
+def _to_float(value: Any, default: float = 0.5) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _row_predicate(
+    *,
+    entity_id: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    risk_category: FieldFilter,
+    source_type: FieldFilter,
+    min_confidence: Optional[float],
+    idx: Mapping[str, int],
+) -> Callable[[List[str]], bool]:
+    """Build a check over raw CSV fields (column positions in idx); no Evidence or JSON is built."""
+    risk = filter_values(risk_category)
+    sources = filter_values(source_type)
+    checks: List[Callable[[List[str]], bool]] = []
+
+    def col(name: str) -> Callable[[List[str]], str]:
+        i = idx.get(name)
+        if i is None:
+            return lambda row: ""
+        return lambda row: row[i] if i < len(row) else ""
+
+    if entity_id is not None:
+        get = col("entity_id")
+        checks.append(lambda row, get=get: get(row) == entity_id)
+    if start_date or end_date:
+        get = col("date")
+        # ISO dates compare correctly as strings; rows without a date never match a date range.
+        checks.append(lambda row, get=get: bool(get(row)) and (not start_date or get(row) >= start_date) and (not end_date or get(row) <= end_date))
+    if risk is not None:
+        get = col("risk_category")
+        checks.append(lambda row, get=get: (get(row) or "other") in risk)
+    if sources is not None:
+        get = col("source_type")
+        checks.append(lambda row, get=get: (get(row) or "other") in sources)
+    if min_confidence is not None:
+        get = col("confidence")
+        checks.append(lambda row, get=get: _to_float(get(row)) >= min_confidence)
+    return lambda row: all(check(row) for check in checks)
+
+
+def iter_evidence_from_csv(
+    csv_path: Path,
+    *,
+    entity_id: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    risk_category: FieldFilter = None,
+    source_type: FieldFilter = None,
+    min_confidence: Optional[float] = None,
+) -> Iterator[Evidence]:
+    """
+    Stream Evidence rows of one CSV that pass the filters.
+
+    Filters are evaluated on the raw CSV fields before an Evidence is built, and
+    attributes are decoded lazily (LazyAttributes), so skipped rows cost one CSV parse.
+    """
+    csv_path = Path(csv_path)
+    if not csv_path.exists():
+        return
+    with csv_path.open(newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+        idx = {name: i for i, name in enumerate(header)}
+        keep = _row_predicate(
+            entity_id=entity_id,
+            start_date=start_date,
+            end_date=end_date,
+            risk_category=risk_category,
+            source_type=source_type,
+            min_confidence=min_confidence,
+            idx=idx,
+        )
+        width = len(header)
+        positions = [idx.get(name) for name in EVIDENCE_CSV_FIELDS]
         for row in reader:
-            attrs = row.get("attributes", "{}")
-            if isinstance(attrs, str):
-                try:
-                    attrs = json.loads(attrs) if attrs else {}
-                except json.JSONDecodeError:
-                    attrs = {}
-            conf = row.get("confidence", "0.5")
-            try:
-                confidence = float(conf)
-            except (TypeError, ValueError):
-                confidence = 0.5
-            out.append(
-                Evidence(
-                    evidence_id=row.get("evidence_id", ""),
-                    entity_id=row.get("entity_id", ""),
-                    date=row.get("date", ""),
-                    source_type=row.get("source_type", "other"),
-                    risk_category=row.get("risk_category", "other"),
-                    summary=row.get("summary", ""),
-                    source_uri=row.get("source_uri", ""),
-                    raw_location=row.get("raw_location") or None,
-                    confidence=confidence,
-                    attributes=attrs if isinstance(attrs, dict) else {},
-                )
+            if not row or not keep(row):
+                continue
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+            (
+                ev_id, ent_id, date, src, risk, summary, uri, raw_loc, conf, attrs
+            ) = (row[i] if i is not None else "" for i in positions)
+            yield Evidence(
+                evidence_id=ev_id,
+                entity_id=ent_id,
+                date=date,
+                source_type=src or "other",
+                risk_category=risk or "other",
+                summary=summary,
+                source_uri=uri,
+                raw_location=raw_loc or None,
+                confidence=_to_float(conf),
+                attributes=LazyAttributes.from_json(attrs),
             )
-    return out
+
+
+def iter_evidence_csv_paths(processed_dir: Path) -> Iterator[Path]:
+    """Yield data/processed/<slug>/evidence_*.csv paths."""
+    processed_dir = Path(processed_dir)
+    if not processed_dir.exists():
+        return
+    for subdir in processed_dir.iterdir():
+        if subdir.is_dir():
+            yield from subdir.glob("evidence_*.csv")
+
+
+def iter_evidence(
+    processed_dir: Path,
+    *,
+    entity_id: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    risk_category: FieldFilter = None,
+    source_type: FieldFilter = None,
+    min_confidence: Optional[float] = None,
+) -> Iterator[Evidence]:
+    """
+    Stream Evidence from data/processed/ matching the filters.
+
+    Uses the indexed evidence store (evidence.sqlite) when present, with the filters
+    pushed into SQL, after importing any CSV written since its last import;
+    otherwise streams every evidence_*.csv, filtering raw fields (an evidence_id
+    found in several CSVs is yielded once). processed_dir may also point at a
+    single CSV file.
+    """
+    processed_dir = Path(processed_dir)
+    filters = dict(
+        entity_id=entity_id,
+        start_date=start_date,
+        end_date=end_date,
+        risk_category=risk_category,
+        source_type=source_type,
+        min_confidence=min_confidence,
+    )
+    if processed_dir.is_file():
+        yield from iter_evidence_from_csv(processed_dir, **filters)
+        return
+    if not processed_dir.exists():
+        return
+    from mcp_layer.evidence_store import EvidenceStore, store_path
+
+    db_path = store_path(processed_dir)
+    if db_path.exists():
+        with EvidenceStore(db_path, readonly=True) as store:
+            if store.stale_csvs(processed_dir):
+                with EvidenceStore(db_path) as writer:
+                    writer.import_csv_dir(processed_dir, only_stale=True)
+            yield from store.iter_evidence(**filters)
+        return
+    seen: Set[str] = set()
+    for csv_path in iter_evidence_csv_paths(processed_dir):
+        for e in iter_evidence_from_csv(csv_path, **filters):
+            if e.evidence_id not in seen:
+                seen.add(e.evidence_id)
+                yield e
+
+
+def load_evidence_batch(
+    processed_dir: Path,
+    *,
+    entity_id: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    risk_category: FieldFilter = None,
+    source_type: FieldFilter = None,
+    min_confidence: Optional[float] = None,
+) -> EvidenceBatch:
+    """Like iter_evidence, collected into a column-oriented EvidenceBatch (compact for large sets)."""
+    return EvidenceBatch(
+        iter_evidence(
+            processed_dir,
+            entity_id=entity_id,
+            start_date=start_date,
+            end_date=end_date,
+            risk_category=risk_category,
+            source_type=source_type,
+            min_confidence=min_confidence,
+        )
+    )
 
 
 def load_evidence_for_entity(processed_dir: Path, entity_id: str) -> List[Evidence]:
     """
     Load all Evidence for an entity from data/processed/.
 
-    Scans processed_dir for subdirs containing evidence_*.csv and returns
+    If processed_dir holds an indexed evidence store (evidence.sqlite, see
+    mcp_layer.evidence_store), the rows are looked up by entity_id there.
+    Otherwise scans processed_dir for subdirs containing evidence_*.csv and returns
     rows where entity_id matches. Convention: data/processed/<slug>/evidence_*.csv.
     """
-    processed_dir = Path(processed_dir)
-    if not processed_dir.exists():
-        return []
-    out: List[Evidence] = []
-    for subdir in processed_dir.iterdir():
-        if not subdir.is_dir():
-            continue
-        for csv_path in subdir.glob("evidence_*.csv"):
-            for e in load_evidence_from_csv(csv_path):
-                if e.entity_id == entity_id:
-                    out.append(e)
-    return out
+    return list(iter_evidence(processed_dir, entity_id=entity_id))
@@ -0,0 +1,290 @@
+"""
+Evidence store: indexed SQLite backend for processed Evidence (data/processed/evidence.sqlite).
+
+The CSV convention (data/processed/<slug>/evidence_*.csv) makes a per-entity
+load parse the whole corpus. The store keeps the same fields in one table,
+keyed by (entity_id, evidence_id) and indexed on date, source_type and
+risk_category, so a lookup touches only the entity's rows.
+
+CSV writers that do not know about the store (build_evidence_tesla.py, older
+tools) still work: every imported CSV is recorded by size and mtime in the
+imports table, and readers (evidence_loader.iter_evidence) import CSVs that are
+new or changed since before querying. Re-imports upsert; rows deleted from such a
+CSV stay in the store until it is rebuilt.
+
+Usage:
+  with EvidenceStore(store_path(Path("data/processed"))) as store:
+      store.import_csv_dir(Path("data/processed"))       # one-time migration
+      store.upsert(evidence)                              # bulk upsert
+      store.load_for_entity("tesla_inc_cik_0001318605", start_date="2023-01-01")
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from osint_swarm.entities import Evidence
+
+from mcp_layer.evidence_loader import (
+    EVIDENCE_CSV_FIELDS,
+    FieldFilter,
+    LazyAttributes,
+    attributes_json,
+    filter_values,
+    iter_evidence_csv_paths,
+    load_evidence_from_csv,
+)
+
+
+EVIDENCE_DB_NAME = "evidence.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evidence (
+    evidence_id   TEXT NOT NULL,
+    entity_id     TEXT NOT NULL,
+    date          TEXT NOT NULL DEFAULT '',
+    source_type   TEXT NOT NULL DEFAULT 'other',
+    risk_category TEXT NOT NULL DEFAULT 'other',
+    summary       TEXT NOT NULL DEFAULT '',
+    source_uri    TEXT NOT NULL DEFAULT '',
+    raw_location  TEXT,
+    confidence    REAL NOT NULL DEFAULT 0.5,
+    attributes    TEXT NOT NULL DEFAULT '{}',
+    PRIMARY KEY (entity_id, evidence_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_evidence_entity_date ON evidence (entity_id, date);
+CREATE INDEX IF NOT EXISTS idx_evidence_source_type ON evidence (source_type, entity_id);
+CREATE INDEX IF NOT EXISTS idx_evidence_risk_category ON evidence (risk_category, entity_id);
+CREATE INDEX IF NOT EXISTS idx_evidence_date ON evidence (date);
+CREATE TABLE IF NOT EXISTS imports (
+    path     TEXT PRIMARY KEY,
+    size     INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+"""
+
+_COLUMNS = ", ".join(EVIDENCE_CSV_FIELDS)
+_UPSERT = (
+    f"INSERT OR REPLACE INTO evidence ({_COLUMNS}) "
+    f"VALUES ({', '.join('?' for _ in EVIDENCE_CSV_FIELDS)})"
+)
+
+
+def store_path(processed_dir: Path) -> Path:
+    """Location of the evidence store inside a processed directory."""
+    return Path(processed_dir) / EVIDENCE_DB_NAME
+
+
+def _evidence_row(e: Evidence) -> Tuple[Any, ...]:
+    return (
+        e.evidence_id,
+        e.entity_id,
+        e.date or "",
+        e.source_type or "other",
+        e.risk_category or "other",
+        e.summary or "",
+        e.source_uri or "",
+        e.raw_location,
+        float(e.confidence),
+        attributes_json(e.attributes),
+    )
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    st = Path(path).stat()
+    return st.st_size, st.st_mtime_ns
+
+
+class EvidenceStore:
+    """
+    SQLite-backed Evidence store; one connection shared across threads behind a lock.
+
+    readonly=True skips the WAL/schema setup (the store must already exist) for query-only use.
+    """
+
+    def __init__(self, db_path: Path, *, readonly: bool = False):
+        self.db_path = Path(db_path)
+        self.readonly = readonly
+        if not readonly:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Several ingestion processes may write at once; wait for the lock rather than fail.
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            if readonly:
+                self._conn.execute("PRAGMA query_only=ON")
+            else:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "EvidenceStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def upsert(self, evidence: Iterable[Evidence], *, batch_size: int = 5000) -> int:
+        """Insert or replace Evidence rows (keyed by entity_id + evidence_id); returns rows written."""
+        written = 0
+        batch: List[Tuple[Any, ...]] = []
+        with self._lock, self._conn:
+            for e in evidence:
+                batch.append(_evidence_row(e))
+                if len(batch) >= batch_size:
+                    self._conn.executemany(_UPSERT, batch)
+                    written += len(batch)
+                    batch.clear()
+            if batch:
+                self._conn.executemany(_UPSERT, batch)
+                written += len(batch)
+        return written
+
+    def delete(self, entity_id: str, evidence_ids: Iterable[str]) -> int:
+        """Remove specific rows of one entity; returns rows deleted."""
+        with self._lock, self._conn:
+            cur = self._conn.executemany(
+                "DELETE FROM evidence WHERE entity_id = ? AND evidence_id = ?",
+                ((entity_id, ev_id) for ev_id in evidence_ids),
+            )
+            return cur.rowcount
+
+    def delete_entity(self, entity_id: str) -> int:
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM evidence WHERE entity_id = ?", (entity_id,)).rowcount
+
+    def iter_evidence(
+        self,
+        *,
+        entity_id: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        risk_category: FieldFilter = None,
+        source_type: FieldFilter = None,
+        min_confidence: Optional[float] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Evidence]:
+        """Stream matching Evidence; filters run in SQL and attributes are decoded lazily."""
+        clauses: List[str] = []
+        params: List[Any] = []
+        if entity_id is not None:
+            clauses.append("entity_id = ?")
+            params.append(entity_id)
+        if start_date:
+            clauses.append("date >= ?")
+            params.append(start_date)
+        if end_date:
+            clauses.append("date <= ?")
+            params.append(end_date)
+        if start_date or end_date:
+            clauses.append("date != ''")
+        for column, value in (("risk_category", risk_category), ("source_type", source_type)):
+            values = filter_values(value)
+            if values is not None:
+                clauses.append(f"{column} IN ({', '.join('?' for _ in values)})")
+                params.extend(sorted(values))
+        if min_confidence is not None:
+            clauses.append("confidence >= ?")
+            params.append(float(min_confidence))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT {_COLUMNS} FROM evidence{where} ORDER BY entity_id, date, evidence_id"
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                for r in rows:
+                    yield Evidence(
+                        evidence_id=r["evidence_id"],
+                        entity_id=r["entity_id"],
+                        date=r["date"],
+                        source_type=r["source_type"],
+                        risk_category=r["risk_category"],
+                        summary=r["summary"],
+                        source_uri=r["source_uri"],
+                        raw_location=r["raw_location"] or None,
+                        confidence=float(r["confidence"]),
+                        attributes=LazyAttributes.from_json(r["attributes"]),
+                    )
+        finally:
+            cursor.close()
+
+    def load_for_entity(
+        self,
+        entity_id: str,
+        *,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        source_type: FieldFilter = None,
+        risk_category: FieldFilter = None,
+        min_confidence: Optional[float] = None,
+    ) -> List[Evidence]:
+        """Evidence for one entity, optionally filtered by date range, source_type, risk_category and confidence."""
+        return list(
+            self.iter_evidence(
+                entity_id=entity_id,
+                start_date=start_date,
+                end_date=end_date,
+                source_type=source_type,
+                risk_category=risk_category,
+                min_confidence=min_confidence,
+            )
+        )
+
+    def entity_ids(self) -> List[str]:
+        with self._lock:
+            return [r[0] for r in self._conn.execute("SELECT DISTINCT entity_id FROM evidence ORDER BY entity_id")]
+
+    def count(self, entity_id: Optional[str] = None) -> int:
+        with self._lock:
+            if entity_id is None:
+                return self._conn.execute("SELECT COUNT(*) FROM evidence").fetchone()[0]
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM evidence WHERE entity_id = ?", (entity_id,)
+            ).fetchone()[0]
+
+    def import_csv(self, csv_path: Path) -> int:
+        """Upsert all rows of one evidence_*.csv and record it as imported."""
+        signature = _file_signature(csv_path)  # taken first: a write during the import makes it stale again
+        written = self.upsert(load_evidence_from_csv(Path(csv_path)))
+        self._record_import(csv_path, signature)
+        return written
+
+    def mark_imported(self, csv_path: Path) -> None:
+        """Record csv_path as in sync with the store (for writers that upsert its rows themselves)."""
+        self._record_import(csv_path, _file_signature(csv_path))
+
+    def _record_import(self, csv_path: Path, signature: Tuple[int, int]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO imports (path, size, mtime_ns) VALUES (?, ?, ?)",
+                (str(Path(csv_path).resolve()), *signature),
+            )
+
+    def stale_csvs(self, processed_dir: Path) -> List[Path]:
+        """evidence_*.csv files under processed_dir that are new or changed since their last import."""
+        with self._lock:
+            try:
+                rows = self._conn.execute("SELECT path, size, mtime_ns FROM imports").fetchall()
+            except sqlite3.OperationalError:  # store created before imports were tracked
+                rows = []
+        imported = {r[0]: (r[1], r[2]) for r in rows}
+        return [
+            p for p in iter_evidence_csv_paths(processed_dir) if imported.get(str(p.resolve())) != _file_signature(p)
+        ]
+
+    def import_csv_dir(self, processed_dir: Path, *, only_stale: bool = False) -> Dict[str, int]:
+        """Migrate data/processed/<slug>/evidence_*.csv into the store (all, or only new/changed ones); returns rows per file."""
+        paths = self.stale_csvs(processed_dir) if only_stale else list(iter_evidence_csv_paths(processed_dir))
+        return {str(p): self.import_csv(p) for p in paths}
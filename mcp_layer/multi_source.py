@@ -0,0 +1,160 @@
+"""
+Multi-source fetch: fan out one entity request to several MCP processors at once.
+
+Each processor does blocking disk or network I/O, so sources are run on a thread
+pool and the overall latency tracks the slowest source rather than the sum.
+Sources that raise or miss their deadline are reported in the result instead of
+failing the whole request; whatever finished in time is returned.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+from osint_swarm.entities import Entity, Evidence
+
+from mcp_layer.base import DataSourceProcessor
+from mcp_layer.evidence_cache import EvidenceCache, evidence_cache_key
+
+
+SourceTimeout = Union[float, Mapping[str, float], None]
+
+_POLL_S = 0.05
+
+
+@dataclass(frozen=True)
+class SourceFailure:
+    """A source that did not contribute evidence: reason is 'timeout', 'error' or 'unknown_source'."""
+
+    source_id: str
+    reason: str
+    message: str = ""
+
+
+@dataclass
+class MultiSourceResult:
+    """Evidence from every source that finished in time, plus the sources that did not."""
+
+    evidence: List[Evidence] = field(default_factory=list)
+    failed: List[SourceFailure] = field(default_factory=list)
+    elapsed_s: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def failed_sources(self) -> List[str]:
+        return [f.source_id for f in self.failed]
+
+    @property
+    def complete(self) -> bool:
+        return not self.failed
+
+
+def _timeout_for(source_id: str, source_timeout_s: SourceTimeout) -> Optional[float]:
+    if source_timeout_s is None:
+        return None
+    if isinstance(source_timeout_s, Mapping):
+        value = source_timeout_s.get(source_id)
+        return float(value) if value is not None else None
+    return float(source_timeout_s)
+
+
+def fetch_from_processors(
+    entity: Entity,
+    processors: Sequence[DataSourceProcessor],
+    *,
+    cache: Optional[EvidenceCache] = None,
+    cache_params: Optional[Mapping[str, Mapping[str, object]]] = None,
+    source_timeout_s: SourceTimeout = None,
+    deadline_s: Optional[float] = None,
+    max_workers: Optional[int] = None,
+) -> MultiSourceResult:
+    """
+    Run processor.get_evidence_for_entity(entity) for all processors concurrently.
+
+    cache_params: source_id -> filter parameters that distinguish its EvidenceCache entries.
+    source_timeout_s: seconds per source (one value for all, or a source_id -> seconds map),
+    counted from when the source starts running, not from when it was queued behind max_workers.
+    deadline_s: global budget for the whole call; sources still running or queued are reported as timeouts.
+    Evidence is returned in processor order regardless of completion order. Timed-out
+    fetches are abandoned, not interrupted: their worker threads finish in the background
+    (and still populate the cache, if one is given).
+    """
+    result = MultiSourceResult()
+    if not processors:
+        return result
+
+    start = time.monotonic()
+    global_deadline = start + deadline_s if deadline_s is not None else None
+    timeouts = {proc.source_id: _timeout_for(proc.source_id, source_timeout_s) for proc in processors}
+    started: Dict[str, float] = {}
+    started_lock = threading.Lock()
+    futures: Dict[str, "Future[List[Evidence]]"] = {}
+    finished: Dict[str, List[Evidence]] = {}
+
+    def _deadline(sid: str, started_at: Mapping[str, float]) -> Optional[float]:
+        """Earliest of the global deadline and, once the source has started, its own timeout."""
+        timeout = timeouts[sid]
+        own = started_at[sid] + timeout if timeout is not None and sid in started_at else None
+        candidates = [d for d in (own, global_deadline) if d is not None]
+        return min(candidates) if candidates else None
+
+    def _fetch(proc: DataSourceProcessor) -> List[Evidence]:
+        with started_lock:
+            started[proc.source_id] = time.monotonic()
+        if cache is None:
+            return proc.get_evidence_for_entity(entity)
+        key = evidence_cache_key(proc.source_id, entity, (cache_params or {}).get(proc.source_id))
+        return cache.get_or_fetch(key, lambda: proc.get_evidence_for_entity(entity))
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers or len(processors),
+        thread_name_prefix="mcp-source",
+    )
+    try:
+        for proc in processors:
+            futures[proc.source_id] = executor.submit(_fetch, proc)
+
+        by_future = {fut: sid for sid, fut in futures.items()}
+        pending = set(by_future)
+        while pending:
+            now = time.monotonic()
+            # Workers record their start under the lock; read one consistent copy per iteration.
+            with started_lock:
+                started_at = dict(started)
+            deadlines = {f: _deadline(by_future[f], started_at) for f in pending}
+            expired = [f for f, d in deadlines.items() if d is not None and d <= now and not f.done()]
+            for fut in expired:
+                pending.discard(fut)
+                sid = by_future[fut]
+                fut.cancel()
+                ran = f"{now - started_at[sid]:.2f}s" if sid in started_at else "never started"
+                result.failed.append(SourceFailure(sid, "timeout", f"no result after {ran}"))
+            if not pending:
+                break
+            upcoming = [d for f, d in deadlines.items() if f in pending and d is not None]
+            wait_s: Optional[float] = max(0.0, min(upcoming) - now) if upcoming else None
+            # Queued sources have no own deadline until they start; poll so their clock is picked up.
+            if any(by_future[f] not in started_at and timeouts[by_future[f]] is not None for f in pending):
+                wait_s = min(wait_s, _POLL_S) if wait_s is not None else _POLL_S
+            done, pending = wait(pending, timeout=wait_s, return_when=FIRST_COMPLETED)
+            with started_lock:
+                started_at = dict(started)
+            for fut in done:
+                sid = by_future[fut]
+                result.elapsed_s[sid] = round(time.monotonic() - started_at.get(sid, start), 4)
+                exc = fut.exception()
+                if exc is not None:
+                    result.failed.append(SourceFailure(sid, "error", str(exc) or type(exc).__name__))
+                else:
+                    finished[sid] = fut.result()
+    finally:
+        executor.shutdown(wait=False)
+
+    for proc in processors:
+        result.evidence.extend(finished.get(proc.source_id, []))
+    order = {proc.source_id: i for i, proc in enumerate(processors)}
+    result.failed.sort(key=lambda f: order.get(f.source_id, len(order)))
+    return result
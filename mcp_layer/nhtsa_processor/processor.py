@@ -2,25 +2,32 @@
 
 from __future__ import annotations
 
+import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 from osint_swarm.data_sources import nhtsa
 from osint_swarm.entities import Evidence
-from osint_swarm.utils.io import read_json, write_json
 
 from mcp_layer.base import DataSourceProcessor
+from mcp_layer.raw_cache import DEFAULT_CACHE_POLICIES, CachePolicy, RawCache
 
 if TYPE_CHECKING:
     from osint_swarm.entities import Entity
 
 
+logger = logging.getLogger(__name__)
+
+# Makes with more recall rows than this are downloaded page by page to a .jsonl file
+# (nhtsa.download_recalls_by_make) instead of being fetched into memory.
+STREAM_THRESHOLD = nhtsa.PAGE_SIZE
+
 def _records_to_evidence(
-    records: List[Dict[str, Any]],
+    records: Iterable[Dict[str, Any]],
     entity_id: str,
     raw_location: Optional[str] = None,
 ) -> List[Evidence]:
-    """Convert NHTSA recall records to Evidence list (same logic as build_evidence_tesla)."""
+    """Convert NHTSA recall records to Evidence list (one row per dated recall)."""
     out: List[Evidence] = []
     for r in records:
         if not isinstance(r, dict):
@@ -74,9 +81,16 @@ def _records_to_evidence(
 class NhtsaProcessor(DataSourceProcessor):
     """MCP processor for NHTSA recalls; uses osint_swarm.data_sources.nhtsa."""
 
-    def __init__(self, data_root: Optional[Path] = None):
+    def __init__(
+        self,
+        data_root: Optional[Path] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        raw_cache: Optional[RawCache] = None,
+    ):
         self.data_root = Path(data_root) if data_root else Path("data")
         self._raw_dir = self.data_root / "raw" / "nhtsa"
+        self.cache_policy = cache_policy or DEFAULT_CACHE_POLICIES["nhtsa"]
+        self._raw_cache = raw_cache or RawCache()
 
     @property
     def source_id(self) -> str:
@@ -91,21 +105,75 @@ class NhtsaProcessor(DataSourceProcessor):
             return entity.name.split(",")[0].strip().upper()
         return None
 
+    def _json_path(self, make: str) -> Path:
+        return self._raw_dir / f"recalls_make_{make.upper()}.json"
+
+    def _ensure_jsonl(self, make: str) -> Optional[Path]:
+        """
+        Streamed .jsonl download for make, refreshed once older than the cache TTL.
+
+        Without any cached file, a count(*) probe decides: makes above STREAM_THRESHOLD
+        are streamed to .jsonl. Returns None when make is served from the .json cache.
+        """
+        jsonl_path = nhtsa.recalls_jsonl_path(self._raw_dir, make)
+        if jsonl_path.exists():
+            if self._raw_cache.is_fresh(jsonl_path, self.cache_policy):
+                return jsonl_path
+        elif self._json_path(make).exists() or nhtsa.count_recalls_by_make(make) <= STREAM_THRESHOLD:
+            return None
+        try:
+            nhtsa.download_recalls_by_make(make, jsonl_path)
+        except Exception:
+            if not (jsonl_path.exists() and self.cache_policy.stale_if_error):
+                raise
+            logger.warning("Refreshing %s failed; serving stale copy", jsonl_path, exc_info=True)
+        return jsonl_path
+
+    def raw_path_for_entity(self, entity: "Entity") -> Optional[Path]:
+        """Raw recalls file the processor reads for entity (streamed .jsonl preferred), if cached."""
+        make = self._make_for_entity(entity)
+        if not make:
+            return None
+        jsonl_path = nhtsa.recalls_jsonl_path(self._raw_dir, make)
+        if jsonl_path.exists():
+            return jsonl_path
+        json_path = self._json_path(make)
+        return json_path if json_path.exists() else None
+
+    def ensure_raw_for_entity(self, entity: "Entity") -> Optional[Path]:
+        """Fetch or revalidate the raw recalls file per cache policy without normalizing it."""
+        make = self._make_for_entity(entity)
+        if not make:
+            return None
+        jsonl_path = self._ensure_jsonl(make)
+        if jsonl_path is not None:
+            return jsonl_path
+        return self._raw_cache.ensure(
+            self._json_path(make),
+            lambda validators: nhtsa.fetch_recalls_by_make_if_modified(make, validators),
+            self.cache_policy,
+        )
+
     def get_evidence_for_entity(self, entity: "Entity") -> List[Evidence]:
         make = self._make_for_entity(entity)
         if not make:
             return []
         entity_id = entity.entity_id
 
-        cache_path = self._raw_dir / f"recalls_make_{make.upper()}.json"
-        if cache_path.exists():
-            payload = read_json(cache_path)
-            raw_location = str(cache_path)
-        else:
-            payload = nhtsa.fetch_recalls_by_make(make)
-            self._raw_dir.mkdir(parents=True, exist_ok=True)
-            write_json(cache_path, payload)
-            raw_location = str(cache_path)
+        # A streamed download (large makes, or scripts/pull_nhtsa_recalls.py --stream) is read row by row.
+        jsonl_path = self._ensure_jsonl(make)
+        if jsonl_path is not None:
+            return _records_to_evidence(
+                nhtsa.iter_recall_records(jsonl_path), entity_id, raw_location=str(jsonl_path)
+            )
+
+        cache_path = self._json_path(make)
+        payload = self._raw_cache.get(
+            cache_path,
+            lambda validators: nhtsa.fetch_recalls_by_make_if_modified(make, validators),
+            self.cache_policy,
+        )
+        raw_location = str(cache_path)
 
         records = nhtsa.extract_recall_records(payload)
         return _records_to_evidence(records, entity_id, raw_location=raw_location)
@@ -0,0 +1,167 @@
+"""
+Raw cache policy: freshness rules for the JSON files under data/raw/.
+
+Each cached payload gets a sidecar `<file>.meta` (JSON) recording when it was
+fetched and the server's ETag/Last-Modified validators. A CachePolicy decides
+what happens once the file is older than its TTL:
+
+- revalidate synchronously with a conditional GET (a 304 only bumps fetched_at);
+- or, with stale_while_revalidate, serve the cached copy immediately and refresh
+  it in a background thread.
+
+If a refresh fails and a cached copy exists, the stale copy is served
+(stale_if_error) rather than failing the investigation.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from osint_swarm.data_sources.http import Validators
+from osint_swarm.utils.io import read_json, write_json, write_raw_json
+
+
+logger = logging.getLogger(__name__)
+
+# fetch(validators) -> (payload, validators); payload is None when the server answered 304.
+ConditionalFetch = Callable[[Optional[Validators]], Tuple[Optional[Any], Validators]]
+
+HOUR_S = 3600.0
+DAY_S = 24 * HOUR_S
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Freshness policy for one source's raw cache. ttl_s=None means cached files never expire."""
+
+    ttl_s: Optional[float] = None
+    stale_while_revalidate: bool = False
+    stale_if_error: bool = True
+
+
+# Per-source defaults: SEC submissions change with every filing; recalls change weekly at most.
+DEFAULT_CACHE_POLICIES: Dict[str, CachePolicy] = {
+    "sec_edgar": CachePolicy(ttl_s=DAY_S),
+    "nhtsa": CachePolicy(ttl_s=7 * DAY_S),
+}
+
+
+@dataclass(frozen=True)
+class CacheMeta:
+    """Sidecar metadata for a cached raw file."""
+
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def validators(self) -> Validators:
+        return Validators(etag=self.etag, last_modified=self.last_modified)
+
+
+def meta_path(path: Path) -> Path:
+    return path.with_name(path.name + ".meta")
+
+
+def read_meta(path: Path) -> Optional[CacheMeta]:
+    """Sidecar metadata for path; files cached before the sidecar existed fall back to their mtime."""
+    mp = meta_path(path)
+    if mp.exists():
+        try:
+            data = json.loads(mp.read_text(encoding="utf-8"))
+            return CacheMeta(
+                fetched_at=float(data.get("fetched_at", 0.0)),
+                etag=data.get("etag"),
+                last_modified=data.get("last_modified"),
+            )
+        except (ValueError, OSError):
+            pass
+    if path.exists():
+        return CacheMeta(fetched_at=path.stat().st_mtime)
+    return None
+
+
+def write_meta(path: Path, meta: CacheMeta) -> None:
+    write_json(
+        meta_path(path),
+        {"fetched_at": meta.fetched_at, "etag": meta.etag, "last_modified": meta.last_modified},
+    )
+
+
+class RawCache:
+    """Applies a CachePolicy to raw files; one instance can serve many paths and threads."""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._refreshing: Set[Path] = set()
+
+    def is_fresh(self, path: Path, policy: CachePolicy) -> bool:
+        meta = read_meta(path)
+        if meta is None or not path.exists():
+            return False
+        return policy.ttl_s is None or self._clock() - meta.fetched_at < policy.ttl_s
+
+    def get(self, path: Path, fetch: ConditionalFetch, policy: CachePolicy) -> Any:
+        """Return the payload for path, fetching or revalidating per policy."""
+        path = Path(path)
+        if not path.exists():
+            return self._store(path, fetch, None)
+        if self.is_fresh(path, policy):
+            return read_json(path)
+        if policy.stale_while_revalidate:
+            self.refresh_in_background(path, fetch)
+            return read_json(path)
+        try:
+            return self._store(path, fetch, read_meta(path))
+        except Exception:
+            if not policy.stale_if_error:
+                raise
+            logger.warning("Revalidation failed for %s; serving stale copy", path, exc_info=True)
+            return read_json(path)
+
+    def ensure(self, path: Path, fetch: ConditionalFetch, policy: CachePolicy) -> Path:
+        """Like get(), but only makes sure path is cached; a fresh file is not decoded."""
+        path = Path(path)
+        if not (path.exists() and self.is_fresh(path, policy)):
+            self.get(path, fetch, policy)
+        return path
+
+    def refresh_in_background(self, path: Path, fetch: ConditionalFetch) -> Optional[threading.Thread]:
+        """Start one background revalidation per path; returns the thread, or None if one is running."""
+        with self._lock:
+            if path in self._refreshing:
+                return None
+            self._refreshing.add(path)
+
+        def _run() -> None:
+            try:
+                self._store(path, fetch, read_meta(path))
+            except Exception:
+                logger.warning("Background refresh failed for %s", path, exc_info=True)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(path)
+
+        thread = threading.Thread(target=_run, name=f"raw-cache-refresh:{path.name}", daemon=True)
+        thread.start()
+        return thread
+
+    def _store(self, path: Path, fetch: ConditionalFetch, meta: Optional[CacheMeta]) -> Any:
+        validators = meta.validators if meta and (meta.etag or meta.last_modified) else None
+        payload, new_validators = fetch(validators)
+        now = self._clock()
+        if payload is None:
+            # 304 Not Modified: the cached copy is current again.
+            kept = validators or new_validators
+            write_meta(path, CacheMeta(now, kept.etag, kept.last_modified))
+            return read_json(path)
+        write_raw_json(path, payload)
+        write_meta(path, CacheMeta(now, new_validators.etag, new_validators.last_modified))
+        return payload
@@ -2,20 +2,82 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 from osint_swarm.data_sources import sec_edgar
 from osint_swarm.entities import Evidence
-from osint_swarm.utils.io import read_json, write_json
+from osint_swarm.utils.io import read_json
 
 from mcp_layer.base import DataSourceProcessor
+from mcp_layer.raw_cache import DEFAULT_CACHE_POLICIES, CachePolicy, RawCache
 
 if TYPE_CHECKING:
     from osint_swarm.entities import Entity
 
 
 ARCHIVES_BASE = "https://www.sec.gov/Archives"
+DEFAULT_MAX_FILINGS = 500
+# Overflow files cover closed historical windows, so a cached copy never goes stale.
+OVERFLOW_CACHE_POLICY = CachePolicy(ttl_s=None)
+
+
+GOVERNANCE_FORMS = frozenset({"8-K", "4", "DEF 14A"})
+
+# (columnar filings, selected row indices, raw_location)
+FilingBatch = Tuple[sec_edgar.FilingsView, Sequence[int], Optional[str]]
+
+
+def _filings_to_evidence(
+    batches: Iterable[FilingBatch],
+    entity_id: str,
+    cik: str,
+    *,
+    max_filings: Optional[int] = DEFAULT_MAX_FILINGS,
+) -> List[Evidence]:
+    """Materialize Evidence for the selected rows only, stopping after max_filings rows."""
+    ev_prefix = f"{entity_id}_sec_".lower().replace(" ", "_")
+    doc_base = f"{ARCHIVES_BASE}/edgar/data/{int(cik)}/"
+    folder_base = f"{ARCHIVES_BASE}/edgar/data/{cik}/"
+    out: List[Evidence] = []
+    seen = 0
+    for view, rows, raw_location in batches:
+        forms, dates, accessions, primary_docs = view.forms, view.dates, view.accessions, view.primary_docs
+        for i in rows:
+            if max_filings is not None and seen >= max_filings:
+                return out
+            seen += 1
+            filing_date = dates[i] or ""
+            accession = accessions[i] or ""
+            if not filing_date or not accession:
+                continue
+            form = forms[i] or "FILING"
+            primary_doc = primary_docs[i] or ""
+            accession_nodash = accession.replace("-", "")
+            out.append(
+                Evidence(
+                    evidence_id=ev_prefix + accession_nodash.lower(),
+                    entity_id=entity_id,
+                    date=filing_date[:10],
+                    source_type="sec_filing",
+                    risk_category="governance" if form in GOVERNANCE_FORMS else "regulatory",
+                    summary=f"SEC filing: {form} filed on {filing_date}",
+                    source_uri=(
+                        f"{doc_base}{accession_nodash}/{primary_doc}"
+                        if primary_doc
+                        else f"{folder_base}{accession_nodash}/"
+                    ),
+                    raw_location=raw_location,
+                    confidence=0.85,
+                    attributes={
+                        "form": form,
+                        "accessionNumber": accession,
+                        "primaryDocument": primary_doc,
+                    },
+                )
+            )
+    return out
 
 
 def _submissions_to_evidence(
@@ -25,60 +87,111 @@ def _submissions_to_evidence(
     raw_location: Optional[str] = None,
     *,
     forms: Optional[Set[str]] = None,
-    max_filings: int = 500,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    max_filings: int = DEFAULT_MAX_FILINGS,
 ) -> List[Evidence]:
-    """Convert SEC submissions JSON to Evidence list."""
-    from osint_swarm.data_sources.sec_edgar import (
-        extract_recent_filings,
-        filing_primary_doc_url,
-    )
-
-    filings = extract_recent_filings(submissions, forms=forms)[:max_filings]
-    out: List[Evidence] = []
-    for f in filings:
-        form = f.get("form") or "FILING"
-        filing_date = f.get("filingDate") or ""
-        accession = f.get("accessionNumber") or ""
-        primary_doc = f.get("primaryDocument") or ""
-        if not filing_date or not accession:
-            continue
-        accession_nodash = accession.replace("-", "")
-        ev_id = f"{entity_id}_sec_{accession_nodash}".lower().replace(" ", "_")
-        source_uri = filing_primary_doc_url(cik, accession, primary_doc) if primary_doc else f"{ARCHIVES_BASE}/edgar/data/{cik}/{accession_nodash}/"
-        summary = f"SEC filing: {form} filed on {filing_date}"
-        risk = "governance" if form in ("8-K", "4", "DEF 14A") else "regulatory"
-        out.append(
-            Evidence(
-                evidence_id=ev_id,
-                entity_id=entity_id,
-                date=filing_date[:10] if len(filing_date) >= 10 else filing_date,
-                source_type="sec_filing",
-                risk_category=risk,
-                summary=summary,
-                source_uri=source_uri,
-                raw_location=raw_location,
-                confidence=0.85,
-                attributes={
-                    "form": form,
-                    "accessionNumber": accession,
-                    "primaryDocument": primary_doc,
-                },
-            )
-        )
-    return out
+    """Convert SEC submissions JSON (recent window) to Evidence list."""
+    view = sec_edgar.recent_filings_view(submissions)
+    rows = view.select(forms=forms, start_date=start_date, end_date=end_date)
+    return _filings_to_evidence([(view, rows, raw_location)], entity_id, cik, max_filings=max_filings)
 
 
 class SecEdgarProcessor(DataSourceProcessor):
-    """MCP processor for SEC EDGAR; uses osint_swarm.data_sources.sec_edgar."""
-
-    def __init__(self, data_root: Optional[Path] = None):
+    """MCP processor for SEC EDGAR; uses osint_swarm.data_sources.sec_edgar.
+
+    By default only the `filings.recent` window is used. With full_history=True the
+    `filings.files` overflow JSONs are fetched concurrently (under the shared SEC rate
+    limit), cached individually under data/raw/sec/, and merged lazily after the
+    recent window. start_date/end_date (YYYY-MM-DD) are pushed down: overflow files
+    whose filingFrom..filingTo range misses the window are never fetched.
+    """
+
+    def __init__(
+        self,
+        data_root: Optional[Path] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        raw_cache: Optional[RawCache] = None,
+        *,
+        full_history: bool = False,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        forms: Optional[Set[str]] = None,
+        max_filings: Optional[int] = None,
+        max_workers: int = 4,
+    ):
         self.data_root = Path(data_root) if data_root else Path("data")
         self._raw_dir = self.data_root / "raw" / "sec"
+        self.cache_policy = cache_policy or DEFAULT_CACHE_POLICIES["sec_edgar"]
+        self._raw_cache = raw_cache or RawCache()
+        self.full_history = full_history
+        self.start_date = start_date
+        self.end_date = end_date
+        self.forms = set(forms) if forms else None
+        # Full history is unbounded by default; the recent window keeps the historical cap.
+        self.max_filings = max_filings if max_filings is not None else (None if full_history else DEFAULT_MAX_FILINGS)
+        self.max_workers = max_workers
 
     @property
     def source_id(self) -> str:
         return "sec_edgar"
 
+    def _overflow_path(self, name: str) -> Path:
+        return self._raw_dir / name
+
+    def _ensure_overflow(self, name: str) -> Path:
+        return self._raw_cache.ensure(
+            self._overflow_path(name),
+            lambda validators: sec_edgar.fetch_submissions_file(name, validators),
+            OVERFLOW_CACHE_POLICY,
+        )
+
+    def iter_filing_batches(
+        self, submissions: Dict[str, Any], raw_location: Optional[str] = None
+    ) -> Iterator[FilingBatch]:
+        """Yield (view, selected rows, raw_location): recent window first, then overflow files in SEC order."""
+        filters = {"forms": self.forms, "start_date": self.start_date, "end_date": self.end_date}
+        view = sec_edgar.recent_filings_view(submissions)
+        yield view, view.select(**filters), raw_location
+        if not self.full_history:
+            return
+
+        files = sec_edgar.overflow_files(submissions, start_date=self.start_date, end_date=self.end_date)
+        if not files:
+            return
+        pool = ThreadPoolExecutor(max_workers=max(1, self.max_workers), thread_name_prefix="sec-overflow")
+        futures = [pool.submit(self._ensure_overflow, f["name"]) for f in files]
+        try:
+            for fut in futures:
+                path = fut.result()
+                view = sec_edgar.FilingsView(read_json(path))
+                yield view, view.select(**filters), str(path)
+        finally:
+            # The consumer may stop early (max_filings): drop fetches that have not started.
+            for fut in futures:
+                fut.cancel()
+            pool.shutdown(wait=True)
+
+    def raw_path_for_entity(self, entity: "Entity") -> Optional[Path]:
+        """Cached submissions JSON for entity, if present."""
+        cik = entity.identifiers.get("cik") if entity.identifiers else None
+        if not cik:
+            return None
+        path = self._raw_dir / f"CIK{sec_edgar.normalize_cik(cik)}.json"
+        return path if path.exists() else None
+
+    def ensure_raw_for_entity(self, entity: "Entity") -> Optional[Path]:
+        """Fetch or revalidate the submissions JSON per cache policy without normalizing it."""
+        cik = entity.identifiers.get("cik") if entity.identifiers else None
+        if not cik:
+            return None
+        cik10 = sec_edgar.normalize_cik(cik)
+        return self._raw_cache.ensure(
+            self._raw_dir / f"CIK{cik10}.json",
+            lambda validators: sec_edgar.fetch_submissions_if_modified(cik10, validators),
+            self.cache_policy,
+        )
+
     def get_evidence_for_entity(self, entity: "Entity") -> List[Evidence]:
         cik = entity.identifiers.get("cik") if entity.identifiers else None
         if not cik:
@@ -87,15 +200,16 @@ class SecEdgarProcessor(DataSourceProcessor):
         entity_id = entity.entity_id
 
         cache_path = self._raw_dir / f"CIK{cik10}.json"
-        if cache_path.exists():
-            submissions = read_json(cache_path)
-            raw_location = str(cache_path)
-        else:
-            submissions = sec_edgar.fetch_submissions(cik10)
-            self._raw_dir.mkdir(parents=True, exist_ok=True)
-            write_json(cache_path, submissions)
-            raw_location = str(cache_path)
-
-        return _submissions_to_evidence(
-            submissions, entity_id, cik10, raw_location=raw_location
+        submissions = self._raw_cache.get(
+            cache_path,
+            lambda validators: sec_edgar.fetch_submissions_if_modified(cik10, validators),
+            self.cache_policy,
+        )
+        raw_location = str(cache_path)
+
+        return _filings_to_evidence(
+            self.iter_filing_batches(submissions, raw_location),
+            entity_id,
+            cik10,
+            max_filings=self.max_filings,
         )
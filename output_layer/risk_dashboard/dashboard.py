@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import List
+from typing import Dict, Iterable, List
 
 from osint_swarm.entities import Evidence
 
@@ -12,29 +12,46 @@ from output_layer.risk_dashboard.types import RiskDashboardScores
 RISK_CATEGORIES = ("governance", "regulatory", "legal", "network", "other")
 
 
-def compute_risk_scores(findings: List[Evidence]) -> RiskDashboardScores:
+class RiskScoreAccumulator:
+    """Running risk sums; add() findings as they arrive, scores() at any point."""
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self.count = 0
+        self._by_category: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0])
+
+    def add(self, findings: Iterable[Evidence]) -> None:
+        for e in findings:
+            self.total += e.confidence
+            self.count += 1
+            acc = self._by_category[e.risk_category]
+            acc[0] += e.confidence
+            acc[1] += 1
+
+    def scores(self) -> RiskDashboardScores:
+        if not self.count:
+            return RiskDashboardScores(by_risk_category={}, overall=0.0, finding_count=0)
+        by_risk_category = {
+            cat: round(self._by_category[cat][0] / self._by_category[cat][1], 4)
+            for cat in RISK_CATEGORIES
+            if cat in self._by_category
+        }
+        return RiskDashboardScores(
+            by_risk_category=by_risk_category,
+            overall=round(self.total / self.count, 4),
+            finding_count=self.count,
+        )
+
+
+def compute_risk_scores(findings: Iterable[Evidence]) -> RiskDashboardScores:
     """
     Compute composite risk score per risk_category (mean confidence of findings in that category)
     and overall. Higher confidence in risk findings = higher score for that dimension.
+    Single pass, so findings may be a stream.
     """
-    if not findings:
-        return RiskDashboardScores(by_risk_category={}, overall=0.0, finding_count=0)
-
-    by_category: dict[str, List[float]] = defaultdict(list)
-    for e in findings:
-        by_category[e.risk_category].append(e.confidence)
-
-    by_risk_category = {
-        cat: round(sum(by_category[cat]) / len(by_category[cat]), 4)
-        for cat in RISK_CATEGORIES
-        if by_category[cat]
-    }
-    overall = sum(e.confidence for e in findings) / len(findings)
-    return RiskDashboardScores(
-        by_risk_category=by_risk_category,
-        overall=round(overall, 4),
-        finding_count=len(findings),
-    )
+    acc = RiskScoreAccumulator()
+    acc.add(findings)
+    return acc.scores()
 
 
 def format_dashboard_cli(scores: RiskDashboardScores) -> str:
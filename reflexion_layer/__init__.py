@@ -1,18 +1,21 @@
 """Reflexion layer: cross-check, gap detection, confidence (Phase 5)."""
 
 from reflexion_layer.confidence_module import (
+    ConfidenceAccumulator,
     ConfidenceScores,
     aggregate_confidence,
     adjusted_confidence,
 )
-from reflexion_layer.cross_check import Conflict, cross_check_findings
+from reflexion_layer.cross_check import Conflict, CrossChecker, cross_check_findings
 from reflexion_layer.gap_detection import Gap, detect_gaps
 
 __all__ = [
     "Conflict",
+    "CrossChecker",
     "cross_check_findings",
     "Gap",
     "detect_gaps",
+    "ConfidenceAccumulator",
     "ConfidenceScores",
     "aggregate_confidence",
     "adjusted_confidence",
@@ -1,6 +1,10 @@
 """Confidence module: aggregate and adjust confidence scores."""
 
-from reflexion_layer.confidence_module.scorer import aggregate_confidence, adjusted_confidence
+from reflexion_layer.confidence_module.scorer import (
+    ConfidenceAccumulator,
+    aggregate_confidence,
+    adjusted_confidence,
+)
 from reflexion_layer.confidence_module.types import ConfidenceScores
 
-__all__ = ["ConfidenceScores", "aggregate_confidence", "adjusted_confidence"]
+__all__ = ["ConfidenceAccumulator", "ConfidenceScores", "aggregate_confidence", "adjusted_confidence"]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 from osint_swarm.entities import Evidence
 
@@ -21,31 +21,44 @@ SOURCE_RELIABILITY: Dict[str, float] = {
 }
 
 
-def aggregate_confidence(findings: List[Evidence]) -> ConfidenceScores:
-    """
-    Aggregate confidence across findings: overall mean and by risk_category / source_type.
-    """
-    if not findings:
-        return ConfidenceScores(overall=0.0, by_risk_category={}, by_source_type={})
+class ConfidenceAccumulator:
+    """Running confidence sums; add() findings as they arrive, scores() at any point."""
 
-    by_risk: Dict[str, List[float]] = defaultdict(list)
-    by_source: Dict[str, List[float]] = defaultdict(list)
-    for e in findings:
-        by_risk[e.risk_category].append(e.confidence)
-        by_source[e.source_type].append(e.confidence)
+    def __init__(self) -> None:
+        self.total = 0.0
+        self.count = 0
+        self._by_risk: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0])
+        self._by_source: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0])
+
+    def add(self, findings: Iterable[Evidence]) -> None:
+        for e in findings:
+            self.total += e.confidence
+            self.count += 1
+            for acc in (self._by_risk[e.risk_category], self._by_source[e.source_type]):
+                acc[0] += e.confidence
+                acc[1] += 1
 
-    overall = sum(e.confidence for e in findings) / len(findings)
-    by_risk_category = {k: sum(v) / len(v) for k, v in by_risk.items() if v}
-    by_source_type = {k: sum(v) / len(v) for k, v in by_source.items() if v}
+    def scores(self) -> ConfidenceScores:
+        if not self.count:
+            return ConfidenceScores(overall=0.0, by_risk_category={}, by_source_type={})
+        return ConfidenceScores(
+            overall=round(self.total / self.count, 4),
+            by_risk_category={k: s / n for k, (s, n) in self._by_risk.items() if n},
+            by_source_type={k: s / n for k, (s, n) in self._by_source.items() if n},
+        )
 
-    return ConfidenceScores(
-        overall=round(overall, 4),
-        by_risk_category=by_risk_category,
-        by_source_type=by_source_type,
-    )
+
+def aggregate_confidence(findings: Iterable[Evidence]) -> ConfidenceScores:
+    """
+    Aggregate confidence across findings: overall mean and by risk_category / source_type.
+    Single pass with running sums, so findings may be a stream (e.g. iter_evidence).
+    """
+    acc = ConfidenceAccumulator()
+    acc.add(findings)
+    return acc.scores()
 
 
-def adjusted_confidence(findings: List[Evidence]) -> List[Tuple[Evidence, float]]:
+def adjusted_confidence(findings: Iterable[Evidence]) -> List[Tuple[Evidence, float]]:
     """
     Return each finding with an adjusted confidence (evidence.confidence * source_reliability).
     """
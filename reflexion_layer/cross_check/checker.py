@@ -3,42 +3,59 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import List
+from typing import Any, Dict, Iterable, List, Tuple
 
 from osint_swarm.entities import Evidence
 
 from reflexion_layer.cross_check.types import Conflict
 
 
-def cross_check_findings(findings: List[Evidence]) -> List[Conflict]:
+class CrossChecker:
     """
-    Compare findings for consistency. Flags conflicts when the same entity/date
-    has materially different claims (e.g. different names or outcomes).
+    Incremental cross-check: add() findings as they arrive, conflicts() at any point.
+
+    Per (entity_id, date) group only the first few evidence_ids, the count and the
+    distinct summaries are kept.
     """
-    conflicts: List[Conflict] = []
-    if not findings:
-        return conflicts
 
-    # Group by (entity_id, date) where date is non-empty
-    by_entity_date: dict[tuple[str, str], List[Evidence]] = defaultdict(list)
-    for e in findings:
-        if e.date:
-            by_entity_date[(e.entity_id, e.date)].append(e)
-
-    for (entity_id, date), group in by_entity_date.items():
-        if len(group) < 2:
-            continue
-        # Check for conflicting summaries (different key facts)
-        summaries = [e.summary.strip() for e in group if e.summary]
-        if len(set(summaries)) > 1:
+    def __init__(self) -> None:
+        # (entity_id, date) -> [first ids, count, distinct summaries]
+        self._by_entity_date: Dict[Tuple[str, str], List[Any]] = defaultdict(lambda: [[], 0, set()])
+
+    def add(self, findings: Iterable[Evidence]) -> None:
+        for e in findings:
+            if e.date:
+                group = self._by_entity_date[(e.entity_id, e.date)]
+                if len(group[0]) < 5:  # cap for readability
+                    group[0].append(e.evidence_id)
+                group[1] += 1
+                if e.summary:
+                    group[2].add(e.summary.strip())
+
+    def conflicts(self) -> List[Conflict]:
+        conflicts: List[Conflict] = []
+        for (entity_id, date), (ids, count, summaries) in self._by_entity_date.items():
+            if count < 2:
+                continue
             # Same entity+date but different summary text -> potential conflict
-            ids = tuple(e.evidence_id for e in group[:5])  # cap for readability
-            conflicts.append(
-                Conflict(
-                    dimension="summary_consistency",
-                    evidence_ids=ids,
-                    description=f"Same entity/date ({entity_id}, {date}) has differing summaries across {len(group)} findings.",
+            if len(summaries) > 1:
+                conflicts.append(
+                    Conflict(
+                        dimension="summary_consistency",
+                        evidence_ids=tuple(ids),
+                        description=f"Same entity/date ({entity_id}, {date}) has differing summaries across {count} findings.",
+                    )
                 )
-            )
+        return conflicts
+
 
-    return conflicts
+def cross_check_findings(findings: Iterable[Evidence]) -> List[Conflict]:
+    """
+    Compare findings for consistency. Flags conflicts when the same entity/date
+    has materially different claims (e.g. different names or outcomes).
+
+    Single pass over findings (a list or a stream).
+    """
+    checker = CrossChecker()
+    checker.add(findings)
+    return checker.conflicts()
@@ -26,15 +26,26 @@ def detect_gaps(context: "InvestigationContext") -> List[Gap]:
         )
         return gaps
 
-    # Check each agent's results for stub-only output
+    # Check each agent's results: failed/timed-out tasks vs stub-only output
     stub_agents = {
-        "legal_agent": ("Sanctions / legal", "Sanctions screening and PACER not yet integrated.", "Add OFAC/sanctions list or CourtListener integration."),
+        "legal_agent": ("Sanctions / legal", "No OFAC lists or CourtListener index staged.", "Stage OFAC lists in data/reference/sanctions/ and run scripts/ingest_courtlistener.py."),
         "social_graph_agent": ("Adverse media / network", "Social graph and adverse media not yet integrated.", "Add Twitter/LinkedIn or GDELT integration."),
     }
+    failures = context.get_task_failures()
     for agent_id, (area, desc, follow_up) in stub_agents.items():
         results = context.get_agent_results(agent_id)
-        if not results:
-            gaps.append(Gap(area=area, description=f"{desc} No findings returned.", suggested_follow_up=follow_up))
+        failed = [f for f in failures if f.task.target_agent == agent_id]
+        if failed:
+            tasks = ", ".join(sorted({f"{f.task.task_type} ({f.reason})" for f in failed}))
+            gaps.append(
+                Gap(
+                    area=area,
+                    description=f"Sub-tasks failed or timed out: {tasks}.",
+                    suggested_follow_up="Check the task errors (data staging, network, timeouts) and rerun the investigation.",
+                )
+            )
+        elif not results:
+            gaps.append(Gap(area=area, description="No findings returned.", suggested_follow_up=follow_up))
         elif all(getattr(e, "attributes", {}).get("stub") for e in results):
             gaps.append(Gap(area=area, description=f"{desc} Only stub placeholders returned.", suggested_follow_up=follow_up))
 
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Build the entity registry snapshot from data/reference/ (optionally downloading SEC's issuer list first)."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+for p in (ROOT, SRC):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+
+from dotenv import load_dotenv
+load_dotenv(ROOT / ".env")
+
+from agents.lead_agent.entity_resolution import EntityRegistry
+from agents.lead_agent.entity_resolution.registry import REFERENCE_DIR_NAME, SEC_TICKER_FILES
+from osint_swarm.data_sources.sec_edgar import (
+    COMPANY_TICKERS_EXCHANGE_URL,
+    COMPANY_TICKERS_URL,
+    fetch_company_tickers,
+)
+from osint_swarm.utils.io import write_json
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Compile names, aliases and identifiers into the entity registry snapshot.")
+    ap.add_argument("--data-root", type=Path, default=ROOT / "data", help="Data directory (reference/ and processed/)")
+    ap.add_argument("--fetch", action="store_true", help="Download SEC company_tickers_exchange.json first (needs SEC_USER_AGENT)")
+    args = ap.parse_args()
+
+    if args.fetch:
+        out = args.data_root / REFERENCE_DIR_NAME / SEC_TICKER_FILES[0]
+        try:
+            payload = fetch_company_tickers(COMPANY_TICKERS_EXCHANGE_URL)
+        except Exception as e:
+            print(f"Exchange file failed ({e}); falling back to company_tickers.json")
+            out = args.data_root / REFERENCE_DIR_NAME / SEC_TICKER_FILES[1]
+            payload = fetch_company_tickers(COMPANY_TICKERS_URL)
+        write_json(out, payload, compact=True)
+        print(f"Wrote: {out}")
+
+    registry = EntityRegistry(args.data_root)
+    start = time.perf_counter()
+    registry.reload()
+    print(f"Registry: {len(registry)} entities from {[p.name for p in registry.source_paths()] or 'curated entries only'} "
+          f"in {time.perf_counter() - start:.2f}s")
+    if registry.snapshot_path.exists():
+        print(f"Snapshot: {registry.snapshot_path}")
+
+
+if __name__ == "__main__":
+    main()
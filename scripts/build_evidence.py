@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Incrementally build data/processed/<entity_id>/evidence_<source>.csv for registry entities."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+for p in (ROOT, SRC):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+
+from agents.lead_agent.entity_resolution import ENTITY_REGISTRY, EntityRegistry, resolve_one, set_default_registry
+from mcp_layer.evidence_builder import EvidenceBuilder
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Build processed evidence from the raw cache; only changed records are re-normalized.")
+    ap.add_argument("entities", nargs="*", help="Entity names/aliases/ids (default: every curated registry entity)")
+    ap.add_argument("--data-root", type=Path, default=ROOT / "data", help="Data directory (raw/processed)")
+    ap.add_argument("--force", action="store_true", help="Ignore manifests and rebuild everything")
+    args = ap.parse_args()
+
+    if args.entities:
+        registry = EntityRegistry(args.data_root)
+        set_default_registry(registry)  # resolve_one uses the same data root
+        entities = []
+        for q in args.entities:
+            entity = registry.get(q) or resolve_one(q)
+            if entity is None:
+                raise SystemExit(f"Unknown entity: {q}")
+            entities.append(entity)
+    else:
+        entities = list(ENTITY_REGISTRY)
+
+    builder = EvidenceBuilder(data_root=args.data_root)
+    for entity in entities:
+        for s in builder.build(entity, force=args.force):
+            if s.status == "built":
+                print(
+                    f"{s.entity_id} {s.source_id}: +{s.added} ~{s.updated} -{s.removed} "
+                    f"(reused {s.reused}) -> {s.output}"
+                )
+            else:
+                print(f"{s.entity_id} {s.source_id}: {s.status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,42 @@
+#!/usr/bin/env python3
+"""
+Tesla vertical slice: build Tesla's processed evidence with the incremental builder.
+
+Kept for the README quick start. Runs `python scripts/build_evidence.py Tesla` and
+also writes the hand-curated SEC seed row (the 2023 CFO-change 8-K, which the
+builder only reports as a generic filing) to evidence_curated.csv next to the
+builder's CSVs. The CSV this script used to write (data/processed/tesla/evidence_tesla.csv)
+repeats the builder's NHTSA rows under other ids; it is left in place with a warning
+unless --remove-legacy is given.
+"""
+
 from __future__ import annotations
 
-import json
+import argparse
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import List
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
-if str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
+for p in (ROOT, SRC):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
 
 from dotenv import load_dotenv
 load_dotenv(ROOT / ".env")
 
+from agents.lead_agent.entity_resolution import EntityRegistry
+from mcp_layer.evidence_builder import EvidenceBuilder
+from mcp_layer.evidence_loader import EVIDENCE_CSV_FIELDS, evidence_to_row, load_evidence_from_csv
+from mcp_layer.evidence_store import EvidenceStore, store_path
 from osint_swarm.entities import Evidence
-from osint_swarm.utils.io import read_json, write_csv_dicts
+from osint_swarm.utils.io import write_csv_dicts
 
 
 TESLA_ENTITY_ID = "tesla_inc_cik_0001318605"
-
-
-def _safe_get(d: Dict[str, Any], *keys: str) -> Any:
-    cur: Any = d
-    for k in keys:
-        if not isinstance(cur, dict):
-            return None
-        cur = cur.get(k)
-    return cur
+LEGACY_CSV = Path("processed") / "tesla" / "evidence_tesla.csv"
+CURATED_CSV_NAME = "evidence_curated.csv"
 
 
 def build_sec_seed_evidence() -> List[Evidence]:
@@ -55,98 +65,53 @@ def build_sec_seed_evidence() -> List[Evidence]:
     ]
 
 
-def build_nhtsa_evidence(raw_path: Path) -> List[Evidence]:
-    payload = read_json(raw_path)
-    records = payload.get("results") or payload.get("Results") or []
-    out: List[Evidence] = []
-
-    for r in records:
-        if not isinstance(r, dict):
-            continue
-
-        # DOT DataHub schema (2026): `nhtsa_id`, `report_received_date`, `defect_summary`, etc.
-        nhtsa_id = r.get("nhtsa_id") or r.get("NHTSA_ID")
-        report_date = r.get("report_received_date") or r.get("ReportReceivedDate")
-        subject = r.get("subject") or r.get("Subject") or ""
-        component = r.get("component") or r.get("Component") or ""
-        defect_summary = r.get("defect_summary") or r.get("Summary") or ""
-        consequence = r.get("consequence_summary") or r.get("Consequence") or ""
-        corrective_action = r.get("corrective_action") or r.get("Remedy") or ""
-        recall_type = r.get("recall_type") or ""
-        potentially_affected = r.get("potentially_affected") or ""
-        mfr_campaign_number = r.get("mfr_campaign_number") or ""
-        manufacturer = r.get("manufacturer") or ""
-
-        recall_link = r.get("recall_link") if isinstance(r.get("recall_link"), dict) else {}
-        recall_url = (recall_link or {}).get("url") or ""
-
-        if not report_date:
-            # Skip records without a date; evidence requires a sortable date.
-            continue
-
-        source_uri = recall_url or "https://www.nhtsa.gov/recalls"
-        ev_id = f"tesla_nhtsa_{(nhtsa_id or mfr_campaign_number or report_date)}".lower().replace(" ", "_")
-        out.append(
-            Evidence(
-                evidence_id=ev_id,
-                entity_id=TESLA_ENTITY_ID,
-                date=str(report_date)[:10],
-                source_type="regulator_api",
-                risk_category="regulatory",
-                summary=(defect_summary or subject or "").strip()[:5000],
-                source_uri=source_uri,
-                raw_location=str(raw_path),
-                confidence=0.8,
-                attributes={
-                    "nhtsa_id": nhtsa_id,
-                    "manufacturer": manufacturer,
-                    "subject": subject,
-                    "component": component,
-                    "recall_type": recall_type,
-                    "potentially_affected": potentially_affected,
-                    "mfr_campaign_number": mfr_campaign_number,
-                    "consequence_summary": (consequence or "").strip()[:5000],
-                    "corrective_action": (corrective_action or "").strip()[:5000],
-                },
-            )
-        )
-
-    return out
+def write_curated_evidence(processed_dir: Path) -> Path:
+    """Write the seed rows to <processed>/<entity_id>/evidence_curated.csv (left untouched when unchanged)."""
+    out_path = processed_dir / TESLA_ENTITY_ID / CURATED_CSV_NAME
+    seed = build_sec_seed_evidence()
+    if load_evidence_from_csv(out_path) != seed:
+        write_csv_dicts(out_path, (evidence_to_row(e) for e in seed), fieldnames=EVIDENCE_CSV_FIELDS)
+    return out_path
 
 
 def main() -> None:
-    raw_nhtsa = Path("data/raw/nhtsa/recalls_make_TESLA.json")
-    if not raw_nhtsa.exists():
+    ap = argparse.ArgumentParser(description="Build Tesla's processed evidence (SEC + NHTSA) from the raw cache.")
+    ap.add_argument("--data-root", type=Path, default=ROOT / "data", help="Data directory (raw/processed)")
+    ap.add_argument("--force", action="store_true", help="Ignore the manifest and rebuild everything")
+    ap.add_argument(
+        "--remove-legacy",
+        action="store_true",
+        help="Delete data/processed/tesla/evidence_tesla.csv (and its rows in the evidence store)",
+    )
+    args = ap.parse_args()
+
+    entity = EntityRegistry(args.data_root).get(TESLA_ENTITY_ID)
+    if entity is None:
+        raise SystemExit(f"Unknown entity: {TESLA_ENTITY_ID}")
+    stats = EvidenceBuilder(data_root=args.data_root).build(entity, force=args.force)
+    if all(s.status == "missing_input" for s in stats):
         raise SystemExit(
-            "Missing NHTSA raw file. Run: python scripts/pull_nhtsa_recalls.py --make TESLA"
+            "Missing raw files. Run: python scripts/pull_sec_submissions.py --cik 0001318605 "
+            "and python scripts/pull_nhtsa_recalls.py --make TESLA"
         )
-
-    evidence: List[Evidence] = []
-    evidence.extend(build_sec_seed_evidence())
-    evidence.extend(build_nhtsa_evidence(raw_nhtsa))
-
-    rows = [e.to_dict() for e in evidence]
-    # Flatten attributes as JSON string for CSV portability.
-    for row in rows:
-        row["attributes"] = json.dumps(row.get("attributes") or {}, ensure_ascii=False)
-
-    out_path = Path("data/processed/tesla/evidence_tesla.csv")
-    fieldnames = [
-        "evidence_id",
-        "entity_id",
-        "date",
-        "source_type",
-        "risk_category",
-        "summary",
-        "source_uri",
-        "raw_location",
-        "confidence",
-        "attributes",
-    ]
-    write_csv_dicts(out_path, rows, fieldnames=fieldnames)
-    print(f"Wrote: {out_path} ({len(rows)} rows)")
+    for s in stats:
+        print(f"{s.source_id}: {s.status}" + (f" -> {s.output}" if s.output else ""))
+    print(f"curated: {write_curated_evidence(args.data_root / 'processed')}")
+
+    legacy = args.data_root / LEGACY_CSV
+    if not legacy.exists():
+        return
+    if not args.remove_legacy:
+        print(f"Warning: {legacy} is superseded by the files above and repeats their rows; rerun with --remove-legacy to delete it.")
+        return
+    db_path = store_path(args.data_root / "processed")
+    if db_path.exists():
+        with EvidenceStore(db_path) as store:
+            curated = {e.evidence_id for e in build_sec_seed_evidence()}  # the legacy CSV carried the seed row too
+            store.delete(TESLA_ENTITY_ID, [e.evidence_id for e in load_evidence_from_csv(legacy) if e.evidence_id not in curated])
+    legacy.unlink()
+    print(f"Removed legacy {legacy}")
 
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""Import data/processed/<slug>/evidence_*.csv into the indexed evidence store (evidence.sqlite)."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+for p in (ROOT, SRC):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+
+from mcp_layer.evidence_store import EvidenceStore, store_path
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Migrate processed evidence CSVs into data/processed/evidence.sqlite.")
+    ap.add_argument("--processed-dir", type=Path, default=Path("data/processed"), help="Processed evidence directory")
+    args = ap.parse_args()
+
+    db_path = store_path(args.processed_dir)
+    with EvidenceStore(db_path) as store:
+        imported = store.import_csv_dir(args.processed_dir)
+        for csv_path, n in imported.items():
+            print(f"Imported: {csv_path} ({n} rows)")
+        print(f"Wrote: {db_path} ({store.count()} rows, {len(store.entity_ids())} entities)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Stream CourtListener bulk CSV dumps (data/raw/courtlistener/) into the local docket/party index."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional, Set
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+for p in (ROOT, SRC):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+
+from dotenv import load_dotenv
+load_dotenv(ROOT / ".env")
+
+from agents.lead_agent.entity_resolution import EntityRegistry, load_entities_csv
+from agents.specialist_agents.legal_agent.pacer_analyzer import bulk_dir, court_db_path, ingest_courtlistener, registry_party_keys
+from osint_swarm.entities import Entity
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Build the CourtListener party-name index used by the Legal Agent's litigation task.")
+    ap.add_argument("--data-root", type=Path, default=ROOT / "data", help="Data directory (raw/courtlistener, processed)")
+    ap.add_argument("--bulk-dir", type=Path, default=None, help="Directory of the dumps (default: data/raw/courtlistener)")
+    ap.add_argument("--all", action="store_true", help="Index every party instead of only those matching the entity registry")
+    ap.add_argument("--file", type=Path, help="Keep parties matching this CSV of entities instead of the registry")
+    ap.add_argument("--force", action="store_true", help="Rebuild the index from scratch")
+    args = ap.parse_args()
+
+    keys: Optional[Set[str]] = None
+    if not args.all:
+        entities: List[Entity] = load_entities_csv(args.file) if args.file else list(EntityRegistry(args.data_root).entities)
+        keys = registry_party_keys(entities)
+        print(f"Keeping parties matching {len(keys)} names of {len(entities)} entities")
+
+    summary = ingest_courtlistener(args.bulk_dir or bulk_dir(args.data_root), court_db_path(args.data_root), keys=keys, force=args.force)
+    print(summary.format())
+
+
+if __name__ == "__main__":
+    main()
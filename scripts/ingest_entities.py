@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Batch ingestion: fetch raw SEC/NHTSA data and build processed evidence for many entities."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+for p in (ROOT, SRC):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+
+from dotenv import load_dotenv
+load_dotenv(ROOT / ".env")
+
+from agents.lead_agent.entity_resolution import ENTITY_REGISTRY, EntityRegistry, load_entities_csv, resolve_one, set_default_registry
+from mcp_layer.batch_ingest import DEFAULT_IO_WORKERS, INGEST_SOURCES, ingest_entities
+from osint_swarm.entities import Entity
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Fetch raw data (rate-limited I/O pool) and normalize evidence (process pool) for many entities.")
+    ap.add_argument("entities", nargs="*", help="Registry names/aliases/ids (default: curated registry entities unless --file is given)")
+    ap.add_argument("--file", type=Path, help="CSV of entities: entity_id,name,cik,ticker,make[,aliases]")
+    ap.add_argument("--data-root", type=Path, default=ROOT / "data", help="Data directory (raw/processed)")
+    ap.add_argument("--sources", default=",".join(INGEST_SOURCES), help="Comma-separated sources to fetch")
+    ap.add_argument("--io-workers", type=int, default=DEFAULT_IO_WORKERS, help="Concurrent fetches (SEC rate limit still applies)")
+    ap.add_argument("--workers", type=int, default=None, help="Normalization processes (default: CPU count; 0 = in-process)")
+    ap.add_argument("--no-fetch", action="store_true", help="Only build from files already in data/raw")
+    ap.add_argument("--force", action="store_true", help="Ignore manifests and rebuild everything")
+    args = ap.parse_args()
+
+    entities: List[Entity] = []
+    if args.file:
+        entities.extend(load_entities_csv(args.file))
+    registry = EntityRegistry(args.data_root)
+    set_default_registry(registry)  # resolve_one uses the same data root
+    for q in args.entities:
+        entity = registry.get(q) or resolve_one(q)
+        if entity is None:
+            raise SystemExit(f"Unknown entity: {q}")
+        entities.append(entity)
+    if not args.file and not args.entities:
+        entities = list(ENTITY_REGISTRY)
+
+    summary = ingest_entities(
+        entities,
+        data_root=args.data_root,
+        sources=[s.strip() for s in args.sources.split(",") if s.strip()],
+        io_workers=args.io_workers,
+        cpu_workers=args.workers,
+        fetch=not args.no_fetch,
+        force=args.force,
+    )
+    print(summary.format())
+
+
+if __name__ == "__main__":
+    main()
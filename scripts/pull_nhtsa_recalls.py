@@ -12,15 +12,33 @@ if str(SRC) not in sys.path:
 from dotenv import load_dotenv
 load_dotenv(ROOT / ".env")
 
-from osint_swarm.data_sources.nhtsa import cache_recalls_json, fetch_recalls_by_make
+from osint_swarm.data_sources.nhtsa import (
+    DEFAULT_PAGE_WORKERS,
+    cache_recalls_json,
+    download_recalls_by_make,
+    fetch_recalls_by_make,
+    recalls_jsonl_path,
+)
 
 
 def main() -> None:
     ap = argparse.ArgumentParser(description="Pull NHTSA recalls for a vehicle make (cached to data/raw/nhtsa/).")
     ap.add_argument("--make", required=True, help="Vehicle make. Example: TESLA")
+    ap.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream pages to data/raw/nhtsa/recalls_make_<MAKE>.jsonl (resumable; for large makes).",
+    )
+    ap.add_argument("--workers", type=int, default=DEFAULT_PAGE_WORKERS, help="Concurrent page fetches.")
     args = ap.parse_args()
 
-    payload = fetch_recalls_by_make(args.make)
+    if args.stream:
+        out_path = recalls_jsonl_path(Path("data/raw/nhtsa"), args.make)
+        count = download_recalls_by_make(args.make, out_path, max_workers=args.workers)
+        print(f"Wrote: {out_path} ({count} rows)")
+        return
+
+    payload = fetch_recalls_by_make(args.make, max_workers=args.workers)
     make_norm = args.make.strip().upper().replace(" ", "_")
     out_path = Path("data/raw/nhtsa") / f"recalls_make_{make_norm}.json"
     cache_recalls_json(payload, out_path=out_path)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Rescreen monitored entities after a sanctions list update (only the list delta is screened)."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+for p in (ROOT, SRC):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+
+from dotenv import load_dotenv
+load_dotenv(ROOT / ".env")
+
+from agents.lead_agent.entity_resolution import EntityRegistry, load_entities_csv, resolve_one, set_default_registry
+from agents.specialist_agents.legal_agent.sanctions_screener import SanctionsMonitor, default_state_path, load_sanctions_lists
+from agents.specialist_agents.legal_agent.sanctions_screener.lists import sanctions_dir
+from osint_swarm.entities import Entity
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Diff the staged OFAC lists against the last run and screen only what changed.")
+    ap.add_argument("--data-root", type=Path, default=ROOT / "data", help="Data directory (reference/sanctions, processed)")
+    ap.add_argument("--state", type=Path, default=None, help="Monitor state file (default: data/processed/sanctions_monitor.pickle)")
+    ap.add_argument("--watch", nargs="*", default=[], help="Registry names/aliases/ids to start monitoring")
+    ap.add_argument("--watch-file", type=Path, help="CSV of entities to monitor: entity_id,name,cik,ticker,make[,aliases]")
+    ap.add_argument("--unwatch", nargs="*", default=[], help="Entity ids to stop monitoring")
+    args = ap.parse_args()
+
+    monitor = SanctionsMonitor(args.state or default_state_path(args.data_root))
+    entities: List[Entity] = []
+    if args.watch_file:
+        entities.extend(load_entities_csv(args.watch_file))
+    if args.watch:
+        registry = EntityRegistry(args.data_root)
+        set_default_registry(registry)  # resolve_one uses the same data root
+        for q in args.watch:
+            entity = registry.get(q) or resolve_one(q)
+            if entity is None:
+                raise SystemExit(f"Unknown entity: {q}")
+            entities.append(entity)
+    monitor.watch(entities)
+    monitor.unwatch(args.unwatch)
+
+    entries = load_sanctions_lists(sanctions_dir(args.data_root))
+    if not entries:
+        raise SystemExit(f"No sanctions lists staged in {sanctions_dir(args.data_root)}")
+    result = monitor.update(entries)
+    monitor.save()
+
+    d = result.delta
+    print(f"List version {d.version[:12]}: {len(d.added)} added, {len(d.changed)} changed, {len(d.removed)} removed, {d.unchanged} unchanged")
+    print(f"Screened {result.screened_entries} entries and {result.screened_parties} parties in {result.elapsed_s:.3f}s; monitoring {len(monitor.parties)}")
+    for a in result.alerts:
+        print(f"ALERT [{a.reason}] {a.entity_id}: {a.screened_name!r} ~ {a.matched_name!r} ({a.entry.key}, {', '.join(a.entry.programs)}) score={a.score:.2f}")
+    for eid, key in result.cleared:
+        print(f"cleared {eid}: {key}")
+
+
+if __name__ == "__main__":
+    main()
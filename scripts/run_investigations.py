@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Run many investigation queries as one batch (shared agents, resolution and per-entity fetches)."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+for p in (ROOT, SRC):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+
+from dotenv import load_dotenv
+load_dotenv(ROOT / ".env")
+
+from app.pipeline import DEFAULT_BATCH_WORKERS, run_investigations
+
+
+def load_queries(path: Path) -> List[str]:
+    """One query per line; blank lines and #-comments are skipped."""
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Run a batch of investigation queries, sharing resolution and evidence fetches per entity.")
+    ap.add_argument("queries", nargs="*", help="Investigation queries")
+    ap.add_argument("--file", type=Path, help="Text file with one query per line")
+    ap.add_argument("--data-root", type=Path, default=ROOT / "data", help="Data directory (raw/processed)")
+    ap.add_argument("--workers", type=int, default=DEFAULT_BATCH_WORKERS, help="Investigations run concurrently")
+    ap.add_argument("--out", type=Path, help="Write per-query results (without report bodies) and the summary as JSON")
+    args = ap.parse_args()
+
+    queries = list(args.queries)
+    if args.file:
+        queries.extend(load_queries(args.file))
+    if not queries:
+        raise SystemExit("No queries given (pass them as arguments or with --file)")
+
+    batch = run_investigations(queries, data_root=args.data_root, max_workers=args.workers)
+    for r in batch["results"]:
+        status = f"error: {r['error']}" if r["error"] else f"{r['findings_count']} findings"
+        print(f"{r['query']!r} -> {r['entity_id'] or '(unresolved)'}: {status}")
+    s = batch["summary"]
+    print()
+    print(f"Queries:   {s['queries']} ({s['distinct_queries']} distinct, {s['unresolved']} unresolved, {s['errors']} errors)")
+    print(f"Entities:  {s['entities']}")
+    print(f"Cache:     {s['evidence_cache']['misses']} fetches, {s['evidence_cache']['hits']} reused")
+    print(f"Time:      {s['elapsed_s']:.2f}s total, resolve {s['resolve_s']:.2f}s, "
+          f"mean {s['mean_query_s']:.2f}s / max {s['max_query_s']:.2f}s per query ({s['queries_per_s']:.2f}/s)")
+
+    if args.out:
+        slim = [{k: v for k, v in r.items() if k not in ("report_md", "report_html")} for r in batch["results"]]
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps({"results": slim, "summary": s}, indent=2, default=str), encoding="utf-8")
+        print(f"Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
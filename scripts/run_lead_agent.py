@@ -21,10 +21,14 @@ def main() -> None:
     ap = argparse.ArgumentParser(description="Run Lead Agent: resolve entity, decompose tasks, collect evidence.")
     ap.add_argument("query", nargs="?", default="Investigate Tesla for money laundering", help="Investigation query")
     ap.add_argument("--data-root", type=Path, default=ROOT / "data", help="Data directory (raw/processed)")
+    ap.add_argument("--checkpoint-dir", type=Path, default=None, help="Checkpoint completed tasks here (e.g. data/checkpoints)")
+    ap.add_argument("--resume", action="store_true", help="Skip tasks already checkpointed with unchanged inputs")
     args = ap.parse_args()
+    if args.resume and args.checkpoint_dir is None:
+        args.checkpoint_dir = args.data_root / "checkpoints"
 
-    agent = LeadAgent(data_root=args.data_root)
-    ctx = agent.run(args.query)
+    agent = LeadAgent(data_root=args.data_root, checkpoint_dir=args.checkpoint_dir)
+    ctx = agent.run(args.query, resume=args.resume)
 
     print("Query:", ctx.get_query())
     entity = ctx.get_entity()
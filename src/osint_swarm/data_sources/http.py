@@ -0,0 +1,195 @@
+"""Shared HTTP client for connectors: keep-alive pools, per-host rate limits, retries.
+
+All connectors should issue requests through `get_default_client()` (or an
+`HttpClient` passed in explicitly) rather than bare `requests.get`, so that
+batch refreshes reuse TCP/TLS connections and respect each host's fair-access
+limit across threads.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# SEC fair-access policy: at most 10 requests/second per client.
+SEC_RATE_LIMIT_RPS = 10.0
+DEFAULT_RATE_LIMITS: Dict[str, float] = {
+    "data.sec.gov": SEC_RATE_LIMIT_RPS,
+    "www.sec.gov": SEC_RATE_LIMIT_RPS,
+}
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class Validators:
+    """HTTP cache validators of a stored payload, used for conditional GETs (304 Not Modified)."""
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def headers(self) -> Dict[str, str]:
+        out: Dict[str, str] = {}
+        if self.etag:
+            out["If-None-Match"] = self.etag
+        if self.last_modified:
+            out["If-Modified-Since"] = self.last_modified
+        return out
+
+    @classmethod
+    def from_response(cls, resp: requests.Response) -> "Validators":
+        return cls(etag=resp.headers.get("ETag"), last_modified=resp.headers.get("Last-Modified"))
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens/second, bursts up to `capacity`."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got: {rate!r}")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Take `tokens` now (possibly going negative); return seconds the caller must wait."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until `tokens` are available; return the time waited in seconds."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+
+class HttpClient:
+    """
+    Pooled `requests.Session` with per-host token buckets and jittered retries.
+
+    rate_limits: host -> requests/second (defaults to SEC's 10 req/s on SEC hosts).
+    Retries on 429/5xx and connection errors with exponential backoff and full
+    jitter, honoring a numeric Retry-After header when the server sends one.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate_limits: Optional[Mapping[str, float]] = None,
+        max_retries: int = 3,
+        backoff_base_s: float = 0.5,
+        backoff_max_s: float = 30.0,
+        pool_maxsize: int = 32,
+        session: Optional[requests.Session] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base_s = backoff_base_s
+        self.backoff_max_s = backoff_max_s
+        self._sleep = sleep
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
+        for host, rate in (DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits).items():
+            self.set_rate_limit(host, rate)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_maxsize)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    def set_rate_limit(self, host: str, rate: Optional[float]) -> None:
+        """Set (or with rate=None, remove) the requests/second limit for a host."""
+        with self._buckets_lock:
+            if rate is None:
+                self._buckets.pop(host.lower(), None)
+            else:
+                self._buckets[host.lower()] = TokenBucket(rate, sleep=self._sleep)
+
+    def bucket_for(self, url: str) -> Optional[TokenBucket]:
+        host = (urlsplit(url).hostname or "").lower()
+        with self._buckets_lock:
+            return self._buckets.get(host)
+
+    def _backoff(self, attempt: int, resp: Optional[requests.Response]) -> float:
+        if resp is not None:
+            retry_after = resp.headers.get("Retry-After", "")
+            if retry_after.strip().isdigit():
+                return min(self.backoff_max_s, float(retry_after))
+        return random.uniform(0, min(self.backoff_max_s, self.backoff_base_s * (2 ** attempt)))
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """GET with rate limiting and retries; returns the last response (callers check status)."""
+        kwargs.setdefault("timeout", 30)
+        bucket = self.bucket_for(url)
+        attempt = 0
+        while True:
+            if bucket is not None:
+                bucket.acquire()
+            try:
+                resp = self.session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+                self._sleep(self._backoff(attempt, None))
+                attempt += 1
+                continue
+            if resp.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                self._sleep(self._backoff(attempt, resp))
+                attempt += 1
+                continue
+            return resp
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_default_client: Optional[HttpClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> HttpClient:
+    """Process-wide shared client (created on first use).
+
+    SEC_MAX_RPS in the environment overrides the SEC hosts' requests/second limit.
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            rate_limits = dict(DEFAULT_RATE_LIMITS)
+            sec_rps = os.environ.get("SEC_MAX_RPS")
+            if sec_rps:
+                rate_limits.update({host: float(sec_rps) for host in ("data.sec.gov", "www.sec.gov")})
+            _default_client = HttpClient(rate_limits=rate_limits)
+        return _default_client
+
+
+def set_default_client(client: Optional[HttpClient]) -> None:
+    """Replace the shared client (e.g. with custom limits); None resets to a fresh default."""
+    global _default_client
+    with _default_client_lock:
+        _default_client = client
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
 
-from osint_swarm.utils.io import write_json
+from osint_swarm.data_sources.http import HttpClient, Validators, get_default_client
+from osint_swarm.utils.io import ensure_parent, read_json, write_json, write_raw_json
 
 
 DOT_DATAHUB_BASE = "https://datahub.transportation.gov"
@@ -16,45 +21,199 @@ class NhtsaError(RuntimeError):
     pass
 
 
-def fetch_recalls_by_make(make: str) -> Dict[str, Any]:
-    """Fetch recall campaigns for a make/manufacturer (e.g., TESLA).
+PAGE_SIZE = 5000
+DEFAULT_PAGE_WORKERS = 4
+_HEADERS = {"Accept": "application/json", "User-Agent": "capstone-osint-swarm/0.1"}
 
-    NOTE: As of 2026, the old `api.nhtsa.gov/recalls/...` endpoints may return 403.
-    This function uses the DOT DataHub (Socrata) tabular view instead.
 
-    Returns a dict with a single `results` list for consistency with earlier code.
-    """
+def _recalls_query(make: str) -> Tuple[str, str]:
+    """Resource URL and SoQL filter for a make."""
     make_norm = make.strip().upper()
-
     # SoQL: match manufacturer name containing the make string (e.g., "Tesla, Inc.")
     where = f"upper(manufacturer) like '%{make_norm}%'"
     url = f"{DOT_DATAHUB_BASE}/resource/{ODI_RECALLS_VIEW_ID}.json"
+    return url, where
+
+
+def _get_page(
+    http: HttpClient,
+    url: str,
+    where: str,
+    offset: int,
+    limit: int,
+    headers: Optional[Dict[str, str]] = None,
+) -> requests.Response:
+    # A stable $order keeps $offset pages disjoint while pages are fetched concurrently.
+    return http.get(
+        url,
+        params={"$limit": limit, "$offset": offset, "$where": where, "$order": ":id"},
+        headers=headers or _HEADERS,
+        timeout=30,
+    )
+
+
+def _page_rows(resp: requests.Response) -> List[Dict[str, Any]]:
+    if resp.status_code != 200:
+        raise NhtsaError(f"DOT DataHub request failed ({resp.status_code}): {resp.url}")
+    batch = resp.json()
+    if not isinstance(batch, list):
+        return []
+    return [r for r in batch if isinstance(r, dict)]
+
+
+def count_recalls_by_make(make: str, *, client: Optional[HttpClient] = None) -> int:
+    """Number of recall rows for a make (SoQL count(*) probe), used to plan page fetches."""
+    url, where = _recalls_query(make)
+    resp = (client or get_default_client()).get(
+        url,
+        params={"$select": "count(*)", "$where": where},
+        headers=_HEADERS,
+        timeout=30,
+    )
+    rows = _page_rows(resp)
+    if not rows:
+        return 0
+    try:
+        return int(next(iter(rows[0].values())))
+    except (StopIteration, TypeError, ValueError):
+        raise NhtsaError(f"Unexpected count(*) response from DOT DataHub: {rows[0]!r}")
+
+
+def fetch_recalls_by_make(
+    make: str,
+    *,
+    client: Optional[HttpClient] = None,
+    max_workers: int = DEFAULT_PAGE_WORKERS,
+) -> Dict[str, Any]:
+    """Fetch recall campaigns for a make/manufacturer (e.g., TESLA).
 
-    all_rows: List[Dict[str, Any]] = []
-    limit = 5000
-    offset = 0
-    while True:
-        resp = requests.get(
-            url,
-            params={
-                "$limit": limit,
-                "$offset": offset,
-                "$where": where,
-            },
-            headers={"Accept": "application/json", "User-Agent": "capstone-osint-swarm/0.1"},
-            timeout=30,
-        )
-        if resp.status_code != 200:
-            raise NhtsaError(f"DOT DataHub request failed ({resp.status_code}): {resp.url}")
-        batch = resp.json()
-        if not isinstance(batch, list) or not batch:
-            break
-        all_rows.extend([r for r in batch if isinstance(r, dict)])
-        if len(batch) < limit:
-            break
-        offset += limit
-
-    return {"results": all_rows, "source": url, "where": where}
+    NOTE: As of 2026, the old `api.nhtsa.gov/recalls/...` endpoints may return 403.
+    This function uses the DOT DataHub (Socrata) tabular view instead.
+
+    Returns a dict with a single `results` list for consistency with earlier code.
+    For result sets larger than one page, see download_recalls_by_make (streams to disk).
+    """
+    payload, _ = fetch_recalls_by_make_if_modified(make, None, client=client, max_workers=max_workers)
+    return payload
+
+
+def fetch_recalls_by_make_if_modified(
+    make: str,
+    validators: Optional[Validators],
+    *,
+    client: Optional[HttpClient] = None,
+    max_workers: int = DEFAULT_PAGE_WORKERS,
+) -> Tuple[Optional[Dict[str, Any]], Validators]:
+    """Conditional variant of fetch_recalls_by_make.
+
+    Validators are sent with the first page only: Socrata's ETag tracks the
+    dataset version, so a 304 there means no page has changed and
+    (None, validators) is returned without fetching the rest. When the first
+    page is full, a count(*) probe sizes the remaining pages, which are then
+    fetched concurrently on up to max_workers threads.
+    """
+    url, where = _recalls_query(make)
+    http = client or get_default_client()
+
+    headers = dict(_HEADERS)
+    if validators:
+        headers.update(validators.headers())
+    first = _get_page(http, url, where, 0, PAGE_SIZE, headers)
+    if validators and first.status_code == 304:
+        return None, validators
+    all_rows = _page_rows(first)
+    new_validators = Validators.from_response(first)
+
+    if len(all_rows) >= PAGE_SIZE:
+        total = count_recalls_by_make(make, client=http)
+        offsets = list(range(PAGE_SIZE, max(total, PAGE_SIZE), PAGE_SIZE))
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="nhtsa-page") as pool:
+            for rows in pool.map(lambda off: _page_rows(_get_page(http, url, where, off, PAGE_SIZE)), offsets):
+                all_rows.extend(rows)
+
+    return {"results": all_rows, "source": url, "where": where}, new_validators
+
+
+def recalls_jsonl_path(raw_dir: Path, make: str) -> Path:
+    """Raw-cache path of a streamed (JSON Lines) recall download for a make."""
+    return Path(raw_dir) / f"recalls_make_{make.strip().upper().replace(' ', '_')}.jsonl"
+
+
+def download_recalls_by_make(
+    make: str,
+    out_path: Path,
+    *,
+    client: Optional[HttpClient] = None,
+    max_workers: int = DEFAULT_PAGE_WORKERS,
+    page_size: int = PAGE_SIZE,
+) -> int:
+    """Stream all recall rows for a make to `out_path` as JSON Lines; return the row count.
+
+    A count(*) probe sizes the download, then pages are fetched concurrently and each
+    page is written to `<out_path>.parts/` as soon as it arrives, so at most
+    max_workers pages are held in memory. An interrupted download resumes: pages
+    already on disk are skipped, unless the row count changed (the parts are then
+    discarded). Completed pages are concatenated into out_path in page order.
+    """
+    url, where = _recalls_query(make)
+    http = client or get_default_client()
+    out_path = Path(out_path)
+    parts_dir = out_path.with_name(out_path.name + ".parts")
+    total = count_recalls_by_make(make, client=http)
+    plan = {"where": where, "total": total, "page_size": page_size}
+
+    plan_path = parts_dir / "plan.json"
+    if parts_dir.exists() and (not plan_path.exists() or read_json(plan_path) != plan):
+        shutil.rmtree(parts_dir)
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    write_json(plan_path, plan)
+
+    n_pages = max(1, -(-total // page_size))
+    page_paths = [parts_dir / f"page_{i:05d}.jsonl" for i in range(n_pages)]
+
+    def _download(i: int) -> None:
+        page_path = page_paths[i]
+        if page_path.exists():
+            return
+        rows = _page_rows(_get_page(http, url, where, i * page_size, page_size))
+        tmp = page_path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False))
+                f.write("\n")
+        os.replace(tmp, page_path)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="nhtsa-page") as pool:
+        list(pool.map(_download, range(n_pages)))
+
+    ensure_parent(out_path)
+    tmp_out = out_path.with_name(out_path.name + ".tmp")
+    count = 0
+    with tmp_out.open("w", encoding="utf-8") as out:
+        for page_path in page_paths:
+            with page_path.open(encoding="utf-8") as f:
+                for line in f:
+                    out.write(line)
+                    count += 1
+    os.replace(tmp_out, out_path)
+    shutil.rmtree(parts_dir)
+    return count
+
+
+def iter_recall_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield recall records from a cached `.jsonl` download or a `{"results": [...]}` JSON file."""
+    path = Path(path)
+    if path.suffix == ".jsonl":
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                row = json.loads(line)
+                if isinstance(row, dict):
+                    yield row
+        return
+    yield from extract_recall_records(read_json(path))
 
 
 def extract_recall_records(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -67,5 +226,5 @@ def extract_recall_records(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
 
 
 def cache_recalls_json(payload: Dict[str, Any], *, out_path: Path) -> None:
-    write_json(out_path, payload)
+    write_raw_json(out_path, payload)
 
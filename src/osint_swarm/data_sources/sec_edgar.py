@@ -2,17 +2,19 @@ from __future__ import annotations
 
 import os
 import time
+from bisect import bisect_left
 from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
-import requests
-
-from osint_swarm.utils.io import write_json
+from osint_swarm.data_sources.http import HttpClient, Validators, get_default_client
+from osint_swarm.utils.io import write_raw_json
 
 
 SEC_BASE = "https://data.sec.gov"
 ARCHIVES_BASE = "https://www.sec.gov/Archives"
+COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+COMPANY_TICKERS_EXCHANGE_URL = "https://www.sec.gov/files/company_tickers_exchange.json"
 
 
 class SecEdgarError(RuntimeError):
@@ -40,52 +42,223 @@ def normalize_cik(cik: str) -> str:
     raise ValueError(f"CIK must be digits only, got: {cik!r}")
 
 
-def fetch_submissions(cik: str, *, sleep_s: float = 0.2) -> Dict[str, Any]:
-    """Fetch SEC company submissions JSON for a CIK."""
+def fetch_submissions(
+    cik: str,
+    *,
+    sleep_s: float = 0.0,
+    client: Optional[HttpClient] = None,
+) -> Dict[str, Any]:
+    """Fetch SEC company submissions JSON for a CIK.
+
+    Requests go through the shared HttpClient, which pools connections and
+    enforces SEC's 10 req/s fair-access limit; `sleep_s` adds an extra pause
+    after the call for callers that want to throttle harder.
+    """
+    submissions, _ = fetch_submissions_if_modified(cik, None, sleep_s=sleep_s, client=client)
+    return submissions
+
+
+def fetch_submissions_if_modified(
+    cik: str,
+    validators: Optional[Validators],
+    *,
+    sleep_s: float = 0.0,
+    client: Optional[HttpClient] = None,
+) -> Tuple[Optional[Dict[str, Any]], Validators]:
+    """Conditional GET of the submissions JSON.
+
+    Returns (None, validators) when SEC answers 304 Not Modified, else the fresh
+    payload and its new ETag/Last-Modified validators.
+    """
     cik10 = normalize_cik(cik)
     url = f"{SEC_BASE}/submissions/CIK{cik10}.json"
-    resp = requests.get(url, headers=_sec_headers(), timeout=30)
+    headers = _sec_headers()
+    if validators:
+        headers.update(validators.headers())
+    resp = (client or get_default_client()).get(url, headers=headers, timeout=30)
+    if validators and resp.status_code == 304:
+        return None, validators
     if resp.status_code != 200:
         raise SecEdgarError(f"SEC submissions request failed ({resp.status_code}): {url}")
-    time.sleep(sleep_s)
-    return resp.json()
+    if sleep_s > 0:
+        time.sleep(sleep_s)
+    return resp.json(), Validators.from_response(resp)
 
 
-def extract_recent_filings(
+def fetch_submissions_file(
+    name: str,
+    validators: Optional[Validators] = None,
+    *,
+    client: Optional[HttpClient] = None,
+) -> Tuple[Optional[Dict[str, Any]], Validators]:
+    """Conditional GET of one submissions overflow file (e.g. CIK0000320193-submissions-001.json).
+
+    Overflow files hold the same parallel arrays as `filings.recent`, at top level.
+    """
+    url = f"{SEC_BASE}/submissions/{name}"
+    headers = _sec_headers()
+    if validators:
+        headers.update(validators.headers())
+    resp = (client or get_default_client()).get(url, headers=headers, timeout=30)
+    if validators and resp.status_code == 304:
+        return None, validators
+    if resp.status_code != 200:
+        raise SecEdgarError(f"SEC submissions file request failed ({resp.status_code}): {url}")
+    return resp.json(), Validators.from_response(resp)
+
+
+def overflow_files(
     submissions: Dict[str, Any],
     *,
-    forms: Optional[Set[str]] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
-    """Extract a normalized list of recent filings from submissions JSON."""
-    recent = submissions.get("filings", {}).get("recent", {})
-    form_list: Sequence[str] = recent.get("form", []) or []
-    date_list: Sequence[str] = recent.get("filingDate", []) or []
-    accession_list: Sequence[str] = recent.get("accessionNumber", []) or []
-    primary_doc_list: Sequence[str] = recent.get("primaryDocument", []) or []
+    """List `filings.files` entries (name, filingFrom, filingTo, ...) overlapping [start_date, end_date].
 
+    Files without a filingFrom/filingTo range are always kept.
+    """
+    files = submissions.get("filings", {}).get("files", []) or []
     out: List[Dict[str, Any]] = []
-    for form, filing_date, accession, primary_doc in zip(
-        form_list, date_list, accession_list, primary_doc_list
-    ):
-        if forms and form not in forms:
+    for f in files:
+        if not isinstance(f, dict) or not f.get("name"):
             continue
-        if start_date and filing_date < start_date:
+        filing_from = f.get("filingFrom") or ""
+        filing_to = f.get("filingTo") or ""
+        if end_date and filing_from and filing_from > end_date:
             continue
-        if end_date and filing_date > end_date:
+        if start_date and filing_to and filing_to < start_date:
             continue
-        out.append(
-            {
-                "form": form,
-                "filingDate": filing_date,
-                "accessionNumber": accession,
-                "primaryDocument": primary_doc,
-            }
-        )
+        out.append(f)
     return out
 
 
+FILING_COLUMNS = ("form", "filingDate", "accessionNumber", "primaryDocument")
+
+
+def _bisect_desc(dates: Sequence[str], value: str, *, skip_equal: bool) -> int:
+    """Binary search in newest-first `dates`: first index with date < value if skip_equal, else <= value."""
+    lo, hi = 0, len(dates)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if dates[mid] > value or (skip_equal and dates[mid] == value):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+class FilingsView:
+    """Columnar view over SEC's parallel filing arrays (no per-filing dicts).
+
+    `select()` returns row indices: the date window is found by binary search,
+    trusting that filingDate is newest-first as SEC publishes it (only the window
+    and its two neighbours are checked; a violation falls back to a linear scan),
+    and form filters use per-form index lists built on first use. Only the
+    selected rows need to be materialized by the caller.
+    """
+
+    def __init__(self, columns: Dict[str, Any]):
+        cols = [columns.get(name, []) or [] for name in FILING_COLUMNS]
+        self.forms, self.dates, self.accessions, self.primary_docs = cols
+        self._len = min(len(c) for c in cols)
+        self._form_index: Optional[Dict[str, List[int]]] = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _window_consistent(self, lo: int, hi: int, start_date: Optional[str], end_date: Optional[str]) -> bool:
+        """Whether [lo, hi) is newest-first, inside the date window, and bounded by rows outside it."""
+        d = self.dates
+        if any(d[i] < d[i + 1] for i in range(lo, hi - 1)):
+            return False
+        if lo < hi and ((end_date and d[lo] > end_date) or (start_date and d[hi - 1] < start_date)):
+            return False
+        before_ok = lo == 0 or not end_date or d[lo - 1] > end_date
+        after_ok = hi >= self._len or not start_date or d[hi] < start_date
+        return before_ok and after_ok
+
+    def form_index(self) -> Dict[str, List[int]]:
+        """form -> ascending row indices (built once per view)."""
+        if self._form_index is None:
+            index: Dict[str, List[int]] = {}
+            for i, form in enumerate(self.forms[: self._len]):
+                index.setdefault(form, []).append(i)
+            self._form_index = index
+        return self._form_index
+
+    def date_range(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Tuple[int, int]:
+        """[lo, hi) rows within the date window; requires newest-first order."""
+        lo = _bisect_desc(self.dates, end_date, skip_equal=False) if end_date else 0
+        hi = _bisect_desc(self.dates, start_date, skip_equal=True) if start_date else self._len
+        return min(lo, self._len), min(hi, self._len)
+
+    def select(
+        self,
+        *,
+        forms: Optional[Set[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> List[int]:
+        """Row indices matching the filters, in original (newest-first) order."""
+        lo, hi = 0, self._len
+        if start_date or end_date:
+            lo, hi = self.date_range(start_date, end_date)
+            if not self._window_consistent(lo, hi, start_date, end_date):
+                d, f = self.dates, self.forms
+                return [
+                    i for i in range(self._len)
+                    if (not forms or f[i] in forms)
+                    and (not start_date or d[i] >= start_date)
+                    and (not end_date or d[i] <= end_date)
+                ]
+        if not forms:
+            return list(range(lo, hi))
+        index = self.form_index()
+        out: List[int] = []
+        for form in forms:
+            rows = index.get(form)
+            if rows:
+                out.extend(rows[bisect_left(rows, lo): bisect_left(rows, hi)])
+        out.sort()
+        return out
+
+    def row(self, i: int) -> Dict[str, Any]:
+        return {
+            "form": self.forms[i],
+            "filingDate": self.dates[i],
+            "accessionNumber": self.accessions[i],
+            "primaryDocument": self.primary_docs[i],
+        }
+
+
+def recent_filings_view(submissions: Dict[str, Any]) -> FilingsView:
+    return FilingsView(submissions.get("filings", {}).get("recent", {}))
+
+
+def extract_filings(
+    columns: Dict[str, Any],
+    *,
+    forms: Optional[Set[str]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Extract a normalized list of filings from SEC's parallel arrays (form, filingDate, ...)."""
+    view = FilingsView(columns)
+    return [view.row(i) for i in view.select(forms=forms, start_date=start_date, end_date=end_date)]
+
+
+def extract_recent_filings(
+    submissions: Dict[str, Any],
+    *,
+    forms: Optional[Set[str]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Extract a normalized list of recent filings from submissions JSON."""
+    view = recent_filings_view(submissions)
+    return [view.row(i) for i in view.select(forms=forms, start_date=start_date, end_date=end_date)]
+
+
 def accession_to_archives_path(cik: str, accession_number: str) -> str:
     """Build SEC Archives path from accession (with dashes)."""
     cik_no_pad = str(int(cik))  # remove left padding for Archives path
@@ -100,5 +273,50 @@ def filing_primary_doc_url(cik: str, accession_number: str, primary_document: st
 
 
 def cache_submissions_json(submissions: Dict[str, Any], *, out_path: Path) -> None:
-    write_json(out_path, submissions)
+    write_raw_json(out_path, submissions)
+
 
+def fetch_company_tickers(
+    url: str = COMPANY_TICKERS_EXCHANGE_URL,
+    *,
+    client: Optional[HttpClient] = None,
+) -> Dict[str, Any]:
+    """Fetch SEC's issuer list (company_tickers.json or company_tickers_exchange.json)."""
+    headers = {**_sec_headers(), "Host": "www.sec.gov"}
+    resp = (client or get_default_client()).get(url, headers=headers, timeout=60)
+    if resp.status_code != 200:
+        raise SecEdgarError(f"SEC company tickers request failed ({resp.status_code}): {url}")
+    return resp.json()
+
+
+def iter_company_tickers(payload: Any) -> Iterable[Tuple[str, str, str, Optional[str]]]:
+    """
+    (cik10, name, ticker, exchange) rows from either SEC issuer file:
+
+    - company_tickers.json: {"0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."}, ...}
+    - company_tickers_exchange.json: {"fields": ["cik", "name", "ticker", "exchange"], "data": [[...], ...]}
+
+    A CIK appears once per listed ticker (share classes); rows keep the file's order.
+    """
+    if isinstance(payload, dict) and isinstance(payload.get("fields"), list):
+        col = {name: i for i, name in enumerate(payload["fields"])}
+        ci, ni, ti = col.get("cik"), col.get("name"), col.get("ticker")
+        ei = col.get("exchange")
+        if ci is None or ni is None:
+            return
+        for row in payload.get("data") or []:
+            cik = str(row[ci] or "").strip()
+            if not cik.isdigit():
+                continue
+            ticker = str(row[ti] or "").strip() if ti is not None else ""
+            exchange = row[ei] if ei is not None else None
+            yield normalize_cik(cik), str(row[ni] or "").strip(), ticker, (exchange or None)
+        return
+    records = payload.values() if isinstance(payload, dict) else payload or []
+    for rec in records:
+        if not isinstance(rec, dict):
+            continue
+        cik = str(rec.get("cik_str") or rec.get("cik") or "").strip()
+        if not cik.isdigit():
+            continue
+        yield normalize_cik(cik), str(rec.get("title") or rec.get("name") or "").strip(), str(rec.get("ticker") or "").strip(), None
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, List, Literal, Optional
+import sys
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type, TypeVar
 
 
 EntityType = Literal["public_company", "private_company", "nonprofit", "individual", "unknown"]
@@ -16,7 +17,38 @@ SourceType = Literal[
 ]
 RiskCategory = Literal["governance", "regulatory", "legal", "network", "other"]
 
+_T = TypeVar("_T")
 
+
+def _slotted(cls: Type[_T]) -> Type[_T]:
+    """Rebuild a frozen dataclass with __slots__ (no per-instance __dict__).
+
+    Equivalent to @dataclass(slots=True), which needs Python 3.10; the generated
+    __init__ keeps its defaults, so the class-level default attributes can go.
+    """
+    names = tuple(f.name for f in fields(cls))  # type: ignore[arg-type]
+    ns = {k: v for k, v in cls.__dict__.items() if k not in names and k not in ("__dict__", "__weakref__")}
+    ns["__slots__"] = names
+
+    def __getstate__(self: Any) -> Tuple[Any, ...]:
+        return tuple(getattr(self, n) for n in names)
+
+    def __setstate__(self: Any, state: Tuple[Any, ...]) -> None:
+        for n, v in zip(names, state):
+            object.__setattr__(self, n, v)
+
+    ns["__getstate__"] = __getstate__
+    ns["__setstate__"] = __setstate__
+    new_cls = type(cls)(cls.__name__, cls.__bases__, ns)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if type(value) is str else value
+
+
+@_slotted
 @dataclass(frozen=True)
 class Entity:
     """Canonical target for an investigation.
@@ -37,11 +69,14 @@ class Entity:
         return asdict(self)
 
 
+@_slotted
 @dataclass(frozen=True)
 class Evidence:
     """A single, citable claim about an entity with provenance.
 
     This is the core unit that later agents consume (not raw HTML/PDF).
+    Instances are slotted, and the low-cardinality fields (entity_id, source_type,
+    risk_category, raw_location) are interned so repeated values share one string.
     """
 
     evidence_id: str
@@ -55,6 +90,13 @@ class Evidence:
     confidence: float = 0.5  # 0..1
     attributes: Dict[str, Any] = field(default_factory=dict)  # extra structured fields
 
+    def __post_init__(self) -> None:
+        for name in _INTERNED_FIELDS:
+            object.__setattr__(self, name, _intern(getattr(self, name)))
+
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+
+_INTERNED_FIELDS = ("entity_id", "source_type", "risk_category", "raw_location")
+
@@ -0,0 +1,149 @@
+"""Column-oriented container for many Evidence rows (struct-of-arrays).
+
+A list of Evidence pays object overhead per row. EvidenceBatch stores each field
+as one column instead: categorical fields (entity_id, source_type, risk_category,
+raw_location) are dictionary-encoded into compact integer arrays, confidence is a
+float array, and the remaining fields are plain lists. Rows are rebuilt as
+Evidence on access, so a batch can be used wherever a Sequence[Evidence] is expected.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union, overload
+
+from osint_swarm.entities import Evidence
+
+
+CATEGORICAL_FIELDS = ("entity_id", "source_type", "risk_category", "raw_location")
+
+
+class _Categorical:
+    """Dictionary-encoded column: one array of codes plus the distinct values."""
+
+    __slots__ = ("codes", "values", "_index")
+
+    def __init__(self) -> None:
+        self.codes = array("I")
+        self.values: List[Optional[str]] = []
+        self._index: Dict[Optional[str], int] = {}
+
+    def append(self, value: Optional[str]) -> None:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        return self.values[self.codes[i]]
+
+
+def _attributes_or_empty(attrs: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    return attrs if attrs is not None else {}
+
+
+class EvidenceBatch(Sequence[Evidence]):
+    """Struct-of-arrays Evidence collection; supports len(), indexing, slicing and iteration."""
+
+    def __init__(self, evidence: Iterable[Evidence] = ()):
+        self._evidence_id: List[str] = []
+        self._date: List[str] = []
+        self._summary: List[str] = []
+        self._source_uri: List[str] = []
+        self._confidence = array("d")
+        self._attributes: List[Optional[Dict[str, Any]]] = []
+        self._cats: Dict[str, _Categorical] = {name: _Categorical() for name in CATEGORICAL_FIELDS}
+        self.extend(evidence)
+
+    @classmethod
+    def from_evidence(cls, evidence: Iterable[Evidence]) -> "EvidenceBatch":
+        return cls(evidence)
+
+    def append(self, e: Evidence) -> None:
+        self._evidence_id.append(e.evidence_id)
+        self._date.append(e.date)
+        self._summary.append(e.summary)
+        self._source_uri.append(e.source_uri)
+        self._confidence.append(float(e.confidence))
+        # Empty attribute dicts are the common case; store None instead of one dict per row.
+        # Only plain dicts are tested: truth-testing a lazily decoded mapping would decode it.
+        attrs = e.attributes
+        self._attributes.append(None if type(attrs) is dict and not attrs else attrs)
+        for name, col in self._cats.items():
+            col.append(getattr(e, name))
+
+    def extend(self, evidence: Iterable[Evidence]) -> None:
+        for e in evidence:
+            self.append(e)
+
+    def __len__(self) -> int:
+        return len(self._evidence_id)
+
+    @overload
+    def __getitem__(self, i: int) -> Evidence: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> "EvidenceBatch": ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[Evidence, "EvidenceBatch"]:
+        if isinstance(i, slice):
+            return self.take(range(*i.indices(len(self))))
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("EvidenceBatch index out of range")
+        cats = self._cats
+        return Evidence(
+            evidence_id=self._evidence_id[i],
+            entity_id=cats["entity_id"][i],  # type: ignore[arg-type]
+            date=self._date[i],
+            source_type=cats["source_type"][i],  # type: ignore[arg-type]
+            risk_category=cats["risk_category"][i],  # type: ignore[arg-type]
+            summary=self._summary[i],
+            source_uri=self._source_uri[i],
+            raw_location=cats["raw_location"][i],
+            confidence=self._confidence[i],
+            attributes=_attributes_or_empty(self._attributes[i]),
+        )
+
+    def __iter__(self) -> Iterator[Evidence]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"EvidenceBatch(rows={len(self)})"
+
+    def column(self, name: str) -> List[Any]:
+        """Values of one field for every row (e.g. batch.column("risk_category"))."""
+        if name in self._cats:
+            col = self._cats[name]
+            return [col.values[c] for c in col.codes]
+        if name == "confidence":
+            return self._confidence.tolist()
+        if name == "attributes":
+            return [_attributes_or_empty(a) for a in self._attributes]
+        if name in ("evidence_id", "date", "summary", "source_uri"):
+            return list(getattr(self, f"_{name}"))
+        raise KeyError(name)
+
+    def categories(self, name: str) -> List[Optional[str]]:
+        """Distinct values of a categorical field, in first-seen order."""
+        return list(self._cats[name].values)
+
+    def where(self, name: str, value: Optional[str]) -> "EvidenceBatch":
+        """Rows whose categorical field equals value; compares integer codes only."""
+        col = self._cats[name]
+        code = col._index.get(value)
+        if code is None:
+            return EvidenceBatch()
+        return self.take(i for i, c in enumerate(col.codes) if c == code)
+
+    def take(self, indices: Iterable[int]) -> "EvidenceBatch":
+        out = EvidenceBatch()
+        for i in indices:
+            out.append(self[i])
+        return out
+
+    def to_list(self) -> List[Evidence]:
+        return list(self)
@@ -1,29 +1,127 @@
 from __future__ import annotations
 
 import csv
+import gzip
 import json
+import lzma
+import os
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Optional
+
+# Optional faster JSON backend (pip install orjson); falls back to the stdlib.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore
+
+
+GZIP_MAGIC = b"\x1f\x8b"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+RAW_CODECS = ("gzip", "lzma", "none")
+# Codec for raw-cache payloads (data/raw); override with OSINT_RAW_CODEC=gzip|lzma|none.
+RAW_CODEC_ENV = "OSINT_RAW_CODEC"
+DEFAULT_RAW_CODEC = "gzip"
 
 
 def ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def write_json(path: Path, obj: Any) -> None:
+def _dumps(obj: Any, *, compact: bool) -> bytes:
+    if compact:
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj)
+            except TypeError:
+                pass
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _encode(data: bytes, codec: str) -> bytes:
+    if codec == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    if codec == "lzma":
+        return lzma.compress(data)
+    if codec == "none":
+        return data
+    raise ValueError(f"Unknown codec {codec!r}; expected one of {RAW_CODECS}")
+
+
+def _decode(data: bytes) -> bytes:
+    """Decompress by magic bytes, so plain, gzip and xz files are all readable."""
+    if data.startswith(GZIP_MAGIC):
+        return gzip.decompress(data)
+    if data.startswith(XZ_MAGIC):
+        return lzma.decompress(data)
+    return data
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
     ensure_parent(path)
-    path.write_text(json.dumps(obj, indent=2, ensure_ascii=False))
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes atomically (temp file + rename)."""
+    _write_bytes_atomic(path, data)
+
+
+def write_json(path: Path, obj: Any, *, compact: bool = False, codec: str = "none") -> None:
+    """Write JSON atomically (temp file + rename), so concurrent readers never see a partial file.
+
+    Defaults to pretty-printed plain text; compact=True drops whitespace and codec
+    ("gzip" | "lzma") compresses the bytes. read_json detects all variants.
+    """
+    _write_bytes_atomic(path, _encode(_dumps(obj, compact=compact), codec))
+
+
+def default_raw_codec() -> str:
+    codec = (os.environ.get(RAW_CODEC_ENV) or DEFAULT_RAW_CODEC).strip().lower()
+    return codec if codec in RAW_CODECS else DEFAULT_RAW_CODEC
+
+
+def write_raw_json(path: Path, obj: Any, *, codec: Optional[str] = None) -> None:
+    """Write a raw-cache payload: compact JSON, compressed with the raw codec (gzip by default).
+
+    The file keeps its usual name (e.g. CIK0001318605.json) so raw_location stays stable;
+    read_json recognizes the compression from the file's magic bytes.
+    """
+    write_json(path, obj, compact=True, codec=codec or default_raw_codec())
 
 
 def read_json(path: Path) -> Any:
-    return json.loads(path.read_text())
+    """Read JSON written by write_json/write_raw_json (plain, gzip or xz; any whitespace)."""
+    return _loads(_decode(Path(path).read_bytes()))
 
 
 def write_csv_dicts(path: Path, rows: Iterable[Dict[str, Any]], fieldnames: List[str]) -> None:
+    """Write rows as CSV atomically (temp file + rename); rows are streamed, not buffered."""
     ensure_parent(path)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow({k: row.get(k) for k in fieldnames})
-
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({k: row.get(k) for k in fieldnames})
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
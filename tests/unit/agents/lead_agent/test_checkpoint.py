@@ -0,0 +1,90 @@
+"""Tests for investigation checkpoints."""
+
+import json
+from pathlib import Path
+
+from agents.lead_agent.context_manager import InvestigationCheckpoint, checkpoint_id_for
+from agents.lead_agent.context_manager.checkpoint import MISSING, raw_file_fingerprinter
+from agents.lead_agent.task_planner import SubTask
+from osint_swarm.entities import Entity, Evidence
+
+
+ENTITY = Entity("e1", "Example Corp", "public_company", identifiers={"cik": "1"})
+FILINGS = SubTask("sec_filings", "corporate_agent", "", consumes=("source:sec_edgar",), produces=("corporate_profile",))
+OWNERSHIP = SubTask("beneficial_ownership", "corporate_agent", "", produces=("ownership_structure",))
+NETWORK = SubTask("network_analysis", "social_graph_agent", "", consumes=("ownership_structure",))
+TASKS = [FILINGS, OWNERSHIP, NETWORK]
+
+
+def _ev(evidence_id: str) -> Evidence:
+    return Evidence(evidence_id, "e1", "2024-01-01", "sec_filing", "governance", "s", "u", attributes={"k": 1})
+
+
+def _checkpoint(path: Path, sources: dict) -> InvestigationCheckpoint:
+    return InvestigationCheckpoint(path, lambda entity, source_id: sources.get(source_id, "missing"))
+
+
+def _run_all(path: Path, sources: dict) -> None:
+    ckpt = _checkpoint(path, sources)
+    ckpt.start("q", ENTITY, TASKS)
+    for task in TASKS:
+        ckpt.record(ENTITY, task, task.target_agent, [_ev(task.task_type)])
+
+
+def test_checkpoint_restores_completed_tasks_with_findings(tmp_path: Path):
+    path = tmp_path / "c.jsonl"
+    _run_all(path, {"sec_edgar": "10:1"})
+    restored = _checkpoint(path, {"sec_edgar": "10:1"}).restore(ENTITY, TASKS)
+    assert list(restored) == TASKS
+    agent_id, findings = restored[FILINGS]
+    assert agent_id == "corporate_agent" and findings == [_ev("sec_filings")]
+    assert _checkpoint(path, {}).stored_entity() == ENTITY
+
+
+def test_checkpoint_invalidates_changed_sources_and_dependents(tmp_path: Path):
+    path = tmp_path / "c.jsonl"
+    _run_all(path, {"sec_edgar": "10:1"})
+    assert list(_checkpoint(path, {"sec_edgar": "11:2"}).restore(ENTITY, TASKS)) == [OWNERSHIP, NETWORK]
+
+    # A producer that is not restored takes its consumers with it.
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    kept = [r for r in records if r.get("task", {}).get("task_type") != "beneficial_ownership"]
+    path.write_text("".join(json.dumps(r) + "\n" for r in kept), encoding="utf-8")
+    assert list(_checkpoint(path, {"sec_edgar": "10:1"}).restore(ENTITY, TASKS)) == [FILINGS]
+
+
+def test_checkpoint_ignores_torn_last_line_and_other_entities(tmp_path: Path):
+    path = tmp_path / "c.jsonl"
+    _run_all(path, {})
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"type": "task", "task": {"task_')
+    assert len(_checkpoint(path, {}).restore(ENTITY, TASKS)) == 3
+    assert _checkpoint(path, {}).restore(Entity("e2", "Other"), TASKS) == {}
+
+
+def test_checkpoint_start_keeps_only_restored_tasks(tmp_path: Path):
+    path = tmp_path / "c.jsonl"
+    _run_all(path, {})
+    ckpt = _checkpoint(path, {})
+    restored = ckpt.restore(ENTITY, TASKS)
+    ckpt.start("q", ENTITY, TASKS, {OWNERSHIP: restored[OWNERSHIP]})
+    assert list(_checkpoint(path, {}).restore(ENTITY, TASKS)) == [OWNERSHIP]
+    ckpt.clear()
+    assert not path.exists()
+
+
+def test_checkpoint_id_ignores_case_and_spacing():
+    assert checkpoint_id_for("Investigate  Tesla") == checkpoint_id_for("investigate tesla ")
+
+
+def test_reference_sources_are_fingerprinted_by_staged_data(tmp_path: Path):
+    from agents.specialist_agents.legal_agent.pacer_analyzer import court_db_path, ingest_courtlistener
+
+    fingerprint = raw_file_fingerprinter(tmp_path)
+    assert fingerprint(ENTITY, "ofac_sanctions") == MISSING and fingerprint(ENTITY, "courtlistener") == MISSING
+    dumps = tmp_path / "raw" / "courtlistener"
+    dumps.mkdir(parents=True)
+    (dumps / "dockets-1.csv").write_text("id,case_name\n1,Doe v. Example Corp\n", encoding="utf-8")
+    ingest_courtlistener(dumps, court_db_path(tmp_path))
+    built = fingerprint(ENTITY, "courtlistener")
+    assert built != MISSING and "dockets-1.csv" in built
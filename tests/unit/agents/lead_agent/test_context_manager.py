@@ -60,3 +60,60 @@ def test_context_get_agent_results_returns_copy():
     r1 = ctx.get_agent_results("legal_agent")
     r2 = ctx.get_agent_results("legal_agent")
     assert r1 is not r2
+
+
+def test_context_add_agent_results_is_thread_safe():
+    import threading
+
+    ctx = InvestigationContext()
+
+    def add(n: int):
+        for i in range(200):
+            ctx.add_agent_results("corporate_agent", [Evidence(f"{n}-{i}", "e1", "", "other", "other", "", "")])
+
+    threads = [threading.Thread(target=add, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(ctx.get_agent_results("corporate_agent")) == 1600
+    assert len(list(ctx.iter_findings())) == 1600
+
+
+def _ev(evidence_id: str, risk: str = "other", source: str = "other") -> Evidence:
+    return Evidence(evidence_id, "e1", "", source, risk, "", "")
+
+
+def test_context_drops_duplicate_evidence_ids():
+    ctx = InvestigationContext()
+    assert ctx.add_agent_results("corporate_agent", [_ev("a"), _ev("b"), _ev("a")]) == 2
+    assert ctx.add_agent_results("legal_agent", [_ev("b"), _ev("c")]) == 1
+    assert [e.evidence_id for e in ctx.get_all_findings()] == ["a", "b", "c"]
+    assert [e.evidence_id for e in ctx.get_agent_results("legal_agent")] == ["c"]
+    assert ctx.duplicates_dropped == 2
+
+
+def test_context_secondary_indexes():
+    ctx = InvestigationContext()
+    ctx.add_agent_results("corporate_agent", [_ev("a", "governance", "sec_filing"), _ev("b", "legal", "sec_filing")])
+    ctx.add_agent_results("legal_agent", [_ev("c", "legal", "court_record")])
+    assert [e.evidence_id for e in ctx.get_findings_by_risk("legal")] == ["b", "c"]
+    assert [e.evidence_id for e in ctx.get_findings_by_source("sec_filing")] == ["a", "b"]
+    assert ctx.get_findings_by_risk("financial") == []
+    assert ctx.get_finding("c").risk_category == "legal"
+    assert ctx.get_finding("missing") is None
+    assert {aid: len(v) for aid, v in ctx.results.items()} == {"corporate_agent": 2, "legal_agent": 1}
+
+
+def test_context_views_are_read_only_snapshots():
+    ctx = InvestigationContext()
+    ctx.add_agent_results("corporate_agent", [_ev("a"), _ev("b")])
+    everything = ctx.get_all_findings()
+    mine = ctx.get_agent_results("corporate_agent")
+    ctx.add_agent_results("corporate_agent", [_ev("c")])
+    assert len(everything) == 2 and len(mine) == 2
+    assert [e.evidence_id for e in mine[-1:]] == ["b"]
+    with pytest.raises(IndexError):
+        mine[2]
+    assert not hasattr(mine, "append")
+    assert len(ctx.get_all_findings()) == 3
@@ -0,0 +1,86 @@
+"""Tests for the dependency-aware task dispatcher."""
+
+import threading
+import time
+
+import pytest
+
+from agents.lead_agent.context_manager import InvestigationContext
+from agents.lead_agent.dispatcher import dispatch_tasks
+from agents.lead_agent.task_planner import SubTask, decompose
+from osint_swarm.entities import Entity, Evidence
+
+
+ENTITY = Entity(entity_id="e1", name="E")
+
+
+def _ev(ev_id: str) -> Evidence:
+    return Evidence(ev_id, "e1", "2024-01-01", "other", "other", "S", "https://x")
+
+
+def test_decompose_declares_data_flow():
+    tasks = {t.task_type: t for t in decompose("Investigate Tesla for money laundering")}
+    assert tasks["corporate_structure"].consumes == ("source:sec_edgar", "source:nhtsa")
+    assert "ownership_structure" in tasks["beneficial_ownership"].produces
+
+
+def test_shared_source_is_fetched_once_before_consumers():
+    fetches = []
+    seen_fetch = []
+
+    def fetch(_entity, _context):
+        time.sleep(0.05)
+        fetches.append(1)
+
+    def stub(_entity, task, _context):
+        seen_fetch.append(len(fetches))
+        return [_ev(task.task_type)]
+
+    tasks = [
+        SubTask("a", "agent", "A", consumes=("source:x",)),
+        SubTask("b", "agent", "B", consumes=("source:x",)),
+        SubTask("c", "agent", "C"),
+    ]
+    ctx = InvestigationContext()
+    dispatch_tasks(ENTITY, tasks, {"agent": stub}, ctx, data_fetchers={"source:x": fetch})
+    assert fetches == [1]
+    assert sorted(seen_fetch) == [0, 1, 1]  # c need not wait; a and b run after the pull
+    assert [e.evidence_id for e in ctx.get_agent_results("agent")] == ["a", "b", "c"]
+
+
+def test_downstream_task_waits_for_producer_and_independent_branch_overlaps():
+    events = []
+    lock = threading.Lock()
+
+    def stub(_entity, task, _context):
+        with lock:
+            events.append(("start", task.task_type))
+        time.sleep(0.1 if task.task_type == "structure" else 0.01)
+        with lock:
+            events.append(("end", task.task_type))
+        return []
+
+    tasks = [
+        SubTask("network", "agent", "N", consumes=("ownership",)),
+        SubTask("structure", "agent", "S", produces=("ownership",)),
+        SubTask("media", "agent", "M"),
+    ]
+    dispatch_tasks(ENTITY, tasks, {"agent": stub}, InvestigationContext())
+    assert events.index(("end", "structure")) < events.index(("start", "network"))
+    assert events.index(("end", "media")) < events.index(("end", "structure"))
+
+
+def test_identical_tasks_run_once():
+    calls = []
+    task = SubTask("a", "agent", "A")
+    dispatch_tasks(ENTITY, [task, task], {"agent": lambda e, t, c: calls.append(t) or []}, InvestigationContext())
+    assert len(calls) == 1
+
+
+def test_dependency_cycle_is_rejected():
+    tasks = [
+        SubTask("a", "agent", "A", consumes=("y",), produces=("x",)),
+        SubTask("b", "agent", "B", consumes=("x",), produces=("y",)),
+    ]
+    with pytest.raises(ValueError):
+        dispatch_tasks(ENTITY, tasks, {"agent": lambda e, t, c: []}, InvestigationContext())
@@ -0,0 +1,80 @@
+"""Tests for the file-backed entity registry and its snapshot."""
+
+import json
+import os
+import pickle
+from pathlib import Path
+
+from agents.lead_agent.entity_resolution import EntityRegistry
+from agents.lead_agent.entity_resolution.registry import EntityTable, entities_from_sec_tickers
+from osint_swarm.entities import Entity
+
+
+EXCHANGE = {
+    "fields": ["cik", "name", "ticker", "exchange"],
+    "data": [
+        [320193, "Apple Inc.", "AAPL", "Nasdaq"],
+        [1652044, "Alphabet Inc.", "GOOGL", "Nasdaq"],
+        [1652044, "Alphabet Inc.", "GOOG", "Nasdaq"],
+        [1318605, "Tesla, Inc.", "TSLA", "Nasdaq"],
+    ],
+}
+
+
+def _write_reference(root: Path, payload=EXCHANGE, name="company_tickers_exchange.json") -> Path:
+    path = root / "reference" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def test_entities_from_both_sec_formats():
+    by_cik = {e.identifiers["cik"]: e for e in entities_from_sec_tickers(EXCHANGE)}
+    alphabet = by_cik["0001652044"]
+    assert alphabet.entity_id == "alphabet_inc_cik_0001652044"
+    assert alphabet.identifiers["ticker"] == "GOOGL" and alphabet.identifiers["tickers"] == "GOOGL,GOOG"
+    (apple,) = entities_from_sec_tickers({"0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."}})
+    assert (apple.entity_id, apple.identifiers) == ("apple_inc_cik_0000320193", {"cik": "0000320193", "ticker": "AAPL"})
+
+
+def test_registry_merges_curated_and_resolves_loaded_issuers(tmp_path: Path):
+    _write_reference(tmp_path)
+    registry = EntityRegistry(tmp_path)
+    assert len(registry) == 3  # Tesla collapses into the curated entry
+    tesla = registry.find_by_cik("1318605")
+    assert tesla.aliases[:2] == ["Tesla", "Tesla Inc"] and tesla.identifiers["make"] == "TESLA"
+    assert tesla.identifiers["exchange"] == "Nasdaq"
+    assert registry.index.resolve("Investigate Apple for fraud").candidates[0].entity_id == "apple_inc_cik_0000320193"
+    assert registry.index.resolve("GOOG").candidates[0].name == "Alphabet Inc."
+    assert registry.get("alphabet_inc_cik_0001652044").identifiers["tickers"] == "GOOGL,GOOG"
+
+
+def test_registry_snapshot_is_reused_and_rebuilt_on_change(tmp_path: Path):
+    ref = _write_reference(tmp_path)
+    first = EntityRegistry(tmp_path, check_interval_s=0)
+    assert len(first) == 3
+    assert first.snapshot_path.exists()
+
+    second = EntityRegistry(tmp_path, check_interval_s=0)
+    built = []
+    second.build = lambda sig=None: built.append(sig)  # type: ignore[method-assign]
+    assert len(second) == 3 and built == []  # loaded from the snapshot
+
+    payload = {**EXCHANGE, "data": EXCHANGE["data"] + [[789019, "Microsoft Corp", "MSFT", "Nasdaq"]]}
+    ref.write_text(json.dumps(payload), encoding="utf-8")
+    os.utime(ref, ns=(ref.stat().st_mtime_ns + 10**9,) * 2)
+    assert len(first) == 4  # lazy reload picked up the new file
+    assert first.index.resolve("MSFT").candidates[0].entity_id == "microsoft_corp_cik_0000789019"
+
+
+def test_registry_without_reference_files_uses_curated_only(tmp_path: Path):
+    registry = EntityRegistry(tmp_path, curated=[Entity("x1", "Example Holdings")])
+    assert [e.entity_id for e in registry.entities] == ["x1"]
+    assert not registry.snapshot_path.exists()
+
+
+def test_entity_table_round_trips_through_pickle():
+    table = EntityTable([Entity("a", "A Corp", "public_company", identifiers={"cik": "1"}, aliases=["A"])])
+    restored = pickle.loads(pickle.dumps(table))
+    assert list(restored) == list(table)
+    assert restored[0].aliases == ["A"]
@@ -39,3 +39,95 @@ def test_resolve_by_alias():
     entity = resolve_one("Tesla Motors")
     assert entity is not None
     assert entity.entity_id == "tesla_inc_cik_0001318605"
+
+
+def _index():
+    from agents.lead_agent.entity_resolution import EntityIndex
+
+    return EntityIndex([
+        Entity("apple_inc", "Apple Inc.", identifiers={"cik": "0000320193", "ticker": "AAPL"}),
+        Entity("apple_hosp", "Apple Hospitality REIT", identifiers={"ticker": "APLE"}),
+        Entity("apple_bank", "Apple", aliases=["Apple Bank"]),
+        Entity("on_semi", "ON Semiconductor", identifiers={"ticker": "ON"}),
+    ])
+
+
+def test_resolve_in_sentence_and_by_ticker_and_cik():
+    assert resolve_one("Investigate Tesla, Inc. for fraud").entity_id == "tesla_inc_cik_0001318605"
+    assert resolve_one("TSLA").entity_id == "tesla_inc_cik_0001318605"
+    assert resolve_one("CIK 1318605 filings").entity_id == "tesla_inc_cik_0001318605"
+
+
+def test_index_prefers_longest_match_and_reports_ambiguity():
+    index = _index()
+    res = index.resolve("Look into Apple Hospitality REIT debt")
+    assert res.match_type == "mention"
+    assert res.matches[0].term == "apple hospitality reit"
+    assert [e.entity_id for e in res.candidates] == ["apple_hosp"]
+    assert not res.ambiguous
+
+    apple = index.resolve("apple")
+    assert apple.match_type == "exact" and apple.candidates[0].entity_id == "apple_bank"
+    assert index.resolve("Apple Inc").candidates[0].entity_id == "apple_inc"
+    assert index.resolve("appl").match_type == "prefix" and index.resolve("appl").ambiguous
+
+
+def test_index_tickers_match_in_text_only_when_upper_case():
+    index = _index()
+    assert index.resolve("news on the merger").candidates == []
+    assert [e.entity_id for e in index.resolve("news on ON and AAPL").candidates] == ["on_semi", "apple_inc"]
+    assert index.lookup("0000320193")[0].entity_id == "apple_inc"
+
+
+def test_resolve_tolerates_typos():
+    from agents.lead_agent.entity_resolution import resolve_detailed
+
+    res = resolve_detailed("Investigate Tesler for money laundering")
+    assert res.match_type == "fuzzy"
+    assert res.candidates[0].entity_id == "tesla_inc_cik_0001318605"
+    assert 0.85 <= res.scores[0] < 1.0
+    assert resolve_one("Tesal Inc").entity_id == "tesla_inc_cik_0001318605"
+
+
+def test_fuzzy_index_threshold_and_minhash():
+    from agents.lead_agent.entity_resolution import EntityIndex, jaro_winkler
+
+    assert jaro_winkler("tesla", "tesla") == 1.0
+    assert jaro_winkler("martha", "marhta") == pytest.approx(0.9611, abs=1e-4)
+    index = _index()
+    assert index.resolve("Aple Hospitality").candidates[0].entity_id == "apple_hosp"
+    assert index.resolve("for fraud").candidates == []  # short and unrelated words never match
+    assert EntityIndex(index.entities, fuzzy_threshold=None).resolve("Aple Hospitality").candidates == []
+    lsh = EntityIndex(index.entities, use_minhash=True)
+    assert lsh.resolve("Aple Hospitalty REIT").candidates[0].entity_id == "apple_hosp"
+
+
+def test_fuzzy_ignores_query_words_that_resemble_issuers():
+    from agents.lead_agent.entity_resolution import EntityIndex
+
+    index = EntityIndex([
+        Entity("tesla", "Tesla, Inc."),
+        Entity("investview", "INVESTVIEW, INC."),
+        Entity("moneylion", "MoneyLion Inc."),
+        Entity("acme", "Acme Holdings Corp"),
+    ])
+    assert index.resolve("Investigate Company X").candidates == []
+    assert [e.entity_id for e in index.resolve("Investigate Acme Holdngs for fraud").candidates] == ["acme"]
+    res = index.resolve("Investigate Tesler for money laundering")
+    assert [e.entity_id for e in res.candidates] == ["tesla"]
+    assert index.resolve("Investigate Moneylian").candidates[0].entity_id == "moneylion"  # real typos still match
+
+
+def test_short_names_match_in_sentences_only_when_capitalized():
+    from agents.lead_agent.entity_resolution import EntityIndex
+
+    index = EntityIndex([
+        Entity("now_inc", "NOW INC."),
+        Entity("target", "TARGET CORP"),
+        Entity("tesla", "Tesla, Inc.", aliases=["Tesla"]),
+    ])
+    assert [e.entity_id for e in index.resolve("Check who now controls Tesla").candidates] == ["tesla"]
+    assert [e.entity_id for e in index.resolve("What is the target of the Tesla probe").candidates] == ["tesla"]
+    assert [e.entity_id for e in index.resolve("Now check Tesla").candidates] == ["tesla", "now_inc"]  # alias first
+    assert index.resolve("Investigate Target").candidates[0].entity_id == "target"
+    assert index.resolve("target").match_type == "exact"
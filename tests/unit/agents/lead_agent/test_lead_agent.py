@@ -61,3 +61,182 @@ def test_lead_agent_accepts_custom_stubs():
     assert len(collected) == 5
     assert "corporate_structure" in collected
     assert "sanctions_screening" in collected
+
+
+def _ev(ev_id: str) -> Evidence:
+    return Evidence(ev_id, "tesla_inc_cik_0001318605", "2024-01-01", "other", "other", "S", "https://x")
+
+
+def test_lead_agent_dispatches_tasks_in_parallel():
+    """Independent tasks overlap: total time tracks the slowest task, not the sum."""
+    import threading
+    import time
+
+    barrier = threading.Barrier(5, timeout=5)
+
+    def stub(_entity, task, _context):
+        barrier.wait()  # deadlocks unless all 5 tasks run at once
+        time.sleep(0.05)
+        return [_ev(task.task_type)]
+
+    agent = LeadAgent(agent_stubs={"corporate_agent": stub, "legal_agent": stub, "social_graph_agent": stub})
+    ctx = agent.run("Investigate Tesla for money laundering")
+    # Findings are committed in task order regardless of completion order.
+    assert [e.evidence_id for e in ctx.get_agent_results("corporate_agent")] == [
+        "corporate_structure",
+        "beneficial_ownership",
+        "transaction_patterns",
+    ]
+    assert ctx.get_task_failures() == []
+
+
+def test_lead_agent_isolates_task_errors_and_timeouts():
+    import time
+
+    def corporate(_entity, task, _context):
+        if task.task_type == "beneficial_ownership":
+            raise RuntimeError("boom")
+        return [_ev(task.task_type)]
+
+    def slow(_entity, _task, _context):
+        time.sleep(1.0)
+        return [_ev("late")]
+
+    agent = LeadAgent(
+        agent_stubs={"corporate_agent": corporate, "legal_agent": slow, "social_graph_agent": corporate},
+        task_timeout_s={"legal_agent": 0.1},
+    )
+    start = time.monotonic()
+    ctx = agent.run("Investigate Tesla for money laundering")
+    assert time.monotonic() - start < 0.9
+    reasons = {f.task.task_type: f.reason for f in ctx.get_task_failures()}
+    assert reasons == {"beneficial_ownership": "error", "sanctions_screening": "timeout"}
+    assert [e.evidence_id for e in ctx.get_agent_results("corporate_agent")] == ["corporate_structure", "transaction_patterns"]
+    assert ctx.get_agent_results("legal_agent") == []
+    assert [e.evidence_id for e in ctx.get_agent_results("social_graph_agent")] == ["adverse_media"]
+
+
+def test_lead_agent_respects_max_parallel():
+    import threading
+
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def stub(_entity, task, _context):
+        import time
+
+        with lock:
+            running.append(task)
+            peak.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(task)
+        return []
+
+    agent = LeadAgent(
+        agent_stubs={"corporate_agent": stub, "legal_agent": stub, "social_graph_agent": stub},
+        max_parallel=2,
+    )
+    agent.run("Investigate Tesla for money laundering")
+    assert len(peak) == 5
+    assert max(peak) <= 2
+
+
+def test_lead_agent_iter_run_streams_typed_events():
+    from agents.lead_agent import (
+        EntityResolved,
+        FindingsBatch,
+        InvestigationCompleted,
+        TaskCompleted,
+        TaskFailed,
+        TasksPlanned,
+        TaskStarted,
+    )
+
+    def ok(entity, task, _ctx):
+        return [Evidence(f"ev_{task.task_type}", entity.entity_id, "2024-01-01", "other", "other", "S", "https://x")]
+
+    def boom(*_args):
+        raise RuntimeError("down")
+
+    agent = LeadAgent(agent_stubs={"corporate_agent": ok, "legal_agent": boom, "social_graph_agent": ok})
+    events = list(agent.iter_run("Investigate Tesla for money laundering"))
+    kinds = [e.kind for e in events]
+    assert isinstance(events[0], EntityResolved) and isinstance(events[1], TasksPlanned)
+    assert isinstance(events[-1], InvestigationCompleted)
+    ctx = events[-1].context
+    n_tasks = len(ctx.get_tasks())
+    assert kinds.count("task_started") == n_tasks
+    batches = [e for e in events if isinstance(e, FindingsBatch)]
+    failed = [e for e in events if isinstance(e, TaskFailed)]
+    assert len(batches) + len(failed) == n_tasks
+    assert all(f.failure.task.target_agent == "legal_agent" for f in failed)
+    assert sum(len(b.findings) for b in batches) == len(ctx.get_all_findings())
+    # every batch is followed by its completion event; nothing completes before starting
+    for i, e in enumerate(events):
+        if isinstance(e, FindingsBatch):
+            assert isinstance(events[i + 1], TaskCompleted) and events[i + 1].task == e.task
+            assert any(isinstance(s, TaskStarted) and s.task == e.task for s in events[:i])
+
+
+def test_lead_agent_iter_run_unknown_entity_only_completes():
+    events = list(LeadAgent(agent_stubs={}).iter_run("Unknown Company XYZ 12345"))
+    assert [e.kind for e in events] == ["investigation_completed"]
+
+
+def test_lead_agent_resumes_from_checkpoint(tmp_path: Path):
+    """Completed tasks are restored on resume; only the failed ones run again."""
+    calls = []
+    fail_legal = [True]
+
+    def stub(entity: Entity, task, _context):
+        calls.append(task.task_type)
+        if task.target_agent == "legal_agent" and fail_legal[0]:
+            raise RuntimeError("source down")
+        return [Evidence(f"{task.task_type}_1", entity.entity_id, "", "other", "other", task.task_type, "")]
+
+    stubs = {"corporate_agent": stub, "legal_agent": stub, "social_graph_agent": stub}
+    query = "Investigate Tesla for money laundering"
+    first = LeadAgent(data_root=tmp_path, agent_stubs=stubs, checkpoint_dir=tmp_path / "ckpt").run(query)
+    failed = sorted(f.task.task_type for f in first.get_task_failures())
+    assert failed and len(first.get_all_findings()) == len(first.get_tasks()) - len(failed)
+
+    calls.clear()
+    fail_legal[0] = False
+    agent = LeadAgent(data_root=tmp_path, agent_stubs=stubs, checkpoint_dir=tmp_path / "ckpt")
+    events = list(agent.iter_run(query, resume=True))
+    assert sorted(calls) == failed
+    restored = [e.task.task_type for e in events if e.kind == "task_completed" and e.restored]
+    assert len(restored) == len(first.get_tasks()) - len(failed)
+    ctx = events[-1].context
+    assert len(ctx.get_all_findings()) == len(ctx.get_tasks())
+
+    calls.clear()
+    agent.run(query, resume=True)
+    assert calls == []  # everything checkpointed and still valid
+    agent.run(query)
+    assert len(calls) == len(ctx.get_tasks())  # without resume the checkpoint starts over
+
+
+def test_lead_agent_resume_requires_checkpoint_dir():
+    with pytest.raises(ValueError):
+        LeadAgent(agent_stubs={}).run("Investigate Tesla", resume=True)
+
+
+def test_lead_agent_resume_rescreens_after_sanctions_lists_change(tmp_path: Path):
+    """Staging a sanctions list between runs invalidates the checkpointed screening."""
+    from agents.specialist_agents import LegalAgent
+
+    legal = LegalAgent(data_root=tmp_path)
+    agent = LeadAgent(data_root=tmp_path, agent_stubs={"legal_agent": legal.run}, checkpoint_dir=tmp_path / "ckpt")
+    query = "Investigate Tesla for sanctions exposure"
+    first = agent.run(query)
+    assert [e.evidence_id for e in first.get_agent_results("legal_agent")] == ["tesla_inc_cik_0001318605_sanctions_stub"]
+
+    lists = tmp_path / "reference" / "sanctions"
+    lists.mkdir(parents=True)
+    (lists / "sdn.csv").write_text('9001,"TESLA, INC.",-0- ,"SDGT",-0- ,-0- ,-0- ,-0- ,-0- ,-0- ,-0- ,-0- \n', encoding="utf-8")
+    resumed = agent.run(query, resume=True)
+    ids = [e.evidence_id for e in resumed.get_agent_results("legal_agent")]
+    assert ids == ["tesla_inc_cik_0001318605_sanctions_sdn_9001"]
@@ -0,0 +1,104 @@
+"""Tests for CourtListener bulk ingestion and the PACER analyzer."""
+
+import bz2
+import gzip
+import io
+from pathlib import Path
+
+from agents.lead_agent.context_manager import InvestigationContext
+from agents.lead_agent.task_planner import SubTask
+from agents.specialist_agents.legal_agent import LegalAgent
+from agents.specialist_agents.legal_agent.pacer_analyzer import (
+    CourtIndex,
+    court_db_path,
+    ingest_courtlistener,
+    registry_party_keys,
+    split_caption,
+)
+from agents.specialist_agents.legal_agent.pacer_analyzer.bulk import iter_bulk_rows
+from osint_swarm.entities import Entity
+
+
+# CourtListener dumps quote with backticks and escape with backslashes.
+DOCKETS = (
+    "`id`,`court_id`,`docket_number`,`case_name`,`date_filed`,`date_terminated`,`nature_of_suit`,`cause`,`slug`\n"
+    "101,`cand`,`3:18-cv-04865`,`In re Tesla, Inc. Securities Litigation`,`2018-08-10`,,`850 Securities`,`15:78`,`in-re-tesla`\n"
+    "102,`cand`,`4:21-cv-01000`,`Smith v. Tesla, Inc., et al.`,`2021-02-01`,`2022-06-30`,`442 Employment`,,`smith-v-tesla`\n"
+    "103,`nysd`,`1:20-cv-00001`,`Doe v. Acme Widgets Corp.`,`2020-01-05`,,`190 Contract`,`28:1332 \\`Diversity\\``,`doe-v-acme`\n"
+    "104,`dcd`,`1:22-cv-00042`,`United States v. Northwind Shipping`,`2022-03-01`,,,,`us-v-northwind`\n"
+)
+PARTIES = "docket_id,name,party_type\n101,\"TESLA, INC.\",Defendant\n104,Tesla Inc,Intervenor\n"
+COURTS = "id,short_name,full_name\ncand,N.D. Cal.,District Court for the Northern District of California\n"
+TESLA = Entity(entity_id="tesla", name="Tesla, Inc.", aliases=["Tesla Motors"])
+
+
+def _stage(root: Path, *, parties: bool = True) -> Path:
+    directory = root / "raw" / "courtlistener"
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "dockets-2024-01-31.csv.bz2").write_bytes(bz2.compress(DOCKETS.encode("utf-8")))
+    (directory / "courts-2024-01-31.csv").write_text(COURTS, encoding="utf-8")
+    if parties:
+        (directory / "parties-2024-01-31.csv.gz").write_bytes(gzip.compress(PARTIES.encode("utf-8")))
+    return directory
+
+
+def test_bulk_rows_handle_backticks_and_captions():
+    rows = list(iter_bulk_rows(io.StringIO(DOCKETS)))
+    assert len(rows) == 4 and rows[2]["cause"] == "28:1332 `Diversity`" and rows[0]["date_terminated"] == ""
+    assert split_caption("Smith v. Tesla, Inc., et al.") == ["Smith", "Tesla, Inc."]
+    assert split_caption("In re Tesla, Inc. Securities Litigation") == ["Tesla, Inc. Securities Litigation"]
+
+
+def test_full_index_lookup_and_rerun_skips_files(tmp_path: Path):
+    directory = _stage(tmp_path)
+    db = court_db_path(tmp_path)
+    summary = ingest_courtlistener(directory, db)
+    assert summary.dockets == 4 and len(summary.files) == 3 and summary.rows_read == 7
+    with CourtIndex(db) as index:
+        matches = index.find_dockets(["Tesla, Inc."])
+        assert [m.docket_id for m in matches] == [104, 102, 101]
+        assert matches[2].party_type == "Defendant" and matches[2].court_name == "N.D. Cal."
+        assert matches[1].party_type == "caption" and matches[1].url.endswith("/docket/102/smith-v-tesla/")
+        assert index.find_dockets(["Acme Widgets"])[0].docket_id == 103
+    again = ingest_courtlistener(directory, db)
+    assert again.files == [] and len(again.skipped) == 3
+
+
+def test_registry_filter_keeps_matching_dockets_and_backfills_new_parties(tmp_path: Path):
+    directory = _stage(tmp_path, parties=False)
+    db = court_db_path(tmp_path)
+    keys = registry_party_keys([TESLA])
+    assert ingest_courtlistener(directory, db, keys=keys).dockets == 1  # only the "Smith v. Tesla" caption matches
+    (directory / "parties-2024-01-31.csv.gz").write_bytes(gzip.compress(PARTIES.encode("utf-8")))
+    summary = ingest_courtlistener(directory, db, keys=keys)
+    assert "dockets-2024-01-31.csv.bz2" in summary.files  # rescanned for the new parties' dockets
+    with CourtIndex(db) as index:
+        assert index.docket_count() == 3
+        assert index.find_dockets(["Acme Widgets"]) == []
+    assert ingest_courtlistener(directory, db).rebuilt  # switching to a full index starts over
+
+
+def test_legal_agent_litigation_uses_court_index(tmp_path: Path):
+    ingest_courtlistener(_stage(tmp_path), court_db_path(tmp_path))
+    agent = LegalAgent(data_root=tmp_path)
+    task = SubTask("litigation", "legal_agent", "Court records")
+    findings = agent.run(TESLA, task, InvestigationContext())
+    assert [f.evidence_id for f in findings] == ["tesla_court_104", "tesla_court_102", "tesla_court_101"]
+    assert all(f.source_type == "court_record" and f.risk_category == "legal" for f in findings)
+    assert findings[2].date == "2018-08-10" and findings[2].attributes["party_type"] == "Defendant"
+    clear = agent.run(Entity(entity_id="x", name="Nobody Holdings"), task, InvestigationContext())
+    assert [f.evidence_id for f in clear] == ["x_court_none"]
+
+
+def test_registry_filter_refreshes_party_linked_dockets(tmp_path: Path):
+    directory = _stage(tmp_path)
+    db = court_db_path(tmp_path)
+    keys = registry_party_keys([TESLA])
+    ingest_courtlistener(directory, db, keys=keys)
+    # Docket 104 is kept only through the parties dump; a refreshed dockets dump must still update it.
+    refreshed = DOCKETS.replace("`2022-03-01`,,", "`2022-03-01`,`2023-09-30`,")
+    (directory / "dockets-2024-01-31.csv.bz2").write_bytes(bz2.compress(refreshed.encode("utf-8")))
+    summary = ingest_courtlistener(directory, db, keys=keys)
+    assert summary.files == ["dockets-2024-01-31.csv.bz2"]
+    with CourtIndex(db) as index:
+        assert index.find_dockets(["Tesla Inc"])[0].date_terminated == "2023-09-30"
@@ -0,0 +1,75 @@
+"""Tests for sanctions list delta rescreening."""
+
+from dataclasses import replace
+from pathlib import Path
+
+from agents.specialist_agents.legal_agent.sanctions_screener import SanctionsEntry, SanctionsMonitor, diff_lists
+from osint_swarm.entities import Entity
+
+
+LIST_V1 = [
+    SanctionsEntry("36", "SDN", "AEROCARIBBEAN AIRLINES", programs=("CUBA",)),
+    SanctionsEntry("9001", "SDN", "NORTHERN STAR SHIPPING LIMITED", programs=("IRAN",)),
+    SanctionsEntry("2674", "SDN", "PETROV, Sergey Ivanovich", "individual", ("RUSSIA-EO14024",)),
+]
+ENTITIES = [
+    Entity(entity_id="northern_star", name="Northern Star Shipping Ltd"),
+    Entity(entity_id="acme", name="Acme Widgets Inc", aliases=["Acme Widget Company"]),
+]
+
+
+def test_diff_lists_finds_added_changed_and_removed():
+    _, fps = diff_lists({}, LIST_V1)
+    v2 = [LIST_V1[0], replace(LIST_V1[1], programs=("IRAN", "SDGT")), SanctionsEntry("9100", "SDN", "NEW CO")]
+    delta, fps2 = diff_lists(fps, v2)
+    assert [e.key for e in delta.added] == ["SDN:9100"]
+    assert [e.key for e in delta.changed] == ["SDN:9001"]
+    assert delta.removed == ("SDN:2674",) and delta.unchanged == 1
+    assert diff_lists(fps2, v2)[0].empty
+
+
+def test_first_update_screens_parties_then_only_the_delta(tmp_path: Path):
+    monitor = SanctionsMonitor(tmp_path / "state.pickle")
+    monitor.watch(ENTITIES)
+    first = monitor.update(LIST_V1)
+    assert first.screened_parties == 2 and first.screened_entries == 0
+    assert [(a.entity_id, a.entry.key, a.reason) for a in first.alerts] == [("northern_star", "SDN:9001", "watched")]
+
+    assert monitor.update(LIST_V1).alerts == []  # unchanged list: known hits do not alert again
+
+    v2 = LIST_V1 + [SanctionsEntry("9200", "SDN", "ACME WIDGET CO", aliases=("ACME WIDGETS",))]
+    second = monitor.update(v2)
+    assert second.screened_entries == 1 and second.screened_parties == 0
+    assert [(a.entity_id, a.entry.key, a.reason) for a in second.alerts] == [("acme", "SDN:9200", "added")]
+    assert set(monitor.hits) == {("northern_star", "SDN:9001"), ("acme", "SDN:9200")}
+
+
+def test_changed_and_removed_entries_clear_hits(tmp_path: Path):
+    monitor = SanctionsMonitor(tmp_path / "state.pickle")
+    monitor.watch(ENTITIES)
+    monitor.update(LIST_V1 + [SanctionsEntry("9200", "SDN", "ACME WIDGET CO")])
+
+    renamed = [LIST_V1[0], replace(LIST_V1[1], name="SOUTHERN CROSS MARINE SA"), LIST_V1[2]]
+    result = monitor.update(renamed)
+    assert result.alerts == []
+    assert result.cleared == [("acme", "SDN:9200"), ("northern_star", "SDN:9001")]
+    assert monitor.hits == {}
+
+
+def test_state_persists_and_new_parties_are_screened_once(tmp_path: Path):
+    path = tmp_path / "state.pickle"
+    monitor = SanctionsMonitor(path)
+    monitor.watch(ENTITIES[:1])
+    monitor.update(LIST_V1)
+    monitor.save()
+
+    reloaded = SanctionsMonitor(path)
+    assert reloaded.list_version == monitor.list_version and set(reloaded.hits) == {("northern_star", "SDN:9001")}
+    assert reloaded.watch(ENTITIES) == 1  # northern_star is unchanged
+    result = reloaded.update(LIST_V1)
+    assert result.delta.empty and result.screened_parties == 1 and result.alerts == []
+
+    reloaded.watch([Entity(entity_id="petrov", name="Sergei Petrov")], related_parties={"petrov": ["Sergey Ivanovich Petrov"]})
+    result = reloaded.update(LIST_V1)
+    assert [(a.entity_id, a.entry.key, a.reason) for a in result.alerts] == [("petrov", "SDN:2674", "watched")]
+    assert reloaded.unwatch(["petrov"]) == 1 and ("petrov", "SDN:2674") not in reloaded.hits
@@ -0,0 +1,108 @@
+"""Tests for the OFAC sanctions screener."""
+
+import os
+from pathlib import Path
+
+from agents.lead_agent.context_manager import InvestigationContext
+from agents.lead_agent.task_planner import SubTask
+from agents.specialist_agents.legal_agent import LegalAgent
+from agents.specialist_agents.legal_agent.sanctions_screener import (
+    SanctionsIndex,
+    get_sanctions_index,
+    load_ofac_xml,
+    load_sanctions_lists,
+    screen_entity,
+    screening_key,
+)
+from osint_swarm.entities import Entity
+
+
+SDN_CSV = """36,"AEROCARIBBEAN AIRLINES",-0- ,"CUBA",-0- ,-0- ,-0- ,-0- ,-0- ,-0- ,-0- ,-0- 
+2674,"PETROV, Sergey Ivanovich","individual","SDGT] [RUSSIA-EO14024",-0- ,-0- ,-0- ,-0- ,-0- ,-0- ,-0- ,"DOB 01 Jan 1960."
+9001,"NORTHERN STAR SHIPPING LIMITED",-0- ,"IRAN",-0- ,-0- ,-0- ,-0- ,-0- ,-0- ,-0- ,-0- 
+\x1a
+"""
+ALT_CSV = """36,12,"aka","AERO-CARIBBEAN",-0- 
+2674,13,"aka","PETROV, Sergei",-0- 
+"""
+SDN_XML = """<?xml version="1.0" standalone="yes"?>
+<sdnList xmlns="https://sanctionslistservice.ofac.treas.gov/api/PublicationPreview/exports/XML">
+  <sdnEntry>
+    <uid>306</uid><lastName>BANCO NACIONAL DE CUBA</lastName><sdnType>Entity</sdnType>
+    <programList><program>CUBA</program></programList>
+    <akaList><aka><uid>219</uid><type>a.k.a.</type><lastName>NATIONAL BANK OF CUBA</lastName></aka></akaList>
+  </sdnEntry>
+  <sdnEntry>
+    <uid>7000</uid><firstName>Ivan</firstName><lastName>KOVALENKO</lastName><sdnType>Individual</sdnType>
+    <programList><program>UKRAINE-EO13660</program></programList>
+  </sdnEntry>
+</sdnList>
+"""
+
+
+def _stage(root: Path) -> Path:
+    directory = root / "reference" / "sanctions"
+    directory.mkdir(parents=True)
+    (directory / "sdn.csv").write_text(SDN_CSV, encoding="utf-8")
+    (directory / "alt.csv").write_text(ALT_CSV, encoding="utf-8")
+    return directory
+
+
+def test_load_ofac_csv_parses_nulls_programs_and_aliases(tmp_path: Path):
+    entries = {e.uid: e for e in load_sanctions_lists(_stage(tmp_path))}
+    assert set(entries) == {"36", "2674", "9001"}
+    petrov = entries["2674"]
+    assert petrov.entry_type == "individual" and petrov.programs == ("SDGT", "RUSSIA-EO14024")
+    assert petrov.aliases == ("PETROV, Sergei",) and petrov.remarks == "DOB 01 Jan 1960."
+    assert entries["36"].entry_type == "entity" and entries["36"].remarks == ""
+
+
+def test_load_ofac_xml_handles_namespace_and_aliases(tmp_path: Path):
+    path = tmp_path / "sdn.xml"
+    path.write_text(SDN_XML, encoding="utf-8")
+    bank, person = load_ofac_xml(path)
+    assert (bank.uid, bank.name, bank.aliases, bank.programs) == ("306", "BANCO NACIONAL DE CUBA", ("NATIONAL BANK OF CUBA",), ("CUBA",))
+    assert person.name == "KOVALENKO, Ivan" and person.entry_type == "individual"
+
+
+def test_screening_key_transliterates():
+    assert screening_key("Сергей Иванович ПЕТРОВ") == "sergey ivanovich petrov"
+    assert screening_key("Łukasz Müller GmbH & Co.") == "lukasz muller gmbh"
+
+
+def test_index_matches_exact_reordered_misspelled_and_transliterated(tmp_path: Path):
+    index = SanctionsIndex(load_sanctions_lists(_stage(tmp_path)))
+    assert index.screen("Aerocaribbean Airlines")[0].exact
+    assert index.screen("Sergey Ivanovich Petrov")[0].entry.uid == "2674"
+    assert index.screen("Сергей Иванович Петров")[0].entry.uid == "2674"
+    hit = index.screen("Northern Starr Shipping Ltd")[0]
+    assert hit.entry.uid == "9001" and 0.88 <= hit.score < 1.0
+    assert index.screen("Tesla, Inc.") == []
+    assert index.screen("Northern Lights Bakery") == []
+
+
+def test_screen_entity_emits_hit_or_clear_evidence(tmp_path: Path):
+    index = SanctionsIndex(load_sanctions_lists(_stage(tmp_path)))
+    entity = Entity("e1", "Acme Holdings", aliases=["Acme"])
+    hits = screen_entity(entity, index, related_parties=["Sergei Petrov"])
+    assert [e.attributes["uid"] for e in hits] == ["2674"]
+    assert hits[0].risk_category == "legal" and hits[0].evidence_id == "e1_sanctions_sdn_2674"
+    (clear,) = screen_entity(entity, index)
+    assert clear.evidence_id == "e1_sanctions_clear" and clear.attributes["screened_names"] == ["Acme Holdings", "Acme"]
+
+
+def test_legal_agent_screens_staged_lists_and_reloads_on_change(tmp_path: Path):
+    directory = _stage(tmp_path)
+    agent = LegalAgent(data_root=tmp_path)
+    task = SubTask("sanctions_screening", "legal_agent", "Screen sanctions")
+    entity = Entity("e1", "Northern Star Shipping Limited")
+    findings = agent.run(entity, task, InvestigationContext())
+    assert findings[0].attributes["uid"] == "9001" and not findings[0].attributes.get("stub")
+    first = get_sanctions_index(tmp_path)
+    assert get_sanctions_index(tmp_path) is first
+
+    sdn = directory / "sdn.csv"
+    sdn.write_text(SDN_CSV.replace("NORTHERN STAR", "SOUTHERN CROSS"), encoding="utf-8")
+    os.utime(sdn, ns=(sdn.stat().st_mtime_ns + 10**9,) * 2)
+    assert get_sanctions_index(tmp_path) is not first
+    assert agent.run(entity, task, InvestigationContext())[0].evidence_id == "e1_sanctions_clear"
@@ -0,0 +1,33 @@
+"""Tests for the batch investigation pipeline."""
+
+import threading
+
+from agents.lead_agent import LeadAgent
+from app.pipeline import run_investigations
+from osint_swarm.entities import Evidence
+
+
+def test_run_investigations_shares_one_cache_per_entity(tmp_path):
+    caches = []
+    lock = threading.Lock()
+
+    def stub(entity, task, ctx):
+        with lock:
+            caches.append((entity.entity_id, id(ctx.evidence_cache)))
+        return [Evidence(f"ev_{task.task_type}", entity.entity_id, "2024-01-01", "other", "other", "S", "https://x")]
+
+    agent = LeadAgent(agent_stubs={"corporate_agent": stub, "legal_agent": stub, "social_graph_agent": stub})
+    queries = ["Investigate Tesla", "Tesla governance", "Unknown Company XYZ 12345", "Investigate Tesla"]
+    batch = run_investigations(queries, data_root=tmp_path, max_workers=3, agent=agent)
+
+    results = batch["results"]
+    assert [r["query"] for r in results] == queries
+    assert results[0]["entity_id"] == results[1]["entity_id"] == "tesla_inc_cik_0001318605"
+    assert results[2]["entity_id"] is None
+    assert all(r["error"] is None for r in results)
+    assert len({cache for _, cache in caches}) == 1
+
+    summary = batch["summary"]
+    assert summary["queries"] == 4 and summary["distinct_queries"] == 3
+    assert summary["entities"] == 1 and summary["unresolved"] == 1
+    assert summary["findings_count"] == sum(r["findings_count"] for r in results)
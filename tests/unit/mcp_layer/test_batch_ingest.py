@@ -0,0 +1,46 @@
+"""Tests for batch ingestion (raw files are pre-cached, so no network is used)."""
+
+import json
+from pathlib import Path
+
+from mcp_layer.batch_ingest import ingest_entities
+from mcp_layer.evidence_loader import load_evidence_for_entity
+from osint_swarm.entities import Entity
+
+
+def _entities(root: Path, n: int):
+    raw = root / "raw" / "nhtsa"
+    raw.mkdir(parents=True, exist_ok=True)
+    out = []
+    for i in range(n):
+        make = f"MAKE{i}"
+        raw.joinpath(f"recalls_make_{make}.json").write_text(
+            json.dumps({"results": [{"report_received_date": "2024-06-01", "nhtsa_id": f"24V{i}", "subject": "S"}]}),
+            encoding="utf-8",
+        )
+        out.append(Entity(entity_id=f"ent{i}", name=make, identifiers={"make": make}))
+    return out
+
+
+def test_ingest_entities_in_process(tmp_path: Path):
+    entities = _entities(tmp_path, 3)
+    summary = ingest_entities(entities, data_root=tmp_path, sources=["nhtsa"], cpu_workers=0)
+    assert summary.entities == 3
+    assert summary.raw_files == 3  # fresh cache hits count as ready
+    assert summary.fetch_failures == []
+    assert summary.sources_built == 3
+    assert summary.records_normalized == 3
+    assert [e.evidence_id for e in load_evidence_for_entity(tmp_path / "processed", "ent1")] == ["ent1_nhtsa_24v1"]
+
+    again = ingest_entities(entities, data_root=tmp_path, sources=["nhtsa"], cpu_workers=0)
+    assert again.sources_unchanged == 3
+    assert again.records_normalized == 0
+    assert "Entities:" in again.format()
+
+
+def test_ingest_entities_process_pool(tmp_path: Path):
+    entities = _entities(tmp_path, 4)
+    summary = ingest_entities(entities, data_root=tmp_path, sources=["nhtsa"], cpu_workers=2, fetch=False)
+    assert summary.build_failures == []
+    assert summary.sources_built == 4
+    assert (tmp_path / "processed" / "ent3" / "evidence_nhtsa.csv").exists()
@@ -0,0 +1,118 @@
+"""Tests for the incremental evidence builder."""
+
+import json
+import os
+from pathlib import Path
+
+from mcp_layer.evidence_builder import EvidenceBuilder
+from mcp_layer.evidence_loader import load_evidence_for_entity
+from mcp_layer.evidence_store import EvidenceStore, store_path
+from osint_swarm.entities import Entity
+
+
+ENTITY = Entity(entity_id="tesla", name="Tesla, Inc.", identifiers={"cik": "0001318605", "make": "TESLA"})
+
+
+def _recall(nhtsa_id: str, summary: str) -> dict:
+    return {"report_received_date": "2024-06-01", "nhtsa_id": nhtsa_id, "defect_summary": summary}
+
+
+def _write_recalls(root: Path, records: list) -> Path:
+    path = root / "raw" / "nhtsa" / "recalls_make_TESLA.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"results": records}), encoding="utf-8")
+    return path
+
+
+def _by_source(stats):
+    return {s.source_id: s for s in stats}
+
+
+def test_builder_first_build_then_unchanged(tmp_path: Path):
+    _write_recalls(tmp_path, [_recall("24V1", "A"), _recall("24V2", "B")])
+    builder = EvidenceBuilder(data_root=tmp_path)
+
+    first = _by_source(builder.build(ENTITY))
+    assert first["nhtsa"].status == "built"
+    assert first["nhtsa"].added == 2
+    assert first["sec_edgar"].status == "missing_input"
+    assert builder.manifest_path(ENTITY).exists()
+
+    second = _by_source(builder.build(ENTITY))
+    assert second["nhtsa"].status == "unchanged"
+    ids = sorted(e.evidence_id for e in load_evidence_for_entity(tmp_path / "processed", "tesla"))
+    assert ids == ["tesla_nhtsa_24v1", "tesla_nhtsa_24v2"]
+
+
+def test_builder_renormalizes_only_changed_records(tmp_path: Path, monkeypatch):
+    path = _write_recalls(tmp_path, [_recall("24V1", "A"), _recall("24V2", "B"), _recall("24V3", "C")])
+    builder = EvidenceBuilder(data_root=tmp_path)
+    builder.build(ENTITY)
+
+    _write_recalls(tmp_path, [_recall("24V1", "A"), _recall("24V2", "B changed"), _recall("24V4", "D")])
+    stats = _by_source(builder.build(ENTITY))["nhtsa"]
+    assert (stats.reused, stats.updated, stats.added, stats.removed) == (1, 1, 1, 1)
+
+    evidence = {e.evidence_id: e for e in load_evidence_for_entity(tmp_path / "processed", "tesla")}
+    assert sorted(evidence) == ["tesla_nhtsa_24v1", "tesla_nhtsa_24v2", "tesla_nhtsa_24v4"]
+    assert evidence["tesla_nhtsa_24v2"].summary == "B changed"
+    assert evidence["tesla_nhtsa_24v1"].raw_location == str(path)
+
+
+def test_builder_skips_touched_but_identical_input(tmp_path: Path):
+    path = _write_recalls(tmp_path, [_recall("24V1", "A")])
+    builder = EvidenceBuilder(data_root=tmp_path)
+    builder.build(ENTITY)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+    assert _by_source(builder.build(ENTITY))["nhtsa"].status == "unchanged"
+
+
+def test_builder_updates_store_incrementally(tmp_path: Path):
+    _write_recalls(tmp_path, [_recall("24V1", "A"), _recall("24V2", "B")])
+    builder = EvidenceBuilder(data_root=tmp_path)
+    EvidenceStore(store_path(tmp_path / "processed")).close()
+    builder.build(ENTITY)
+
+    _write_recalls(tmp_path, [_recall("24V2", "B")])
+    builder.build(ENTITY)
+    with EvidenceStore(store_path(tmp_path / "processed")) as store:
+        assert [e.evidence_id for e in store.load_for_entity("tesla")] == ["tesla_nhtsa_24v2"]
+
+
+def test_builder_caps_sec_filings_like_the_processor(tmp_path: Path):
+    from mcp_layer.sec_edgar_processor.processor import DEFAULT_MAX_FILINGS
+
+    n = DEFAULT_MAX_FILINGS + 20
+    recent = {
+        "accessionNumber": [f"0000000000-24-{i:06d}" for i in range(n)],
+        "filingDate": ["2024-01-01"] * n,
+        "form": ["8-K"] * n,
+        "primaryDocument": ["doc.htm"] * n,
+    }
+    path = tmp_path / "raw" / "sec" / "CIK0001318605.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps({"filings": {"recent": recent}}), encoding="utf-8")
+
+    stats = _by_source(EvidenceBuilder(data_root=tmp_path).build(ENTITY))
+    assert stats["sec_edgar"].added == DEFAULT_MAX_FILINGS
+
+
+def test_builder_rebuilds_csv_written_after_the_manifest(tmp_path: Path):
+    _write_recalls(tmp_path, [_recall("24V1", "A"), _recall("24V2", "B")])
+    builder = EvidenceBuilder(data_root=tmp_path)
+    builder.build(ENTITY)
+    old_manifest = builder.manifest_path(ENTITY).read_bytes()
+
+    # A build interrupted after writing the CSV but before the manifest...
+    _write_recalls(tmp_path, [_recall("24V1", "A"), _recall("24V2", "B changed"), _recall("24V3", "C")])
+    builder.build(ENTITY)
+    builder.manifest_path(ENTITY).write_bytes(old_manifest)
+    # ...then the raw file goes back to the content the manifest describes.
+    _write_recalls(tmp_path, [_recall("24V1", "A"), _recall("24V2", "B")])
+
+    stats = _by_source(builder.build(ENTITY))["nhtsa"]
+    assert stats.status == "built" and stats.reused == 0
+    evidence = {e.evidence_id: e for e in load_evidence_for_entity(tmp_path / "processed", "tesla")}
+    assert sorted(evidence) == ["tesla_nhtsa_24v1", "tesla_nhtsa_24v2"]
+    assert evidence["tesla_nhtsa_24v2"].summary == "B"
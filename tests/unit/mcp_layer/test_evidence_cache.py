@@ -0,0 +1,105 @@
+"""Tests for the investigation-scoped evidence cache."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from mcp_layer import get_evidence_for_entity
+from mcp_layer.evidence_cache import EvidenceCache, evidence_cache_key
+from osint_swarm.entities import Entity, Evidence
+
+
+def _ev(ev_id: str) -> Evidence:
+    return Evidence(ev_id, "e1", "2024-01-01", "other", "other", "S", "https://x")
+
+
+def test_evidence_cache_key_ignores_param_order():
+    entity = Entity(entity_id="e1", name="E", identifiers={"cik": "1", "make": "E"})
+    k1 = evidence_cache_key("sec_edgar", entity, {"forms": {"8-K", "4"}, "start": "2020"})
+    k2 = evidence_cache_key("sec_edgar", entity, {"start": "2020", "forms": {"4", "8-K"}})
+    assert k1 == k2
+    assert evidence_cache_key("nhtsa", entity) != evidence_cache_key("sec_edgar", entity)
+
+
+def test_evidence_cache_hit_and_miss_counters():
+    cache = EvidenceCache()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return [_ev("a")]
+
+    assert cache.get_or_fetch(("k",), fetch)[0].evidence_id == "a"
+    assert cache.get_or_fetch(("k",), fetch)[0].evidence_id == "a"
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert stats.misses == 1
+    assert stats.hits == 1
+    assert stats.entries == 1
+
+
+def test_evidence_cache_single_flight_under_concurrency():
+    cache = EvidenceCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return [_ev("a")]
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(cache.get_or_fetch(("k",), fetch)))
+    leader.start()
+    started.wait(timeout=5)
+    followers = [
+        threading.Thread(target=lambda: results.append(cache.get_or_fetch(("k",), fetch)))
+        for _ in range(4)
+    ]
+    for t in followers:
+        t.start()
+    release.set()
+    for t in [leader] + followers:
+        t.join(timeout=5)
+
+    assert len(calls) == 1
+    assert len(results) == 5
+    assert cache.stats().misses == 1
+
+
+def test_evidence_cache_does_not_cache_failures():
+    cache = EvidenceCache()
+
+    def boom():
+        raise RuntimeError("source down")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_fetch(("k",), boom)
+    assert len(cache) == 0
+    assert cache.get_or_fetch(("k",), lambda: [_ev("b")])[0].evidence_id == "b"
+
+
+def test_get_evidence_for_entity_with_cache_reads_source_once(tmp_path: Path, monkeypatch):
+    nhtsa_dir = tmp_path / "raw" / "nhtsa"
+    nhtsa_dir.mkdir(parents=True)
+    nhtsa_dir.joinpath("recalls_make_TESLA.json").write_text(
+        json.dumps({"results": [{"report_received_date": "2024-06-01", "nhtsa_id": "24V1", "subject": "S"}]}),
+        encoding="utf-8",
+    )
+    from mcp_layer import raw_cache
+
+    reads = []
+    real_read_json = raw_cache.read_json
+    monkeypatch.setattr(raw_cache, "read_json", lambda p: reads.append(p) or real_read_json(p))
+
+    entity = Entity(entity_id="tesla", name="Tesla, Inc.", identifiers={"make": "TESLA"})
+    cache = EvidenceCache()
+    first = get_evidence_for_entity(entity, sources=["nhtsa"], data_root=tmp_path, cache=cache)
+    second = get_evidence_for_entity(entity, sources=["nhtsa"], data_root=tmp_path, cache=cache)
+    assert [e.evidence_id for e in first] == [e.evidence_id for e in second]
+    assert len(reads) == 1
+    assert cache.stats().hits == 1
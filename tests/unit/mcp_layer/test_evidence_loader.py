@@ -6,7 +6,14 @@ from pathlib import Path
 
 import pytest
 
-from mcp_layer.evidence_loader import load_evidence_for_entity, load_evidence_from_csv
+from mcp_layer.evidence_loader import (
+    LazyAttributes,
+    evidence_to_row,
+    iter_evidence,
+    load_evidence_batch,
+    load_evidence_for_entity,
+    load_evidence_from_csv,
+)
 from osint_swarm.entities import Evidence
 
 
@@ -55,3 +62,97 @@ def test_load_evidence_for_entity_from_processed_dir(tmp_path: Path):
 def test_load_evidence_for_entity_nonexistent_dir():
     """Non-existent processed_dir returns empty list."""
     assert load_evidence_for_entity(Path("/nonexistent/processed"), "any_id") == []
+
+
+_HEADER = "evidence_id,entity_id,date,source_type,risk_category,summary,source_uri,raw_location,confidence,attributes\n"
+
+
+def _write_corpus(root: Path) -> None:
+    sub = root / "corpus"
+    sub.mkdir()
+    sub.joinpath("evidence_corpus.csv").write_text(
+        _HEADER
+        + 'a,ent1,2022-01-01,sec_filing,governance,A,https://x,,0.9,"{""form"": ""8-K""}"\n'
+        + "b,ent1,2023-06-01,regulator_api,regulatory,B,https://x,,0.4,{}\n"
+        + "c,ent1,,other,other,C,https://x,,0.7,{}\n"
+        + "d,ent2,2023-06-01,sec_filing,governance,D,https://x,,0.9,not-json\n",
+        encoding="utf-8",
+    )
+
+
+def test_iter_evidence_pushes_down_filters(tmp_path: Path):
+    _write_corpus(tmp_path)
+    ids = lambda **kw: [e.evidence_id for e in iter_evidence(tmp_path, **kw)]
+    assert ids(entity_id="ent1") == ["a", "b", "c"]
+    assert ids(entity_id="ent1", start_date="2023-01-01") == ["b"]
+    assert ids(end_date="2022-12-31") == ["a"]
+    assert ids(risk_category={"regulatory", "other"}) == ["b", "c"]
+    assert ids(source_type="sec_filing", min_confidence=0.8) == ["a", "d"]
+
+
+def test_iter_evidence_decodes_attributes_lazily(tmp_path: Path):
+    _write_corpus(tmp_path)
+    rows = list(iter_evidence(tmp_path, entity_id="ent1"))
+    attrs = rows[0].attributes
+    assert isinstance(attrs, LazyAttributes) and not attrs.decoded
+    assert attrs.get("form") == "8-K"
+    assert attrs.decoded
+    assert rows[0].to_dict()["attributes"] == {"form": "8-K"}
+    assert json.loads(json.dumps(rows[0].attributes)) == {"form": "8-K"}
+    bad = next(iter_evidence(tmp_path, entity_id="ent2"))
+    assert dict(bad.attributes) == {}
+
+
+def test_lazy_attributes_serialize_and_mutate_before_first_read():
+    attrs = LazyAttributes.from_json('{"a": 1, "b": 2}')
+    row = evidence_to_row(Evidence("x", "e", "", "other", "other", "s", "u", attributes=attrs))
+    assert json.loads(row["attributes"]) == {"a": 1, "b": 2} and not attrs.decoded  # written back as is
+    assert json.loads(json.dumps(dict(attrs))) == {"a": 1, "b": 2}
+
+    assert LazyAttributes.from_json('{"a": 1}').pop("a", "missing") == 1
+    assert LazyAttributes.from_json('{"a": 1}').setdefault("a", 0) == 1
+    assert LazyAttributes.from_json('{"a": 1}').popitem() == ("a", 1)
+    assert LazyAttributes.from_json('{"a": 1}') | {"b": 2} == {"a": 1, "b": 2}
+    written = LazyAttributes.from_json('{"a": 1}')
+    written["b"] = 2
+    del written["a"]
+    assert dict(written) == {"b": 2} and json.loads(json.dumps(written)) == {"b": 2}
+
+
+def test_iter_evidence_uses_store_with_same_filters(tmp_path: Path):
+    from mcp_layer.evidence_store import EvidenceStore, store_path
+
+    _write_corpus(tmp_path)
+    csv_ids = [e.evidence_id for e in iter_evidence(tmp_path, entity_id="ent1", start_date="2022-01-01")]
+    with EvidenceStore(store_path(tmp_path)) as store:
+        store.import_csv_dir(tmp_path)
+    store_rows = list(iter_evidence(tmp_path, entity_id="ent1", start_date="2022-01-01"))
+    assert [e.evidence_id for e in store_rows] == csv_ids == ["a", "b"]
+    assert store_rows[0].attributes == {"form": "8-K"}
+
+
+def test_iter_evidence_yields_an_id_found_in_several_csvs_once(tmp_path: Path):
+    header = "evidence_id,entity_id,date,source_type,risk_category,summary,source_uri,raw_location,confidence,attributes\n"
+    for slug in ("a", "b"):
+        (tmp_path / slug).mkdir()
+        (tmp_path / slug / "evidence_x.csv").write_text(
+            header + f"dup,ent,2024-01-01,other,other,{slug},https://x,,0.5,{{}}\n" + f"only_{slug},ent,2024-01-01,other,other,S,https://x,,0.5,{{}}\n",
+            encoding="utf-8",
+        )
+    ids = sorted(e.evidence_id for e in iter_evidence(tmp_path, entity_id="ent"))
+    assert ids == ["dup", "only_a", "only_b"]
+
+
+def test_load_evidence_batch_keeps_attributes_undecoded(tmp_path: Path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "evidence_x.csv").write_text(
+        "evidence_id,entity_id,date,source_type,risk_category,summary,source_uri,raw_location,confidence,attributes\n"
+        'e1,ent,2024-01-01,other,other,S,https://x,,0.5,"{""form"": ""8-K""}"\n'
+        "e2,ent,2024-01-01,other,other,S,https://x,,0.5,\n",
+        encoding="utf-8",
+    )
+    batch = load_evidence_batch(tmp_path, entity_id="ent")
+    first = batch[0].attributes
+    assert isinstance(first, LazyAttributes) and not first.decoded
+    assert first == {"form": "8-K"}
+    assert batch[1].attributes == {}
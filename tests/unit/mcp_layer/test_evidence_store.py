@@ -0,0 +1,88 @@
+"""Tests for the SQLite evidence store."""
+
+from pathlib import Path
+
+import pytest
+
+from mcp_layer.evidence_loader import load_evidence_for_entity
+from mcp_layer.evidence_store import EvidenceStore, store_path
+from osint_swarm.entities import Evidence
+
+
+def _ev(ev_id: str, entity_id: str = "e1", date: str = "2024-01-01", **kw) -> Evidence:
+    return Evidence(
+        evidence_id=ev_id,
+        entity_id=entity_id,
+        date=date,
+        source_type=kw.get("source_type", "sec_filing"),
+        risk_category=kw.get("risk_category", "governance"),
+        summary=kw.get("summary", "S"),
+        source_uri="https://sec.gov",
+        confidence=0.9,
+        attributes=kw.get("attributes", {"form": "8-K"}),
+    )
+
+
+def test_evidence_store_upsert_and_load(tmp_path: Path):
+    with EvidenceStore(tmp_path / "evidence.sqlite") as store:
+        assert store.upsert([_ev("a"), _ev("b", date="2023-05-01"), _ev("c", entity_id="e2")]) == 3
+        out = store.load_for_entity("e1")
+        assert [e.evidence_id for e in out] == ["b", "a"]
+        assert out[1].attributes == {"form": "8-K"}
+        assert out[1].confidence == 0.9
+        assert store.entity_ids() == ["e1", "e2"]
+
+
+def test_evidence_store_upsert_replaces_existing_rows(tmp_path: Path):
+    with EvidenceStore(tmp_path / "evidence.sqlite") as store:
+        store.upsert([_ev("a", summary="old")])
+        store.upsert([_ev("a", summary="new")])
+        assert store.count("e1") == 1
+        assert store.load_for_entity("e1")[0].summary == "new"
+
+
+def test_evidence_store_filters(tmp_path: Path):
+    with EvidenceStore(tmp_path / "evidence.sqlite") as store:
+        store.upsert([
+            _ev("a", date="2022-01-01"),
+            _ev("b", date="2023-01-01", source_type="regulator_api", risk_category="regulatory"),
+            _ev("c", date="2024-01-01"),
+        ])
+        assert [e.evidence_id for e in store.load_for_entity("e1", start_date="2022-06-01")] == ["b", "c"]
+        assert [e.evidence_id for e in store.load_for_entity("e1", end_date="2023-01-01")] == ["a", "b"]
+        assert [e.evidence_id for e in store.load_for_entity("e1", source_type="regulator_api")] == ["b"]
+        assert [e.evidence_id for e in store.load_for_entity("e1", risk_category="governance")] == ["a", "c"]
+
+
+def test_evidence_store_imports_csv_dir_and_loader_uses_it(tmp_path: Path):
+    subdir = tmp_path / "tesla"
+    subdir.mkdir()
+    subdir.joinpath("evidence_tesla.csv").write_text(
+        "evidence_id,entity_id,date,source_type,risk_category,summary,source_uri,raw_location,confidence,attributes\n"
+        'e1,tesla,2024-01-01,regulator_api,regulatory,Recall,https://nhtsa.gov,,0.8,"{""nhtsa_id"": ""24V1""}"\n'
+        'e2,other,2024-01-02,other,other,X,https://x,,0.5,{}\n',
+        encoding="utf-8",
+    )
+    with EvidenceStore(store_path(tmp_path)) as store:
+        imported = store.import_csv_dir(tmp_path)
+        assert list(imported.values()) == [2]
+
+    # Remove the CSV: the loader must now answer from the store.
+    subdir.joinpath("evidence_tesla.csv").unlink()
+    out = load_evidence_for_entity(tmp_path, "tesla")
+    assert [e.evidence_id for e in out] == ["e1"]
+    assert out[0].attributes == {"nhtsa_id": "24V1"}
+
+
+def test_loader_imports_csvs_written_after_the_store(tmp_path: Path):
+    header = "evidence_id,entity_id,date,source_type,risk_category,summary,source_uri,raw_location,confidence,attributes\n"
+    with EvidenceStore(store_path(tmp_path)) as store:
+        store.upsert([_ev("old", entity_id="tesla")])
+
+    csv_path = tmp_path / "tesla" / "evidence_tesla.csv"
+    csv_path.parent.mkdir()
+    csv_path.write_text(header + "new,tesla,2024-02-01,other,other,Fresh,https://x,,0.5,{}\n", encoding="utf-8")
+    assert [e.evidence_id for e in load_evidence_for_entity(tmp_path, "tesla")] == ["old", "new"]
+
+    with EvidenceStore(store_path(tmp_path)) as store:
+        assert store.stale_csvs(tmp_path) == []
@@ -0,0 +1,91 @@
+"""Tests for concurrent multi-source fetch (fetch_evidence_for_entity)."""
+
+import json
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from mcp_layer import fetch_evidence_for_entity
+from mcp_layer.base import DataSourceProcessor
+from mcp_layer.multi_source import fetch_from_processors
+from osint_swarm.entities import Entity, Evidence
+
+
+class FakeProcessor(DataSourceProcessor):
+    def __init__(self, sid: str, delay: float = 0.0, error: Exception = None):
+        self._sid = sid
+        self.delay = delay
+        self.error = error
+
+    @property
+    def source_id(self) -> str:
+        return self._sid
+
+    def get_evidence_for_entity(self, entity: Entity) -> List[Evidence]:
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [Evidence(f"{self._sid}_1", entity.entity_id, "2024-01-01", "other", "other", "S", "https://x")]
+
+
+ENTITY = Entity(entity_id="e1", name="E")
+
+
+def test_fetch_from_processors_runs_sources_concurrently():
+    procs = [FakeProcessor("a", 0.2), FakeProcessor("b", 0.2), FakeProcessor("c", 0.2)]
+    start = time.monotonic()
+    result = fetch_from_processors(ENTITY, procs)
+    elapsed = time.monotonic() - start
+    assert result.complete
+    assert [e.evidence_id for e in result.evidence] == ["a_1", "b_1", "c_1"]
+    assert elapsed < 0.5
+
+
+def test_fetch_from_processors_reports_errors_with_partial_results():
+    procs = [FakeProcessor("ok"), FakeProcessor("bad", error=RuntimeError("403"))]
+    result = fetch_from_processors(ENTITY, procs)
+    assert [e.evidence_id for e in result.evidence] == ["ok_1"]
+    assert result.failed_sources == ["bad"]
+    assert result.failed[0].reason == "error"
+    assert "403" in result.failed[0].message
+
+
+def test_fetch_from_processors_per_source_timeout():
+    procs = [FakeProcessor("fast"), FakeProcessor("slow", 1.0)]
+    start = time.monotonic()
+    result = fetch_from_processors(ENTITY, procs, source_timeout_s={"slow": 0.1})
+    assert time.monotonic() - start < 0.8
+    assert [e.evidence_id for e in result.evidence] == ["fast_1"]
+    assert result.failed[0].source_id == "slow"
+    assert result.failed[0].reason == "timeout"
+
+
+def test_fetch_from_processors_global_deadline():
+    procs = [FakeProcessor("a", 1.0), FakeProcessor("b", 1.0)]
+    result = fetch_from_processors(ENTITY, procs, source_timeout_s=5.0, deadline_s=0.1)
+    assert result.evidence == []
+    assert sorted(result.failed_sources) == ["a", "b"]
+
+
+def test_fetch_evidence_for_entity_reports_unknown_source(tmp_path: Path):
+    nhtsa_dir = tmp_path / "raw" / "nhtsa"
+    nhtsa_dir.mkdir(parents=True)
+    nhtsa_dir.joinpath("recalls_make_TESLA.json").write_text(
+        json.dumps({"results": [{"report_received_date": "2024-06-01", "nhtsa_id": "24V1", "subject": "S"}]}),
+        encoding="utf-8",
+    )
+    entity = Entity(entity_id="tesla", name="Tesla, Inc.", identifiers={"make": "TESLA"})
+    result = fetch_evidence_for_entity(entity, sources=["nhtsa", "gdelt"], data_root=tmp_path)
+    assert len(result.evidence) == 1
+    assert result.failed_sources == ["gdelt"]
+    assert result.failed[0].reason == "unknown_source"
+
+
+def test_fetch_from_processors_source_timeout_starts_when_the_source_runs():
+    # With one worker, "b" waits 0.8s behind "a"; its 0.5s budget must not be spent in the queue.
+    procs = [FakeProcessor("a", 0.8), FakeProcessor("b", 0.0)]
+    result = fetch_from_processors(ENTITY, procs, source_timeout_s={"b": 0.5}, max_workers=1)
+    assert result.complete
+    assert [e.evidence_id for e in result.evidence] == ["a_1", "b_1"]
@@ -57,3 +57,68 @@ def test_nhtsa_processor_derives_make_from_name(tmp_path: Path):
     entity = Entity(entity_id="tesla_inc", name="Tesla, Inc.", identifiers={})
     evidence = proc.get_evidence_for_entity(entity)
     assert len(evidence) >= 1
+
+
+def test_nhtsa_processor_reads_streamed_jsonl_download(tmp_path: Path):
+    """A streamed .jsonl download takes precedence over the JSON cache."""
+    raw_dir = tmp_path / "raw" / "nhtsa"
+    raw_dir.mkdir(parents=True)
+    raw_dir.joinpath("recalls_make_TESLA.jsonl").write_text(
+        '{"report_received_date": "2024-06-01", "nhtsa_id": "24V1", "subject": "A"}\n'
+        '{"report_received_date": "2024-07-01", "nhtsa_id": "24V2", "subject": "B"}\n',
+        encoding="utf-8",
+    )
+    proc = NhtsaProcessor(data_root=tmp_path)
+    entity = Entity(entity_id="tesla", name="Tesla, Inc.", identifiers={"make": "TESLA"})
+    evidence = proc.get_evidence_for_entity(entity)
+    assert [e.attributes["nhtsa_id"] for e in evidence] == ["24V1", "24V2"]
+    assert evidence[0].raw_location.endswith(".jsonl")
+
+
+def _stub_download(calls: list):
+    def download(make, out_path, **kwargs):
+        calls.append(make)
+        Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(out_path).write_text('{"report_received_date": "2024-07-01", "nhtsa_id": "24V999"}\n', encoding="utf-8")
+        return 1
+
+    return download
+
+
+def test_nhtsa_processor_refreshes_stale_jsonl_download(tmp_path: Path, monkeypatch):
+    """A .jsonl download older than the cache TTL is downloaded again; a fresh one is reused."""
+    import os
+
+    from mcp_layer.nhtsa_processor import processor as mod
+
+    raw_dir = tmp_path / "raw" / "nhtsa"
+    raw_dir.mkdir(parents=True)
+    jsonl = raw_dir / "recalls_make_TESLA.jsonl"
+    jsonl.write_text('{"report_received_date": "2024-06-01", "nhtsa_id": "24V100"}\n', encoding="utf-8")
+    calls: list = []
+    monkeypatch.setattr(mod.nhtsa, "download_recalls_by_make", _stub_download(calls))
+    proc = NhtsaProcessor(data_root=tmp_path)
+    entity = Entity(entity_id="tesla", name="Tesla, Inc.", identifiers={"make": "TESLA"})
+
+    assert [e.evidence_id for e in proc.get_evidence_for_entity(entity)] == ["tesla_nhtsa_24v100"]
+    assert calls == []
+
+    old = jsonl.stat().st_mtime - proc.cache_policy.ttl_s - 60
+    os.utime(jsonl, (old, old))
+    assert [e.evidence_id for e in proc.get_evidence_for_entity(entity)] == ["tesla_nhtsa_24v999"]
+    assert calls == ["TESLA"]
+
+
+def test_nhtsa_processor_streams_large_makes(tmp_path: Path, monkeypatch):
+    """Without a cache, a make above STREAM_THRESHOLD rows is streamed to .jsonl instead of fetched into memory."""
+    from mcp_layer.nhtsa_processor import processor as mod
+
+    calls: list = []
+    monkeypatch.setattr(mod.nhtsa, "count_recalls_by_make", lambda make, **kw: mod.STREAM_THRESHOLD + 1)
+    monkeypatch.setattr(mod.nhtsa, "download_recalls_by_make", _stub_download(calls))
+    monkeypatch.setattr(mod.nhtsa, "fetch_recalls_by_make_if_modified", lambda *a, **kw: pytest.fail("fetched into memory"))
+    proc = NhtsaProcessor(data_root=tmp_path)
+    entity = Entity(entity_id="tesla", name="Tesla, Inc.", identifiers={"make": "TESLA"})
+
+    assert proc.ensure_raw_for_entity(entity).suffix == ".jsonl"
+    assert calls == ["TESLA"]
@@ -0,0 +1,113 @@
+"""Tests for the raw cache policy (TTL, conditional revalidation, stale-while-revalidate)."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from mcp_layer.raw_cache import CachePolicy, RawCache, meta_path, read_meta
+from osint_swarm.data_sources.http import Validators
+from osint_swarm.utils.io import read_json
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSource:
+    """Conditional fetch that answers 304 when the caller's ETag matches the current version."""
+
+    def __init__(self, payload, etag="v1"):
+        self.payload = payload
+        self.etag = etag
+        self.calls = []
+
+    def __call__(self, validators):
+        self.calls.append(validators)
+        if validators and validators.etag == self.etag:
+            return None, validators
+        return self.payload, Validators(etag=self.etag)
+
+
+def test_raw_cache_fetches_and_writes_sidecar(tmp_path: Path):
+    path = tmp_path / "raw" / "x.json"
+    source = FakeSource({"a": 1})
+    cache = RawCache(clock=FakeClock())
+    assert cache.get(path, source, CachePolicy(ttl_s=60)) == {"a": 1}
+    assert read_json(path) == {"a": 1}
+    assert read_meta(path).etag == "v1"
+    assert source.calls == [None]
+
+
+def test_raw_cache_serves_fresh_copy_without_fetching(tmp_path: Path):
+    path = tmp_path / "x.json"
+    clock = FakeClock()
+    source = FakeSource({"a": 1})
+    cache = RawCache(clock=clock)
+    cache.get(path, source, CachePolicy(ttl_s=60))
+    clock.now += 30
+    cache.get(path, source, CachePolicy(ttl_s=60))
+    assert len(source.calls) == 1
+
+
+def test_raw_cache_revalidates_with_conditional_get(tmp_path: Path):
+    path = tmp_path / "x.json"
+    clock = FakeClock()
+    source = FakeSource({"a": 1})
+    cache = RawCache(clock=clock)
+    cache.get(path, source, CachePolicy(ttl_s=60))
+    clock.now += 120
+    assert cache.get(path, source, CachePolicy(ttl_s=60)) == {"a": 1}
+    assert source.calls[-1] == Validators(etag="v1")
+    assert read_meta(path).fetched_at == clock.now
+
+    source.payload, source.etag = {"a": 2}, "v2"
+    clock.now += 120
+    assert cache.get(path, source, CachePolicy(ttl_s=60)) == {"a": 2}
+    assert read_meta(path).etag == "v2"
+
+
+def test_raw_cache_stale_while_revalidate_refreshes_in_background(tmp_path: Path):
+    path = tmp_path / "x.json"
+    clock = FakeClock()
+    source = FakeSource({"a": 1})
+    cache = RawCache(clock=clock)
+    policy = CachePolicy(ttl_s=60, stale_while_revalidate=True)
+    cache.get(path, source, policy)
+    source.payload, source.etag = {"a": 2}, "v2"
+    clock.now += 120
+
+    assert cache.get(path, source, policy) == {"a": 1}
+    for _ in range(500):
+        if read_meta(path).etag == "v2":
+            break
+        time.sleep(0.01)
+    assert read_json(path) == {"a": 2}
+
+
+def test_raw_cache_serves_stale_copy_when_refresh_fails(tmp_path: Path):
+    path = tmp_path / "x.json"
+    path.write_text('{"a": 1}')
+    clock = FakeClock(now=path.stat().st_mtime + 10_000)
+
+    def failing(_validators):
+        raise RuntimeError("offline")
+
+    cache = RawCache(clock=clock)
+    assert cache.get(path, failing, CachePolicy(ttl_s=60)) == {"a": 1}
+    with pytest.raises(RuntimeError):
+        cache.get(path, failing, CachePolicy(ttl_s=60, stale_if_error=False))
+    assert not meta_path(path).exists()
+
+
+def test_raw_cache_legacy_file_without_sidecar_never_expires_without_ttl(tmp_path: Path):
+    path = tmp_path / "x.json"
+    path.write_text('{"a": 1}')
+    source = FakeSource({"a": 2})
+    cache = RawCache(clock=FakeClock(now=path.stat().st_mtime + 10 ** 9))
+    assert cache.get(path, source, CachePolicy(ttl_s=None)) == {"a": 1}
+    assert source.calls == []
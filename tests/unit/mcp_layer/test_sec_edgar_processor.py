@@ -56,3 +56,56 @@ def test_sec_edgar_processor_uses_cache(tmp_path: Path):
         assert e.source_type == "sec_filing"
         assert e.date in ("2024-02-01", "2024-01-15")
         assert "sec.gov" in e.source_uri
+
+
+HISTORY_SUBMISSIONS = {
+    "filings": {
+        "recent": {
+            "form": ["8-K"],
+            "filingDate": ["2024-01-15"],
+            "accessionNumber": ["0000950170-24-000002"],
+            "primaryDocument": ["tsla-8k.htm"],
+        },
+        "files": [
+            {"name": "CIK0001318605-submissions-001.json", "filingFrom": "2015-01-01", "filingTo": "2019-12-31"},
+            {"name": "CIK0001318605-submissions-002.json", "filingFrom": "2010-01-01", "filingTo": "2014-12-31"},
+        ],
+    }
+}
+
+OVERFLOW_001 = {
+    "form": ["10-K", "4"],
+    "filingDate": ["2019-02-19", "2016-05-01"],
+    "accessionNumber": ["0001564590-19-003165", "0001181431-16-000001"],
+    "primaryDocument": ["tsla-10k.htm", "xslF345X03/form4.xml"],
+}
+
+
+def _write_history_cache(tmp_path: Path) -> Path:
+    import json
+
+    raw_dir = tmp_path / "raw" / "sec"
+    raw_dir.mkdir(parents=True)
+    raw_dir.joinpath("CIK0001318605.json").write_text(json.dumps(HISTORY_SUBMISSIONS), encoding="utf-8")
+    raw_dir.joinpath("CIK0001318605-submissions-001.json").write_text(json.dumps(OVERFLOW_001), encoding="utf-8")
+    return raw_dir
+
+
+def test_sec_edgar_processor_recent_only_ignores_overflow_files(tmp_path: Path):
+    _write_history_cache(tmp_path)
+    proc = SecEdgarProcessor(data_root=tmp_path)
+    entity = Entity(entity_id="tesla", name="Tesla, Inc.", identifiers={"cik": "0001318605"})
+    assert len(proc.get_evidence_for_entity(entity)) == 1
+
+
+def test_sec_edgar_processor_full_history_merges_overflow_with_date_pushdown(tmp_path: Path, monkeypatch):
+    """Only overflow files overlapping the window are read; 002 (2010-2014) is never fetched."""
+    monkeypatch.delenv("SEC_USER_AGENT", raising=False)
+    monkeypatch.delenv("SEC_UA", raising=False)
+    raw_dir = _write_history_cache(tmp_path)
+    proc = SecEdgarProcessor(data_root=tmp_path, full_history=True, start_date="2016-01-01")
+    entity = Entity(entity_id="tesla", name="Tesla, Inc.", identifiers={"cik": "0001318605"})
+    evidence = proc.get_evidence_for_entity(entity)
+    assert [e.date for e in evidence] == ["2024-01-15", "2019-02-19", "2016-05-01"]
+    assert evidence[1].raw_location.endswith("CIK0001318605-submissions-001.json")
+    assert not raw_dir.joinpath("CIK0001318605-submissions-002.json").exists()
@@ -0,0 +1,54 @@
+"""Tests for the compact Evidence representation and EvidenceBatch."""
+
+import dataclasses
+import pickle
+
+import pytest
+
+from osint_swarm.entities import Entity, Evidence
+from osint_swarm.evidence_batch import EvidenceBatch
+
+
+def _ev(ev_id: str, entity_id: str = "ent1", risk: str = "governance", **kw) -> Evidence:
+    return Evidence(ev_id, entity_id, "2024-01-01", "sec_filing", risk, "S", "https://x", **kw)
+
+
+def test_evidence_is_slotted_and_frozen():
+    e = _ev("a")
+    assert not hasattr(e, "__dict__")
+    assert not hasattr(Entity("e", "E"), "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        e.summary = "other"  # type: ignore[misc]
+    assert e.raw_location is None and e.confidence == 0.5 and e.attributes == {}
+
+
+def test_evidence_interns_categorical_fields():
+    a = _ev("a", entity_id="".join(["ent", "1"]), raw_location="".join(["data/raw/", "x.json"]))
+    b = _ev("b", entity_id="".join(["ent", "1"]), raw_location="".join(["data/raw/", "x.json"]))
+    assert a.entity_id is b.entity_id
+    assert a.raw_location is b.raw_location
+
+
+def test_evidence_keeps_dataclass_api():
+    e = _ev("a", attributes={"form": "8-K"})
+    assert pickle.loads(pickle.dumps(e)) == e
+    assert dataclasses.replace(e, summary="T").summary == "T"
+    assert e.to_dict()["attributes"] == {"form": "8-K"}
+    assert [f.name for f in dataclasses.fields(e)][:2] == ["evidence_id", "entity_id"]
+
+
+def test_evidence_batch_round_trips_rows():
+    rows = [_ev("a", attributes={"k": 1}), _ev("b", entity_id="ent2", risk="legal", confidence=0.9)]
+    batch = EvidenceBatch(rows)
+    assert len(batch) == 2
+    assert list(batch) == rows
+    assert batch[-1] == rows[1]
+    assert batch.column("confidence") == [0.5, 0.9]
+    assert batch.categories("entity_id") == ["ent1", "ent2"]
+    assert [e.evidence_id for e in batch[1:]] == ["b"]
+
+
+def test_evidence_batch_where_filters_on_codes():
+    batch = EvidenceBatch(_ev(str(i), risk="legal" if i % 2 else "governance") for i in range(6))
+    assert [e.evidence_id for e in batch.where("risk_category", "legal")] == ["1", "3", "5"]
+    assert len(batch.where("risk_category", "network")) == 0
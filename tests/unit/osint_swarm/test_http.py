@@ -0,0 +1,78 @@
+"""Tests for the shared connector HTTP client (rate limiting + retries)."""
+
+import pytest
+
+from osint_swarm.data_sources.http import HttpClient, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, s: float) -> None:
+        self.now += s
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeSession:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        return FakeResponse(self.statuses.pop(0))
+
+
+def test_token_bucket_limits_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(10.0, clock=clock, sleep=clock.sleep)
+    for _ in range(30):
+        bucket.acquire()
+    # 10 burst tokens, then 20 more at 10/s -> ~2 seconds of waiting
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_http_client_retries_on_429_and_5xx():
+    session = FakeSession([429, 503, 200])
+    sleeps = []
+    client = HttpClient(session=session, sleep=sleeps.append, rate_limits={})
+    resp = client.get("https://data.sec.gov/submissions/CIK0000000001.json")
+    assert resp.status_code == 200
+    assert len(session.calls) == 3
+    assert len(sleeps) == 2
+
+
+def test_http_client_gives_up_after_max_retries():
+    session = FakeSession([500, 500, 500])
+    client = HttpClient(session=session, sleep=lambda s: None, max_retries=2, rate_limits={})
+    assert client.get("https://example.com/x").status_code == 500
+    assert len(session.calls) == 3
+
+
+def test_http_client_honors_retry_after():
+    session = FakeSession([429, 200])
+    sleeps = []
+    client = HttpClient(session=session, sleep=sleeps.append, rate_limits={})
+    session.get = lambda url, **kw: FakeResponse(session.statuses.pop(0), {"Retry-After": "3"})
+    client.get("https://example.com/x")
+    assert sleeps == [3.0]
+
+
+def test_http_client_applies_per_host_limits():
+    client = HttpClient(session=FakeSession([]), rate_limits={"data.sec.gov": 10.0})
+    assert client.bucket_for("https://data.sec.gov/submissions/x.json") is not None
+    assert client.bucket_for("https://datahub.transportation.gov/resource/x.json") is None
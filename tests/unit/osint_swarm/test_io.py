@@ -0,0 +1,50 @@
+"""Tests for JSON IO helpers (compact/compressed raw storage, format detection)."""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from osint_swarm.utils import io
+from osint_swarm.utils.io import read_json, write_json, write_raw_json
+
+PAYLOAD = {"filings": {"recent": {"form": ["8-K"] * 50}}, "name": "Société Générale"}
+
+
+@pytest.mark.parametrize("codec", ["gzip", "lzma", "none"])
+def test_write_raw_json_round_trips(tmp_path: Path, codec: str):
+    path = tmp_path / "CIK0000000001.json"
+    write_raw_json(path, PAYLOAD, codec=codec)
+    assert read_json(path) == PAYLOAD
+
+
+def test_write_raw_json_is_smaller_than_pretty_json(tmp_path: Path):
+    pretty, raw = tmp_path / "pretty.json", tmp_path / "raw.json"
+    write_json(pretty, PAYLOAD)
+    write_raw_json(raw, PAYLOAD, codec="gzip")
+    assert raw.read_bytes().startswith(io.GZIP_MAGIC)
+    assert raw.stat().st_size < pretty.stat().st_size
+
+
+def test_read_json_reads_legacy_pretty_files(tmp_path: Path):
+    path = tmp_path / "legacy.json"
+    path.write_text(json.dumps(PAYLOAD, indent=2, ensure_ascii=False), encoding="utf-8")
+    assert read_json(path) == PAYLOAD
+
+
+def test_default_raw_codec_from_environment(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv(io.RAW_CODEC_ENV, "lzma")
+    path = tmp_path / "x.json"
+    write_raw_json(path, PAYLOAD)
+    assert path.read_bytes().startswith(io.XZ_MAGIC)
+    monkeypatch.setenv(io.RAW_CODEC_ENV, "bogus")
+    assert io.default_raw_codec() == io.DEFAULT_RAW_CODEC
+
+
+def test_read_json_without_orjson(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(io, "orjson", None)
+    path = tmp_path / "x.json"
+    write_raw_json(path, PAYLOAD, codec="gzip")
+    assert gzip.decompress(path.read_bytes()).startswith(b'{"filings"')
+    assert read_json(path) == PAYLOAD
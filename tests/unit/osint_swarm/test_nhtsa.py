@@ -0,0 +1,92 @@
+"""Tests for the NHTSA DataHub connector (concurrent paging, streamed JSONL download)."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from osint_swarm.data_sources import nhtsa
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+        self.headers = {"ETag": '"v1"'}
+        self.url = "https://datahub.example/resource"
+
+    def json(self):
+        return self._body
+
+
+class FakeSocrata:
+    """Serves `total` rows for $limit/$offset queries and answers count(*) probes."""
+
+    def __init__(self, total: int):
+        self.rows = [{"nhtsa_id": f"R{i:05d}", "report_received_date": "2024-01-01"} for i in range(total)]
+        self.offsets = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        params = params or {}
+        if params.get("$select") == "count(*)":
+            return FakeResponse([{"count": str(len(self.rows))}])
+        offset, limit = int(params["$offset"]), int(params["$limit"])
+        with self.lock:
+            self.offsets.append(offset)
+        return FakeResponse(self.rows[offset:offset + limit])
+
+
+def test_count_recalls_by_make():
+    assert nhtsa.count_recalls_by_make("TESLA", client=FakeSocrata(42)) == 42
+
+
+def test_fetch_recalls_by_make_fetches_remaining_pages_concurrently(monkeypatch):
+    monkeypatch.setattr(nhtsa, "PAGE_SIZE", 10)
+    client = FakeSocrata(35)
+    payload = nhtsa.fetch_recalls_by_make("TESLA", client=client, max_workers=3)
+    assert [r["nhtsa_id"] for r in payload["results"]] == [f"R{i:05d}" for i in range(35)]
+    assert sorted(client.offsets) == [0, 10, 20, 30]
+
+
+def test_fetch_recalls_by_make_single_page_skips_count_probe():
+    client = FakeSocrata(3)
+    payload = nhtsa.fetch_recalls_by_make("TESLA", client=client)
+    assert len(payload["results"]) == 3
+    assert client.offsets == [0]
+
+
+def test_download_recalls_by_make_streams_jsonl(tmp_path: Path):
+    out = tmp_path / "recalls_make_TESLA.jsonl"
+    count = nhtsa.download_recalls_by_make("TESLA", out, client=FakeSocrata(25), page_size=10, max_workers=2)
+    assert count == 25
+    rows = list(nhtsa.iter_recall_records(out))
+    assert [r["nhtsa_id"] for r in rows] == [f"R{i:05d}" for i in range(25)]
+    assert not out.with_name(out.name + ".parts").exists()
+
+
+def test_download_recalls_by_make_resumes_from_completed_pages(tmp_path: Path):
+    out = tmp_path / "recalls_make_TESLA.jsonl"
+    client = FakeSocrata(25)
+    parts = out.with_name(out.name + ".parts")
+    parts.mkdir()
+    parts.joinpath("plan.json").write_text(
+        json.dumps({"where": "upper(manufacturer) like '%TESLA%'", "total": 25, "page_size": 10})
+    )
+    parts.joinpath("page_00000.jsonl").write_text(
+        "".join(json.dumps(r) + "\n" for r in client.rows[:10])
+    )
+    assert nhtsa.download_recalls_by_make("TESLA", out, client=client, page_size=10) == 25
+    assert sorted(client.offsets) == [10, 20]
+
+
+def test_download_recalls_by_make_discards_parts_when_count_changed(tmp_path: Path):
+    out = tmp_path / "recalls_make_TESLA.jsonl"
+    parts = out.with_name(out.name + ".parts")
+    parts.mkdir()
+    parts.joinpath("plan.json").write_text(json.dumps({"where": "x", "total": 5, "page_size": 10}))
+    parts.joinpath("page_00000.jsonl").write_text('{"nhtsa_id": "stale"}\n')
+    client = FakeSocrata(12)
+    assert nhtsa.download_recalls_by_make("TESLA", out, client=client, page_size=10) == 12
+    assert "stale" not in out.read_text()
@@ -0,0 +1,88 @@
+"""Tests for SEC EDGAR connector helpers (filing extraction, overflow file selection)."""
+
+from osint_swarm.data_sources import sec_edgar
+
+
+SUBMISSIONS = {
+    "filings": {
+        "recent": {
+            "form": ["10-K", "8-K", "4"],
+            "filingDate": ["2024-02-01", "2024-01-15", "2023-12-01"],
+            "accessionNumber": ["a-1", "a-2", "a-3"],
+            "primaryDocument": ["k.htm", "8k.htm", "f4.xml"],
+        },
+        "files": [
+            {"name": "CIK0000000001-submissions-001.json", "filingFrom": "2015-01-01", "filingTo": "2019-12-31"},
+            {"name": "CIK0000000001-submissions-002.json", "filingFrom": "2010-01-01", "filingTo": "2014-12-31"},
+        ],
+    }
+}
+
+
+def test_extract_recent_filings_filters_forms_and_dates():
+    out = sec_edgar.extract_recent_filings(SUBMISSIONS, forms={"8-K", "4"}, start_date="2024-01-01")
+    assert [f["accessionNumber"] for f in out] == ["a-2"]
+
+
+def test_overflow_files_selects_files_overlapping_window():
+    names = lambda files: [f["name"][-8:-5] for f in files]
+    assert names(sec_edgar.overflow_files(SUBMISSIONS)) == ["001", "002"]
+    assert names(sec_edgar.overflow_files(SUBMISSIONS, start_date="2016-06-01")) == ["001"]
+    assert names(sec_edgar.overflow_files(SUBMISSIONS, end_date="2012-01-01")) == ["002"]
+    assert sec_edgar.overflow_files(SUBMISSIONS, start_date="2020-01-01") == []
+
+
+def _linear_select(columns, forms=None, start_date=None, end_date=None):
+    return [
+        i for i, (f, d) in enumerate(zip(columns["form"], columns["filingDate"]))
+        if (not forms or f in forms) and (not start_date or d >= start_date) and (not end_date or d <= end_date)
+    ]
+
+
+def test_filings_view_select_matches_linear_scan():
+    dates = [f"2024-{m:02d}-{d:02d}" for m in range(12, 0, -1) for d in (28, 15, 15, 1)]
+    forms = ["4", "8-K", "10-Q", "4"] * 12
+    columns = {
+        "form": forms,
+        "filingDate": dates,
+        "accessionNumber": [f"acc-{i}" for i in range(len(dates))],
+        "primaryDocument": ["doc.htm"] * len(dates),
+    }
+    view = sec_edgar.FilingsView(columns)
+    cases = [
+        {},
+        {"forms": {"8-K"}},
+        {"start_date": "2024-06-15"},
+        {"end_date": "2024-03-15"},
+        {"forms": {"4", "10-Q"}, "start_date": "2024-02-15", "end_date": "2024-11-01"},
+        {"start_date": "2025-01-01"},
+        {"forms": {"S-1"}},
+    ]
+    for case in cases:
+        assert view.select(**case) == _linear_select(columns, **case), case
+
+
+def test_filings_view_falls_back_to_scan_when_unsorted():
+    columns = {
+        "form": ["4", "8-K", "4"],
+        "filingDate": ["2020-01-01", "2024-01-01", "2022-01-01"],
+        "accessionNumber": ["a", "b", "c"],
+        "primaryDocument": ["x", "y", "z"],
+    }
+    view = sec_edgar.FilingsView(columns)
+    assert view.select(start_date="2021-01-01") == [1, 2]
+    assert view.row(2)["accessionNumber"] == "c"
+
+
+def test_filings_view_checks_order_only_around_the_window():
+    columns = {
+        "form": ["4"] * 4,
+        "filingDate": ["2024-05-01", "2024-03-01", "2024-04-01", "2024-01-01"],
+        "accessionNumber": ["a", "b", "c", "d"],
+        "primaryDocument": ["x"] * 4,
+    }
+    view = sec_edgar.FilingsView(columns)
+    assert view.select() == [0, 1, 2, 3]
+    assert view.select(forms={"4"}) == [0, 1, 2, 3]
+    # The window's neighbour (row 2) is newer than the window start: detected, linear scan.
+    assert view.select(start_date="2024-03-15") == [0, 2]
@@ -43,3 +43,14 @@ def test_format_dashboard_cli():
     assert "governance" in out
     assert "regulatory" in out
     assert "10" in out
+
+
+def test_risk_score_accumulator_incremental():
+    from output_layer.risk_dashboard import RiskScoreAccumulator
+
+    acc = RiskScoreAccumulator()
+    acc.add([Evidence("ev1", "ent1", "2024-01-01", "sec_filing", "governance", "X", "https://sec.gov", confidence=0.9)])
+    assert acc.scores().finding_count == 1
+    acc.add([Evidence("ev2", "ent1", "2024-01-02", "regulator_api", "regulatory", "Y", "https://nhtsa.gov", confidence=0.7)])
+    assert acc.scores().overall == 0.8
+    assert acc.scores().by_risk_category == {"governance": 0.9, "regulatory": 0.7}
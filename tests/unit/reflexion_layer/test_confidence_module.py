@@ -60,3 +60,28 @@ def test_adjusted_confidence_other_source_lower():
     assert len(out) == 1
     _, adj = out[0]
     assert adj == 0.5  # other weight 0.5
+
+
+def test_aggregate_confidence_accepts_stream():
+    findings = (
+        Evidence(f"e{i}", "ent1", "2024-01-01", "sec_filing", "governance", "X", "https://sec.gov", confidence=c)
+        for i, c in enumerate((0.8, 0.6))
+    )
+    out = aggregate_confidence(findings)
+    assert out.overall == 0.7
+    assert out.by_risk_category == {"governance": pytest.approx(0.7)}
+
+
+def test_confidence_accumulator_matches_aggregate_across_batches():
+    from reflexion_layer.confidence_module import ConfidenceAccumulator
+
+    findings = [
+        Evidence(f"e{i}", "ent1", "2024-01-01", st, "governance", "X", "https://x", confidence=c)
+        for i, (st, c) in enumerate((("sec_filing", 0.9), ("other", 0.5), ("sec_filing", 0.7)))
+    ]
+    acc = ConfidenceAccumulator()
+    assert acc.scores().overall == 0.0
+    acc.add(findings[:1])
+    assert acc.scores().overall == 0.9
+    acc.add(findings[1:])
+    assert acc.scores() == aggregate_confidence(findings)
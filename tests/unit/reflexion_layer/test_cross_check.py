@@ -42,3 +42,24 @@ def test_cross_check_no_date_skipped():
         Evidence("e1", "ent1", "", "other", "other", "No date", "https://x.com", confidence=0.5),
     ]
     assert cross_check_findings(findings) == []
+
+
+def test_cross_check_findings_accepts_stream():
+    findings = iter([
+        Evidence("e1", "ent1", "2024-01-01", "sec_filing", "governance", "A", "https://x"),
+        Evidence("e2", "ent1", "2024-01-01", "sec_filing", "governance", "B", "https://x"),
+    ])
+    conflicts = cross_check_findings(findings)
+    assert len(conflicts) == 1
+    assert conflicts[0].evidence_ids == ("e1", "e2")
+
+
+def test_cross_checker_detects_conflict_across_batches():
+    from reflexion_layer.cross_check import CrossChecker
+
+    checker = CrossChecker()
+    checker.add([Evidence("e1", "ent1", "2024-01-01", "sec_filing", "governance", "A", "https://x")])
+    assert checker.conflicts() == []
+    checker.add([Evidence("e2", "ent1", "2024-01-01", "court_record", "legal", "B", "https://y")])
+    (conflict,) = checker.conflicts()
+    assert conflict.evidence_ids == ("e1", "e2")
@@ -2,7 +2,7 @@
 
 import pytest
 
-from agents.lead_agent.context_manager import InvestigationContext
+from agents.lead_agent.context_manager import InvestigationContext, TaskFailure
 from agents.lead_agent.task_planner import SubTask
 from reflexion_layer.gap_detection import Gap, detect_gaps
 from osint_swarm.entities import Entity, Evidence
@@ -58,3 +58,13 @@ def test_detect_gaps_legal_empty_returns_gap():
     # No legal results at all
     gaps = detect_gaps(ctx)
     assert any("legal" in g.area.lower() or "Sanctions" in g.area for g in gaps)
+
+
+def test_detect_gaps_tells_failed_legal_tasks_from_stub_output():
+    ctx = InvestigationContext()
+    ctx.set_entity(Entity(entity_id="e1", name="E", identifiers={}))
+    ctx.add_task_failure(TaskFailure(SubTask("litigation", "legal_agent", "Court records"), "timeout"))
+    legal = [g for g in detect_gaps(ctx) if g.area == "Sanctions / legal"]
+    assert len(legal) == 1
+    assert "litigation (timeout)" in legal[0].description
+    assert "staged" not in legal[0].description